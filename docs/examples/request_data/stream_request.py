@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict
+
+from litestar import Litestar, post
+
+
+@dataclass
+class Measurement:
+    sensor: str
+    value: float
+
+
+@post(path="/measurements")
+async def ingest(data: AsyncIterator[Measurement]) -> Dict[str, int]:
+    # items are decoded and validated one at a time, as the request body is received
+    count = 0
+    async for measurement in data:
+        count += 1
+    return {"count": count}
+
+
+app = Litestar(route_handlers=[ingest])
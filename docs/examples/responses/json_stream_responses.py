@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import AsyncGenerator
+
+from litestar import Litestar, get
+from litestar.response import JSONStream
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+
+
+async def fetch_rows() -> AsyncGenerator[Row, None]:
+    for i in range(200_000):
+        yield Row(id=i, name=f"row {i}")
+
+
+@get(path="/rows")
+async def rows() -> JSONStream[Row]:
+    return JSONStream(fetch_rows())
+
+
+@get(path="/rows.ndjson")
+async def rows_ndjson() -> JSONStream[Row]:
+    return JSONStream(fetch_rows(), ndjson=True)
+
+
+app = Litestar(route_handlers=[rows, rows_ndjson])
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from functools import lru_cache
 from traceback import format_exc
 from typing import TYPE_CHECKING, Any, Pattern
 
 from litestar._asgi.routing_trie import validate_node
+from litestar._asgi.routing_trie.cache import RouteCache
+from litestar._asgi.routing_trie.compiled import compile_route_map, parse_path_to_compiled_route
 from litestar._asgi.routing_trie.mapping import add_route_to_trie
 from litestar._asgi.routing_trie.traversal import parse_path_to_route
 from litestar._asgi.routing_trie.types import create_node
@@ -18,6 +19,7 @@ __all__ = ("ASGIRouter",)
 
 
 if TYPE_CHECKING:
+    from litestar._asgi.routing_trie.compiled import CompiledRouteNode
     from litestar._asgi.routing_trie.types import RouteTrieNode
     from litestar.app import Litestar
     from litestar.routes import ASGIRoute, HTTPRoute, WebSocketRoute
@@ -45,6 +47,8 @@ class ASGIRouter:
     """
 
     __slots__ = (
+        "_compiled_route_map",
+        "_handle_routing",
         "_mount_paths_regex",
         "_mount_routes",
         "_plain_routes",
@@ -52,22 +56,30 @@ class ASGIRouter:
         "_static_routes",
         "app",
         "root_route_map_node",
+        "route_cache",
         "route_handler_index",
         "route_mapping",
     )
 
-    def __init__(self, app: Litestar) -> None:
+    def __init__(self, app: Litestar, compiled_routing: bool = False) -> None:
         """Initialize ``ASGIRouter``.
 
         Args:
             app: The Litestar app instance
+            compiled_routing: Whether to resolve parameterized routes using the compiled route map, as enabled by
+                ``ExperimentalFeatures.COMPILED_ROUTING``.
         """
+        self._compiled_route_map: CompiledRouteNode | None = None
+        self._handle_routing = self.handle_compiled_routing if compiled_routing else self.handle_routing
         self._mount_paths_regex: Pattern | None = None
         self._mount_routes: dict[str, RouteTrieNode] = {}
         self._plain_routes: set[str] = set()
         self._registered_routes: set[HTTPRoute | WebSocketRoute | ASGIRoute] = set()
         self.app = app
         self.root_route_map_node: RouteTrieNode = create_node()
+        self.route_cache: RouteCache[tuple[ASGIApp, RouteHandlerType, tuple[Any, ...]]] = RouteCache.from_config(
+            app.route_cache_config
+        )
         self.route_handler_index: dict[str, RouteHandlerType] = {}
         self.route_mapping: dict[str, list[BaseRoute]] = defaultdict(list)
 
@@ -83,14 +95,16 @@ class ASGIRouter:
             path = path.split(root_path, maxsplit=1)[-1]
         normalized_path = normalize_path(path)
 
-        asgi_app, scope["route_handler"], scope["path"], scope["path_params"] = self.handle_routing(
+        asgi_app, scope["route_handler"], scope["path"], scope["path_params"] = self._handle_routing(
             path=normalized_path, method=scope.get("method")
         )
         await asgi_app(scope, receive, send)
 
-    @lru_cache(1024)  # noqa: B019
     def handle_routing(self, path: str, method: Method | None) -> tuple[ASGIApp, RouteHandlerType, str, dict[str, Any]]:
-        """Handle routing for a given path / method combo. This method is meant to allow easy caching.
+        """Handle routing for a given path / method combo.
+
+        The handlers of parameterized routes are cached in :attr:`route_cache` by their path template, so a high
+        cardinality of path parameter values does not affect the effectiveness of the cache.
 
         Args:
             path: The path of the request.
@@ -106,6 +120,37 @@ class ASGIRouter:
             plain_routes=self._plain_routes,
             root_node=self.root_route_map_node,
             method=method,
+            route_cache=self.route_cache,
+        )
+
+    def handle_compiled_routing(
+        self, path: str, method: Method | None
+    ) -> tuple[ASGIApp, RouteHandlerType, str, dict[str, Any]]:
+        """Handle routing for a given path / method combo using the compiled route map.
+
+        The compiled route map is created lazily on the first call after routes have been added. As with
+        :meth:`handle_routing`, the handlers of parameterized routes are cached in :attr:`route_cache` by their path
+        template.
+
+        Args:
+            path: The path of the request.
+            method: The scope's method, if any.
+
+        Returns:
+            A tuple composed of the ASGIApp of the route, the route handler instance, the resolved and normalized path and any parsed path params.
+        """
+        if self._compiled_route_map is None:
+            self._compiled_route_map = compile_route_map(self.root_route_map_node)
+
+        return parse_path_to_compiled_route(
+            mount_paths_regex=self._mount_paths_regex,
+            mount_routes=self._mount_routes,
+            path=path,
+            plain_routes=self._plain_routes,
+            root_node=self.root_route_map_node,
+            compiled_root_node=self._compiled_route_map,
+            method=method,
+            route_cache=self.route_cache,
         )
 
     def _store_handler_to_route_mapping(self, route: BaseRoute) -> None:
@@ -145,6 +190,8 @@ class ASGIRouter:
             self._registered_routes.add(route)
 
         validate_node(node=self.root_route_map_node)
+        self._compiled_route_map = None
+        self.route_cache.clear()
         if self._mount_routes:
             self._mount_paths_regex = re.compile("|".join(sorted(set(self._mount_routes))))  # pyright: ignore
 
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, Hashable, Literal, TypeVar
+
+__all__ = ("RouteCache",)
+
+
+if TYPE_CHECKING:
+    from litestar.config.route_cache import RouteCacheConfig
+
+T = TypeVar("T")
+
+
+class RouteCache(Generic[T]):
+    """A bounded cache for route resolution results, which keeps track of hits, misses and evictions."""
+
+    __slots__ = ("_data", "eviction_policy", "evictions", "hits", "max_size", "misses")
+
+    def __init__(self, max_size: int = 1024, eviction_policy: Literal["lru", "fifo"] = "lru") -> None:
+        """Initialize ``RouteCache``.
+
+        Args:
+            max_size: Maximum number of entries to keep. If set to ``0``, nothing will be cached.
+            eviction_policy: Policy used to choose the entry to evict once ``max_size`` has been reached. ``lru``
+                evicts the least recently used entry, ``fifo`` the oldest entry.
+        """
+        self._data: OrderedDict[Hashable, T] = OrderedDict()
+        self.eviction_policy = eviction_policy
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config: RouteCacheConfig) -> RouteCache[Any]:
+        """Create a ``RouteCache`` from a :class:`RouteCacheConfig <litestar.config.route_cache.RouteCacheConfig>`.
+
+        Args:
+            config: A route cache config.
+
+        Returns:
+            A ``RouteCache`` instance.
+        """
+        return cls(max_size=config.max_size, eviction_policy=config.eviction_policy)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> T | None:
+        """Get a value from the cache.
+
+        Args:
+            key: Key of the value.
+
+        Returns:
+            The cached value or ``None`` if it is not in the cache.
+        """
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if self.eviction_policy == "lru":
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Store a value in the cache, evicting an entry if the cache is full.
+
+        Args:
+            key: Key of the value.
+            value: The value to store.
+
+        Returns:
+            None
+        """
+        if not self.max_size:
+            return
+
+        if key not in self._data and len(self._data) >= self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+        self._data[key] = value
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. The hit, miss and eviction counters are preserved.
+
+        Returns:
+            None
+        """
+        self._data.clear()
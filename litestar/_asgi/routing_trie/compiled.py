@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Literal, Pattern
+
+from litestar._asgi.routing_trie.traversal import resolve_plain_or_mount_route
+from litestar._asgi.routing_trie.types import PathParameterSentinel
+from litestar.exceptions import MethodNotAllowedException, NotFoundException
+
+__all__ = (
+    "CompiledRouteNode",
+    "compile_route_map",
+    "parse_path_to_compiled_route",
+    "traverse_compiled_route_map",
+)
+
+
+if TYPE_CHECKING:
+    from litestar._asgi.routing_trie.cache import RouteCache
+    from litestar._asgi.routing_trie.types import ASGIHandlerTuple, RouteTrieNode
+    from litestar.types import ASGIApp, Method, RouteHandlerType
+
+
+@dataclass
+class CompiledRouteNode:
+    """A node of the compiled, compressed radix tree used to resolve parameterized routes.
+
+    The node is created from a :class:`RouteTrieNode` by :func:`compile_route_map`. Chains of static path components
+    that do not branch are collapsed into a single node, and the path parameter parsers are resolved ahead of time for
+    each of the node's handlers.
+    """
+
+    __slots__ = (
+        "asgi_handlers",
+        "children",
+        "is_asgi",
+        "is_path_type",
+        "param_child",
+        "path_parameters",
+        "prefix",
+    )
+
+    asgi_handlers: dict[Method | Literal["websocket", "asgi"], ASGIHandlerTuple]
+    """A mapping of ASGI handlers stored on the node."""
+    children: dict[str, CompiledRouteNode]
+    """A dictionary mapping static path components to child nodes."""
+    is_asgi: bool
+    """Designate the node as having an ``asgi`` type handler."""
+    is_path_type: bool
+    """Designates the node as consuming the remainder of the path as a ``path`` type path parameter."""
+    param_child: CompiledRouteNode | None
+    """The child node that is used if the path component is a path parameter, if any."""
+    path_parameters: dict[Method | Literal["websocket", "asgi"], tuple[tuple[str, Callable[[str], Any] | None], ...]]
+    """A mapping of handler keys to tuples of path parameter names and their parsers."""
+    prefix: tuple[str, ...]
+    """Static path components that have to follow the component this node has been reached by."""
+
+
+def _compile_node(node: RouteTrieNode, compress: bool = True) -> CompiledRouteNode:
+    """Compile a trie node and its descendants.
+
+    Args:
+        node: A trie node.
+        compress: Whether chains of static, non-branching child nodes should be collapsed into this node.
+
+    Returns:
+        A compiled route node.
+    """
+    prefix: list[str] = []
+    while compress and not node.asgi_handlers and not node.is_path_param_node and not node.is_path_type:
+        static_keys = [key for key in node.children if isinstance(key, str) and "/" not in key]
+        if len(static_keys) != 1:
+            break
+        prefix.append(static_keys[0])
+        node = node.children[static_keys[0]]
+
+    return CompiledRouteNode(
+        asgi_handlers=dict(node.asgi_handlers),
+        # keys containing a slash are full path aliases of plain and mount routes, which are resolved without traversal
+        children={
+            key: _compile_node(child)
+            for key, child in node.children.items()
+            if isinstance(key, str) and "/" not in key and child is not node
+        },
+        is_asgi=node.is_asgi,
+        is_path_type=node.is_path_type,
+        param_child=_compile_node(node.children[PathParameterSentinel])
+        if node.is_path_param_node and PathParameterSentinel in node.children
+        else None,
+        path_parameters={
+            key: tuple((definition.name, definition.parser) for definition in definitions)
+            for key, definitions in node.path_parameters.items()
+        },
+        prefix=tuple(prefix),
+    )
+
+
+def compile_route_map(root_node: RouteTrieNode) -> CompiledRouteNode:
+    """Compile the route trie into a compressed radix tree.
+
+    Args:
+        root_node: The root trie node.
+
+    Returns:
+        The root node of the compiled tree.
+    """
+    return _compile_node(root_node, compress=False)
+
+
+def traverse_compiled_route_map(root_node: CompiledRouteNode, path: str) -> tuple[CompiledRouteNode, list[str]]:
+    """Traverse the compiled route map and retrieve the node for the request path.
+
+    Args:
+        root_node: The root node of the compiled tree.
+        path: The normalized request path.
+
+    Raises:
+        NotFoundException: If no correlating node is found.
+
+    Returns:
+        A tuple containing the target node and a list containing all path parameter values.
+    """
+    current_node = root_node
+    path_params: list[str] = []
+    # a normalized path always starts with a slash, so the first component is always empty
+    path_components = path.split("/")
+    index = 1
+    end = len(path_components) if path != "/" else 1
+
+    while index < end:
+        component = path_components[index]
+        next_node = current_node.children.get(component)
+
+        if next_node is None:
+            next_node = current_node.param_child
+            if next_node is None:
+                raise NotFoundException()
+
+            if next_node.is_path_type:
+                path_params.append("/" + "/".join(path_components[index:]))
+                current_node = next_node
+                break
+
+            path_params.append(component)
+
+        index += 1
+        if prefix := next_node.prefix:
+            prefix_end = index + len(prefix)
+            if tuple(path_components[index:prefix_end]) != prefix:
+                raise NotFoundException()
+            index = prefix_end
+
+        current_node = next_node
+
+    if not current_node.asgi_handlers:
+        raise NotFoundException()
+
+    return current_node, path_params
+
+
+def parse_path_to_compiled_route(
+    method: Method | None,
+    mount_paths_regex: Pattern | None,
+    mount_routes: dict[str, RouteTrieNode],
+    path: str,
+    plain_routes: set[str],
+    root_node: RouteTrieNode,
+    compiled_root_node: CompiledRouteNode,
+    route_cache: RouteCache[tuple[ASGIApp, RouteHandlerType, tuple[Any, ...]]] | None = None,
+) -> tuple[ASGIApp, RouteHandlerType, str, dict[str, Any]]:
+    """Resolve the ASGI app, route handler and path parameters for a path using the compiled route map.
+
+    Args:
+        method: The scope's method, if any.
+        mount_paths_regex: A compiled regex to match the mount routes.
+        mount_routes: Mapping of mount routes to trie nodes.
+        path: The path to resolve.
+        plain_routes: The set of plain routes.
+        root_node: The root trie node.
+        compiled_root_node: The root node of the compiled tree.
+        route_cache: An optional cache for the handlers and path parameter parsers of parameterized routes. Entries are
+            keyed by the compiled node of the route template and the method, so they are shared between all paths
+            matching the same template.
+
+    Raises:
+        MethodNotAllowedException: if no matching method is found.
+        NotFoundException: If no correlating node is found or if path params can not be parsed into values according
+            to the node definition.
+
+    Returns:
+        A tuple containing the stack of middlewares, the route handler that is wrapped by it, the resolved path and the
+        parsed path parameters.
+    """
+    try:
+        if resolved := resolve_plain_or_mount_route(
+            method=method,
+            mount_paths_regex=mount_paths_regex,
+            mount_routes=mount_routes,
+            path=path,
+            plain_routes=plain_routes,
+            root_node=root_node,
+        ):
+            return resolved
+
+        node, path_param_values = traverse_compiled_route_map(root_node=compiled_root_node, path=path)
+        cache_key = (id(node), method)
+        if route_cache is None or (cached := route_cache.get(cache_key)) is None:
+            key = "asgi" if node.is_asgi else method or "websocket"
+            asgi_app, handler = node.asgi_handlers[key]
+            parameter_parsers = node.path_parameters[key]
+            if route_cache is not None:
+                route_cache.set(cache_key, (asgi_app, handler, parameter_parsers))
+        else:
+            asgi_app, handler, parameter_parsers = cached
+
+        return (
+            asgi_app,
+            handler,
+            path,
+            {
+                name: parser(value) if parser else value
+                for (name, parser), value in zip(parameter_parsers, path_param_values)
+            },
+        )
+    except KeyError as e:
+        raise MethodNotAllowedException() from e
+    except ValueError as e:
+        raise NotFoundException() from e
@@ -9,6 +9,7 @@ from litestar._asgi.routing_trie.types import (
     create_node,
 )
 from litestar._asgi.utils import wrap_in_exception_handler
+from litestar.enums import ScopeType
 from litestar.types.internal_types import PathParameterDefinition
 
 __all__ = ("add_mount_route", "add_route_to_trie", "build_route_middleware_stack", "configure_node")
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
     from litestar._asgi.routing_trie.types import RouteTrieNode
     from litestar.app import Litestar
     from litestar.routes import ASGIRoute, HTTPRoute, WebSocketRoute
-    from litestar.types import ASGIApp, RouteHandlerType
+    from litestar.types import ASGIApp, Method, RouteHandlerType
 
 
 def add_mount_route(
@@ -147,7 +148,7 @@ def configure_node(
         for method, handler_mapping in route.route_handler_map.items():
             handler, _ = handler_mapping
             node.asgi_handlers[method] = ASGIHandlerTuple(
-                asgi_app=build_route_middleware_stack(app=app, route=route, route_handler=handler),
+                asgi_app=build_route_middleware_stack(app=app, route=route, route_handler=handler, method=method),
                 handler=handler,
             )
             node.path_parameters[method] = route.path_parameters
@@ -172,13 +173,18 @@ def build_route_middleware_stack(
     app: Litestar,
     route: HTTPRoute | WebSocketRoute | ASGIRoute,
     route_handler: RouteHandlerType,
+    method: Method | None = None,
 ) -> ASGIApp:
     """Construct a middleware stack that serves as the point of entry for each route.
 
+    Middleware that declares to be bypassed for every request to the route, via a ``should_bypass_for_route`` method,
+    is left out of the stack.
+
     Args:
         app: The Litestar app instance.
         route: The route that is being added.
         route_handler: The route handler that is being wrapped.
+        method: The http method the stack is built for, if any.
 
     Returns:
         An ASGIApp that is composed of a "stack" of middlewares.
@@ -187,7 +193,19 @@ def build_route_middleware_stack(
     from litestar.middleware.compression import CompressionMiddleware
     from litestar.middleware.csrf import CSRFMiddleware
     from litestar.middleware.response_cache import ResponseCacheMiddleware
-    from litestar.routes import HTTPRoute
+    from litestar.routes import HTTPRoute, WebSocketRoute
+
+    scope_type: ScopeType | None = None
+    if isinstance(route, HTTPRoute):
+        scope_type = ScopeType.HTTP
+    elif isinstance(route, WebSocketRoute):
+        scope_type = ScopeType.WEBSOCKET
+
+    def add_middleware(asgi_handler: ASGIApp, middleware_app: ASGIApp) -> ASGIApp:
+        should_bypass_for_route = getattr(middleware_app, "should_bypass_for_route", None)
+        if should_bypass_for_route is not None and should_bypass_for_route(route_handler, scope_type, method):
+            return asgi_handler
+        return middleware_app
 
     # we wrap the route.handle method in the ExceptionHandlerMiddleware
     asgi_handler = wrap_in_exception_handler(
@@ -199,20 +217,22 @@ def build_route_middleware_stack(
         asgi_handler = CSRFMiddleware(app=asgi_handler, config=app.csrf_config)
 
     if app.compression_config:
-        asgi_handler = CompressionMiddleware(app=asgi_handler, config=app.compression_config)
+        asgi_handler = add_middleware(
+            asgi_handler, CompressionMiddleware(app=asgi_handler, config=app.compression_config)
+        )
 
     if isinstance(route, HTTPRoute) and any(r.cache for r in route.route_handlers):
         asgi_handler = ResponseCacheMiddleware(app=asgi_handler, config=app.response_cache_config)
 
     if app.allowed_hosts:
-        asgi_handler = AllowedHostsMiddleware(app=asgi_handler, config=app.allowed_hosts)
+        asgi_handler = add_middleware(asgi_handler, AllowedHostsMiddleware(app=asgi_handler, config=app.allowed_hosts))
 
     for middleware in route_handler.resolve_middleware():
         if hasattr(middleware, "__iter__"):
             handler, kwargs = cast("tuple[Any, dict[str, Any]]", middleware)
-            asgi_handler = handler(app=asgi_handler, **kwargs)
+            asgi_handler = add_middleware(asgi_handler, handler(app=asgi_handler, **kwargs))
         else:
-            asgi_handler = middleware(app=asgi_handler)  # type: ignore[call-arg]
+            asgi_handler = add_middleware(asgi_handler, middleware(app=asgi_handler))  # type: ignore[call-arg]
 
     # we wrap the entire stack again in ExceptionHandlerMiddleware
     return wrap_in_exception_handler(
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Pattern
 
 from litestar._asgi.routing_trie.types import PathParameterSentinel
 from litestar.exceptions import MethodNotAllowedException, NotFoundException
 from litestar.utils import normalize_path
 
-__all__ = ("parse_node_handlers", "parse_path_params", "parse_path_to_route", "traverse_route_map")
+__all__ = (
+    "parse_node_handlers",
+    "parse_path_params",
+    "parse_path_to_route",
+    "resolve_plain_or_mount_route",
+    "traverse_route_map",
+)
 
 
 if TYPE_CHECKING:
+    from litestar._asgi.routing_trie.cache import RouteCache
     from litestar._asgi.routing_trie.types import ASGIHandlerTuple, RouteTrieNode
     from litestar.types import ASGIApp, Method, RouteHandlerType
     from litestar.types.internal_types import PathParameterDefinition
@@ -83,7 +89,6 @@ def parse_node_handlers(
     return node.asgi_handlers["websocket"]
 
 
-@lru_cache(1024)
 def parse_path_params(
     parameter_definitions: tuple[PathParameterDefinition, ...], path_param_values: tuple[str, ...]
 ) -> dict[str, Any]:
@@ -105,6 +110,52 @@ def parse_path_params(
     }
 
 
+def resolve_plain_or_mount_route(
+    method: Method | None,
+    mount_paths_regex: Pattern | None,
+    mount_routes: dict[str, RouteTrieNode],
+    path: str,
+    plain_routes: set[str],
+    root_node: RouteTrieNode,
+) -> tuple[ASGIApp, RouteHandlerType, str, dict[str, Any]] | None:
+    """Resolve a path that corresponds to a plain route or to a mount route, without traversing the trie.
+
+    Args:
+        method: The scope's method, if any.
+        mount_paths_regex: A compiled regex to match the mount routes.
+        mount_routes: Mapping of mount routes to trie nodes.
+        path: The path to resolve.
+        plain_routes: The set of plain routes.
+        root_node: The root trie node.
+
+    Raises:
+        KeyError: If no matching method is found.
+
+    Returns:
+        A tuple containing the stack of middlewares, the route handler that is wrapped by it, the resolved path and
+        an empty path parameters dictionary, or ``None`` if the path has to be resolved by traversing the trie.
+    """
+    if path in plain_routes:
+        asgi_app, handler = parse_node_handlers(node=root_node.children[path], method=method)
+        return asgi_app, handler, path, {}
+
+    if mount_paths_regex and (match := mount_paths_regex.search(path)):
+        mount_path = path[match.start() : match.end()]
+        mount_node = mount_routes[mount_path]
+        remaining_path = path[match.end() :]
+        # since we allow regular handlers under static paths, we must validate that the request does not match
+        # any such handler.
+        children = [sub_route for sub_route in mount_node.children or [] if sub_route != mount_path]
+        if not children or all(sub_route not in path for sub_route in children):  # type: ignore[operator]
+            asgi_app, handler = parse_node_handlers(node=mount_node, method=method)
+            remaining_path = remaining_path or "/"
+            if not mount_node.is_static:
+                remaining_path = remaining_path if remaining_path.endswith("/") else f"{remaining_path}/"
+            return asgi_app, handler, remaining_path, {}
+
+    return None
+
+
 def parse_path_to_route(
     method: Method | None,
     mount_paths_regex: Pattern | None,
@@ -112,6 +163,7 @@ def parse_path_to_route(
     path: str,
     plain_routes: set[str],
     root_node: RouteTrieNode,
+    route_cache: RouteCache[tuple[ASGIApp, RouteHandlerType, tuple[PathParameterDefinition, ...]]] | None = None,
 ) -> tuple[ASGIApp, RouteHandlerType, str, dict[str, Any]]:
     """Given a scope object, retrieve the asgi_handlers and is_mount boolean values from correct trie node.
 
@@ -122,6 +174,9 @@ def parse_path_to_route(
         plain_routes: The set of plain routes.
         mount_routes: Mapping of mount routes to trie nodes.
         mount_paths_regex: A compiled regex to match the mount routes.
+        route_cache: An optional cache for the handlers and path parameter definitions of parameterized routes. Entries
+            are keyed by the trie node of the route template and the method, so they are shared between all paths
+            matching the same template.
 
     Raises:
         MethodNotAllowedException: if no matching method is found.
@@ -132,31 +187,31 @@ def parse_path_to_route(
     """
 
     try:
-        if path in plain_routes:
-            asgi_app, handler = parse_node_handlers(node=root_node.children[path], method=method)
-            return asgi_app, handler, path, {}
-
-        if mount_paths_regex and (match := mount_paths_regex.search(path)):
-            mount_path = path[match.start() : match.end()]
-            mount_node = mount_routes[mount_path]
-            remaining_path = path[match.end() :]
-            # since we allow regular handlers under static paths, we must validate that the request does not match
-            # any such handler.
-            children = [sub_route for sub_route in mount_node.children or [] if sub_route != mount_path]
-            if not children or all(sub_route not in path for sub_route in children):  # type: ignore[operator]
-                asgi_app, handler = parse_node_handlers(node=mount_node, method=method)
-                remaining_path = remaining_path or "/"
-                if not mount_node.is_static:
-                    remaining_path = remaining_path if remaining_path.endswith("/") else f"{remaining_path}/"
-                return asgi_app, handler, remaining_path, {}
+        if resolved := resolve_plain_or_mount_route(
+            method=method,
+            mount_paths_regex=mount_paths_regex,
+            mount_routes=mount_routes,
+            path=path,
+            plain_routes=plain_routes,
+            root_node=root_node,
+        ):
+            return resolved
 
         node, path_parameters, path = traverse_route_map(
             root_node=root_node,
             path=path,
         )
-        asgi_app, handler = parse_node_handlers(node=node, method=method)
-        key = method or ("asgi" if node.is_asgi else "websocket")
-        parsed_path_parameters = parse_path_params(node.path_parameters[key], tuple(path_parameters))
+        cache_key = (id(node), method)
+        if route_cache is None or (cached := route_cache.get(cache_key)) is None:
+            asgi_app, handler = parse_node_handlers(node=node, method=method)
+            key = method or ("asgi" if node.is_asgi else "websocket")
+            parameter_definitions = node.path_parameters[key]
+            if route_cache is not None:
+                route_cache.set(cache_key, (asgi_app, handler, parameter_definitions))
+        else:
+            asgi_app, handler, parameter_definitions = cached
+
+        parsed_path_parameters = parse_path_params(parameter_definitions, tuple(path_parameters))
 
         return (
             asgi_app,
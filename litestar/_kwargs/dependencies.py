@@ -2,9 +2,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import anyio
+
+from litestar.types import Empty
 from litestar.utils.compat import async_next
+from litestar.utils.scope.state import ScopeState
 
-__all__ = ("Dependency", "create_dependency_batches", "map_dependencies_recursively", "resolve_dependency")
+__all__ = (
+    "Dependency",
+    "create_dependency_batches",
+    "create_dependency_plan",
+    "map_dependencies_recursively",
+    "resolve_dependency",
+)
 
 
 if TYPE_CHECKING:
@@ -38,6 +48,15 @@ class Dependency:
         return hash(self.key)
 
 
+class _PendingValue:
+    """Placeholder for a request scoped dependency value, which is being computed."""
+
+    __slots__ = ("event",)
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+
+
 async def resolve_dependency(
     dependency: Dependency,
     connection: ASGIConnection,
@@ -56,6 +75,39 @@ async def resolve_dependency(
         kwargs: Any kwargs to pass to the dependency, the result will be stored here as well.
         cleanup_group: DependencyCleanupGroup to which generators returned by ``dependency`` will be added
     """
+    if dependency.provide.cache_scope != "request":
+        kwargs[dependency.key] = await _call_dependency(dependency, connection, kwargs, cleanup_group)
+        return
+
+    connection_state = ScopeState.from_scope(connection.scope)
+    if connection_state.dependency_cache is Empty:
+        connection_state.dependency_cache = {}
+    request_cache = connection_state.dependency_cache
+    cache_key = dependency.provide._request_cache_key
+
+    # wait for a value computed concurrently by another provider of the same dependency
+    while isinstance(cached_value := request_cache.get(cache_key, Empty), _PendingValue):
+        await cached_value.event.wait()
+    if cached_value is not Empty:
+        kwargs[dependency.key] = cached_value
+        return
+
+    request_cache[cache_key] = pending = _PendingValue()
+    try:
+        request_cache[cache_key] = value = await _call_dependency(dependency, connection, kwargs, cleanup_group)
+    finally:
+        if request_cache.get(cache_key) is pending:
+            del request_cache[cache_key]
+        pending.event.set()
+    kwargs[dependency.key] = value
+
+
+async def _call_dependency(
+    dependency: Dependency,
+    connection: ASGIConnection,
+    kwargs: dict[str, Any],
+    cleanup_group: DependencyCleanupGroup,
+) -> Any:
     signature_model = dependency.provide.signature_model
     dependency_kwargs = (
         signature_model.parse_values_from_connection_kwargs(connection=connection, **kwargs)
@@ -71,7 +123,7 @@ async def resolve_dependency(
         cleanup_group.add(value)
         value = await async_next(value)
 
-    kwargs[dependency.key] = value
+    return value
 
 
 def create_dependency_batches(expected_dependencies: set[Dependency]) -> list[set[Dependency]]:
@@ -106,6 +158,37 @@ def create_dependency_batches(expected_dependencies: set[Dependency]) -> list[se
     return batches
 
 
+def create_dependency_plan(batches: list[set[Dependency]]) -> list[Dependency | tuple[Dependency, ...]]:
+    """Create the steps to resolve batches of dependencies in.
+
+    Dependencies of a batch that do not need to await anything, i.e. sync callables and sync generators, are resolved
+    one after another, before the remaining dependencies of the batch. Those are resolved concurrently in a task group,
+    if there is more than one of them.
+
+    Args:
+        batches: Batches of dependencies, as created by :func:`create_dependency_batches`.
+
+    Returns:
+        A list of steps, which are either a single dependency to resolve, or a tuple of dependencies to resolve
+        concurrently.
+    """
+    plan: list[Dependency | tuple[Dependency, ...]] = []
+    for batch in batches:
+        awaiting: list[Dependency] = []
+        for dependency in sorted(batch, key=lambda d: d.key):
+            provide = dependency.provide
+            if provide.has_sync_callable and not provide.has_async_generator_dependency:
+                plan.append(dependency)
+            else:
+                awaiting.append(dependency)
+
+        if len(awaiting) > 1:
+            plan.append(tuple(awaiting))
+        else:
+            plan.extend(awaiting)
+    return plan
+
+
 def map_dependencies_recursively(dependency: Dependency, dependencies_to: dict[Dependency, set[Dependency]]) -> None:
     """Recursively map dependencies to their sub dependencies.
 
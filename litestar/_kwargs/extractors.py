@@ -2,18 +2,23 @@ from __future__ import annotations
 
 from collections import defaultdict
 from functools import lru_cache, partial
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Mapping, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Coroutine, Mapping, NamedTuple, cast
 
-from litestar._multipart import parse_multipart_form
+import msgspec
+
+from litestar._multipart import parse_multipart_form_stream
 from litestar._parsers import (
     parse_query_string,
     parse_url_encoded_form_data,
 )
+from litestar._signature.model import ERR_RE
+from litestar._stream_parsers import parse_json_array_stream, parse_msgpack_array_stream, parse_ndjson_stream
+from litestar.constants import NDJSON_MEDIA_TYPE
 from litestar.datastructures import Headers
 from litestar.datastructures.upload_file import UploadFile
 from litestar.datastructures.url import URL
 from litestar.enums import ParamType, RequestEncodingType
-from litestar.exceptions import ValidationException
+from litestar.exceptions import SerializationException, ValidationException
 from litestar.params import BodyKwarg
 from litestar.types import Empty
 from litestar.utils.predicates import is_non_string_sequence
@@ -32,6 +37,7 @@ __all__ = (
     "cookies_extractor",
     "create_connection_value_extractor",
     "create_data_extractor",
+    "create_data_stream_extractor",
     "create_multipart_extractor",
     "create_query_default_dict",
     "create_url_encoded_data_extractor",
@@ -338,10 +344,12 @@ async def _extract_multipart(
     connection.scope["_form"] = form_values = (  # type: ignore[typeddict-unknown-key]
         connection.scope["_form"]  # type: ignore[typeddict-item]
         if "_form" in connection.scope
-        else parse_multipart_form(
-            body=await connection.body(),
+        else await parse_multipart_form_stream(
+            stream=connection.stream(),
             boundary=connection.content_type[-1].get("boundary", "").encode(),
             multipart_form_part_limit=multipart_form_part_limit,
+            max_spool_size=connection.app.multipart_form_spool_size,
+            max_buffer_size=connection.app.multipart_form_buffer_size,
             type_decoders=connection.route_handler.resolve_type_decoders(),
         )
     )
@@ -454,6 +462,11 @@ def create_data_extractor(kwargs_model: KwargsModel) -> Callable[[dict[str, Any]
                 is_data_optional=kwargs_model.is_data_optional,
                 data_dto=kwargs_model.expected_data_dto,
             )
+    elif kwargs_model.expected_data_stream:
+        data_extractor = create_data_stream_extractor(
+            field_definition=kwargs_model.expected_data_stream,
+            data_dto=kwargs_model.expected_data_dto,
+        )
     elif kwargs_model.expected_msgpack_data:
         data_extractor = cast(
             "Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]]", msgpack_extractor
@@ -474,6 +487,73 @@ def create_data_extractor(kwargs_model: KwargsModel) -> Callable[[dict[str, Any]
     return extractor
 
 
+async def _decode_data_stream(
+    connection: Request[Any, Any, Any], media_type: str, decode: Callable[[bytes], Any]
+) -> AsyncGenerator[Any, None]:
+    if media_type == RequestEncodingType.MESSAGEPACK:
+        items = parse_msgpack_array_stream(connection.stream())
+    elif media_type == NDJSON_MEDIA_TYPE:
+        items = parse_ndjson_stream(connection.stream())
+    else:
+        items = parse_json_array_stream(connection.stream())
+
+    index = 0
+    async for item in items:
+        try:
+            yield decode(item)
+        except (msgspec.DecodeError, SerializationException) as e:
+            # DTOs raise the msgspec error wrapped in a SerializationException
+            error = e.__cause__ if isinstance(e, SerializationException) and e.__cause__ else e
+            keys = ["data", str(index)]
+            if isinstance(error, msgspec.ValidationError) and (match := ERR_RE.search(str(error))):
+                keys.append(match.group(1))
+            message = connection.route_handler.signature_model._build_error_message(
+                keys=keys, exc_msg=str(error), connection=connection
+            )
+            raise ValidationException(
+                detail=f"Validation failed for {connection.method} {connection.url.path}", extra=[message]
+            ) from e
+        index += 1
+
+
+def create_data_stream_extractor(
+    field_definition: FieldDefinition, data_dto: type[AbstractDTO] | None
+) -> Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]]:
+    """Create an extractor for ``data`` annotated as an async iterator, decoding its items incrementally.
+
+    The body can be a JSON array, newline delimited JSON or a MessagePack array, depending on the ``media_type`` of
+    :class:`Body <.params.Body>` if set, otherwise on the request's ``Content-Type``. Each item is validated as it is
+    decoded, so only the current chunk of the body is held in memory.
+
+    Args:
+        field_definition: The field definition of ``data``.
+        data_dto: A data DTO type, if configured for handler.
+
+    Returns:
+        An extractor function.
+    """
+    item_type = field_definition.inner_types[0].annotation if field_definition.inner_types else Any
+    body_media_type: str | None = None
+    if isinstance(field_definition.kwarg_definition, BodyKwarg) and field_definition.kwarg_definition.media_type:
+        body_media_type = field_definition.kwarg_definition.media_type
+
+    async def extract_data_stream(connection: Request[Any, Any, Any]) -> AsyncGenerator[Any, None]:
+        media_type = body_media_type or connection.content_type[0]
+        decode: Callable[[bytes], Any]
+        if data_dto:
+            decode = data_dto(connection).decode_bytes
+        else:
+            decoder_type = (
+                msgspec.msgpack.Decoder if media_type == RequestEncodingType.MESSAGEPACK else msgspec.json.Decoder
+            )
+            decode = decoder_type(
+                item_type, dec_hook=connection.route_handler.default_deserializer, strict=False
+            ).decode
+        return _decode_data_stream(connection, media_type, decode)
+
+    return extract_data_stream  # type:ignore[return-value]
+
+
 def create_dto_extractor(
     data_dto: type[AbstractDTO],
 ) -> Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]]:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable
 
 from anyio import create_task_group
 
@@ -8,6 +8,7 @@ from litestar._kwargs.cleanup import DependencyCleanupGroup
 from litestar._kwargs.dependencies import (
     Dependency,
     create_dependency_batches,
+    create_dependency_plan,
     resolve_dependency,
 )
 from litestar._kwargs.extractors import (
@@ -57,8 +58,10 @@ class KwargsModel:
 
     __slots__ = (
         "dependency_batches",
+        "dependency_plan",
         "expected_cookie_params",
         "expected_data_dto",
+        "expected_data_stream",
         "expected_form_data",
         "expected_header_params",
         "expected_msgpack_data",
@@ -76,6 +79,7 @@ class KwargsModel:
         *,
         expected_cookie_params: set[ParameterDefinition],
         expected_data_dto: type[AbstractDTO] | None,
+        expected_data_stream: FieldDefinition | None = None,
         expected_dependencies: set[Dependency],
         expected_form_data: tuple[RequestEncodingType | str, FieldDefinition] | None,
         expected_header_params: set[ParameterDefinition],
@@ -90,6 +94,7 @@ class KwargsModel:
 
         Args:
             expected_cookie_params: Any expected cookie parameter kwargs
+            expected_data_stream: Any expected data kwarg annotated as an async iterator, decoded incrementally
             expected_dependencies: Any expected dependency kwargs
             expected_form_data: Any expected form data kwargs
             expected_header_params: Any expected header parameter kwargs
@@ -102,6 +107,7 @@ class KwargsModel:
             sequence_query_parameter_names: Any query parameters that are sequences
         """
         self.expected_cookie_params = expected_cookie_params
+        self.expected_data_stream = expected_data_stream
         self.expected_form_data = expected_form_data
         self.expected_header_params = expected_header_params
         self.expected_msgpack_data = expected_msgpack_data
@@ -115,6 +121,7 @@ class KwargsModel:
             expected_cookie_params
             or expected_dependencies
             or expected_form_data
+            or expected_data_stream
             or expected_msgpack_data
             or expected_header_params
             or expected_path_params
@@ -126,6 +133,7 @@ class KwargsModel:
         self.is_data_optional = is_data_optional
         self.extractors = self._create_extractors()
         self.dependency_batches = create_dependency_batches(expected_dependencies)
+        self.dependency_plan = create_dependency_plan(self.dependency_batches)
 
     def _create_extractors(self) -> list[Callable[[dict[str, Any], ASGIConnection], None]]:
         reserved_kwargs_extractors: dict[str, Callable[[dict[str, Any], ASGIConnection], None]] = {
@@ -301,6 +309,7 @@ class KwargsModel:
         sequence_query_parameter_names = {p.field_alias for p in expected_query_parameters if p.is_sequence}
 
         expected_form_data: tuple[RequestEncodingType | str, FieldDefinition] | None = None
+        expected_data_stream: FieldDefinition | None = None
         expected_msgpack_data: FieldDefinition | None = None
         expected_data_dto: type[AbstractDTO] | None = None
         data_field_definition = field_definitions.get("data")
@@ -313,6 +322,9 @@ class KwargsModel:
             if media_type in (RequestEncodingType.MULTI_PART, RequestEncodingType.URL_ENCODED):
                 expected_form_data = (media_type, data_field_definition)
                 expected_data_dto = signature_model._data_dto
+            elif data_field_definition.is_subclass_of(AsyncIterable):
+                expected_data_stream = data_field_definition
+                expected_data_dto = signature_model._data_dto
             elif signature_model._data_dto:
                 expected_data_dto = signature_model._data_dto
             elif media_type == RequestEncodingType.MESSAGEPACK:
@@ -342,6 +354,7 @@ class KwargsModel:
             if "data" in expected_reserved_kwargs and "data" in dependency_kwargs_model.expected_reserved_kwargs:
                 cls._validate_dependency_data(
                     expected_form_data=expected_form_data,
+                    expected_data_stream=expected_data_stream,
                     dependency_kwargs_model=dependency_kwargs_model,
                 )
 
@@ -352,6 +365,7 @@ class KwargsModel:
             expected_cookie_params=expected_cookie_parameters,
             expected_dependencies=expected_dependencies,
             expected_data_dto=expected_data_dto,
+            expected_data_stream=expected_data_stream,
             expected_form_data=expected_form_data,
             expected_header_params=expected_header_parameters,
             expected_msgpack_data=expected_msgpack_data,
@@ -389,13 +403,13 @@ class KwargsModel:
             kwargs: Kwargs to pass to dependencies.
         """
         cleanup_group = DependencyCleanupGroup()
-        for batch in self.dependency_batches:
-            if len(batch) == 1:
-                await resolve_dependency(next(iter(batch)), connection, kwargs, cleanup_group)
+        for step in self.dependency_plan:
+            if isinstance(step, Dependency):
+                await resolve_dependency(step, connection, kwargs, cleanup_group)
             else:
                 try:
                     async with create_task_group() as task_group:
-                        for dependency in batch:
+                        for dependency in step:
                             task_group.start_soon(resolve_dependency, dependency, connection, kwargs, cleanup_group)
                 except _ExceptionGroup as excgroup:
                     raise excgroup.exceptions[0] from excgroup  # type: ignore[attr-defined]
@@ -419,9 +433,15 @@ class KwargsModel:
     def _validate_dependency_data(
         cls,
         expected_form_data: tuple[RequestEncodingType | str, FieldDefinition] | None,
+        expected_data_stream: FieldDefinition | None,
         dependency_kwargs_model: KwargsModel,
     ) -> None:
         """Validate that the 'data' kwarg is compatible across dependencies."""
+        if bool(expected_data_stream) != bool(dependency_kwargs_model.expected_data_stream):
+            raise ImproperlyConfiguredException(
+                "Dependencies have incompatible 'data' kwarg types: one expects an async iterator and the other a "
+                "decoded body"
+            )
         if bool(expected_form_data) != bool(dependency_kwargs_model.expected_form_data):
             raise ImproperlyConfiguredException(
                 "Dependencies have incompatible 'data' kwarg types: one expects JSON and the other expects form-data"
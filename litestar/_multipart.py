@@ -28,13 +28,14 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from email.utils import decode_rfc2231
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterable
 from urllib.parse import unquote
 
+from litestar.constants import ONE_MEGABYTE
 from litestar.datastructures.upload_file import UploadFile
 from litestar.exceptions import ValidationException
 
-__all__ = ("parse_body", "parse_content_header", "parse_multipart_form")
+__all__ = ("parse_body", "parse_content_header", "parse_multipart_form", "parse_multipart_form_stream")
 
 
 if TYPE_CHECKING:
@@ -45,6 +46,13 @@ _quoted = r'"([^"]*)"'
 _param = re.compile(rf";\s*{_token}=(?:{_token}|{_quoted})", re.ASCII)
 _firefox_quote_escape = re.compile(r'\\"(?!; |\s*$)')
 
+# states of the streaming parser
+_PREAMBLE = 0
+_DELIMITER = 1
+_HEADERS = 2
+_DATA = 3
+_EPILOGUE = 4
+
 
 def parse_content_header(value: str) -> tuple[str, dict[str, str]]:
     """Parse content-type and content-disposition header values.
@@ -114,45 +122,27 @@ def parse_multipart_form(
     fields: defaultdict[str, list[Any]] = defaultdict(list)
 
     for form_part in parse_body(body=body, boundary=boundary, multipart_form_part_limit=multipart_form_part_limit):
-        file_name = None
-        content_type = "text/plain"
-        content_charset = "utf-8"
-        field_name = None
         line_index = 2
         line_end_index = 0
-        headers: list[tuple[str, str]] = []
+        header_lines: list[bytes] = []
 
         while line_end_index != -1:
             line_end_index = form_part.find(b"\r\n", line_index)
-            form_line = form_part[line_index:line_end_index].decode("utf-8")
+            form_line = form_part[line_index:line_end_index]
 
             if not form_line:
                 break
 
             line_index = line_end_index + 2
-            colon_index = form_line.index(":")
-            current_idx = colon_index + 2
-            form_header_field = form_line[:colon_index].lower()
-            form_header_value, form_parameters = parse_content_header(form_line[current_idx:])
-
-            if form_header_field == "content-disposition":
-                field_name = form_parameters.get("name")
-                file_name = form_parameters.get("filename")
+            header_lines.append(form_line)
 
-                if file_name is None and (filename_with_asterisk := form_parameters.get("filename*")):
-                    encoding, _, value = decode_rfc2231(filename_with_asterisk)
-                    file_name = unquote(value, encoding=encoding or content_charset)
-
-            elif form_header_field == "content-type":
-                content_type = form_header_value
-                content_charset = form_parameters.get("charset", "utf-8")
-            headers.append((form_header_field, form_header_value))
+        field_name, file_name, content_type, content_charset, headers = _parse_part_headers(header_lines)
 
         if field_name:
             post_data = form_part[line_index:-4].lstrip(b"\r\n")
             if file_name:
                 form_file = UploadFile(
-                    content_type=content_type, filename=file_name, file_data=post_data, headers=dict(headers)
+                    content_type=content_type, filename=file_name, file_data=post_data, headers=headers
                 )
                 fields[field_name].append(form_file)
             elif post_data:
@@ -161,3 +151,270 @@ def parse_multipart_form(
                 fields[field_name].append(None)
 
     return {k: v if len(v) > 1 else v[0] for k, v in fields.items()}
+
+
+def _parse_part_headers(header_lines: list[bytes]) -> tuple[str | None, str | None, str, str, dict[str, str]]:
+    """Parse the header lines of a form part.
+
+    Args:
+        header_lines: The raw header lines of the part.
+
+    Returns:
+        A tuple containing the field name, the file name, the content type, the charset and the headers of the part.
+    """
+    file_name = None
+    content_type = "text/plain"
+    content_charset = "utf-8"
+    field_name = None
+    headers: list[tuple[str, str]] = []
+
+    for raw_line in header_lines:
+        form_line = raw_line.decode("utf-8")
+        colon_index = form_line.index(":")
+        current_idx = colon_index + 2
+        form_header_field = form_line[:colon_index].lower()
+        form_header_value, form_parameters = parse_content_header(form_line[current_idx:])
+
+        if form_header_field == "content-disposition":
+            field_name = form_parameters.get("name")
+            file_name = form_parameters.get("filename")
+
+            if file_name is None and (filename_with_asterisk := form_parameters.get("filename*")):
+                encoding, _, value = decode_rfc2231(filename_with_asterisk)
+                file_name = unquote(value, encoding=encoding or content_charset)
+
+        elif form_header_field == "content-type":
+            content_type = form_header_value
+            content_charset = form_parameters.get("charset", "utf-8")
+        headers.append((form_header_field, form_header_value))
+
+    return field_name, file_name, content_type, content_charset, dict(headers)
+
+
+class _MultipartStreamParser:
+    """State machine parsing a multipart body fed to it in chunks."""
+
+    __slots__ = (
+        "buffer",
+        "content_charset",
+        "delimiter",
+        "field_data",
+        "field_name",
+        "fields",
+        "max_buffer_size",
+        "max_spool_size",
+        "multipart_form_part_limit",
+        "part_count",
+        "part_delimiter",
+        "state",
+        "upload_file",
+    )
+
+    def __init__(
+        self, boundary: bytes, multipart_form_part_limit: int, max_spool_size: int, max_buffer_size: int
+    ) -> None:
+        self.buffer = bytearray()
+        self.content_charset = "utf-8"
+        self.delimiter = b"--" + boundary
+        self.field_data = bytearray()
+        self.field_name: str | None = None
+        self.fields: defaultdict[str, list[Any]] = defaultdict(list)
+        self.max_buffer_size = max_buffer_size
+        self.max_spool_size = max_spool_size
+        self.multipart_form_part_limit = multipart_form_part_limit
+        self.part_count = 0
+        self.part_delimiter = b"\r\n" + self.delimiter
+        self.state = _PREAMBLE
+        self.upload_file: UploadFile | None = None
+
+    async def feed(self, chunk: bytes) -> None:
+        """Parse a chunk of the body.
+
+        Args:
+            chunk: The chunk.
+
+        Returns:
+            None
+        """
+        if self.state == _EPILOGUE:
+            return
+        self.buffer += chunk
+
+        while True:
+            if self.state == _PREAMBLE:
+                done = self._parse_preamble()
+            elif self.state == _DELIMITER:
+                done = self._parse_delimiter()
+            elif self.state == _HEADERS:
+                done = self._parse_headers()
+            elif self.state == _DATA:
+                done = await self._parse_data()
+            else:
+                done = True
+            if done:
+                return
+
+    def finish(self) -> dict[str, Any]:
+        """Finish parsing once the end of the body has been reached.
+
+        Returns:
+            A dictionary of parsed results.
+
+        Raises:
+            ValidationException: If the body ended before the closing boundary.
+        """
+        if self.state not in (_PREAMBLE, _EPILOGUE):
+            raise ValidationException("unexpected end of multipart form data")
+        return {k: v if len(v) > 1 else v[0] for k, v in self.fields.items()}
+
+    async def close(self) -> None:
+        """Close the upload files created so far.
+
+        Returns:
+            None
+        """
+        upload_files = [value for values in self.fields.values() for value in values if isinstance(value, UploadFile)]
+        if self.upload_file is not None and self.upload_file not in upload_files:
+            upload_files.append(self.upload_file)
+        for upload_file in upload_files:
+            await upload_file.close()
+
+    def _parse_preamble(self) -> bool:
+        index = self.buffer.find(self.delimiter)
+        if index == -1:
+            del self.buffer[: max(len(self.buffer) - len(self.delimiter) + 1, 0)]
+            return True
+        del self.buffer[: index + len(self.delimiter)]
+        self.state = _DELIMITER
+        return False
+
+    def _parse_delimiter(self) -> bool:
+        if len(self.buffer) < 2:
+            return True
+        if self.buffer.startswith(b"--"):
+            self.state = _EPILOGUE
+            return True
+        index = self.buffer.find(b"\r\n")
+        if index == -1:
+            return True
+        del self.buffer[: index + 2]
+        self.state = _HEADERS
+        return False
+
+    def _parse_headers(self) -> bool:
+        if self.buffer.startswith(b"\r\n"):
+            header_lines: list[bytes] = []
+            del self.buffer[:2]
+        else:
+            index = self.buffer.find(b"\r\n\r\n")
+            if index == -1:
+                if len(self.buffer) > self.max_buffer_size:
+                    raise ValidationException(
+                        f"multipart component headers exceed the maximum size of {self.max_buffer_size} bytes"
+                    )
+                return True
+            header_lines = bytes(self.buffer[:index]).split(b"\r\n")
+            del self.buffer[: index + 4]
+
+        self.part_count += 1
+        if self.part_count > self.multipart_form_part_limit:
+            raise ValidationException(
+                f"number of multipart components exceeds the allowed limit of {self.multipart_form_part_limit}, "
+                f"this potentially indicates a DoS attack"
+            )
+
+        self.field_name, file_name, content_type, self.content_charset, headers = _parse_part_headers(header_lines)
+        self.upload_file = (
+            UploadFile(
+                content_type=content_type, filename=file_name, headers=headers, max_spool_size=self.max_spool_size
+            )
+            if file_name and self.field_name
+            else None
+        )
+        self.field_data.clear()
+        self.state = _DATA
+        return False
+
+    async def _parse_data(self) -> bool:
+        buffer = self.buffer
+        index = buffer.find(self.part_delimiter)
+        end = len(buffer) - len(self.part_delimiter) + 1 if index == -1 else index
+
+        if end > 0:
+            if self.field_name:
+                await self._write_data(buffer[:end])
+            del buffer[:end]
+        if index == -1:
+            return True
+
+        del buffer[: len(self.part_delimiter)]
+        if self.field_name:
+            await self._add_field(self.field_name)
+        self.state = _DELIMITER
+        return False
+
+    async def _write_data(self, data: bytearray) -> None:
+        if self.upload_file is not None:
+            await self.upload_file.write(bytes(data))
+            return
+        self.field_data += data
+        if len(self.field_data) > self.max_buffer_size:
+            raise ValidationException(f"multipart component exceeds the maximum size of {self.max_buffer_size} bytes")
+
+    async def _add_field(self, field_name: str) -> None:
+        if self.upload_file is not None:
+            await self.upload_file.seek(0)
+            self.fields[field_name].append(self.upload_file)
+        elif self.field_data:
+            self.fields[field_name].append(self.field_data.decode(self.content_charset))
+        else:
+            self.fields[field_name].append(None)
+
+
+async def parse_multipart_form_stream(
+    stream: AsyncIterable[bytes],
+    boundary: bytes,
+    multipart_form_part_limit: int = 1000,
+    max_spool_size: int = ONE_MEGABYTE,
+    max_buffer_size: int = ONE_MEGABYTE,
+    type_decoders: TypeDecodersSequence | None = None,
+) -> dict[str, Any]:
+    """Parse multipart form data incrementally from a stream of chunks.
+
+    In contrast to :func:`parse_multipart_form`, the body is never held in memory as a whole. File parts are written
+    to their :class:`UploadFile <.datastructures.UploadFile>` as the data arrives, which rolls them over to disk once
+    they exceed ``max_spool_size``, so only the headers and the values of non-file fields are buffered in memory.
+
+    Args:
+        stream: An async iterable of body chunks, e.g. :meth:`Request.stream <.connection.Request.stream>`.
+        boundary: Boundary of the multipart message.
+        multipart_form_part_limit: Limit of the number of parts allowed.
+        max_spool_size: The size above which uploaded files will be rolled to disk.
+        max_buffer_size: The maximum size in bytes of the headers and the value of a non-file field of a part.
+        type_decoders: A sequence of type decoders to use.
+
+    Returns:
+        A dictionary of parsed results.
+
+    Raises:
+        ValidationException: If the form data is invalid or incomplete. Upload files created up to this point are
+            closed.
+    """
+    if not boundary:
+        async for _ in stream:
+            pass
+        return {}
+
+    parser = _MultipartStreamParser(
+        boundary=boundary,
+        multipart_form_part_limit=multipart_form_part_limit,
+        max_spool_size=max_spool_size,
+        max_buffer_size=max_buffer_size,
+    )
+    try:
+        async for chunk in stream:
+            await parser.feed(chunk)
+        return parser.finish()
+    except Exception:
+        await parser.close()
+        raise
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterable
 
 from litestar._openapi.schema_generation import SchemaCreator
 from litestar.enums import RequestEncodingType
+from litestar.openapi.spec.enums import OpenAPIType
 from litestar.openapi.spec.media_type import OpenAPIMediaType
 from litestar.openapi.spec.request_body import RequestBody
+from litestar.openapi.spec.schema import Schema
 from litestar.params import BodyKwarg
 
 __all__ = ("create_request_body",)
@@ -39,6 +41,8 @@ def create_request_body(
     if isinstance(data_field.kwarg_definition, BodyKwarg) and data_field.kwarg_definition.media_type:
         media_type = data_field.kwarg_definition.media_type
 
+    is_stream = data_field.is_subclass_of(AsyncIterable) and bool(data_field.inner_types)
+
     if resolved_data_dto:
         schema = resolved_data_dto.create_openapi_schema(
             field_definition=data_field,
@@ -46,6 +50,10 @@ def create_request_body(
             schema_creator=schema_creator,
         )
     else:
-        schema = schema_creator.for_field_definition(data_field)
+        schema = schema_creator.for_field_definition(data_field.inner_types[0] if is_stream else data_field)
+
+    if is_stream:
+        # the items of streamed data are sent as an array
+        schema = Schema(type=OpenAPIType.ARRAY, items=schema)
 
     return RequestBody(required=True, content={media_type: OpenAPIMediaType(schema=schema)})
@@ -19,6 +19,7 @@ from litestar.openapi.spec.media_type import OpenAPIMediaType
 from litestar.openapi.spec.schema import Schema
 from litestar.response import (
     File,
+    JSONStream,
     Redirect,
     Stream,
     Template,
@@ -149,6 +150,10 @@ class ResponseFactory:
 
                 result = self.schema_creator.for_field_definition(field_def)
 
+            if self.field_definition.is_subclass_of(JSONStream):
+                result = Schema(type=OpenAPIType.ARRAY, items=result)
+                media_type = media_type or MediaType.JSON
+
             schema = (
                 result if isinstance(result, Schema) else self.context.schema_registry.from_reference(result).schema
             )
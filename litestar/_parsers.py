@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from collections import defaultdict
 from functools import lru_cache
 from http.cookies import _unquote as unquote_cookie
@@ -14,7 +15,15 @@ except ImportError:
         return _parse_qsl(qs.decode("latin-1"), keep_blank_values=True, separator=separator)
 
 
-__all__ = ("parse_cookie_string", "parse_query_string", "parse_url_encoded_form_data")
+__all__ = (
+    "parse_accept_encoding_header",
+    "parse_cookie_string",
+    "parse_query_string",
+    "parse_range_header",
+    "parse_url_encoded_form_data",
+)
+
+_BYTE_RANGE_SPEC_RE = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$", re.ASCII)
 
 
 @lru_cache(1024)
@@ -65,3 +74,85 @@ def parse_cookie_string(cookie_string: str) -> dict[str, str]:
         )
     }
     return output
+
+
+@lru_cache(1024)
+def parse_accept_encoding_header(accept_encoding: str) -> dict[str, float]:
+    """Parse the value of an ``Accept-Encoding`` header into a dictionary of content codings and their quality values.
+
+    Args:
+        accept_encoding: The ``Accept-Encoding`` header value.
+
+    Returns:
+        A dictionary mapping lower cased content codings to their quality values
+    """
+    qualities: dict[str, float] = {}
+    for element in accept_encoding.split(","):
+        coding, _, params = element.partition(";")
+        if not (coding := coding.strip().lower()):
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+                quality = min(quality, 1.0) if quality > 0 else 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def parse_range_header(value: str, size: int) -> list[tuple[int, int]] | None:
+    """Parse the value of a ``Range`` header into a list of byte ranges of a resource.
+
+    Args:
+        value: The ``Range`` header value.
+        size: The size of the resource in bytes.
+
+    Returns:
+        A sorted list of inclusive ``(start, end)`` tuples, in which overlapping and adjacent ranges are merged. The
+        list is empty if none of the ranges can be satisfied. ``None`` if the header is not a valid byte range header,
+        in which case it should be ignored.
+    """
+    unit, _, range_set = value.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    has_range_spec = False
+    for range_spec in range_set.split(","):
+        if not range_spec.strip():
+            continue
+        if not (match := _BYTE_RANGE_SPEC_RE.match(range_spec)):
+            return None
+
+        has_range_spec = True
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            if last and int(last) < start:
+                return None
+            end = min(int(last), size - 1) if last else size - 1
+        elif last:
+            # a suffix range, selecting the last bytes of the resource
+            start, end = max(size - int(last), 0), size - 1
+        else:
+            return None
+
+        if start < size and start <= end:
+            ranges.append((start, end))
+
+    if not has_range_spec:
+        return None
+
+    ranges.sort()
+    merged: list[tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
@@ -7,6 +7,7 @@ from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
     Callable,
     ClassVar,
     Dict,
@@ -14,10 +15,13 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     TypedDict,
     Union,
     cast,
+    get_args,
+    get_origin,
 )
 from uuid import UUID
 
@@ -81,6 +85,33 @@ DEFAULT_TYPE_DECODERS = [
 ]
 
 
+def _get_passthrough_types(annotation: Any) -> Optional[Tuple[type, ...]] | Literal[False]:
+    """Get the types of values that can be passed through for a field of a signature model without being converted.
+
+    Values of these exact types would be returned unchanged by :func:`msgspec.convert`, so converting them can be
+    skipped.
+
+    Args:
+        annotation: The annotation of the signature model field.
+
+    Returns:
+        ``None`` if any value can be passed through, a tuple of types, or ``False`` if values always have to be
+        converted.
+    """
+    if annotation is Any:
+        return None
+
+    if isinstance(annotation, type):
+        return (annotation,)
+
+    if get_origin(annotation) is Union:
+        args = get_args(annotation)
+        if all(isinstance(arg, type) for arg in args):
+            return args
+
+    return False
+
+
 def _deserializer(target_type: Any, value: Any, default_deserializer: Callable[[Any, Any], Any]) -> Any:
     if isinstance(value, DTOData):
         return value
@@ -100,6 +131,7 @@ class SignatureModel(Struct):
     _data_dto: ClassVar[Optional[Type[AbstractDTO]]]
     _dependency_name_set: ClassVar[Set[str]]
     _fields: ClassVar[Dict[str, FieldDefinition]]
+    _passthrough_types: ClassVar[Dict[str, Union[Optional[Tuple[type, ...]], Literal[False]]]]
     _return_annotation: ClassVar[Any]
 
     @classmethod
@@ -188,6 +220,36 @@ class SignatureModel(Struct):
         Returns:
             A dictionary of parsed values
         """
+        deserializer: Callable[[Any, Any], Any] | None = None
+        values: dict[str, Any] = {}
+        for field_name, passthrough_types in cls._passthrough_types.items():
+            if field_name not in kwargs:
+                # let the signature model apply defaults or report the missing value
+                break
+
+            value = kwargs[field_name]
+            if passthrough_types is None or (passthrough_types and type(value) in passthrough_types):
+                values[field_name] = value
+                continue
+
+            if deserializer is None:
+                deserializer = partial(
+                    _deserializer, default_deserializer=connection.route_handler.default_deserializer
+                )
+            try:
+                values[field_name] = convert(
+                    value, cls.__annotations__[field_name], strict=False, dec_hook=deserializer, str_keys=True
+                )
+            except (ValidationError, ExtendedMsgSpecValidationError):
+                # let the signature model collect all validation errors
+                break
+        else:
+            return values
+
+        return cls._convert_with_model(connection, kwargs)
+
+    @classmethod
+    def _convert_with_model(cls, connection: ASGIConnection, kwargs: dict[str, Any]) -> dict[str, Any]:
         messages: list[ErrorMessage] = []
         deserializer = partial(_deserializer, default_deserializer=connection.route_handler.default_deserializer)
         try:
@@ -232,6 +294,7 @@ class SignatureModel(Struct):
         )
 
         struct_fields: list[tuple[str, Any, Any]] = []
+        passthrough_types: dict[str, Optional[Tuple[type, ...]] | Literal[False]] = {}
 
         for field_definition in parsed_signature.parameters.values():
             meta_data: Meta | None = None
@@ -262,6 +325,7 @@ class SignatureModel(Struct):
 
             default = field_definition.default if field_definition.has_default else NODEFAULT
             struct_fields.append((field_definition.name, annotation, default))
+            passthrough_types[field_definition.name] = _get_passthrough_types(annotation)
 
         return defstruct(  # type:ignore[return-value]
             f"{fn_name}_signature_model",
@@ -272,6 +336,7 @@ class SignatureModel(Struct):
                 "_return_annotation": parsed_signature.return_type.annotation,
                 "_dependency_name_set": dependency_names,
                 "_fields": parsed_signature.parameters,
+                "_passthrough_types": passthrough_types,
                 "_data_dto": data_dto,
             },
             kw_only=True,
@@ -285,8 +350,9 @@ class SignatureModel(Struct):
         meta_data: Meta | None = None,
         data_dto: type[AbstractDTO] | None = None,
     ) -> Any:
-        # DTOs have already validated their data, so we can just use Any here
-        if field_definition.name == "data" and data_dto:
+        # DTOs have already validated their data, and the items of streamed data are validated as they are decoded, so
+        # we can just use Any here
+        if field_definition.name == "data" and (data_dto or field_definition.is_subclass_of(AsyncIterable)):
             return Any
 
         annotation = _normalize_annotation(field_definition=field_definition)
@@ -0,0 +1,382 @@
+"""Incremental parsers splitting a request body stream of JSON, NDJSON or MessagePack items into the raw bytes of
+the individual items, so they can be decoded one at a time without holding the whole body in memory.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import AsyncGenerator, AsyncIterable
+
+from litestar.exceptions import ValidationException
+
+__all__ = ("parse_json_array_stream", "parse_msgpack_array_stream", "parse_ndjson_stream")
+
+# the regular expressions below use "unrolled loops", which match runs of characters at once and backtrack in linear
+# time if the buffer ends in the middle of a value
+_JSON_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+# whitespace, scalars and complete strings, up to the next bracket, comma or incomplete string
+_JSON_TOP_LEVEL = rb'[^"\[\]{},]*(?:' + _JSON_STRING + rb'[^"\[\]{},]*)*'
+# same as above, but including commas, as they only matter outside of nested containers
+_JSON_NESTED = rb'[^"\[\]{}]*(?:' + _JSON_STRING + rb'[^"\[\]{}]*)*'
+
+# the rest of a string, up to the closing quote
+_JSON_STRING_REST_RE = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_JSON_TOP_LEVEL_RE = re.compile(_JSON_TOP_LEVEL, re.DOTALL)
+_JSON_NESTED_RE = re.compile(_JSON_NESTED, re.DOTALL)
+# an item without nested containers followed by a comma, which covers most items and is matched in one go
+_JSON_FLAT_ITEM_RE = re.compile(
+    rb"\s*((?=[^\[\]{},\s])" + _JSON_TOP_LEVEL + rb"|\{" + _JSON_NESTED + rb"\}|\[" + _JSON_NESTED + rb"\]),",
+    re.DOTALL,
+)
+
+_QUOTE = ord('"')
+_OPEN = frozenset(b"[{")
+_CLOSE = frozenset(b"]}")
+_COMMA = ord(",")
+_ARRAY_START = ord("[")
+_ARRAY_END = ord("]")
+
+# MessagePack formats, see https://github.com/msgpack/msgpack/blob/master/spec.md#formats
+# format byte -> size of the object following the format byte
+_MSGPACK_FIXED_SIZE = {
+    0xC0: 0,
+    0xC2: 0,
+    0xC3: 0,
+    0xCA: 4,
+    0xCB: 8,
+    0xCC: 1,
+    0xCD: 2,
+    0xCE: 4,
+    0xCF: 8,
+    0xD0: 1,
+    0xD1: 2,
+    0xD2: 4,
+    0xD3: 8,
+    0xD4: 2,
+    0xD5: 3,
+    0xD6: 5,
+    0xD7: 9,
+    0xD8: 17,
+}
+# format byte -> (size of the length field, number of bytes between the length field and the payload)
+_MSGPACK_VARIABLE_SIZE = {
+    0xC4: (1, 0),
+    0xC5: (2, 0),
+    0xC6: (4, 0),
+    0xC7: (1, 1),
+    0xC8: (2, 1),
+    0xC9: (4, 1),
+    0xD9: (1, 0),
+    0xDA: (2, 0),
+    0xDB: (4, 0),
+}
+# format byte -> (size of the length field, number of objects per counted element)
+_MSGPACK_CONTAINERS = {
+    0xDC: (2, 1),
+    0xDD: (4, 1),
+    0xDE: (2, 2),
+    0xDF: (4, 2),
+}
+
+
+def _invalid_body(message: str) -> ValidationException:
+    return ValidationException(f"Invalid request body: {message}")
+
+
+async def parse_ndjson_stream(stream: AsyncIterable[bytes]) -> AsyncGenerator[bytes, None]:
+    """Split a stream of newline delimited JSON into its items.
+
+    Args:
+        stream: An async iterable of body chunks, e.g. :meth:`Request.stream <.connection.Request.stream>`.
+
+    Yields:
+        The raw bytes of each item. Blank lines are skipped.
+    """
+    buffer = bytearray()
+    async for chunk in stream:
+        start = 0
+        buffer += chunk
+        while (end := buffer.find(b"\n", start)) != -1:
+            if line := buffer[start:end].strip():
+                yield bytes(line)
+            start = end + 1
+        del buffer[:start]
+
+    if line := buffer.strip():
+        yield bytes(line)
+
+
+def _skip_json_string_rest(buffer: bytearray, pos: int) -> tuple[int, bool]:
+    """Skip the rest of a JSON string, which started in a previous chunk.
+
+    Args:
+        buffer: The buffer holding the string.
+        pos: The position in the string to continue from.
+
+    Returns:
+        A tuple of the position after the string, or the position to continue from once more data is available, and
+        whether the string is complete.
+    """
+    pos = _JSON_STRING_REST_RE.match(buffer, pos).end()  # type: ignore[union-attr]
+    if pos < len(buffer) and buffer[pos] == _QUOTE:
+        return pos + 1, True
+    return pos, False
+
+
+class _JSONArrayScanner:
+    """Scanner finding the items of a JSON array, which is fed to it in chunks."""
+
+    __slots__ = ("buffer", "depth", "finished", "has_items", "in_string", "pos", "start", "started")
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.started = self.finished = self.has_items = self.in_string = False
+        self.depth = 0
+        # start of the current item and position of the scan in the buffer
+        self.start = self.pos = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Scan a chunk of the array.
+
+        Args:
+            chunk: The chunk.
+
+        Returns:
+            The raw bytes of the items completed by the chunk.
+        """
+        self.buffer += chunk
+
+        if self.finished:
+            if self.buffer.strip():
+                raise _invalid_body("unexpected data after the end of the JSON array")
+            self.buffer.clear()
+            return []
+
+        if not self.started and not self._start():
+            return []
+
+        items: list[bytes] = []
+        self._scan(items)
+        if self.start:
+            del self.buffer[: self.start]
+            self.pos -= self.start
+            self.start = 0
+        return items
+
+    def finish(self) -> None:
+        """Check that the array is complete once the end of the stream has been reached.
+
+        Returns:
+            None
+        """
+        if self.started and not self.finished:
+            raise _invalid_body("unexpected end of JSON array")
+
+    def _start(self) -> bool:
+        if not (stripped := self.buffer.lstrip()):
+            self.buffer.clear()
+            return False
+        if stripped[0] != _ARRAY_START:
+            raise _invalid_body("expected a JSON array")
+        del self.buffer[: len(self.buffer) - len(stripped) + 1]
+        self.started = True
+        return True
+
+    def _scan(self, items: list[bytes]) -> None:
+        buffer = self.buffer
+        depth, in_string, pos, start = self.depth, self.in_string, self.pos, self.start
+
+        while True:
+            if not depth and pos == start:
+                pos = start = self._scan_flat_items(pos, items)
+
+            if in_string:
+                pos, complete = _skip_json_string_rest(buffer, pos)
+                if not complete:
+                    # wait for the rest of the string
+                    break
+                in_string = False
+
+            pos = (_JSON_NESTED_RE if depth else _JSON_TOP_LEVEL_RE).match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer):
+                break
+
+            char = buffer[pos]
+            pos += 1
+            if char == _QUOTE:
+                # a string continuing in the next chunk
+                in_string = True
+            elif char in _OPEN:
+                depth += 1
+            elif depth:
+                # inside of nested containers, the scan only stops at quotes and brackets
+                depth -= 1
+            elif self._end_item(start, pos - 1, char, items):
+                return
+            else:
+                start = pos
+
+        self.depth, self.in_string, self.pos, self.start = depth, in_string, pos, start
+
+    def _scan_flat_items(self, pos: int, items: list[bytes]) -> int:
+        while match := _JSON_FLAT_ITEM_RE.match(self.buffer, pos):
+            self.has_items = True
+            items.append(bytes(match.group(1)))
+            pos = match.end()
+        return pos
+
+    def _end_item(self, start: int, end: int, char: int, items: list[bytes]) -> bool:
+        """Handle a comma or closing bracket on the top level of the array.
+
+        Returns:
+            Whether the end of the array has been reached.
+        """
+        item = self.buffer[start:end].strip()
+        if char == _COMMA:
+            if not item:
+                raise _invalid_body("unexpected ',' in JSON array")
+            self.has_items = True
+            items.append(bytes(item))
+            return False
+
+        if char != _ARRAY_END:
+            raise _invalid_body("unexpected '}' in JSON array")
+        if item:
+            items.append(bytes(item))
+        elif self.has_items:
+            raise _invalid_body("unexpected ']' in JSON array")
+        if self.buffer[end + 1 :].strip():
+            raise _invalid_body("unexpected data after the end of the JSON array")
+        self.finished = True
+        self.buffer.clear()
+        self.depth = self.pos = self.start = 0
+        return True
+
+
+async def parse_json_array_stream(stream: AsyncIterable[bytes]) -> AsyncGenerator[bytes, None]:
+    """Split a stream holding a JSON array into its items.
+
+    Only the structure of the array is checked here, the items themselves are validated when they are decoded.
+
+    Args:
+        stream: An async iterable of body chunks, e.g. :meth:`Request.stream <.connection.Request.stream>`.
+
+    Yields:
+        The raw bytes of each item.
+
+    Raises:
+        ValidationException: If the body is not a JSON array.
+    """
+    scanner = _JSONArrayScanner()
+    async for chunk in stream:
+        for item in scanner.feed(chunk):
+            yield item
+    scanner.finish()
+
+
+def _skip_msgpack_objects(buffer: bytearray, pos: int, count: int) -> tuple[int, int]:
+    """Skip ``count`` consecutive MessagePack objects, including the objects nested in them.
+
+    Args:
+        buffer: The buffer holding the objects.
+        pos: The position of the first object in the buffer.
+        count: The number of objects to skip.
+
+    Returns:
+        A tuple of the position of the first object not skipped and the number of objects left to skip, which is
+        ``0`` if all objects were complete.
+    """
+    size = len(buffer)
+    while count and pos < size:
+        byte = buffer[pos]
+        end = pos + 1
+        nested = 0
+        if byte <= 0x7F or byte >= 0xE0:
+            pass
+        elif byte <= 0x8F:
+            nested = (byte & 0x0F) * 2
+        elif byte <= 0x9F:
+            nested = byte & 0x0F
+        elif byte <= 0xBF:
+            end += byte & 0x1F
+        elif byte in _MSGPACK_FIXED_SIZE:
+            end += _MSGPACK_FIXED_SIZE[byte]
+        elif byte in _MSGPACK_VARIABLE_SIZE:
+            length_size, extra = _MSGPACK_VARIABLE_SIZE[byte]
+            if end + length_size > size:
+                break
+            end += length_size + extra + int.from_bytes(buffer[end : end + length_size], "big")
+        elif byte in _MSGPACK_CONTAINERS:
+            length_size, objects = _MSGPACK_CONTAINERS[byte]
+            if end + length_size > size:
+                break
+            nested = int.from_bytes(buffer[end : end + length_size], "big") * objects
+            end += length_size
+        else:
+            raise _invalid_body(f"invalid MessagePack format byte {byte:#x}")
+
+        if end > size:
+            break
+        pos = end
+        count += nested - 1
+
+    return pos, count
+
+
+async def parse_msgpack_array_stream(stream: AsyncIterable[bytes]) -> AsyncGenerator[bytes, None]:
+    """Split a stream holding a MessagePack array into its items.
+
+    Only the structure of the array is checked here, the items themselves are validated when they are decoded.
+
+    Args:
+        stream: An async iterable of body chunks, e.g. :meth:`Request.stream <.connection.Request.stream>`.
+
+    Yields:
+        The raw bytes of each item.
+
+    Raises:
+        ValidationException: If the body is not a MessagePack array.
+    """
+    buffer = bytearray()
+    # number of items left, and position and number of objects left to skip in the current item
+    remaining: int | None = None
+    pos = 0
+    objects = 1
+
+    async for chunk in stream:
+        buffer += chunk
+
+        if remaining is None:
+            if not buffer:
+                continue
+            header = buffer[0]
+            if 0x90 <= header <= 0x9F:
+                remaining = header & 0x0F
+                del buffer[:1]
+            elif header in (0xDC, 0xDD):
+                length_size = 2 if header == 0xDC else 4
+                if len(buffer) < length_size + 1:
+                    continue
+                remaining = int.from_bytes(buffer[1 : length_size + 1], "big")
+                del buffer[: length_size + 1]
+            else:
+                raise _invalid_body("expected a MessagePack array")
+
+        start = 0
+        while remaining:
+            pos, objects = _skip_msgpack_objects(buffer, pos, objects)
+            if objects:
+                # wait for the rest of the item
+                break
+            yield bytes(buffer[start:pos])
+            remaining -= 1
+            start = pos
+            objects = 1
+        del buffer[:start]
+        pos -= start
+
+        if not remaining and buffer:
+            raise _invalid_body("unexpected data after the end of the MessagePack array")
+
+    if remaining:
+        raise _invalid_body("unexpected end of MessagePack array")
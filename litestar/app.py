@@ -20,9 +20,11 @@ from litestar._asgi.utils import get_route_handlers, wrap_in_exception_handler
 from litestar._openapi.plugin import OpenAPIPlugin
 from litestar._openapi.schema_generation import openapi_schema_plugins
 from litestar.config.allowed_hosts import AllowedHostsConfig
-from litestar.config.app import AppConfig
+from litestar.config.app import AppConfig, ExperimentalFeatures
 from litestar.config.response_cache import ResponseCacheConfig
+from litestar.config.route_cache import RouteCacheConfig
 from litestar.connection import Request, WebSocket
+from litestar.constants import ONE_MEGABYTE
 from litestar.datastructures.state import State
 from litestar.events.emitter import BaseEventEmitterBackend, SimpleEventEmitter
 from litestar.exceptions import (
@@ -55,7 +57,6 @@ from litestar.utils.warnings import warn_pdb_on_exception
 if TYPE_CHECKING:
     from typing_extensions import Self
 
-    from litestar.config.app import ExperimentalFeatures
     from litestar.config.compression import CompressionConfig
     from litestar.config.cors import CORSConfig
     from litestar.config.csrf import CSRFConfig
@@ -153,12 +154,15 @@ class Litestar(Router):
         "include_in_schema",
         "logger",
         "logging_config",
+        "multipart_form_buffer_size",
         "multipart_form_part_limit",
+        "multipart_form_spool_size",
         "on_shutdown",
         "on_startup",
         "openapi_config",
         "request_class",
         "response_cache_config",
+        "route_cache_config",
         "route_map",
         "signature_namespace",
         "state",
@@ -187,14 +191,17 @@ class Litestar(Router):
         debug: bool | None = None,
         dependencies: Dependencies | None = None,
         etag: ETag | None = None,
-        event_emitter_backend: type[BaseEventEmitterBackend] = SimpleEventEmitter,
+        event_emitter_backend: type[BaseEventEmitterBackend]
+        | Callable[..., BaseEventEmitterBackend] = SimpleEventEmitter,
         exception_handlers: ExceptionHandlersMap | None = None,
         guards: Sequence[Guard] | None = None,
         include_in_schema: bool | EmptyType = Empty,
         listeners: Sequence[EventListener] | None = None,
         logging_config: BaseLoggingConfig | EmptyType | None = Empty,
         middleware: Sequence[Middleware] | None = None,
+        multipart_form_buffer_size: int = ONE_MEGABYTE,
         multipart_form_part_limit: int = 1000,
+        multipart_form_spool_size: int = ONE_MEGABYTE,
         on_app_init: Sequence[OnAppInitHandler] | None = None,
         on_shutdown: Sequence[LifespanHook] | None = None,
         on_startup: Sequence[LifespanHook] | None = None,
@@ -208,6 +215,7 @@ class Litestar(Router):
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
         return_dto: type[AbstractDTO] | None | EmptyType = Empty,
+        route_cache_config: RouteCacheConfig | None = None,
         security: Sequence[SecurityRequirement] | None = None,
         signature_namespace: Mapping[str, Any] | None = None,
         signature_types: Sequence[Any] | None = None,
@@ -256,7 +264,8 @@ class Litestar(Router):
             etag: An ``etag`` header of type :class:`ETag <.datastructures.ETag>` to add to route handlers of this app.
                 Can be overridden by route handlers.
             event_emitter_backend: A subclass of
-                :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`.
+                :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`, or a callable
+                returning an instance of one, receiving the listeners as the ``listeners`` keyword argument.
             exception_handlers: A mapping of status codes and/or exception types to handler functions.
             guards: A sequence of :class:`Guard <.types.Guard>` callables.
             include_in_schema: A boolean flag dictating whether  the route handler should be documented in the OpenAPI schema.
@@ -264,8 +273,12 @@ class Litestar(Router):
             listeners: A sequence of :class:`EventListener <.events.listener.EventListener>`.
             logging_config: A subclass of :class:`BaseLoggingConfig <.logging.config.BaseLoggingConfig>`.
             middleware: A sequence of :class:`Middleware <.types.Middleware>`.
+            multipart_form_buffer_size: The maximal size in bytes of the headers and of non-file field values of a
+                multipart/formdata request part, which are buffered in memory.
             multipart_form_part_limit: The maximal number of allowed parts in a multipart/formdata request. This limit
                 is intended to protect from DoS attacks.
+            multipart_form_spool_size: The size in bytes above which files uploaded in a multipart/formdata request are
+                rolled over to disk.
             on_app_init: A sequence of :class:`OnAppInitHandler <.types.OnAppInitHandler>` instances. Handlers receive
                 an instance of :class:`AppConfig <.config.app.AppConfig>` that will have been initially populated with
                 the parameters passed to :class:`Litestar <litestar.app.Litestar>`, and must return an instance of same.
@@ -290,6 +303,7 @@ class Litestar(Router):
             response_cache_config: Configures caching behavior of the application.
             return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
                 outbound response data.
+            route_cache_config: Configures the cache used to resolve requests to route handlers.
             route_handlers: A sequence of route handlers, which can include instances of
                 :class:`Router <.router.Router>`, subclasses of :class:`Controller <.controller.Controller>` or any
                 callable decorated by the route handler decorators.
@@ -348,7 +362,9 @@ class Litestar(Router):
             listeners=list(listeners or []),
             logging_config=logging_config,
             middleware=list(middleware or []),
+            multipart_form_buffer_size=multipart_form_buffer_size,
             multipart_form_part_limit=multipart_form_part_limit,
+            multipart_form_spool_size=multipart_form_spool_size,
             on_shutdown=list(on_shutdown or []),
             on_startup=list(on_startup or []),
             openapi_config=openapi_config,
@@ -362,6 +378,7 @@ class Litestar(Router):
             response_cookies=response_cookies or [],
             response_headers=response_headers or [],
             return_dto=return_dto,
+            route_cache_config=route_cache_config or RouteCacheConfig(),
             route_handlers=list(route_handlers) if route_handlers is not None else [],
             security=list(security or []),
             signature_namespace=dict(signature_namespace or {}),
@@ -399,7 +416,10 @@ class Litestar(Router):
         self.get_logger: GetLogger = get_logger_placeholder
         self.logger: Logger | None = None
         self.routes: list[HTTPRoute | ASGIRoute | WebSocketRoute] = []
-        self.asgi_router = ASGIRouter(app=self)
+        self.route_cache_config = config.route_cache_config
+        self.asgi_router = ASGIRouter(
+            app=self, compiled_routing=ExperimentalFeatures.COMPILED_ROUTING in self.experimental_features
+        )
 
         self.after_exception = [ensure_async_callable(h) for h in config.after_exception]
         self.allowed_hosts = cast("AllowedHostsConfig | None", config.allowed_hosts)
@@ -409,7 +429,9 @@ class Litestar(Router):
         self.csrf_config = config.csrf_config
         self.event_emitter = config.event_emitter_backend(listeners=config.listeners)
         self.logging_config = config.logging_config
+        self.multipart_form_buffer_size = config.multipart_form_buffer_size
         self.multipart_form_part_limit = config.multipart_form_part_limit
+        self.multipart_form_spool_size = config.multipart_form_spool_size
         self.on_shutdown = config.on_shutdown
         self.on_startup = config.on_startup
         self.openapi_config = config.openapi_config
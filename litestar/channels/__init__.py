@@ -1,5 +1,5 @@
 from .backends.base import ChannelsBackend
-from .plugin import ChannelsPlugin
-from .subscriber import Subscriber
+from .plugin import ChannelsMetrics, ChannelsPlugin
+from .subscriber import Subscriber, SubscriberMetrics
 
-__all__ = ("ChannelsPlugin", "ChannelsBackend", "Subscriber")
+__all__ = ("ChannelsPlugin", "ChannelsBackend", "ChannelsMetrics", "Subscriber", "SubscriberMetrics")
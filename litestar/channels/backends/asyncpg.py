@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from contextlib import AsyncExitStack
 from functools import partial
-from typing import AsyncGenerator, Awaitable, Callable, Iterable, overload
+from typing import AsyncGenerator, Awaitable, Callable, Iterable, Sequence, overload
 
 import asyncpg
 
@@ -47,15 +47,20 @@ class AsyncPgChannelsBackend(ChannelsBackend):
         self._queue = None
 
     async def publish(self, data: bytes, channels: Iterable[str]) -> None:
+        await self.publish_many([(data, channels)])
+
+    async def publish_many(self, messages: Sequence[tuple[bytes, Iterable[str]]]) -> None:
         if self._queue is None:
             raise RuntimeError("Backend not yet initialized. Did you forget to call on_startup?")
 
-        dec_data = data.decode("utf-8")
+        notifications: list[tuple[str, str]] = []
+        for data, channels in messages:
+            dec_data = data.decode("utf-8")
+            notifications.extend((channel, dec_data) for channel in channels)
 
         conn = await self._connect()
         try:
-            for channel in channels:
-                await conn.execute("SELECT pg_notify($1, $2);", channel, dec_data)
+            await conn.executemany("SELECT pg_notify($1, $2);", notifications)
         finally:
             await conn.close()
 
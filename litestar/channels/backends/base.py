@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Iterable
+from typing import AsyncGenerator, Iterable, Sequence
 
 
 class ChannelsBackend(ABC):
@@ -20,6 +20,15 @@ class ChannelsBackend(ABC):
         """Publish the message ``data`` to all ``channels``"""
         ...
 
+    async def publish_many(self, messages: Sequence[tuple[bytes, Iterable[str]]]) -> None:
+        """Publish multiple messages, each given as a tuple of ``data`` and ``channels``.
+
+        Backends should override this to publish all messages with as few round trips as possible. The default
+        implementation calls :meth:`publish` for every message.
+        """
+        for data, channels in messages:
+            await self.publish(data, channels)
+
     @abstractmethod
     async def subscribe(self, channels: Iterable[str]) -> None:
         """Start listening for events on ``channels``"""
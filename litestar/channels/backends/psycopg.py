@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import AsyncExitStack
-from typing import AsyncGenerator, Iterable
+from typing import AsyncGenerator, Iterable, Sequence
 
 import psycopg
 
@@ -28,10 +28,15 @@ class PsycoPgChannelsBackend(ChannelsBackend):
         await self._exit_stack.aclose()
 
     async def publish(self, data: bytes, channels: Iterable[str]) -> None:
-        dec_data = data.decode("utf-8")
-        async with await psycopg.AsyncConnection.connect(self._pg_dsn) as conn:
-            for channel in channels:
-                await conn.execute("SELECT pg_notify(%s, %s);", (channel, dec_data))
+        await self.publish_many([(data, channels)])
+
+    async def publish_many(self, messages: Sequence[tuple[bytes, Iterable[str]]]) -> None:
+        notifications: list[tuple[str, str]] = []
+        for data, channels in messages:
+            dec_data = data.decode("utf-8")
+            notifications.extend((channel, dec_data) for channel in channels)
+        async with await psycopg.AsyncConnection.connect(self._pg_dsn) as conn, conn.cursor() as cursor:
+            await cursor.executemany("SELECT pg_notify(%s, %s);", notifications)
 
     async def subscribe(self, channels: Iterable[str]) -> None:
         for channel in set(channels) - self._subscribed_channels:
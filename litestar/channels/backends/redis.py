@@ -9,7 +9,7 @@ else:
     import importlib.resources as importlib_resources
 from abc import ABC
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable, cast
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable, Sequence, cast
 
 from litestar.channels.backends.base import ChannelsBackend
 
@@ -126,6 +126,17 @@ class RedisChannelsPubSubBackend(RedisChannelsBackend):
         """
         await self._publish_script(keys=list(set(channels)), args=[data])
 
+    async def publish_many(self, messages: Sequence[tuple[bytes, Iterable[str]]]) -> None:
+        """Publish multiple messages, each given as a tuple of ``data`` and ``channels``.
+
+        .. note::
+            All messages are sent in a single pipeline. Each message is published atomically, using a lua script
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for data, channels in messages:
+                await self._publish_script(keys=list(set(channels)), args=[data], client=pipe)
+            await pipe.execute()
+
     async def stream_events(self) -> AsyncGenerator[tuple[str, Any], None]:
         """Return a generator, iterating over events of subscribed channels as they become available.
 
@@ -214,17 +225,31 @@ class RedisChannelsStreamBackend(RedisChannelsBackend):
         .. note::
             This operation is performed atomically, using a Lua script
         """
+        await self._publish_script(**self._make_publish_script_args(data, channels))
+
+    async def publish_many(self, messages: Sequence[tuple[bytes, Iterable[str]]]) -> None:
+        """Publish multiple messages, each given as a tuple of ``data`` and ``channels``.
+
+        .. note::
+            All messages are sent in a single pipeline. Each message is published atomically, using a Lua script
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for data, channels in messages:
+                await self._publish_script(**self._make_publish_script_args(data, channels), client=pipe)
+            await pipe.execute()
+
+    def _make_publish_script_args(self, data: bytes, channels: Iterable[str]) -> dict[str, list[Any]]:
         channels = set(channels)
-        await self._publish_script(
-            keys=[self._make_key(key) for key in channels],
-            args=[
+        return {
+            "keys": [self._make_key(key) for key in channels],
+            "args": [
                 data,
                 self._history_limit,
                 self._stream_ttl,
                 int(self._cap_streams_approximate),
                 *channels,
             ],
-        )
+        }
 
     async def _get_subscribed_channels(self) -> set[str]:
         """Get subscribed channels. If no channels are currently subscribed, wait"""
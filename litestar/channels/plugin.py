@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 from asyncio import CancelledError, Queue, Task, create_task
+from collections import OrderedDict
 from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
+from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING, AsyncGenerator, Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, Iterable
 
 import msgspec.json
 
@@ -13,6 +15,8 @@ from litestar.exceptions import ImproperlyConfiguredException, LitestarException
 from litestar.handlers import WebsocketRouteHandler
 from litestar.plugins import InitPluginProtocol
 from litestar.serialization import default_serializer
+from litestar.status_codes import WS_1013_TRY_AGAIN_LATER
+from litestar.utils.sync import ensure_async_callable
 
 from .subscriber import BacklogStrategy, EventCallback, Subscriber
 
@@ -23,13 +27,33 @@ if TYPE_CHECKING:
     from litestar.config.app import AppConfig
     from litestar.connection import WebSocket
     from litestar.types import LitestarEncodableType, TypeEncodersMap
-    from litestar.types.asgi_types import WebSocketMode
+    from litestar.types.asgi_types import WebSocketMode, WebSocketSendEvent
 
 
 class ChannelsException(LitestarException):
     pass
 
 
+@dataclass(frozen=True)
+class ChannelsMetrics:
+    """Aggregated metrics of all subscribers of a :class:`ChannelsPlugin`."""
+
+    subscribers: int
+    """Amount of active subscribers."""
+    queued: int
+    """Amount of events waiting in the streams of active subscribers."""
+    max_lag: float
+    """The highest :attr:`Subscriber.lag <litestar.channels.subscriber.Subscriber.lag>` of all active subscribers."""
+    delivered: int
+    """Total amount of events delivered to subscribers."""
+    dropped: int
+    """Total amount of events dropped because a subscriber's backlog was full."""
+    coalesced: int
+    """Total amount of events that replaced a pending event of the same channel."""
+    disconnected: int
+    """Total amount of subscribers disconnected because their backlog was full."""
+
+
 class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
     def __init__(
         self,
@@ -45,6 +69,11 @@ class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
         subscriber_backlog_strategy: BacklogStrategy = "backoff",
         subscriber_class: type[Subscriber] = Subscriber,
         type_encoders: TypeEncodersMap | None = None,
+        publish_batch_size: int = 100,
+        ws_send_event_cache_size: int = 0,
+        coalesce_channels: Iterable[str] | None = None,
+        on_metrics: Callable[[ChannelsMetrics], Any] | None = None,
+        metrics_interval: float = 10,
     ) -> None:
         """Plugin to handle broadcasting to WebSockets with support for channels.
 
@@ -68,15 +97,27 @@ class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
                 that limit is reached, new messages will be treated accordingly to ``backlog_strategy``
             subscriber_backlog_strategy: Define the behaviour if ``max_backlog`` is reached for a subscriber. `
                 `backoff`` will result in new messages being dropped until older ones have been processed. ``dropleft``
-                will drop older messages in favour of new ones.
+                will drop older messages in favour of new ones. ``disconnect`` will end the subscriber's stream, causing
+                the generated route handlers to close the connection.
             subscriber_class: A :class:`Subscriber` subclass to return from :meth:`subscribe`
             type_encoders: An additional mapping of type encoders used to encode data before sending
+            publish_batch_size: Maximum amount of messages enqueued with :meth:`publish` to send to the backend at
+                once. Messages are collected from the queue without waiting, so batches only form under load
+            ws_send_event_cache_size: If greater than ``0``, the generated websocket route handlers keep the
+                ``websocket.send`` events of this amount of recent messages, so that a message broadcast to multiple
+                sockets is only converted into an event once
+            coalesce_channels: Channels for which only the latest value matters. A message published to one of these
+                channels replaces a message of the same channel still waiting in a subscriber's stream
+            on_metrics: A sync or async callable invoked every ``metrics_interval`` seconds with the
+                :class:`ChannelsMetrics` returned by :meth:`metrics`
+            metrics_interval: Interval in seconds in which to invoke ``on_metrics``
 
         """
         self._backend = backend
         self._pub_queue: Queue[tuple[bytes, list[str]]] | None = None
         self._pub_task: Task | None = None
         self._sub_task: Task | None = None
+        self._metrics_task: Task | None = None
 
         if not (channels or arbitrary_channels_allowed):
             raise ImproperlyConfiguredException("Must define either channels or set arbitrary_channels_allowed=True")
@@ -97,6 +138,14 @@ class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
         self._max_backlog = subscriber_max_backlog
         self._backlog_strategy: BacklogStrategy = subscriber_backlog_strategy
         self._subscriber_class = subscriber_class
+        self._publish_batch_size = max(publish_batch_size, 1)
+        self._ws_send_event_cache_size = ws_send_event_cache_size
+        self._ws_send_events: OrderedDict[bytes, WebSocketSendEvent] = OrderedDict()
+        self._coalesce_channels = set(coalesce_channels or [])
+        self._on_metrics = ensure_async_callable(on_metrics) if on_metrics else None
+        self._metrics_interval = metrics_interval
+        # totals of subscribers that have been unsubscribed from all channels
+        self._retired_metrics = {"delivered": 0, "dropped": 0, "coalesced": 0, "disconnected": 0}
 
         self._channels: dict[str, set[Subscriber]] = {channel: set() for channel in channels or []}
 
@@ -233,6 +282,7 @@ class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
                 channels_to_unsubscribe.add(channel)
 
         if all(subscriber not in queues for queues in self._channels.values()):
+            self._retire_subscriber(subscriber)
             await subscriber.put(None)  # this will stop any running task or generator by breaking the inner loop
             if subscriber.is_running:
                 await subscriber.stop()
@@ -278,21 +328,75 @@ class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
             for entry in history:
                 await subscriber.put(entry)
 
+    def metrics(self) -> ChannelsMetrics:
+        """Return metrics aggregated over all subscribers.
+
+        Returns:
+            A :class:`ChannelsMetrics` instance
+        """
+        subscribers = {
+            subscriber for channel_subscribers in self._channels.values() for subscriber in channel_subscribers
+        }
+        totals = dict(self._retired_metrics)
+        queued = 0
+        max_lag = 0.0
+        for subscriber in subscribers:
+            queued += subscriber.qsize
+            max_lag = max(max_lag, subscriber.lag)
+            totals["delivered"] += subscriber.delivered
+            totals["dropped"] += subscriber.dropped
+            totals["coalesced"] += subscriber.coalesced
+            totals["disconnected"] += subscriber.is_disconnected
+        return ChannelsMetrics(subscribers=len(subscribers), queued=queued, max_lag=max_lag, **totals)
+
+    def _retire_subscriber(self, subscriber: Subscriber) -> None:
+        self._retired_metrics["delivered"] += subscriber.delivered
+        self._retired_metrics["dropped"] += subscriber.dropped
+        self._retired_metrics["coalesced"] += subscriber.coalesced
+        self._retired_metrics["disconnected"] += subscriber.is_disconnected
+
     async def _ws_handler_func(self, channel_name: str, socket: WebSocket) -> None:
         await socket.accept()
 
-        # the ternary operator triggers a mypy bug: https://github.com/python/mypy/issues/10740
-        on_event: EventCallback = socket.send_text if self._socket_send_mode == "text" else socket.send_bytes  # type: ignore[assignment]
+        on_event: EventCallback
+        if self._ws_send_event_cache_size:
+
+            async def send_event(data: bytes) -> None:
+                await socket.send(self._get_ws_send_event(data))
+
+            on_event = send_event
+        else:
+            # the ternary operator triggers a mypy bug: https://github.com/python/mypy/issues/10740
+            on_event = socket.send_text if self._socket_send_mode == "text" else socket.send_bytes  # type: ignore[assignment]
 
         async with self.start_subscription(channel_name) as subscriber:
             if self._handler_should_send_history:
                 await self.put_subscriber_history(subscriber, channels=channel_name, limit=self._history_limit)
 
             # use the background task, so we can block on receive(), breaking the loop when a connection closes
-            async with subscriber.run_in_background(on_event):
+            async with subscriber.run_in_background(
+                on_event,
+                on_disconnect=partial(socket.close, code=WS_1013_TRY_AGAIN_LATER, reason="Backlog full"),
+            ):
                 while (await socket.receive())["type"] != "websocket.disconnect":
                     continue
 
+    def _get_ws_send_event(self, data: bytes) -> WebSocketSendEvent:
+        """Get the ``websocket.send`` event for ``data``, creating it only once for all sockets receiving it."""
+        if (event := self._ws_send_events.get(data)) is not None:
+            self._ws_send_events.move_to_end(data)
+            return event
+
+        event = {"type": "websocket.send", "bytes": None, "text": None}
+        if self._socket_send_mode == "binary":
+            event["bytes"] = data
+        else:
+            event["text"] = data.decode("utf-8")
+        self._ws_send_events[data] = event
+        if len(self._ws_send_events) > self._ws_send_event_cache_size:
+            self._ws_send_events.popitem(last=False)
+        return event
+
     def _create_ws_handler_func(self, channel_name: str) -> Callable[[WebSocket], Awaitable[None]]:
         async def ws_handler_func(socket: WebSocket) -> None:
             await self._ws_handler_func(channel_name=channel_name, socket=socket)
@@ -301,20 +405,31 @@ class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
 
     async def _pub_worker(self) -> None:
         while self._pub_queue:
-            data, channels = await self._pub_queue.get()
-            await self._backend.publish(data, channels)
-            self._pub_queue.task_done()
+            messages = [await self._pub_queue.get()]
+            while len(messages) < self._publish_batch_size and not self._pub_queue.empty():
+                messages.append(self._pub_queue.get_nowait())
+            await self._backend.publish_many(messages)
+            for _ in messages:
+                self._pub_queue.task_done()
 
     async def _sub_worker(self) -> None:
         async for channel, payload in self._backend.stream_events():
+            coalesce_key = channel if channel in self._coalesce_channels else None
             for subscriber in self._channels.get(channel, []):
-                subscriber.put_nowait(payload)
+                subscriber.put_nowait(payload, coalesce_key=coalesce_key)
+
+    async def _metrics_worker(self) -> None:
+        while self._on_metrics:
+            await asyncio.sleep(self._metrics_interval)
+            await self._on_metrics(self.metrics())
 
     async def _on_startup(self) -> None:
         await self._backend.on_startup()
         self._pub_queue = Queue()
         self._pub_task = create_task(self._pub_worker())
         self._sub_task = create_task(self._sub_worker())
+        if self._on_metrics:
+            self._metrics_task = create_task(self._metrics_worker())
         if self._channels:
             await self._backend.subscribe(list(self._channels))
 
@@ -332,6 +447,12 @@ class ChannelsPlugin(InitPluginProtocol, AbstractAsyncContextManager):
             ]
         )
 
+        if self._metrics_task:
+            self._metrics_task.cancel()
+            with suppress(CancelledError):
+                await self._metrics_task
+            self._metrics_task = None
+
         if self._sub_task:
             self._sub_task.cancel()
             with suppress(CancelledError):
@@ -4,7 +4,9 @@ import asyncio
 from asyncio import CancelledError, Queue, QueueFull
 from collections import deque
 from contextlib import AsyncExitStack, asynccontextmanager, suppress
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, Generic, Literal, TypeVar
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, Generic, Literal, TypeVar, Union
 
 if TYPE_CHECKING:
     from litestar.channels import ChannelsPlugin
@@ -12,19 +14,52 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
-BacklogStrategy = Literal["backoff", "dropleft"]
+BacklogStrategy = Literal["backoff", "dropleft", "disconnect"]
 
 EventCallback = Callable[[bytes], Awaitable[Any]]
 
 
+@dataclass(frozen=True)
+class SubscriberMetrics:
+    """A snapshot of the state of a :class:`Subscriber`'s event stream."""
+
+    queued: int
+    """Amount of events waiting in the stream."""
+    delivered: int
+    """Amount of events handed to the consumer of the stream."""
+    dropped: int
+    """Amount of events dropped because the backlog was full."""
+    coalesced: int
+    """Amount of events that replaced a pending event of the same channel."""
+    lag: float
+    """Time in seconds the oldest event in the stream has been waiting."""
+
+
+class _CoalescedEvent:
+    __slots__ = ("data", "key")
+
+    def __init__(self, key: str, data: bytes) -> None:
+        self.key = key
+        self.data = data
+
+
+_StreamItem = Union[bytes, _CoalescedEvent, None]
+
+
 class AsyncDeque(Queue, Generic[T]):
-    def __init__(self, maxsize: int | None) -> None:
+    def __init__(self, maxsize: int | None, on_drop: Callable[[T], None] | None = None) -> None:
         self._deque_maxlen = maxsize
+        self._on_drop = on_drop
         super().__init__()
 
     def _init(self, maxsize: int) -> None:
         self._queue: deque[T] = deque(maxlen=self._deque_maxlen)
 
+    def _put(self, item: T) -> None:
+        if self._on_drop is not None and len(self._queue) == self._deque_maxlen:
+            self._on_drop(self._queue[0])
+        self._queue.append(item)
+
 
 class Subscriber:
     """A wrapper around a stream of events published to subscribed channels"""
@@ -38,42 +73,128 @@ class Subscriber:
         self._task: asyncio.Task | None = None
         self._plugin = plugin
         self._backend = plugin._backend
-        self._queue: Queue[bytes | None] | AsyncDeque[bytes | None]
+        self._backlog_strategy = backlog_strategy
+        self._queue: Queue[_StreamItem] | AsyncDeque[_StreamItem]
+        self._enqueued_at: deque[float] = deque()
+        self._pending_coalesced: dict[str, _CoalescedEvent] = {}
+        self._is_disconnected = False
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
 
         if max_backlog and backlog_strategy == "dropleft":
-            self._queue = AsyncDeque(maxsize=max_backlog or 0)
+            self._queue = AsyncDeque(maxsize=max_backlog or 0, on_drop=self._on_drop)
         else:
             self._queue = Queue(maxsize=max_backlog or 0)
 
     async def put(self, item: bytes | None) -> None:
+        if self._is_disconnected:
+            return
         await self._queue.put(item)
+        self._enqueued_at.append(monotonic())
+
+    def put_nowait(self, item: bytes | None, coalesce_key: str | None = None) -> bool:
+        """Put an item in the subscriber's stream without waiting
+
+        Args:
+            item: The item to put in the stream
+            coalesce_key: If given, and an item put with the same key is still waiting in the stream, replace that
+                item's data with ``item`` instead of adding a new one, so only the latest value will be delivered
+        """
+        if self._is_disconnected:
+            return False
+
+        event: _StreamItem = item
+        if coalesce_key is not None and item is not None:
+            if (pending := self._pending_coalesced.get(coalesce_key)) is not None:
+                pending.data = item
+                self.coalesced += 1
+                return True
+            event = _CoalescedEvent(key=coalesce_key, data=item)
 
-    def put_nowait(self, item: bytes | None) -> bool:
-        """Put an item in the subscriber's stream without waiting"""
         try:
-            self._queue.put_nowait(item)
-            return True
+            self._queue.put_nowait(event)
         except QueueFull:
+            self.dropped += 1
+            if self._backlog_strategy == "disconnect":
+                self._disconnect()
             return False
 
+        self._enqueued_at.append(monotonic())
+        if isinstance(event, _CoalescedEvent):
+            self._pending_coalesced[event.key] = event
+        return True
+
     @property
     def qsize(self) -> int:
         return self._queue.qsize()
 
+    @property
+    def lag(self) -> float:
+        """Time in seconds the oldest event in the stream has been waiting"""
+        return monotonic() - self._enqueued_at[0] if self._enqueued_at else 0.0
+
+    @property
+    def is_disconnected(self) -> bool:
+        """Return whether the stream was closed because the backlog was full, when using the ``disconnect`` strategy"""
+        return self._is_disconnected
+
+    @property
+    def metrics(self) -> SubscriberMetrics:
+        """Return a snapshot of the stream's metrics"""
+        return SubscriberMetrics(
+            queued=self.qsize,
+            delivered=self.delivered,
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+            lag=self.lag,
+        )
+
+    def _on_drop(self, item: _StreamItem) -> None:
+        # called by the AsyncDeque when the oldest item is evicted
+        self._enqueued_at.popleft()
+        self._queue.task_done()
+        if isinstance(item, _CoalescedEvent):
+            del self._pending_coalesced[item.key]
+        if item is not None:
+            self.dropped += 1
+
+    def _disconnect(self) -> None:
+        """Discard all pending events and end the stream, rejecting any further events"""
+        self._is_disconnected = True
+        while not self._queue.empty():
+            if self._queue.get_nowait() is not None:
+                self.dropped += 1
+            self._queue.task_done()
+        self._enqueued_at.clear()
+        self._pending_coalesced.clear()
+        self._queue.put_nowait(None)
+        self._enqueued_at.append(monotonic())
+
     async def iter_events(self) -> AsyncGenerator[bytes, None]:
         """Iterate over the stream of events. If no items are available, block until
         one becomes available
         """
         while True:
             item = await self._queue.get()
+            self._enqueued_at.popleft()
             if item is None:
                 self._queue.task_done()
                 break
+            if isinstance(item, _CoalescedEvent):
+                del self._pending_coalesced[item.key]
+                item = item.data
+            self.delivered += 1
             yield item
             self._queue.task_done()
 
     @asynccontextmanager
-    async def run_in_background(self, on_event: EventCallback, join: bool = True) -> AsyncGenerator[None, None]:
+    async def run_in_background(
+        self,
+        on_event: EventCallback,
+        join: bool = True,
+        on_disconnect: Callable[[], Awaitable[Any]] | None = None,
+    ) -> AsyncGenerator[None, None]:
         """Start a task in the background that sends events from the subscriber's stream
         to ``socket`` as they become available. On exit, it will prevent the stream from
         accepting new events and wait until the currently enqueued ones are processed.
@@ -85,28 +206,35 @@ class Subscriber:
             join: If ``True``, wait for all items in the stream to be processed before
                 stopping the worker. Note that an error occurring within the context
                 will always lead to the immediate cancellation of the worker
+            on_disconnect: Callback to invoke if the stream is closed because the
+                backlog was full, when using the ``disconnect`` strategy
         """
-        self._start_in_background(on_event=on_event)
+        self._start_in_background(on_event=on_event, on_disconnect=on_disconnect)
         async with AsyncExitStack() as exit_stack:
             exit_stack.push_async_callback(self.stop, join=False)
             yield
             exit_stack.pop_all()
             await self.stop(join=join)
 
-    async def _worker(self, on_event: EventCallback) -> None:
+    async def _worker(self, on_event: EventCallback, on_disconnect: Callable[[], Awaitable[Any]] | None = None) -> None:
         async for event in self.iter_events():
             await on_event(event)
+        if self._is_disconnected and on_disconnect is not None:
+            await on_disconnect()
 
-    def _start_in_background(self, on_event: EventCallback) -> None:
+    def _start_in_background(
+        self, on_event: EventCallback, on_disconnect: Callable[[], Awaitable[Any]] | None = None
+    ) -> None:
         """Start a task in the background that sends events from the subscriber's stream
         to ``socket`` as they become available.
 
         Args:
             on_event: Callback to invoke with the event data for every event
+            on_disconnect: Callback to invoke if the stream is closed because the backlog was full
         """
         if self._task is not None:
             raise RuntimeError("Subscriber is already running")
-        self._task = asyncio.create_task(self._worker(on_event))
+        self._task = asyncio.create_task(self._worker(on_event, on_disconnect))
 
     @property
     def is_running(self) -> bool:
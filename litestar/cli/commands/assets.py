@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+from typing import Callable
+
+from click import Choice, argument, group, option
+from click import Path as ClickPath
+
+from litestar.cli._utils import LitestarCLIException, LitestarGroup, console
+from litestar.static_files.base import PRECOMPRESSED_FILE_SUFFIXES
+
+__all__ = ("assets_group", "compress_assets_command", "get_compressor")
+
+
+DEFAULT_EXTENSIONS = (".css", ".csv", ".html", ".js", ".json", ".map", ".mjs", ".svg", ".txt", ".wasm", ".xml")
+
+
+def get_compressor(encoding: str) -> Callable[[bytes], bytes]:
+    """Get a function compressing data with the highest compression level of ``encoding``.
+
+    Args:
+        encoding: A content encoding, one of ``br``, ``gzip`` or ``zstd``.
+
+    Returns:
+        A function compressing bytes.
+    """
+    if encoding == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+
+    if encoding == "br":
+        try:
+            import brotli
+        except ImportError as e:
+            raise LitestarCLIException("Brotli compression requires 'brotli' to be installed") from e
+        return lambda data: brotli.compress(data, quality=11)
+
+    try:
+        import zstandard
+    except ImportError as e:
+        raise LitestarCLIException("Zstandard compression requires 'zstandard' to be installed") from e
+    return zstandard.ZstdCompressor(level=19).compress
+
+
+@group(cls=LitestarGroup, name="assets")
+def assets_group() -> None:
+    """Manage static assets."""
+
+
+@assets_group.command("compress")  # type: ignore[misc]
+@argument("directories", nargs=-1, required=True, type=ClickPath(exists=True, file_okay=False, path_type=Path))
+@option(
+    "-e",
+    "--encoding",
+    "encodings",
+    multiple=True,
+    type=Choice(list(PRECOMPRESSED_FILE_SUFFIXES)),
+    default=("br", "gzip"),
+    show_default=True,
+    help="Encoding to create precompressed files for. Can be given multiple times",
+)
+@option(
+    "--extension",
+    "extensions",
+    multiple=True,
+    default=DEFAULT_EXTENSIONS,
+    show_default=True,
+    help="Extension of the files to compress. Can be given multiple times",
+)
+@option("--min-size", default=1024, show_default=True, help="Minimum size in bytes of the files to compress")
+@option("--force", is_flag=True, default=False, help="Recreate precompressed files that are up to date")
+def compress_assets_command(
+    directories: tuple[Path, ...], encodings: tuple[str, ...], extensions: tuple[str, ...], min_size: int, force: bool
+) -> None:
+    """Create precompressed versions of static files.
+
+    For every file, a sibling file with the suffix of each encoding is created, which is served instead of the file by
+    static files routers created with ``precompressed=True``. Precompressed files are only kept if they are smaller
+    than the original.
+    """
+    compressors = {encoding: get_compressor(encoding) for encoding in dict.fromkeys(encodings)}
+    sidecar_suffixes = set(PRECOMPRESSED_FILE_SUFFIXES.values())
+    extensions = tuple(ext if ext.startswith(".") else f".{ext}" for ext in extensions)
+    created = skipped = 0
+
+    for directory in directories:
+        for path in sorted(directory.rglob("*")):
+            if not path.is_file() or path.suffix in sidecar_suffixes or not path.name.endswith(extensions):
+                continue
+
+            stat = path.stat()
+            if stat.st_size < min_size:
+                continue
+
+            data: bytes | None = None
+            for encoding, compress in compressors.items():
+                sidecar_path = path.with_name(path.name + PRECOMPRESSED_FILE_SUFFIXES[encoding])
+                if not force and sidecar_path.exists() and sidecar_path.stat().st_mtime >= stat.st_mtime:
+                    skipped += 1
+                    continue
+
+                if data is None:
+                    data = path.read_bytes()
+                compressed = compress(data)
+                if len(compressed) >= len(data):
+                    sidecar_path.unlink(missing_ok=True)
+                    skipped += 1
+                    continue
+
+                sidecar_path.write_bytes(compressed)
+                os.utime(sidecar_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                created += 1
+                console.print(f"[green]{sidecar_path}[/] ({len(data)} -> {len(compressed)} bytes)")
+
+    console.print(f"Created {created} precompressed files, skipped {skipped}")
@@ -6,7 +6,7 @@ from click import Context, group, option, pass_context
 from click import Path as ClickPath
 
 from ._utils import LitestarEnv, LitestarExtensionGroup
-from .commands import core, schema, sessions
+from .commands import assets, core, schema, sessions
 
 __all__ = ("litestar_group",)
 
@@ -35,3 +35,4 @@ litestar_group.add_command(core.routes_command)
 litestar_group.add_command(core.version_command)
 litestar_group.add_command(sessions.sessions_group)
 litestar_group.add_command(schema.schema_group)
+litestar_group.add_command(assets.assets_group)
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Callable
 
 from litestar.config.allowed_hosts import AllowedHostsConfig
 from litestar.config.response_cache import ResponseCacheConfig
+from litestar.config.route_cache import RouteCacheConfig
+from litestar.constants import ONE_MEGABYTE
 from litestar.datastructures import State
 from litestar.events.emitter import SimpleEventEmitter
 from litestar.types.empty import Empty
@@ -119,8 +121,12 @@ class AppConfig:
 
     Can be overridden by route handlers.
     """
-    event_emitter_backend: type[BaseEventEmitterBackend] = field(default=SimpleEventEmitter)
-    """A subclass of :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`."""
+    event_emitter_backend: type[BaseEventEmitterBackend] | Callable[..., BaseEventEmitterBackend] = field(
+        default=SimpleEventEmitter
+    )
+    """A subclass of :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`, or a callable returning
+    an instance of one, receiving the listeners as the ``listeners`` keyword argument.
+    """
     exception_handlers: ExceptionHandlersMap = field(default_factory=dict)
     """A dictionary that maps handler functions to status codes and/or exception types."""
     guards: list[Guard] = field(default_factory=list)
@@ -169,6 +175,8 @@ class AppConfig:
     """:class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing outbound response
     data.
     """
+    route_cache_config: RouteCacheConfig = field(default_factory=RouteCacheConfig)
+    """Configures the cache used to resolve requests to route handlers."""
     route_handlers: list[ControllerRouterHandler] = field(default_factory=list)
     """A required list of route handlers, which can include instances of :class:`Router <.router.Router>`,
     subclasses of :class:`Controller <.controller.Controller>` or any function decorated by the route handler
@@ -207,6 +215,11 @@ class AppConfig:
     multipart_form_part_limit: int = field(default=1000)
     """The maximal number of allowed parts in a multipart/formdata request. This limit is intended to protect from
     DoS attacks."""
+    multipart_form_spool_size: int = field(default=ONE_MEGABYTE)
+    """The size in bytes above which files uploaded in a multipart/formdata request are rolled over to disk."""
+    multipart_form_buffer_size: int = field(default=ONE_MEGABYTE)
+    """The maximal size in bytes of the headers and of non-file field values of a multipart/formdata request part,
+    which are buffered in memory."""
     experimental_features: list[ExperimentalFeatures] | None = None
 
     def __post_init__(self) -> None:
@@ -221,3 +234,4 @@ class AppConfig:
 
 class ExperimentalFeatures(str, enum.Enum):
     DTO_CODEGEN = "DTO_CODEGEN"
+    COMPILED_ROUTING = "COMPILED_ROUTING"
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
+from litestar._parsers import parse_accept_encoding_header
+from litestar.enums import CompressionEncoding
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.middleware.compression import CompressionMiddleware
 from litestar.middleware.compression.gzip_facade import GzipCompression
@@ -21,10 +23,10 @@ class CompressionConfig:
     using the ``compression_config`` key.
     """
 
-    backend: Literal["gzip", "brotli"] | str
+    backend: Literal["gzip", "brotli", "zstd"] | str
     """The backend to use.
 
-    If the value given is `gzip` or `brotli`, then the builtin gzip and brotli compression is used.
+    If the value given is `gzip`, `brotli` or `zstd`, then the builtin gzip, brotli and zstd compression is used.
     """
     minimum_size: int = field(default=500)
     """Minimum response size (bytes) to enable compression, affects all backends."""
@@ -49,6 +51,11 @@ class CompressionConfig:
     """
     brotli_gzip_fallback: bool = True
     """Use GZIP if Brotli is not supported."""
+    zstd_level: int = field(default=3)
+    """Range ``[1-22]``, Controls the compression-speed vs compression-density tradeoff.
+
+    The higher the level, the slower the compression.
+    """
     middleware_class: type[CompressionMiddleware] = CompressionMiddleware
     """Middleware class to use, should be a subclass of :class:`CompressionMiddleware`."""
     exclude: str | list[str] | None = None
@@ -61,6 +68,20 @@ class CompressionConfig:
     """Configuration specific to the backend."""
     gzip_fallback: bool = True
     """Use GZIP as a fallback if the provided backend is not supported by the client."""
+    thread_offload_threshold: int | None = None
+    """If set, response body chunks of at least this size (bytes) are compressed in a worker thread, so compressing
+    large responses does not block the event loop.
+
+    The thread pool used can be configured with :func:`set_asyncio_executor <litestar.concurrency.set_asyncio_executor>`
+    or :func:`set_trio_capacity_limiter <litestar.concurrency.set_trio_capacity_limiter>`.
+    """
+    flush_chunks: bool = True
+    """Flush the compression stream after each chunk of a streaming response, so every chunk is sent to the client as
+    soon as it has been produced.
+
+    Disabling this yields a better compression ratio and less overhead for streaming responses, at the cost of chunks
+    being held back until enough data has been compressed.
+    """
 
     def __post_init__(self) -> None:
         if self.minimum_size <= 0:
@@ -81,3 +102,42 @@ class CompressionConfig:
 
             self.gzip_fallback = self.brotli_gzip_fallback
             self.compression_facade = BrotliCompression
+        elif self.backend == "zstd":
+            # zstandard is not guaranteed to be installed.
+            from litestar.middleware.compression.zstd_facade import ZstdCompression
+
+            if self.zstd_level < 1 or self.zstd_level > 22:
+                raise ImproperlyConfiguredException("zstd_level must be a value between 1 and 22")
+
+            self.compression_facade = ZstdCompression
+
+    def resolve_encoding(self, accept_encoding: str) -> str | None:
+        """Select the encoding to compress a response with, based on the value of a request's ``Accept-Encoding``
+        header.
+
+        The encoding with the highest quality value is selected. If the configured backend and the gzip fallback are
+        accepted with the same quality, the configured backend is preferred.
+
+        Args:
+            accept_encoding: Value of the ``Accept-Encoding`` header.
+
+        Returns:
+            The encoding to use, or ``None`` if the response should not be compressed.
+        """
+        if not accept_encoding:
+            return None
+
+        qualities = parse_accept_encoding_header(accept_encoding)
+        default_quality = qualities.get("*", 0.0)
+
+        encoding: str | None = None
+        quality = 0.0
+        candidates = [self.compression_facade.encoding]
+        if self.gzip_fallback:
+            candidates.append(CompressionEncoding.GZIP)
+
+        for candidate in candidates:
+            candidate_quality = qualities.get(candidate, default_quality)
+            if candidate_quality > quality:
+                encoding, quality = candidate, candidate_quality
+        return encoding
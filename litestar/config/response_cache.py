@@ -6,6 +6,7 @@ from urllib.parse import urlencode
 
 from litestar.status_codes import (
     HTTP_200_OK,
+    HTTP_206_PARTIAL_CONTENT,
     HTTP_300_MULTIPLE_CHOICES,
     HTTP_301_MOVED_PERMANENTLY,
     HTTP_308_PERMANENT_REDIRECT,
@@ -52,6 +53,9 @@ def default_do_cache_predicate(_: HTTPScope, status_code: int) -> bool:
     Returns:
         A boolean indicating whether the response should be cached.
     """
+    if status_code == HTTP_206_PARTIAL_CONTENT:
+        # partial content depends on the request's "Range" header, which is not part of the cache key
+        return False
     return HTTP_200_OK <= status_code < HTTP_300_MULTIPLE_CHOICES or status_code in (
         HTTP_301_MOVED_PERMANENTLY,
         HTTP_308_PERMANENT_REDIRECT,
@@ -75,6 +79,21 @@ class ResponseCacheConfig:
     cache_response_filter: Callable[[HTTPScope, int], bool] = field(default=default_do_cache_predicate)
     """A callable that receives connection scope and a status code, and returns a boolean indicating whether the
     response should be cached."""
+    coalesce_requests: bool = False
+    """If ``True``, concurrent requests for the same cache key wait for the first of them to compute and cache the
+    response, instead of all of them calling the route handler. Requests are coalesced within a single process, unless
+    :attr:`lock_expiration` is set.
+    """
+    stale_while_revalidate: int | None = None
+    """Time in seconds an expired response may still be served from the cache. When an expired response is served, it
+    is refreshed in a background task, by calling the route handler again. Until the refresh is done, requests keep
+    being served the expired response.
+    """
+    lock_expiration: int | None = None
+    """If set, a lock is acquired in the store while a response is being computed or refreshed, so that requests are
+    coalesced across multiple workers sharing the store. The lock expires after the given time in seconds, which should
+    be longer than it takes to compute the response.
+    """
 
     def get_store_from_app(self, app: Litestar) -> Store:
         """Get the store defined in :attr:`store` from an :class:`Litestar <.app.Litestar>` instance."""
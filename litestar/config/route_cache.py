@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+__all__ = ("RouteCacheConfig",)
+
+
+@dataclass
+class RouteCacheConfig:
+    """Configuration for the cache used by the router to resolve requests to route handlers.
+
+    To configure the route cache, pass an instance of this class to :class:`Litestar <.app.Litestar>` using the
+    ``route_cache_config`` key.
+
+    Routes with path parameters are cached by their path template and the request method, so that requests to e.g.
+    ``/items/{item_id:uuid}`` share a single cache entry, regardless of the value of ``item_id``. Only the path
+    parameters are parsed per request. Routes without path parameters are resolved by a set lookup and are not cached.
+    """
+
+    max_size: int = 1024
+    """Maximum number of entries to keep in the cache. If set to ``0``, caching is disabled."""
+    eviction_policy: Literal["lru", "fifo"] = "lru"
+    """Policy used to choose the entry to evict once :attr:`max_size` has been reached.
+
+    ``lru`` evicts the least recently used entry, ``fifo`` evicts the oldest entry, which avoids reordering the cache
+    on every hit.
+    """
@@ -3,7 +3,7 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Generic
 
-from litestar._multipart import parse_content_header, parse_multipart_form
+from litestar._multipart import parse_content_header, parse_multipart_form_stream
 from litestar._parsers import parse_url_encoded_form_data
 from litestar.connection.base import (
     ASGIConnection,
@@ -155,12 +155,21 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
     async def stream(self) -> AsyncGenerator[bytes, None]:
         """Return an async generator that streams chunks of bytes.
 
+        If the body has already been read, it is yielded as a single chunk.
+
         Returns:
             An async generator.
 
         Raises:
             RuntimeError: if the stream is already consumed
         """
+        if self._body is Empty and (body := self._connection_state.body) is not Empty:
+            self._body = body
+
+        async for chunk in self._stream():
+            yield chunk
+
+    async def _stream(self) -> AsyncGenerator[bytes, None]:
         if self._body is Empty:
             if not self.is_connected:
                 raise InternalServerException("stream consumed")
@@ -193,7 +202,7 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
             if (body := self._connection_state.body) is not Empty:
                 self._body = body
             else:
-                self._body = self._connection_state.body = b"".join([c async for c in self.stream()])
+                self._body = self._connection_state.body = b"".join([c async for c in self._stream()])
         return self._body
 
     async def form(self) -> FormMultiDict:
@@ -201,6 +210,9 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
         'application/x-www-form- urlencoded', return a FormMultiDict instance populated with the values sent in the
         request, otherwise, an empty instance.
 
+        Multipart forms are parsed incrementally from :meth:`stream`, which consumes the request body without storing
+        it. :meth:`body` can therefore not be called after the form has been parsed, unless it was read before.
+
         Returns:
             A FormMultiDict instance
         """
@@ -210,10 +222,12 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
             else:
                 content_type, options = self.content_type
                 if content_type == RequestEncodingType.MULTI_PART:
-                    self._form = parse_multipart_form(
-                        body=await self.body(),
+                    self._form = await parse_multipart_form_stream(
+                        stream=self.stream(),
                         boundary=options.get("boundary", "").encode(),
                         multipart_form_part_limit=self.app.multipart_form_part_limit,
+                        max_spool_size=self.app.multipart_form_spool_size,
+                        max_buffer_size=self.app.multipart_form_buffer_size,
                     )
                 elif content_type == RequestEncodingType.URL_ENCODED:
                     self._form = parse_url_encoded_form_data(
@@ -12,7 +12,9 @@ DEFAULT_ALLOWED_CORS_HEADERS: Final = {"Accept", "Accept-Language", "Content-Lan
 DEFAULT_CHUNK_SIZE: Final = 1024 * 128  # 128KB
 HTTP_DISCONNECT: Final = "http.disconnect"
 HTTP_RESPONSE_BODY: Final = "http.response.body"
+HTTP_RESPONSE_PATHSEND: Final = "http.response.pathsend"
 HTTP_RESPONSE_START: Final = "http.response.start"
+NDJSON_MEDIA_TYPE: Final = "application/x-ndjson"
 ONE_MEGABYTE: Final = 1024 * 1024
 OPENAPI_NOT_INITIALIZED: Final = "Litestar has not been instantiated with OpenAPIConfig"
 REDIRECT_STATUS_CODES: Final = {301, 302, 303, 307, 308}
@@ -172,7 +172,7 @@ class PrometheusMiddleware(AbstractMiddleware):
             if message["type"] == "http.response.start":
                 request_span["status_code"] = message["status"]
 
-            if message["type"] == "http.response.body":
+            if message["type"] in ("http.response.body", "http.response.pathsend"):
                 end = time.perf_counter()
                 request_span["duration"] = end - request_span["start_time"]
                 request_span["end_time"] = end
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from inspect import isasyncgenfunction, isclass, isgeneratorfunction
-from typing import TYPE_CHECKING, Any
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Literal
+
+import anyio
 
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.types import Empty
@@ -21,10 +24,40 @@ if TYPE_CHECKING:
 __all__ = ("Provide",)
 
 
+def _resolve_cache_scope(
+    use_cache: bool, cache_scope: Literal["app", "request"] | None, cache_ttl: float | None
+) -> Literal["app", "request"] | None:
+    """Validate the caching options of a :class:`Provide` and resolve them into a cache scope.
+
+    Args:
+        use_cache: Whether the value should be cached in the ``"app"`` scope.
+        cache_scope: The scope in which the value should be cached.
+        cache_ttl: Time in seconds after which a value cached in the ``"app"`` scope is recomputed.
+
+    Returns:
+        The cache scope, or ``None`` if the value should not be cached.
+    """
+    if cache_ttl is not None:
+        if cache_ttl <= 0:
+            raise ImproperlyConfiguredException("cache_ttl must be a positive number")
+        if cache_scope == "request":
+            raise ImproperlyConfiguredException("cache_ttl can only be used with cache_scope='app'")
+        return "app"
+
+    if use_cache:
+        if cache_scope == "request":
+            raise ImproperlyConfiguredException("use_cache=True cannot be combined with cache_scope='request'")
+        return "app"
+
+    return cache_scope
+
+
 class Provide:
     """Wrapper class for dependency injection"""
 
     __slots__ = (
+        "cache_scope",
+        "cache_ttl",
         "dependency",
         "has_sync_callable",
         "has_sync_generator_dependency",
@@ -34,6 +67,9 @@ class Provide:
         "sync_to_thread",
         "use_cache",
         "value",
+        "_expires_at",
+        "_refresh_event",
+        "_request_cache_key",
     )
 
     parsed_fn_signature: ParsedSignature
@@ -45,17 +81,28 @@ class Provide:
         dependency: AnyCallable | type[Any],
         use_cache: bool = False,
         sync_to_thread: bool | None = None,
+        cache_scope: Literal["app", "request"] | None = None,
+        cache_ttl: float | None = None,
     ) -> None:
         """Initialize ``Provide``
 
         Args:
             dependency: Callable to call or class to instantiate. The result is then injected as a dependency.
-            use_cache: Cache the dependency return value. Defaults to False.
+            use_cache: Cache the dependency return value. Defaults to False. Equivalent to ``cache_scope="app"``.
             sync_to_thread: Run sync code in an async thread. Defaults to False.
+            cache_scope: The scope in which the dependency return value is cached:
+
+                - ``"app"``: The value is shared by all connections, until ``cache_ttl`` expires.
+                - ``"request"``: The value is shared by all dependents resolved for a connection, including those of
+                  other request scoped providers of the same ``dependency``.
+            cache_ttl: Time in seconds after which a value cached in the ``"app"`` scope is recomputed. While it is
+                recomputed, other connections still receive the previous value. Implies ``cache_scope="app"``.
         """
         if not callable(dependency):
             raise ImproperlyConfiguredException("Provider dependency must a callable value")
 
+        cache_scope = _resolve_cache_scope(use_cache=use_cache, cache_scope=cache_scope, cache_ttl=cache_ttl)
+
         is_class_dependency = isclass(dependency)
         self.has_sync_generator_dependency = isgeneratorfunction(
             dependency if not is_class_dependency else dependency.__call__  # type: ignore[operator]
@@ -65,7 +112,7 @@ class Provide:
         )
         has_generator_dependency = self.has_sync_generator_dependency or self.has_async_generator_dependency
 
-        if has_generator_dependency and use_cache:
+        if has_generator_dependency and cache_scope == "app":
             raise ImproperlyConfiguredException(
                 "Cannot cache generator dependency, consider using Lifespan Context instead."
             )
@@ -88,23 +135,45 @@ class Provide:
             self.has_sync_callable = has_sync_callable
 
         self.sync_to_thread = bool(sync_to_thread)
-        self.use_cache = use_cache
+        self.cache_scope = cache_scope
+        self.cache_ttl = cache_ttl
+        self.use_cache = cache_scope == "app"
         self.value: Any = Empty
+        self._expires_at: float | None = None
+        self._refresh_event: anyio.Event | None = None
+        self._request_cache_key = id(dependency)
 
     async def __call__(self, **kwargs: Any) -> Any:
         """Call the provider's dependency."""
 
-        if self.use_cache and self.value is not Empty:
-            return self.value
+        if not self.use_cache:
+            if self.has_sync_callable:
+                return self.dependency(**kwargs)
+            return await self.dependency(**kwargs)
 
-        if self.has_sync_callable:
-            value = self.dependency(**kwargs)
-        else:
-            value = await self.dependency(**kwargs)
+        while self.value is Empty or (self._expires_at is not None and self._expires_at <= monotonic()):
+            if self._refresh_event is None:
+                return await self._refresh(kwargs)
+            if self.value is not Empty:
+                # serve the expired value while another connection is computing its replacement
+                return self.value
+            await self._refresh_event.wait()
 
-        if self.use_cache:
-            self.value = value
+        return self.value
 
+    async def _call_dependency(self, kwargs: dict[str, Any]) -> Any:
+        if self.has_sync_callable:
+            return self.dependency(**kwargs)
+        return await self.dependency(**kwargs)
+
+    async def _refresh(self, kwargs: dict[str, Any]) -> Any:
+        self._refresh_event = event = anyio.Event()
+        try:
+            self.value = value = await self._call_dependency(kwargs)
+            self._expires_at = None if self.cache_ttl is None else monotonic() + self.cache_ttl
+        finally:
+            self._refresh_event = None
+            event.set()
         return value
 
     def __eq__(self, other: Any) -> bool:
@@ -113,5 +182,7 @@ class Provide:
             isinstance(other, self.__class__)
             and other.dependency == self.dependency
             and other.use_cache == self.use_cache
+            and other.cache_scope == self.cache_scope
+            and other.cache_ttl == self.cache_ttl
             and other.value == self.value
         )
@@ -9,9 +9,14 @@ from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
     ClassVar,
     Collection,
     Final,
+    Iterable,
+    Iterator,
     Mapping,
     Protocol,
     Union,
@@ -119,6 +124,9 @@ class DTOBackend:
         if field_definition.is_subclass_of(DTOData):
             self.dto_data_type = field_definition.annotation
             field_definition = self.field_definition.inner_types[0]
+        elif is_data_field and field_definition.is_subclass_of(AsyncIterable):
+            # streamed data is decoded one item at a time
+            field_definition = self.field_definition.inner_types[0]
 
         self.annotation = build_annotation_for_backend(model_type, field_definition, self.transfer_model_type)
 
@@ -335,12 +343,11 @@ class DTOBackend:
             Encoded data.
         """
         if self.wrapper_attribute_name:
-            wrapped_transfer = _transfer_data(
-                destination_type=self.transfer_model_type,
-                source_data=getattr(data, self.wrapper_attribute_name),
-                field_definitions=self.parsed_field_definitions,
-                field_definition=self.field_definition,
-                is_data_field=self.is_data_field,
+            wrapped_data = getattr(data, self.wrapper_attribute_name)
+            wrapped_transfer = (
+                _transfer_stream(wrapped_data, self._encode_data)
+                if self._is_stream(wrapped_data)
+                else self._encode_data(wrapped_data)
             )
             setattr(
                 data,
@@ -349,17 +356,27 @@ class DTOBackend:
             )
             return cast("LitestarEncodableType", data)
 
-        return cast(
-            "LitestarEncodableType",
-            _transfer_data(
-                destination_type=self.transfer_model_type,
-                source_data=data,
-                field_definitions=self.parsed_field_definitions,
-                field_definition=self.field_definition,
-                is_data_field=self.is_data_field,
-            ),
+        return cast("LitestarEncodableType", self._encode_data(data))
+
+    def _encode_data(self, data: Any) -> Any:
+        return _transfer_data(
+            destination_type=self.transfer_model_type,
+            source_data=data,
+            field_definitions=self.parsed_field_definitions,
+            field_definition=self.field_definition,
+            is_data_field=self.is_data_field,
         )
 
+    def _is_stream(self, wrapped_data: Any) -> bool:
+        """Whether ``wrapped_data`` is a stream of instances of a single model type, or a callable returning one, like
+        the content of a :class:`JSONStream <litestar.response.JSONStream>`, which is encoded lazily, item by item.
+        """
+        if self.field_definition.is_non_string_collection or isinstance(wrapped_data, (str, bytes, Mapping, type)):
+            return False
+        if isinstance(self.model_type, type) and isinstance(wrapped_data, self.model_type):
+            return False
+        return isinstance(wrapped_data, (Iterable, AsyncIterable)) or callable(wrapped_data)
+
     def _get_handler_for_field_definition(self, field_definition: FieldDefinition) -> CompositeTypeHandler | None:
         if field_definition.is_union:
             return self._create_union_type
@@ -555,6 +572,37 @@ def _filter_nested_field_mapping(field_name_mapping: Mapping[str, str], field_na
     }
 
 
+def _transfer_stream(
+    items: Iterable[Any] | AsyncIterable[Any] | Callable[[], Iterable[Any] | AsyncIterable[Any]],
+    transfer: Callable[[Any], Any],
+) -> Iterator[Any] | AsyncIterator[Any] | Callable[[], Iterator[Any] | AsyncIterator[Any]]:
+    """Lazily transfer the items of a sync or async iterable.
+
+    Args:
+        items: The items to transfer, or a callable returning them.
+        transfer: A callable transferring a single item.
+
+    Returns:
+        An iterator or async iterator of transferred items, or a callable returning one if ``items`` is a callable.
+    """
+    if not isinstance(items, (Iterable, AsyncIterable)):
+        get_items = items
+
+        def transfer_callable() -> Iterator[Any] | AsyncIterator[Any]:
+            return _transfer_stream(get_items(), transfer)  # type: ignore[return-value]
+
+        return transfer_callable
+
+    if not isinstance(items, AsyncIterable):
+        return map(transfer, items)
+
+    async def transfer_items() -> AsyncIterator[Any]:
+        async for item in items:
+            yield transfer(item)
+
+    return transfer_items()
+
+
 def _transfer_data(
     destination_type: type[Any],
     source_data: Any | Collection[Any],
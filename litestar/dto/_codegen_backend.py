@@ -15,7 +15,6 @@ from typing import (
     Generator,
     Mapping,
     Protocol,
-    cast,
 )
 
 from msgspec import UNSET
@@ -34,7 +33,6 @@ from litestar.utils.helpers import unique_name_for_scope
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
     from litestar.dto import AbstractDTO
-    from litestar.types.serialization import LitestarEncodableType
     from litestar.typing import FieldDefinition
 
 __all__ = ("DTOCodegenBackend",)
@@ -143,22 +141,6 @@ class DTOCodegenBackend(DTOBackend):
             )
         return self._transfer_to_model_type(self.parse_raw(raw, asgi_connection))
 
-    def encode_data(self, data: Any) -> LitestarEncodableType:
-        """Encode data into a ``LitestarEncodableType``.
-
-        Args:
-            data: Data to encode.
-
-        Returns:
-            Encoded data.
-        """
-        if self.wrapper_attribute_name:
-            wrapped_transfer = self._encode_data(getattr(data, self.wrapper_attribute_name))
-            setattr(data, self.wrapper_attribute_name, wrapped_transfer)
-            return cast("LitestarEncodableType", data)
-
-        return cast("LitestarEncodableType", self._encode_data(data))
-
     def _create_transfer_data_fn(
         self,
         destination_type: type[Any],
@@ -3,7 +3,7 @@ from __future__ import annotations
 import typing
 from abc import abstractmethod
 from inspect import getmodule
-from typing import TYPE_CHECKING, Collection, Generic, TypeVar
+from typing import TYPE_CHECKING, AsyncIterable, Collection, Generic, TypeVar
 
 from typing_extensions import NotRequired, TypedDict, get_type_hints
 
@@ -300,6 +300,9 @@ class AbstractDTO(Generic[T]):
         if field_definition.is_subclass_of(DTOData):
             return cls.resolve_model_type(field_definition.inner_types[0])
 
+        if field_definition.is_subclass_of(AsyncIterable) and field_definition.inner_types:
+            return cls.resolve_model_type(field_definition.inner_types[0])
+
         if field_definition.is_collection:
             if field_definition.is_mapping:
                 return cls.resolve_model_type(field_definition.inner_types[1])
@@ -76,6 +76,7 @@ class CompressionEncoding(str, Enum):
 
     GZIP = "gzip"
     BROTLI = "br"
+    ZSTD = "zstd"
 
 
 class ASGIExtension(str, Enum):
@@ -1,4 +1,11 @@
-from .emitter import BaseEventEmitterBackend, SimpleEventEmitter
+from .emitter import BaseEventEmitterBackend, ChannelsEventEmitter, EventQueueFullException, SimpleEventEmitter
 from .listener import EventListener, listener
 
-__all__ = ("EventListener", "SimpleEventEmitter", "BaseEventEmitterBackend", "listener")
+__all__ = (
+    "BaseEventEmitterBackend",
+    "ChannelsEventEmitter",
+    "EventListener",
+    "EventQueueFullException",
+    "SimpleEventEmitter",
+    "listener",
+)
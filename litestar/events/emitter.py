@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import math
+import logging
 import sys
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import AsyncExitStack
 from functools import partial
-from typing import TYPE_CHECKING, Any, Sequence
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING, Any, Literal, Sequence
 
 if sys.version_info < (3, 9):
     from typing import AsyncContextManager
@@ -14,17 +16,32 @@ else:
     from contextlib import AbstractAsyncContextManager as AsyncContextManager
 
 import anyio
+import msgspec
 
-from litestar.exceptions import ImproperlyConfiguredException
+from litestar.exceptions import ImproperlyConfiguredException, LitestarException
+from litestar.serialization import encode_json
 
 if TYPE_CHECKING:
     from types import TracebackType
 
-    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-
+    from litestar.channels.backends.base import ChannelsBackend
     from litestar.events.listener import EventListener
 
-__all__ = ("BaseEventEmitterBackend", "SimpleEventEmitter")
+__all__ = (
+    "BaseEventEmitterBackend",
+    "ChannelsEventEmitter",
+    "EventQueueFullException",
+    "OverflowPolicy",
+    "SimpleEventEmitter",
+)
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["raise", "drop_new", "drop_oldest"]
+
+
+class EventQueueFullException(LitestarException):
+    """Raised when emitting an event while the queue of a bounded event emitter is full."""
 
 
 class BaseEventEmitterBackend(AsyncContextManager["BaseEventEmitterBackend"], ABC):
@@ -63,41 +80,161 @@ class BaseEventEmitterBackend(AsyncContextManager["BaseEventEmitterBackend"], AB
 class SimpleEventEmitter(BaseEventEmitterBackend):
     """Event emitter the works only in the current process"""
 
-    __slots__ = ("_queue", "_exit_stack", "_receive_stream", "_send_stream")
-
-    def __init__(self, listeners: Sequence[EventListener]) -> None:
+    __slots__ = (
+        "_accepting",
+        "_blocked",
+        "_concurrency",
+        "_counter",
+        "_exit_stack",
+        "_listener_concurrency",
+        "_queue",
+        "_task_group",
+        "_wakeup",
+        "_worker_done",
+        "max_concurrency",
+        "max_queue_size",
+        "overflow_policy",
+        "shutdown_timeout",
+    )
+
+    def __init__(
+        self,
+        listeners: Sequence[EventListener],
+        *,
+        max_queue_size: int | None = None,
+        overflow_policy: OverflowPolicy = "raise",
+        max_concurrency: int | None = None,
+        shutdown_timeout: float | None = None,
+    ) -> None:
         """Create an event emitter instance.
 
         Args:
             listeners: A list of listeners.
+            max_queue_size: Maximum number of listener calls waiting to be started. If ``None``, the queue is unbounded.
+            overflow_policy: What to do when emitting an event while the queue is full. ``raise`` raises an
+                :class:`EventQueueFullException`, ``drop_new`` discards the new listener calls and ``drop_oldest``
+                discards the oldest waiting listener calls to make room for the new ones.
+            max_concurrency: Maximum number of listener calls to run concurrently. Further calls wait in the queue,
+                ordered by the :attr:`priority <.events.listener.EventListener.priority>` of their listener. If
+                ``None``, every call is started immediately.
+            shutdown_timeout: Maximum time in seconds to wait for waiting and running listener calls to finish on
+                shutdown, after which they are cancelled. If ``None``, wait until all calls are finished.
         """
         super().__init__(listeners=listeners)
-        self._receive_stream: MemoryObjectReceiveStream | None = None
-        self._send_stream: MemoryObjectSendStream | None = None
+        if max_queue_size is not None and max_queue_size < 1:
+            raise ImproperlyConfiguredException("max_queue_size must be a positive integer")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ImproperlyConfiguredException("max_concurrency must be a positive integer")
+
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.max_concurrency = max_concurrency
+        self.shutdown_timeout = shutdown_timeout
+        self._queue: list[tuple[int, int, EventListener, tuple[Any, ...], dict[str, Any]]] = []
+        # calls popped from the queue while their listener was running at its max_concurrency
+        self._blocked: dict[EventListener, deque[tuple[int, int, EventListener, tuple[Any, ...], dict[str, Any]]]] = {}
+        self._counter = count()
+        self._accepting = False
+        self._concurrency: anyio.Semaphore | None = None
+        self._listener_concurrency: dict[EventListener, anyio.Semaphore] = {}
+        self._wakeup: anyio.Event | None = None
+        self._worker_done: anyio.Event | None = None
+        self._task_group: anyio.abc.TaskGroup | None = None
         self._exit_stack: AsyncExitStack | None = None
 
-    async def _worker(self, receive_stream: MemoryObjectReceiveStream) -> None:
-        """Run items from ``receive_stream`` in a task group.
+    async def _run_listener(self, listener: EventListener, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        fn = partial(listener.fn, **kwargs) if kwargs else listener.fn
+        try:
+            await fn(*args)
+        finally:
+            if self._concurrency:
+                self._concurrency.release()
+            if semaphore := self._listener_concurrency.get(listener):
+                semaphore.release()
+                if blocked := self._blocked.get(listener):
+                    heappush(self._queue, blocked.popleft())
+                    if self._wakeup:
+                        self._wakeup.set()
+
+    def _pending_calls(self) -> int:
+        return len(self._queue) + sum(len(blocked) for blocked in self._blocked.values())
+
+    async def _worker(self) -> None:
+        """Start the queued listener calls in a task group, highest priority first.
+
+        Calls of a listener running at its ``max_concurrency`` are set aside until one of its running calls finishes,
+        so they do not take up the slots of the emitter's ``max_concurrency`` while waiting.
+
+        Returns when the emitter has been closed and all queued listener calls have finished.
 
         Returns:
             None
         """
-        async with receive_stream, anyio.create_task_group() as task_group:
-            async for item in receive_stream:
-                fn, args, kwargs = item
-                if kwargs:
-                    fn = partial(fn, **kwargs)
-                task_group.start_soon(fn, *args)  # pyright: ignore[reportGeneralTypeIssues]
+        try:
+            async with anyio.create_task_group() as task_group:
+                while True:
+                    while not self._queue:
+                        if not self._accepting and not any(self._blocked.values()):
+                            return
+                        self._wakeup = anyio.Event()
+                        await self._wakeup.wait()
+
+                    if self._concurrency:
+                        await self._concurrency.acquire()
+                        if not self._queue:  # the queue may have been cleared while waiting
+                            self._concurrency.release()
+                            continue
+
+                    entry = heappop(self._queue)
+                    _, _, listener, args, kwargs = entry
+                    if semaphore := self._listener_concurrency.get(listener):
+                        if not semaphore.value:
+                            self._blocked.setdefault(listener, deque()).append(entry)
+                            if self._concurrency:
+                                self._concurrency.release()
+                            continue
+                        semaphore.acquire_nowait()
+
+                    task_group.start_soon(self._run_listener, listener, args, kwargs)
+        finally:
+            self._worker_done.set()  # type: ignore[union-attr]
+
+    def _enqueue(self, listener: EventListener, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        if self.max_queue_size is not None and self._pending_calls() >= self.max_queue_size:
+            if self.overflow_policy == "raise":
+                raise EventQueueFullException(f"event queue is full ({self.max_queue_size} pending listener calls)")
+            if self.overflow_policy == "drop_new":
+                logger.warning("Event queue is full, dropping call of listener %s", listener.fn.__name__)
+                return
+            # the heap is ordered by priority, so the oldest entry has to be searched for
+            oldest = min(
+                (*self._queue, *(blocked[0] for blocked in self._blocked.values() if blocked)),
+                key=lambda entry: entry[1],
+            )
+            if (blocked := self._blocked.get(oldest[2])) and blocked[0] is oldest:
+                blocked.popleft()
+            else:
+                self._queue.remove(oldest)
+                heapify(self._queue)
+            logger.warning("Event queue is full, dropped the oldest pending listener call")
+
+        heappush(self._queue, (-listener.priority, next(self._counter), listener, args, kwargs))
 
     async def __aenter__(self) -> SimpleEventEmitter:
         self._exit_stack = AsyncExitStack()
-        send_stream, receive_stream = anyio.create_memory_object_stream(math.inf)  # type: ignore[var-annotated]
-        self._send_stream = send_stream
-        task_group = anyio.create_task_group()
-
-        await self._exit_stack.enter_async_context(task_group)
-        await self._exit_stack.enter_async_context(send_stream)
-        task_group.start_soon(self._worker, receive_stream)
+        self._concurrency = anyio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        self._listener_concurrency = {
+            listener: anyio.Semaphore(listener.max_concurrency)
+            for listeners in self.listeners.values()
+            for listener in listeners
+            if listener.max_concurrency
+        }
+        self._worker_done = anyio.Event()
+        self._task_group = anyio.create_task_group()
+        self._accepting = True
+
+        await self._exit_stack.enter_async_context(self._task_group)
+        self._task_group.start_soon(self._worker)
 
         return self
 
@@ -107,11 +244,28 @@ class SimpleEventEmitter(BaseEventEmitterBackend):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        self._accepting = False
+        if self._wakeup:
+            self._wakeup.set()
+
+        if self._worker_done and self.shutdown_timeout is not None:
+            with anyio.move_on_after(self.shutdown_timeout):
+                await self._worker_done.wait()
+            if not self._worker_done.is_set():
+                logger.warning(
+                    "Event listeners did not finish within %s seconds, cancelling them and discarding %d pending calls",
+                    self.shutdown_timeout,
+                    self._pending_calls(),
+                )
+                self._task_group.cancel_scope.cancel()  # type: ignore[union-attr]
+                self._queue.clear()
+                self._blocked.clear()
+
         if self._exit_stack:
             await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
 
         self._exit_stack = None
-        self._send_stream = None
+        self._task_group = None
 
     def emit(self, event_id: str, *args: Any, **kwargs: Any) -> None:
         """Emit an event to all attached listeners.
@@ -123,12 +277,146 @@ class SimpleEventEmitter(BaseEventEmitterBackend):
 
         Returns:
             None
+
+        Raises:
+            EventQueueFullException: If the queue is full and ``overflow_policy`` is ``raise``.
         """
-        if not (self._send_stream and self._exit_stack):
+        if not (self._accepting and self._exit_stack):
             raise RuntimeError("Emitter not initialized")
 
+        self._dispatch(event_id, args, kwargs)
+
+    def _dispatch(self, event_id: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
         if listeners := self.listeners.get(event_id):
             for listener in listeners:
-                self._send_stream.send_nowait((listener.fn, args, kwargs))
+                self._enqueue(listener, args, kwargs)
+            if self._wakeup:
+                self._wakeup.set()
             return
         raise ImproperlyConfiguredException(f"no event listeners are registered for event ID: {event_id}")
+
+
+class ChannelsEventEmitter(SimpleEventEmitter):
+    """Event emitter distributing events to all processes through a
+    :class:`ChannelsBackend <litestar.channels.backends.base.ChannelsBackend>`.
+
+    Emitted events are published to a channel, and every emitter subscribed to it runs its listeners for the events it
+    receives, including the emitter that published the event. Arguments passed to :meth:`emit` are serialized as JSON.
+    """
+
+    __slots__ = (
+        "_publish_queue",
+        "_publish_ready",
+        "_publisher_done",
+        "_publishing",
+        "_receive_scope",
+        "backend",
+        "channel",
+    )
+
+    def __init__(
+        self,
+        listeners: Sequence[EventListener],
+        *,
+        backend: ChannelsBackend,
+        channel: str = "litestar_events",
+        max_queue_size: int | None = None,
+        overflow_policy: OverflowPolicy = "raise",
+        max_concurrency: int | None = None,
+        shutdown_timeout: float | None = None,
+    ) -> None:
+        """Create an event emitter instance.
+
+        Args:
+            listeners: A list of listeners.
+            backend: The channels backend to distribute events with. It should not be shared with a
+                :class:`ChannelsPlugin <litestar.channels.ChannelsPlugin>`.
+            channel: The channel to publish events to.
+            max_queue_size: Maximum number of listener calls waiting to be started in this process.
+            overflow_policy: What to do when receiving an event while the queue is full.
+            max_concurrency: Maximum number of listener calls to run concurrently in this process.
+            shutdown_timeout: Maximum time in seconds to wait for listener calls to finish on shutdown.
+        """
+        super().__init__(
+            listeners=listeners,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+            max_concurrency=max_concurrency,
+            shutdown_timeout=shutdown_timeout,
+        )
+        self.backend = backend
+        self.channel = channel
+        self._publish_queue: list[bytes] = []
+        self._publishing = False
+        self._publish_ready: anyio.Event | None = None
+        self._publisher_done: anyio.Event | None = None
+        self._receive_scope: anyio.CancelScope | None = None
+
+    async def _publish_worker(self) -> None:
+        try:
+            while self._publishing or self._publish_queue:
+                if not self._publish_queue:
+                    self._publish_ready = anyio.Event()
+                    await self._publish_ready.wait()
+                    continue
+                messages, self._publish_queue = self._publish_queue, []
+                await self.backend.publish_many([(data, [self.channel]) for data in messages])
+        finally:
+            self._publisher_done.set()  # type: ignore[union-attr]
+
+    async def _receive_worker(self) -> None:
+        with self._receive_scope:  # type: ignore[union-attr]
+            async for _, data in self.backend.stream_events():
+                event_id, args, kwargs = msgspec.json.decode(data)
+                try:
+                    self._dispatch(event_id, args, kwargs)
+                except (EventQueueFullException, ImproperlyConfiguredException):
+                    logger.exception("Could not handle event %r", event_id)
+
+    async def __aenter__(self) -> ChannelsEventEmitter:
+        await self.backend.on_startup()
+        await self.backend.subscribe([self.channel])
+        await super().__aenter__()
+        self._exit_stack.push_async_callback(self.backend.on_shutdown)  # type: ignore[union-attr]
+        self._publishing = True
+        self._publisher_done = anyio.Event()
+        self._receive_scope = anyio.CancelScope()
+        self._task_group.start_soon(self._publish_worker)  # type: ignore[union-attr]
+        self._task_group.start_soon(self._receive_worker)  # type: ignore[union-attr]
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._publishing = False
+        if self._publish_ready:
+            self._publish_ready.set()
+        if self._publisher_done:
+            await self._publisher_done.wait()
+        if self._receive_scope:
+            self._receive_scope.cancel()
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    def emit(self, event_id: str, *args: Any, **kwargs: Any) -> None:
+        """Publish an event, to be handled by the listeners of all emitters subscribed to the channel.
+
+        Args:
+            event_id: The ID of the event to emit, e.g 'my_event'.
+            *args: args to pass to the listener(s). Must be serializable as JSON.
+            **kwargs: kwargs to pass to the listener(s). Must be serializable as JSON.
+
+        Returns:
+            None
+        """
+        if not self._publishing:
+            raise RuntimeError("Emitter not initialized")
+
+        if event_id not in self.listeners:
+            raise ImproperlyConfiguredException(f"no event listeners are registered for event ID: {event_id}")
+
+        self._publish_queue.append(encode_json((event_id, args, kwargs)))
+        if self._publish_ready:
+            self._publish_ready.set()
@@ -17,18 +17,25 @@ logger = logging.getLogger(__name__)
 class EventListener:
     """Decorator for event listeners"""
 
-    __slots__ = ("event_ids", "fn", "listener_id")
+    __slots__ = ("event_ids", "fn", "listener_id", "max_concurrency", "priority")
 
     fn: AsyncAnyCallable
 
-    def __init__(self, *event_ids: str) -> None:
+    def __init__(self, *event_ids: str, priority: int = 0, max_concurrency: int | None = None) -> None:
         """Create a decorator for event handlers.
 
         Args:
             *event_ids: The id of the event to listen to or a list of
                 event ids to listen to.
+            priority: Calls of listeners with a higher priority are started first, if the emitter has to queue them.
+            max_concurrency: Maximum number of calls of this listener to run concurrently.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ImproperlyConfiguredException("max_concurrency must be a positive integer")
+
         self.event_ids: frozenset[str] = frozenset(event_ids)
+        self.priority = priority
+        self.max_concurrency = max_concurrency
 
     def __call__(self, fn: AnyCallable) -> EventListener:
         """Decorate a callable by wrapping it inside an instance of EventListener.
@@ -527,7 +527,12 @@ class BaseRouteHandler:
 
     @staticmethod
     def _validate_dependency_is_unique(dependencies: dict[str, Provide], key: str, provider: Provide) -> None:
-        """Validate that a given provider has not been already defined under a different key."""
+        """Validate that a given provider has not been already defined under a different key.
+
+        Request scoped providers are exempt, since they share their value across keys.
+        """
+        if provider.cache_scope == "request":
+            return
         for dependency_key, value in dependencies.items():
             if provider == value:
                 raise ImproperlyConfiguredException(
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any, Sequence, cast
 from litestar.enums import HttpMethod
 from litestar.exceptions import ValidationException
 from litestar.response import Response
+from litestar.response.base import _StaticHeaders
+from litestar.serialization import get_json_encoder, get_msgpack_encoder, get_serializer
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
 from litestar.types.builtin_types import NoneType
 
@@ -56,6 +58,13 @@ def create_data_handler(
 
     """
 
+    normalized_headers = normalize_headers(headers)
+    static_headers = _StaticHeaders.create(normalized_headers, cookies)
+    # build the encoders for the type encoders of the responses created below once, instead of for every response
+    serializer = get_serializer({**(response_class.type_encoders or {}), **(type_encoders or {})})
+    json_encoder = get_json_encoder(serializer)
+    msgpack_encoder = get_msgpack_encoder(serializer)
+
     async def handler(
         data: Any,
         request: Request[Any, Any, Any],
@@ -65,7 +74,7 @@ def create_data_handler(
         if isawaitable(data):
             data = await data
 
-        response = response_class(
+        response = created_response = response_class(
             background=background,
             content=data,
             media_type=media_type,
@@ -76,7 +85,20 @@ def create_data_handler(
         if after_request:
             response = await after_request(response)  # type: ignore[arg-type,misc]
 
-        return response.to_asgi_response(app=None, request=request, headers=normalize_headers(headers), cookies=cookies)  # pyright: ignore
+        if type(response).to_asgi_response is Response.to_asgi_response:
+            if response is not created_response:
+                # the response returned by the after request hook may use different type encoders
+                return response._create_asgi_response(
+                    cookies=response.cookies, headers=response.headers, static_headers=static_headers
+                )
+            return response._create_asgi_response(
+                cookies=response.cookies,
+                headers=response.headers,
+                static_headers=static_headers,
+                json_encoder=json_encoder,
+                msgpack_encoder=msgpack_encoder,
+            )
+        return response.to_asgi_response(app=None, request=request, headers=normalized_headers, cookies=cookies)  # pyright: ignore
 
     return handler
 
@@ -141,6 +163,7 @@ def create_response_handler(
 
     normalized_headers = normalize_headers(headers)
     cookie_list = list(cookies)
+    static_headers = _StaticHeaders.create(normalized_headers, cookie_list)
 
     async def handler(
         data: Response,
@@ -149,6 +172,16 @@ def create_response_handler(
         **kwargs: Any,  # kwargs is for return dto
     ) -> ASGIApp:
         response = await after_request(data) if after_request else data  # type:ignore[arg-type,misc]
+        if type(response).to_asgi_response is Response.to_asgi_response:
+            return response._create_asgi_response(
+                background=background,
+                cookies=response.cookies,
+                headers=response.headers,
+                media_type=media_type,
+                static_headers=static_headers,
+                status_code=status_code,
+                type_encoders=type_encoders,
+            )
         return response.to_asgi_response(  # type: ignore[no-any-return]
             app=None,
             background=background,
@@ -5,11 +5,12 @@ from typing import TYPE_CHECKING, Pattern, Sequence
 
 from litestar.exceptions import ImproperlyConfiguredException
 
-__all__ = ("build_exclude_path_pattern", "should_bypass_middleware")
+__all__ = ("build_exclude_path_pattern", "should_bypass_middleware", "should_bypass_middleware_for_route")
 
 
 if TYPE_CHECKING:
-    from litestar.types import Method, Scope, Scopes
+    from litestar.enums import ScopeType
+    from litestar.types import Method, RouteHandlerType, Scope, Scopes
 
 
 def build_exclude_path_pattern(*, exclude: str | list[str] | None = None) -> Pattern | None:
@@ -67,3 +68,37 @@ def should_bypass_middleware(
             scope["raw_path"].decode() if getattr(scope.get("route_handler", {}), "is_mount", False) else scope["path"]
         )
     )
+
+
+def should_bypass_middleware_for_route(
+    *,
+    exclude_http_methods: Sequence[Method] | None = None,
+    exclude_opt_key: str | None = None,
+    method: Method | None,
+    route_handler: RouteHandlerType,
+    scope_type: ScopeType | None,
+    scopes: Scopes,
+) -> bool:
+    """Determine whether a middleware would be bypassed for every request to a route, so it can be left out of the
+    route's middleware stack.
+
+    Exclusion by path patterns depends on the requested path and can therefore not be determined here.
+
+    Args:
+        exclude_http_methods: A sequence of http methods that do not require authentication.
+        exclude_opt_key: Key in ``opt`` with which a route handler can "opt-out" of a middleware.
+        method: The http method the middleware stack is built for, if any.
+        route_handler: The route handler the middleware stack is built for.
+        scope_type: The type of the ASGI scopes handled by the route, or ``None`` if it can handle any type.
+        scopes: A set with the ASGI scope types that are supported by the middleware.
+
+    Returns:
+        A boolean indicating if a middleware should be left out of the middleware stack
+    """
+    if scope_type is not None and scope_type not in scopes:
+        return True
+
+    if exclude_opt_key and route_handler.opt.get(exclude_opt_key):
+        return True
+
+    return bool(exclude_http_methods and method in exclude_http_methods)
@@ -9,13 +9,14 @@ from litestar.enums import HttpMethod, ScopeType
 from litestar.middleware._utils import (
     build_exclude_path_pattern,
     should_bypass_middleware,
+    should_bypass_middleware_for_route,
 )
 
 __all__ = ("AbstractAuthenticationMiddleware", "AuthenticationResult")
 
 
 if TYPE_CHECKING:
-    from litestar.types import ASGIApp, Method, Receive, Scope, Scopes, Send
+    from litestar.types import ASGIApp, Method, Receive, RouteHandlerType, Scope, Scopes, Send
 
 
 @dataclass
@@ -89,6 +90,31 @@ class AbstractAuthenticationMiddleware(ABC):
             scope["auth"] = auth_result.auth
         await self.app(scope, receive, send)
 
+    def should_bypass_for_route(
+        self, route_handler: RouteHandlerType, scope_type: ScopeType | None, method: Method | None
+    ) -> bool:
+        """Determine whether authentication would be skipped for every request to a route.
+
+        Called when building the middleware stack of a route. If ``True`` is returned, the middleware is left out of
+        the route's stack entirely.
+
+        Args:
+            route_handler: The route handler the middleware stack is built for.
+            scope_type: The type of the ASGI scopes handled by the route, or ``None`` if it can handle any type.
+            method: The http method the middleware stack is built for, if any.
+
+        Returns:
+            A boolean indicating if the middleware should be left out of the route's middleware stack
+        """
+        return should_bypass_middleware_for_route(
+            exclude_http_methods=self.exclude_http_methods,
+            exclude_opt_key=self.exclude_opt_key,
+            method=method,
+            route_handler=route_handler,
+            scope_type=scope_type,
+            scopes=self.scopes,
+        )
+
     @abstractmethod
     async def authenticate_request(self, connection: ASGIConnection) -> AuthenticationResult:
         """Receive the http connection and return an :class:`AuthenticationResult`.
@@ -7,13 +7,14 @@ from litestar.enums import ScopeType
 from litestar.middleware._utils import (
     build_exclude_path_pattern,
     should_bypass_middleware,
+    should_bypass_middleware_for_route,
 )
 
 __all__ = ("AbstractMiddleware", "DefineMiddleware", "MiddlewareProtocol")
 
 
 if TYPE_CHECKING:
-    from litestar.types import Scopes
+    from litestar.types import Method, RouteHandlerType, Scopes
     from litestar.types.asgi_types import ASGIApp, Receive, Scope, Send
 
 
@@ -111,6 +112,31 @@ class AbstractMiddleware:
         self.exclude_opt_key = exclude_opt_key or self.exclude_opt_key
         self.exclude_pattern = build_exclude_path_pattern(exclude=(exclude or self.exclude))
 
+    def should_bypass_for_route(
+        self, route_handler: RouteHandlerType, scope_type: ScopeType | None, method: Method | None
+    ) -> bool:
+        """Determine whether the middleware would be bypassed for every request to a route.
+
+        Called when building the middleware stack of a route. If ``True`` is returned, the middleware is left out of
+        the route's stack entirely. Subclasses that perform work even when being bypassed should override this to
+        return ``False``.
+
+        Args:
+            route_handler: The route handler the middleware stack is built for.
+            scope_type: The type of the ASGI scopes handled by the route, or ``None`` if it can handle any type.
+            method: The http method the middleware stack is built for, if any.
+
+        Returns:
+            A boolean indicating if the middleware should be left out of the route's middleware stack
+        """
+        return should_bypass_middleware_for_route(
+            exclude_opt_key=self.exclude_opt_key,
+            method=method,
+            route_handler=route_handler,
+            scope_type=scope_type,
+            scopes=self.scopes,
+        )
+
     @classmethod
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
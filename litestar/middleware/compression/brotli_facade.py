@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 
 
 class BrotliCompression(CompressionFacade):
-    __slots__ = ("compressor", "buffer", "compression_encoding")
+    __slots__ = ("compressor", "buffer", "compression_encoding", "flush_chunks")
 
     encoding = CompressionEncoding.BROTLI
 
@@ -31,6 +31,7 @@ class BrotliCompression(CompressionFacade):
     ) -> None:
         self.buffer = buffer
         self.compression_encoding = compression_encoding
+        self.flush_chunks = config.flush_chunks
         modes: dict[Literal["generic", "text", "font"], int] = {
             "text": int(MODE_TEXT),
             "font": int(MODE_FONT),
@@ -45,7 +46,8 @@ class BrotliCompression(CompressionFacade):
 
     def write(self, body: bytes) -> None:
         self.buffer.write(self.compressor.process(body))
-        self.buffer.write(self.compressor.flush())
+        if self.flush_chunks:
+            self.buffer.write(self.compressor.flush())
 
     def close(self) -> None:
         self.buffer.write(self.compressor.finish())
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 
 class GzipCompression(CompressionFacade):
-    __slots__ = ("compressor", "buffer", "compression_encoding")
+    __slots__ = ("compressor", "buffer", "compression_encoding", "flush_chunks")
 
     encoding = CompressionEncoding.GZIP
 
@@ -22,11 +22,13 @@ class GzipCompression(CompressionFacade):
     ) -> None:
         self.buffer = buffer
         self.compression_encoding = compression_encoding
+        self.flush_chunks = config.flush_chunks
         self.compressor = GzipFile(mode="wb", fileobj=buffer, compresslevel=config.gzip_compress_level)
 
     def write(self, body: bytes) -> None:
         self.compressor.write(body)
-        self.compressor.flush()
+        if self.flush_chunks:
+            self.compressor.flush()
 
     def close(self) -> None:
         self.compressor.close()
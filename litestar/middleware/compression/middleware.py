@@ -3,11 +3,15 @@ from __future__ import annotations
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Literal
 
+from litestar.concurrency import sync_to_thread
+from litestar.constants import HTTP_RESPONSE_PATHSEND
 from litestar.datastructures import Headers, MutableScopeHeaders
 from litestar.enums import CompressionEncoding, ScopeType
 from litestar.middleware.base import AbstractMiddleware
 from litestar.middleware.compression.gzip_facade import GzipCompression
+from litestar.status_codes import HTTP_206_PARTIAL_CONTENT
 from litestar.utils.empty import value_or_default
+from litestar.utils.scope import disable_scope_extension
 from litestar.utils.scope.state import ScopeState
 
 if TYPE_CHECKING:
@@ -28,6 +32,12 @@ if TYPE_CHECKING:
         Compressor = Any
 
 
+def _write_to_facade(facade: CompressionFacade, body: bytes, close: bool) -> None:
+    facade.write(body)
+    if close:
+        facade.close()
+
+
 class CompressionMiddleware(AbstractMiddleware):
     """Compression Middleware Wrapper.
 
@@ -58,30 +68,40 @@ class CompressionMiddleware(AbstractMiddleware):
             None
         """
         accept_encoding = Headers.from_scope(scope).get("accept-encoding", "")
-        config = self.config
 
-        if config.compression_facade.encoding in accept_encoding:
+        if compression_encoding := self.config.resolve_encoding(accept_encoding):
+            # file responses have to be sent as body messages, so they can be compressed
+            disable_scope_extension(scope, HTTP_RESPONSE_PATHSEND)
             await self.app(
                 scope,
                 receive,
-                self.create_compression_send_wrapper(
-                    send=send, compression_encoding=config.compression_facade.encoding, scope=scope
-                ),
-            )
-            return
-
-        if config.gzip_fallback and CompressionEncoding.GZIP in accept_encoding:
-            await self.app(
-                scope,
-                receive,
-                self.create_compression_send_wrapper(
-                    send=send, compression_encoding=CompressionEncoding.GZIP, scope=scope
-                ),
+                self.create_compression_send_wrapper(send=send, compression_encoding=compression_encoding, scope=scope),
             )
             return
 
         await self.app(scope, receive, send)
 
+    async def compress(self, facade: CompressionFacade, body: bytes, close: bool = False) -> None:
+        """Write a chunk of the response body to a compression facade.
+
+        If the chunk is at least as large as the configured
+        :attr:`thread_offload_threshold <.config.compression.CompressionConfig.thread_offload_threshold>`, it is
+        compressed in a worker thread.
+
+        Args:
+            facade: The compression facade of the response.
+            body: A chunk of the response body.
+            close: Whether to close the compression stream after writing the chunk.
+
+        Returns:
+            None
+        """
+        threshold = self.config.thread_offload_threshold
+        if threshold is not None and len(body) >= threshold:
+            await sync_to_thread(_write_to_facade, facade, body, close)
+        else:
+            _write_to_facade(facade, body, close)
+
     def create_compression_send_wrapper(
         self,
         send: Send,
@@ -112,6 +132,7 @@ class CompressionMiddleware(AbstractMiddleware):
 
         initial_message: HTTPResponseStartEvent | None = None
         started = False
+        passthrough = False
 
         connection_state = ScopeState.from_scope(scope)
 
@@ -123,11 +144,22 @@ class CompressionMiddleware(AbstractMiddleware):
             """
             nonlocal started
             nonlocal initial_message
+            nonlocal passthrough
 
             if message["type"] == "http.response.start":
+                if message["status"] == HTTP_206_PARTIAL_CONTENT or "content-encoding" in MutableScopeHeaders(message):
+                    # byte ranges refer to the uncompressed content, so partial content is sent as is, and so is
+                    # content that has already been encoded, e.g. a precompressed static file
+                    passthrough = True
+                    await send(message)
+                    return
                 initial_message = message
                 return
 
+            if passthrough:
+                await send(message)
+                return
+
             if initial_message is not None and value_or_default(connection_state.is_cached, False):
                 await send(initial_message)
                 await send(message)
@@ -146,7 +178,7 @@ class CompressionMiddleware(AbstractMiddleware):
                         del headers["Content-Length"]
                         connection_state.response_compressed = True
 
-                        facade.write(body)
+                        await self.compress(facade, body)
 
                         message["body"] = bytes_buffer.getvalue()
                         bytes_buffer.seek(0)
@@ -155,8 +187,7 @@ class CompressionMiddleware(AbstractMiddleware):
                         await send(message)
 
                     elif len(body) >= self.config.minimum_size:
-                        facade.write(body)
-                        facade.close()
+                        await self.compress(facade, body, close=True)
                         body = bytes_buffer.getvalue()
 
                         headers = MutableScopeHeaders(initial_message)
@@ -174,9 +205,7 @@ class CompressionMiddleware(AbstractMiddleware):
                         await send(message)
 
                 else:
-                    facade.write(body)
-                    if not more_body:
-                        facade.close()
+                    await self.compress(facade, body, close=not more_body)
 
                     message["body"] = bytes_buffer.getvalue()
 
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+from litestar.enums import CompressionEncoding
+from litestar.exceptions import MissingDependencyException
+from litestar.middleware.compression.facade import CompressionFacade
+
+try:
+    from zstandard import COMPRESSOBJ_FLUSH_BLOCK, ZstdCompressor
+except ImportError as e:
+    raise MissingDependencyException("zstandard", extra="zstd") from e
+
+
+if TYPE_CHECKING:
+    from io import BytesIO
+
+    from litestar.config.compression import CompressionConfig
+
+
+class ZstdCompression(CompressionFacade):
+    __slots__ = ("buffer", "compression_encoding", "compressor", "flush_chunks")
+
+    encoding = CompressionEncoding.ZSTD
+
+    def __init__(
+        self,
+        buffer: BytesIO,
+        compression_encoding: Literal[CompressionEncoding.ZSTD] | str,
+        config: CompressionConfig,
+    ) -> None:
+        self.buffer = buffer
+        self.compression_encoding = compression_encoding
+        self.flush_chunks = config.flush_chunks
+        self.compressor = ZstdCompressor(level=config.zstd_level).compressobj()
+
+    def write(self, body: bytes) -> None:
+        self.buffer.write(self.compressor.compress(body))
+        if self.flush_chunks:
+            self.buffer.write(self.compressor.flush(COMPRESSOBJ_FLUSH_BLOCK))
+
+    def close(self) -> None:
+        self.buffer.write(self.compressor.flush())
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Iterable
 
 from litestar.constants import (
     HTTP_RESPONSE_BODY,
+    HTTP_RESPONSE_PATHSEND,
     HTTP_RESPONSE_START,
 )
 from litestar.data_extractors import (
@@ -226,6 +227,14 @@ class LoggingMiddleware(AbstractMiddleware):
             elif message["type"] == HTTP_RESPONSE_BODY:
                 connection_state.log_context[HTTP_RESPONSE_BODY] = message
                 self.log_response(scope=scope)
+            elif message["type"] == HTTP_RESPONSE_PATHSEND:
+                # the server sends the file, so there is no body to log
+                connection_state.log_context[HTTP_RESPONSE_BODY] = {
+                    "type": HTTP_RESPONSE_BODY,
+                    "body": b"",
+                    "more_body": False,
+                }
+                self.log_response(scope=scope)
             await send(message)
 
         return send_wrapper
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from math import ceil
 from time import time
 from typing import TYPE_CHECKING, Any, Callable, Literal, cast
 
@@ -11,7 +12,7 @@ from litestar.middleware.base import AbstractMiddleware, DefineMiddleware
 from litestar.serialization import decode_json, encode_json
 from litestar.utils import ensure_async_callable
 
-__all__ = ("CacheObject", "RateLimitConfig", "RateLimitMiddleware")
+__all__ = ("CacheObject", "RateLimitConfig", "RateLimitMiddleware", "RateLimitState")
 
 
 if TYPE_CHECKING:
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
 
 
 DurationUnit = Literal["second", "minute", "hour", "day"]
+RateLimitAlgorithm = Literal["history", "fixed_window", "sliding_window", "token_bucket"]
 
 DURATION_VALUES: dict[DurationUnit, int] = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
 
@@ -38,6 +40,20 @@ class CacheObject:
     reset: int
 
 
+@dataclass
+class RateLimitState:
+    """Result of checking a request against a counter based rate limiting algorithm."""
+
+    __slots__ = ("allowed", "remaining", "reset")
+
+    allowed: bool
+    """Whether the request is within the rate limit."""
+    remaining: int
+    """Number of requests remaining in the current quota."""
+    reset: int
+    """Time in seconds until the quota resets."""
+
+
 class RateLimitMiddleware(AbstractMiddleware):
     """Rate-limiting middleware."""
 
@@ -74,25 +90,33 @@ class RateLimitMiddleware(AbstractMiddleware):
         store = self.config.get_store_from_app(app)
         if await self.should_check_request(request=request):
             key = self.cache_key_from_request(request=request)
-            cache_object = await self.retrieve_cached_history(key, store)
-            if len(cache_object.history) >= self.max_requests:
+            cache_object: CacheObject | RateLimitState
+            if self.config.algorithm == "history":
+                cache_object = await self.retrieve_cached_history(key, store)
+                allowed = len(cache_object.history) < self.max_requests
+            else:
+                cache_object = await self.check_rate_limit(key, store)
+                allowed = cache_object.allowed
+
+            if not allowed:
                 raise TooManyRequestsException(
                     headers=self.create_response_headers(cache_object=cache_object)
                     if self.config.set_rate_limit_headers
                     else None
                 )
-            await self.set_cached_history(key=key, cache_object=cache_object, store=store)
+            if isinstance(cache_object, CacheObject):
+                await self.set_cached_history(key=key, cache_object=cache_object, store=store)
             if self.config.set_rate_limit_headers:
                 send = self.create_send_wrapper(send=send, cache_object=cache_object)
 
         await self.app(scope, receive, send)  # pyright: ignore
 
-    def create_send_wrapper(self, send: Send, cache_object: CacheObject) -> Send:
+    def create_send_wrapper(self, send: Send, cache_object: CacheObject | RateLimitState) -> Send:
         """Create a ``send`` function that wraps the original send to inject response headers.
 
         Args:
             send: The ASGI send function.
-            cache_object: A StorageObject instance.
+            cache_object: A :class:`CacheObject` or :class:`RateLimitState`.
 
         Returns:
             Send wrapper callable.
@@ -174,6 +198,64 @@ class RateLimitMiddleware(AbstractMiddleware):
         cache_object.history = [int(time()), *cache_object.history]
         await store.set(key, encode_json(cache_object), expires_in=DURATION_VALUES[self.unit])
 
+    async def check_rate_limit(self, key: str, store: Store) -> RateLimitState:
+        """Count a request against the rate limit, using the counter based algorithm set in
+        :attr:`RateLimitConfig.algorithm`.
+
+        Each algorithm counts a request with an atomic :meth:`Store.incr <.stores.base.Store.incr>` operation, so the
+        cost of a request does not depend on the size of the quota. The sliding window additionally reads the count of
+        the previous window, which is a separate, non-atomic operation. If a request is rejected, its increment is
+        undone with a second :meth:`Store.incr <.stores.base.Store.incr>`, so that clients retrying while they are
+        limited do not extend their own limit.
+
+        Args:
+            key: Cache key.
+            store: A :class:`Store <.stores.base.Store>`
+
+        Returns:
+            A :class:`RateLimitState`.
+        """
+        duration = DURATION_VALUES[self.unit]
+        now = time()
+
+        if self.config.algorithm == "token_bucket":
+            # generic cell rate algorithm: the stored value is the theoretical arrival time of the next request in
+            # milliseconds. Each request pushes it forward by the time it takes to regenerate one token.
+            now_ms = int(now * 1000)
+            duration_ms = duration * 1000
+            emission_interval = max(duration_ms // self.max_requests, 1)
+            arrival_time = await store.incr(key, emission_interval, expires_in=duration, floor=now_ms)
+            if arrival_time - now_ms > duration_ms:
+                # undo the increment, so rejected requests do not consume tokens. The next token is available once
+                # the arrival time is within the duration again
+                await store.incr(key, -emission_interval)
+                return RateLimitState(
+                    allowed=False, remaining=0, reset=ceil((arrival_time - now_ms - duration_ms) / 1000)
+                )
+            return RateLimitState(
+                allowed=True,
+                remaining=(duration_ms - arrival_time + now_ms) // emission_interval,
+                reset=ceil((arrival_time - now_ms) / 1000),
+            )
+
+        window = int(now // duration)
+        reset = ceil((window + 1) * duration - now)
+        window_key = f"{key}::{window}"
+        count = await store.incr(window_key, expires_in=duration * 2)
+
+        if self.config.algorithm == "sliding_window":
+            # weigh the previous window's count by the share of it that is still covered by the sliding window
+            previous = await store.get(f"{key}::{window - 1}")
+            if previous:
+                count += int(int(previous) * (1 - (now - window * duration) / duration))
+
+        if count > self.max_requests:
+            # undo the increment, so rejected requests are not counted against the current or the following window
+            await store.incr(window_key, -1)
+            return RateLimitState(allowed=False, remaining=0, reset=reset)
+
+        return RateLimitState(allowed=True, remaining=self.max_requests - count, reset=reset)
+
     async def should_check_request(self, request: Request[Any, Any, Any]) -> bool:
         """Return a boolean indicating if a request should be checked for rate limiting.
 
@@ -187,27 +269,32 @@ class RateLimitMiddleware(AbstractMiddleware):
             return await self.check_throttle_handler(request)
         return True
 
-    def create_response_headers(self, cache_object: CacheObject) -> dict[str, str]:
+    def create_response_headers(self, cache_object: CacheObject | RateLimitState) -> dict[str, str]:
         """Create ratelimit response headers.
 
         Notes:
             * see the `IETF RateLimit draft <https://datatracker.ietf.org/doc/draft-ietf-httpapi-ratelimit-headers/>_`
 
         Args:
-            cache_object:A :class:`CacheObject`.
+            cache_object: A :class:`CacheObject` or :class:`RateLimitState`.
 
         Returns:
             A dict of http headers.
         """
-        remaining_requests = str(
-            len(cache_object.history) - self.max_requests if len(cache_object.history) <= self.max_requests else 0
-        )
+        if isinstance(cache_object, RateLimitState):
+            remaining_requests = str(cache_object.remaining)
+            reset = str(cache_object.reset)
+        else:
+            remaining_requests = str(
+                len(cache_object.history) - self.max_requests if len(cache_object.history) <= self.max_requests else 0
+            )
+            reset = str(int(time()) - cache_object.reset)
 
         return {
             self.config.rate_limit_policy_header_key: f"{self.max_requests}; w={DURATION_VALUES[self.unit]}",
             self.config.rate_limit_limit_header_key: str(self.max_requests),
             self.config.rate_limit_remaining_header_key: remaining_requests,
-            self.config.rate_limit_reset_header_key: str(int(time()) - cache_object.reset),
+            self.config.rate_limit_reset_header_key: reset,
         }
 
 
@@ -217,6 +304,20 @@ class RateLimitConfig:
 
     rate_limit: tuple[DurationUnit, int]
     """A tuple containing a time unit (second, minute, hour, day) and quantity, e.g. ("day", 1) or ("minute", 5)."""
+    algorithm: RateLimitAlgorithm = field(default="history")
+    """The algorithm used to limit requests.
+
+    - ``history``: Store a list of request timestamps per client. The list has to be retrieved and stored again on
+      every request, so its cost grows with the quota.
+    - ``fixed_window``: Count requests per client in fixed windows of the configured time unit.
+    - ``sliding_window``: Like ``fixed_window``, but the count of the previous window is weighted into the count of
+      the current one, which smooths bursts at window boundaries.
+    - ``token_bucket``: Allow bursts of up to the quota, regenerating tokens evenly over the time unit.
+
+    The counter based algorithms rely on :meth:`Store.incr <.stores.base.Store.incr>`, which is atomic for the
+    builtin memory and redis stores, and have a constant cost per request. ``sliding_window`` reads the count of the
+    previous window in a separate operation. Rejected requests are not counted.
+    """
     exclude: str | list[str] | None = field(default=None)
     """A pattern or list of patterns to skip in the rate limiting middleware."""
     exclude_opt_key: str | None = field(default=None)
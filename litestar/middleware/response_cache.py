@@ -1,32 +1,201 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from asyncio import Task, create_task
+from time import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, cast
 
+import anyio
+from msgspec import Struct
+from msgspec.msgpack import Decoder
 from msgspec.msgpack import encode as encode_msgpack
 
-from litestar import Request
-from litestar.constants import HTTP_RESPONSE_BODY, HTTP_RESPONSE_START
-from litestar.enums import ScopeType
+from litestar.connection import Request
+from litestar.constants import HTTP_RESPONSE_BODY, HTTP_RESPONSE_PATHSEND, HTTP_RESPONSE_START
+from litestar.enums import CompressionEncoding, ScopeType
 from litestar.utils.empty import value_or_default
-from litestar.utils.scope.state import ScopeState
+from litestar.utils.scope import disable_scope_extension
+from litestar.utils.scope.state import CONNECTION_STATE_KEY, ScopeState
 
 from .base import AbstractMiddleware
 
 if TYPE_CHECKING:
     from litestar.config.response_cache import ResponseCacheConfig
+    from litestar.connection import ASGIConnection
     from litestar.handlers import HTTPRouteHandler
-    from litestar.types import ASGIApp, HTTPScope, Message, Receive, Scope, Send
+    from litestar.stores.base import Store
+    from litestar.types import ASGIApp, HTTPRequestEvent, HTTPScope, Message, Receive, Scope, Send
 
-__all__ = ["ResponseCacheMiddleware"]
+__all__ = ["CachedResponse", "ResponseCacheMiddleware", "get_response_cache_key"]
+
+_LOCK_POLL_INTERVAL = 0.05
+
+
+class CachedResponse(Struct, array_like=True):
+    """A cached response, consisting of the status code and headers sent at the start of the response, and the
+    complete body as a single chunk.
+    """
+
+    status: int
+    headers: List[Tuple[bytes, bytes]]  # noqa: UP006
+    body: bytes
+    stale_at: Optional[float] = None  # noqa: UP007
+    """Timestamp after which the response is stale and should be refreshed, if it is served beyond its expiry time."""
+
+    def to_bytes(self) -> bytes:
+        """Encode the instance to bytes"""
+        return encode_msgpack(self)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> CachedResponse:
+        """Load a previously encoded with :meth:`CachedResponse.to_bytes`"""
+        return _cached_response_decoder.decode(raw)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        connection_state = ScopeState.from_scope(scope)
+        connection_state.is_cached = True
+        if self.stale_at is not None and time() >= self.stale_at:
+            connection_state.is_stale = True
+        await send({"type": HTTP_RESPONSE_START, "status": self.status, "headers": self.headers})
+        await send({"type": HTTP_RESPONSE_BODY, "body": self.body, "more_body": False})
+
+
+_cached_response_decoder = Decoder(CachedResponse)
+
+
+def get_response_cache_key(connection: ASGIConnection, route_handler: HTTPRouteHandler) -> str:
+    """Get the key a response is cached under.
+
+    If compression is enabled, responses are cached separately for each encoding the compression middleware may
+    select, so cached responses can be served compressed without having to compress them again.
+
+    Args:
+        connection: The connection of the request.
+        route_handler: The route handler of the request.
+
+    Returns:
+        The cache key.
+    """
+    app = connection.app
+    key = (route_handler.cache_key_builder or app.response_cache_config.key_builder)(connection)  # type: ignore[arg-type]
+    if app.compression_config and (
+        encoding := app.compression_config.resolve_encoding(connection.headers.get("accept-encoding", ""))
+    ):
+        return f"{key}::{encoding.value if isinstance(encoding, CompressionEncoding) else encoding}"
+    return key
+
+
+async def _empty_receive() -> HTTPRequestEvent:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _discard_send(message: Message) -> None:
+    pass
 
 
 class ResponseCacheMiddleware(AbstractMiddleware):
     def __init__(self, app: ASGIApp, config: ResponseCacheConfig) -> None:
         self.config = config
+        self._in_flight: dict[str, anyio.Event] = {}
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: set[Task[None]] = set()
         super().__init__(app=app, scopes={ScopeType.HTTP})
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        config = self.config
+        if not (config.coalesce_requests or config.stale_while_revalidate):
+            await self.app(scope, receive, self._create_send_wrapper(scope, send))
+            return
+
         route_handler = cast("HTTPRouteHandler", scope["route_handler"])
+        key = get_response_cache_key(Request(scope), route_handler)
+        store = config.get_store_from_app(scope["app"])
+
+        if config.coalesce_requests:
+            await self._call_coalesced(scope, receive, send, key=key, store=store)
+        else:
+            await self.app(scope, receive, self._create_send_wrapper(scope, send))
+
+        if value_or_default(ScopeState.from_scope(scope).is_stale, False) and key not in self._refreshing:
+            self._start_refresh(scope, key=key, store=store)
+
+    async def _call_coalesced(self, scope: Scope, receive: Receive, send: Send, key: str, store: Store) -> None:
+        if (in_flight := self._in_flight.get(key)) is not None:
+            # another request is already computing the response, which will be in the cache once it is done
+            await in_flight.wait()
+            await self.app(scope, receive, self._create_send_wrapper(scope, send))
+            return
+
+        event = self._in_flight[key] = anyio.Event()
+
+        def release() -> None:
+            if self._in_flight.get(key) is event:
+                del self._in_flight[key]
+            event.set()
+
+        connection_state = ScopeState.from_scope(scope)
+
+        async def release_send(message: Message) -> None:
+            if message["type"] == HTTP_RESPONSE_START and value_or_default(connection_state.is_cached, False):
+                release()
+            await send(message)
+
+        lock_acquired = False
+        try:
+            if self.config.lock_expiration and not await store.exists(key):
+                lock_acquired = await self._acquire_lock(key, store=store, wait=True)
+            await self.app(scope, receive, self._create_send_wrapper(scope, release_send, on_cached=release))
+        finally:
+            release()
+            if lock_acquired:
+                await store.delete(f"{key}::lock")
+
+    def _start_refresh(self, scope: Scope, key: str, store: Store) -> None:
+        """Refresh a stale response in a background task, so neither the request that served it nor requests arriving
+        during the refresh have to wait for it. These keep being served the stale response until it has been replaced.
+        """
+        self._refreshing.add(key)
+        state = {k: v for k, v in scope.get("state", {}).items() if k != CONNECTION_STATE_KEY}
+        refresh_scope = cast("Scope", {**scope, "state": state})
+        ScopeState.from_scope(refresh_scope).skip_cache = True
+        # keep a reference to the task, so it is not garbage collected before it is done
+        task = create_task(self._refresh(refresh_scope, key=key, store=store))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, scope: Scope, key: str, store: Store) -> None:
+        """Call the route handler again to refresh a stale response."""
+        try:
+            if self.config.lock_expiration and not await self._acquire_lock(key, store=store, wait=False):
+                return
+            try:
+                await self.app(scope, _empty_receive, self._create_send_wrapper(scope, _discard_send))
+            finally:
+                if self.config.lock_expiration:
+                    await store.delete(f"{key}::lock")
+        finally:
+            self._refreshing.discard(key)
+
+    async def _acquire_lock(self, key: str, store: Store, wait: bool) -> bool:
+        """Acquire a lock for ``key`` in the store, shared between workers.
+
+        If ``wait`` is ``True`` and the lock is held by another worker, wait until it has been released or the response
+        has been cached.
+        """
+        lock_expiration = cast("int", self.config.lock_expiration)
+        lock_key = f"{key}::lock"
+        if await store.incr(lock_key, expires_in=lock_expiration) == 1:
+            return True
+
+        if wait:
+            with anyio.move_on_after(lock_expiration):
+                while await store.exists(lock_key) and not await store.exists(key):
+                    await anyio.sleep(_LOCK_POLL_INTERVAL)
+        return False
+
+    def _create_send_wrapper(self, scope: Scope, send: Send, on_cached: Callable[[], None] | None = None) -> Send:
+        route_handler = cast("HTTPRouteHandler", scope["route_handler"])
+        # the body of a file response has to be sent as body messages to be cached
+        disable_scope_extension(scope, HTTP_RESPONSE_PATHSEND)
 
         expires_in: int | None = None
         if route_handler.cache is True:
@@ -36,23 +205,43 @@ class ResponseCacheMiddleware(AbstractMiddleware):
 
         connection_state = ScopeState.from_scope(scope)
 
-        messages: list[Message] = []
+        start_message: Message | None = None
+        body_chunks: list[bytes] = []
 
         async def wrapped_send(message: Message) -> None:
+            nonlocal start_message
+
             if not value_or_default(connection_state.is_cached, False):
                 if message["type"] == HTTP_RESPONSE_START:
                     do_cache = connection_state.do_cache = self.config.cache_response_filter(
                         cast("HTTPScope", scope), message["status"]
                     )
                     if do_cache:
-                        messages.append(message)
-                elif value_or_default(connection_state.do_cache, False):
-                    messages.append(message)
-
-                if messages and message["type"] == HTTP_RESPONSE_BODY and not message["more_body"]:
-                    key = (route_handler.cache_key_builder or self.config.key_builder)(Request(scope))
-                    store = self.config.get_store_from_app(scope["app"])
-                    await store.set(key, encode_msgpack(messages), expires_in=expires_in)
+                        start_message = message
+                elif start_message is not None and message["type"] == HTTP_RESPONSE_BODY:
+                    body_chunks.append(message["body"])
+
+                    if not message.get("more_body", False):
+                        await self._store_response(
+                            scope, start_message=start_message, body=b"".join(body_chunks), expires_in=expires_in
+                        )
+                        if on_cached is not None:
+                            on_cached()
             await send(message)
 
-        await self.app(scope, receive, wrapped_send)
+        return wrapped_send
+
+    async def _store_response(self, scope: Scope, start_message: Message, body: bytes, expires_in: int | None) -> None:
+        cached_response = CachedResponse(
+            status=start_message["status"], headers=list(start_message.get("headers", [])), body=body
+        )
+        if expires_in is not None and self.config.stale_while_revalidate:
+            cached_response.stale_at = time() + expires_in
+            expires_in += self.config.stale_while_revalidate
+
+        store = self.config.get_store_from_app(scope["app"])
+        await store.set(
+            get_response_cache_key(Request(scope), cast("HTTPRouteHandler", scope["route_handler"])),
+            cached_response.to_bytes(),
+            expires_in=expires_in,
+        )
@@ -1,5 +1,6 @@
 from .base import Response
 from .file import File
+from .json_stream import JSONStream
 from .redirect import Redirect
 from .sse import ServerSentEvent, ServerSentEventMessage
 from .streaming import Stream
@@ -7,6 +8,7 @@ from .template import Template
 
 __all__ = (
     "File",
+    "JSONStream",
     "Redirect",
     "Response",
     "ServerSentEvent",
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import itertools
 import re
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterable, Literal, Mapping, TypeVar, overload
+from email.utils import parsedate_to_datetime
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterable, Literal, Mapping, NamedTuple, TypeVar, overload
+
+import msgspec
 
 from litestar.datastructures.cookie import Cookie
-from litestar.datastructures.headers import ETag, MutableScopeHeaders
+from litestar.datastructures.headers import ETag, Headers, MutableScopeHeaders
 from litestar.enums import MediaType, OpenAPIMediaType
-from litestar.exceptions import ImproperlyConfiguredException
+from litestar.exceptions import ImproperlyConfiguredException, SerializationException
 from litestar.serialization import default_serializer, encode_json, encode_msgpack, get_serializer
 from litestar.status_codes import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED
 from litestar.types.empty import Empty
@@ -23,6 +27,7 @@ if TYPE_CHECKING:
     from litestar.types import (
         HTTPResponseBodyEvent,
         HTTPResponseStartEvent,
+        RawHeaders,
         Receive,
         ResponseCookies,
         ResponseHeaders,
@@ -36,9 +41,58 @@ __all__ = ("ASGIResponse", "Response")
 
 T = TypeVar("T")
 
+_CONDITIONAL_METHODS = frozenset(("GET", "HEAD"))
+
+
+def _encode(encoder: msgspec.json.Encoder | msgspec.msgpack.Encoder, content: Any) -> bytes:
+    try:
+        return encoder.encode(content)
+    except (TypeError, msgspec.EncodeError) as msgspec_error:
+        raise SerializationException(str(msgspec_error)) from msgspec_error
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check if an etag matches any of the etags of an ``If-None-Match`` header, using the weak comparison.
+
+    Args:
+        if_none_match: The value of an ``If-None-Match`` header.
+        etag: The value of an ``ETag`` header.
+
+    Returns:
+        A boolean indicating whether the etag matches.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    return any(
+        (candidate[2:] if candidate.startswith("W/") else candidate) == opaque_tag
+        for candidate in (value.strip() for value in if_none_match.split(","))
+    )
+
+
 MEDIA_TYPE_APPLICATION_JSON_PATTERN = re.compile(r"^application/(?:.+\+)?json")
 
 
+class _StaticHeaders(NamedTuple):
+    """Headers and cookies that are encoded once and added to every response of a route handler."""
+
+    headers: tuple[tuple[bytes, bytes], ...]
+    """The encoded headers."""
+    names: frozenset[str]
+    """The lowercased names of the headers."""
+    cookies: tuple[tuple[bytes, bytes], ...]
+    """The encoded ``set-cookie`` headers."""
+
+    @classmethod
+    def create(cls, headers: Mapping[str, str], cookies: Iterable[Cookie]) -> _StaticHeaders:
+        encoded_headers = tuple((k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items())
+        return cls(
+            headers=encoded_headers,
+            names=frozenset(name.decode("latin-1") for name, _ in encoded_headers),
+            cookies=tuple(cookie.to_encoded_header() for cookie in cookies if not cookie.documentation_only),
+        )
+
+
 class ASGIResponse:
     """A low-level ASGI response class."""
 
@@ -69,6 +123,7 @@ class ASGIResponse:
         is_head_response: bool = False,
         media_type: MediaType | str | None = None,
         status_code: int | None = None,
+        static_headers: _StaticHeaders | None = None,
     ) -> None:
         """A low-level ASGI response class.
 
@@ -83,6 +138,8 @@ class ASGIResponse:
             is_head_response: A boolean indicating if the response is a HEAD response.
             media_type: The response media type.
             status_code: The response status code.
+            static_headers: Headers and cookies encoded ahead of time. The headers are added unless ``headers``
+                contains a header with the same name.
         """
         body = body.encode() if isinstance(body, str) else body
         status_code = status_code or HTTP_200_OK
@@ -93,6 +150,16 @@ class ASGIResponse:
             for header_name, header_value in encoded_headers:
                 self.headers.add(header_name.decode("latin-1"), header_value.decode("latin-1"))
 
+        if static_headers is not None and static_headers.headers:
+            if headers:
+                headers = list(headers.items() if isinstance(headers, dict) else headers)
+                overridden = {k.lower() for k, _ in headers} & static_headers.names
+                self.headers.headers.extend(
+                    header for header in static_headers.headers if header[0].decode("latin-1") not in overridden
+                )
+            else:
+                self.headers.headers.extend(static_headers.headers)
+
         if headers is not None:
             for k, v in headers.items() if isinstance(headers, dict) else headers:
                 self.headers.add(k, v)  # pyright: ignore
@@ -127,6 +194,8 @@ class ASGIResponse:
         self._encoded_cookies = tuple(
             cookie.to_encoded_header() for cookie in (cookies or ()) if not cookie.documentation_only
         )
+        if static_headers is not None and static_headers.cookies:
+            self._encoded_cookies += static_headers.cookies
         self.encoding = encoding
         self.is_head_response = is_head_response
         self.status_code = status_code
@@ -139,6 +208,60 @@ class ASGIResponse:
     def encode_headers(self) -> list[tuple[bytes, bytes]]:
         return [*self.headers.headers, *self._encoded_cookies]
 
+    def is_not_modified(self, request_headers: Headers) -> bool:
+        """Check if the representation the client has cached is still fresh, based on the request's
+        ``If-None-Match`` or ``If-Modified-Since`` headers and the response's ``ETag`` or ``Last-Modified`` headers.
+
+        Args:
+            request_headers: The request headers.
+
+        Returns:
+            A boolean indicating whether a ``304 Not Modified`` response should be sent instead.
+        """
+        if (if_none_match := request_headers.get("if-none-match")) is not None:
+            # 'If-Modified-Since' must be ignored if 'If-None-Match' is present
+            etag = self.headers.get("etag")
+            return etag is not None and _etag_matches(if_none_match, etag)
+
+        if (if_modified_since := request_headers.get("if-modified-since")) and (
+            last_modified := self.headers.get("last-modified")
+        ):
+            try:
+                return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def set_not_modified(self) -> None:
+        """Turn the response into a ``304 Not Modified`` response without a body.
+
+        Returns:
+            None
+        """
+        self.status_code = HTTP_304_NOT_MODIFIED
+        self.body = b""
+        self.content_length = 0
+        del self.headers["content-length"]
+        del self.headers["content-type"]
+
+    def evaluate_conditional_request(self, scope: Scope) -> None:
+        """Send a ``304 Not Modified`` response if the request is a conditional ``GET`` or ``HEAD`` request, and the
+        representation the client has cached is still fresh.
+
+        Args:
+            scope: The ASGI connection scope.
+
+        Returns:
+            None
+        """
+        if (
+            self.status_code == HTTP_200_OK
+            and scope.get("method") in _CONDITIONAL_METHODS
+            and ("etag" in self.headers or "last-modified" in self.headers)
+            and self.is_not_modified(Headers.from_scope(scope))
+        ):
+            self.set_not_modified()
+
     async def after_response(self) -> None:
         """Execute after the response is sent.
 
@@ -191,9 +314,10 @@ class ASGIResponse:
         Returns:
             None
         """
+        self.evaluate_conditional_request(scope)
         await self.start_response(send=send)
 
-        if self.is_head_response:
+        if self.is_head_response or self.status_code == HTTP_304_NOT_MODIFIED:
             event: HTTPResponseBodyEvent = {"type": "http.response.body", "body": b"", "more_body": False}
             await send(event)
         else:
@@ -214,6 +338,7 @@ class Response(Generic[T]):
         "media_type",
         "status_code",
         "response_type_encoders",
+        "_generate_etag",
     )
 
     content: T
@@ -260,6 +385,7 @@ class Response(Generic[T]):
         self.media_type = media_type
         self.status_code = status_code
         self.response_type_encoders = {**(self.type_encoders or {}), **(type_encoders or {})}
+        self._generate_etag = False
 
     @overload
     def set_cookie(self, /, cookie: Cookie) -> None: ...
@@ -333,17 +459,36 @@ class Response(Generic[T]):
         """
         self.headers[key] = value
 
-    def set_etag(self, etag: str | ETag) -> None:
+    def set_etag(self, etag: str | ETag | None = None) -> None:
         """Set an etag header.
 
         Args:
-            etag: An etag value.
+            etag: An etag value. If not given, a weak etag is generated from the rendered response body.
 
         Returns:
             None
         """
+        if etag is None:
+            self._generate_etag = True
+            return
         self.headers["etag"] = etag.to_header() if isinstance(etag, ETag) else etag
 
+    def _get_headers_with_etag(self, headers: dict[str, Any], body: bytes | str) -> dict[str, Any]:
+        """Add a generated weak etag to the response headers, if it has been requested with :meth:`set_etag`.
+
+        Args:
+            headers: The response headers.
+            body: The rendered response body.
+
+        Returns:
+            The response headers.
+        """
+        if not self._generate_etag:
+            return headers
+        if isinstance(body, str):
+            body = body.encode(self.encoding)
+        return {**headers, "etag": f'W/"{blake2b(body, digest_size=16).hexdigest()}"'}
+
     def delete_cookie(
         self,
         key: str,
@@ -364,9 +509,20 @@ class Response(Generic[T]):
         self.cookies = [c for c in self.cookies if c != cookie]
         self.cookies.append(cookie)
 
-    def render(self, content: Any, media_type: str, enc_hook: Serializer = default_serializer) -> bytes:
+    def render(
+        self,
+        content: Any,
+        media_type: str,
+        enc_hook: Serializer = default_serializer,
+        *,
+        json_encoder: msgspec.json.Encoder | None = None,
+        msgpack_encoder: msgspec.msgpack.Encoder | None = None,
+    ) -> bytes:
         """Handle the rendering of content into a bytes string.
 
+        If ``json_encoder`` or ``msgpack_encoder`` are given, they are used to encode the content instead of
+        ``enc_hook``.
+
         Returns:
             An encoded bytes string
         """
@@ -384,11 +540,15 @@ class Response(Generic[T]):
                 return content.encode(self.encoding)
 
             if media_type == MediaType.MESSAGEPACK:
+                if msgpack_encoder is not None:
+                    return _encode(msgpack_encoder, content)
                 return encode_msgpack(content, enc_hook)
 
             if MEDIA_TYPE_APPLICATION_JSON_PATTERN.match(
                 media_type,
             ):
+                if json_encoder is not None:
+                    return _encode(json_encoder, content)
                 return encode_json(content, enc_hook)
 
             raise ImproperlyConfiguredException(f"unsupported media_type {media_type} for content {content!r}")
@@ -439,21 +599,53 @@ class Response(Generic[T]):
         headers = {**headers, **self.headers} if headers is not None else self.headers
         cookies = self.cookies if cookies is None else itertools.chain(self.cookies, cookies)
 
-        if type_encoders:
-            type_encoders = {**type_encoders, **(self.response_type_encoders or {})}
-        else:
-            type_encoders = self.response_type_encoders
+        return self._create_asgi_response(
+            background=background,
+            cookies=cookies,
+            encoded_headers=encoded_headers,
+            headers=headers,
+            is_head_response=is_head_response,
+            media_type=media_type,
+            status_code=status_code,
+            type_encoders=type_encoders,
+        )
 
+    def _create_asgi_response(
+        self,
+        *,
+        background: BackgroundTask | BackgroundTasks | None = None,
+        cookies: Iterable[Cookie],
+        encoded_headers: RawHeaders | None = None,
+        headers: dict[str, Any],
+        is_head_response: bool = False,
+        media_type: MediaType | str | None = None,
+        status_code: int | None = None,
+        static_headers: _StaticHeaders | None = None,
+        type_encoders: TypeEncodersMap | None = None,
+        json_encoder: msgspec.json.Encoder | None = None,
+        msgpack_encoder: msgspec.msgpack.Encoder | None = None,
+    ) -> ASGIResponse:
         media_type = get_enum_string_value(self.media_type or media_type or MediaType.JSON)
 
+        if json_encoder is not None and type(self).render is Response.render:
+            # the encoders were built for the response's type encoders by the route handler
+            body = self.render(self.content, media_type, json_encoder=json_encoder, msgpack_encoder=msgpack_encoder)
+        else:
+            if type_encoders:
+                type_encoders = {**type_encoders, **(self.response_type_encoders or {})}
+            else:
+                type_encoders = self.response_type_encoders
+            body = self.render(self.content, media_type, get_serializer(type_encoders))
+
         return ASGIResponse(
             background=self.background or background,
-            body=self.render(self.content, media_type, get_serializer(type_encoders)),
+            body=body,
             cookies=cookies,
             encoded_headers=encoded_headers,
             encoding=self.encoding,
-            headers=headers,
+            headers=self._get_headers_with_etag(headers, body),
             is_head_response=is_head_response,
             media_type=media_type,
+            static_headers=static_headers,
             status_code=self.status_code or status_code,
         )
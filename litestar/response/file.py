@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 import itertools
+import os
 from email.utils import formatdate
 from inspect import iscoroutine
 from mimetypes import encodings_map, guess_type
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Coroutine, Iterable, Literal, cast
+from secrets import token_hex
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Coroutine, Iterable, Literal, Sequence, cast
 from urllib.parse import quote
 from zlib import adler32
 
-from litestar.constants import ONE_MEGABYTE
+from litestar._parsers import parse_range_header
+from litestar.constants import HTTP_RESPONSE_PATHSEND, ONE_MEGABYTE
+from litestar.datastructures.headers import Headers
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem, FileSystemAdapter
 from litestar.response.base import Response
 from litestar.response.streaming import ASGIStreamingResponse
+from litestar.status_codes import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT, HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
 from litestar.utils.deprecation import warn_deprecation
 from litestar.utils.helpers import get_enum_string_value
 
@@ -30,10 +35,12 @@ if TYPE_CHECKING:
     from litestar.enums import MediaType
     from litestar.types import (
         HTTPResponseBodyEvent,
+        HTTPResponsePathsendEvent,
         PathType,
         Receive,
         ResponseCookies,
         ResponseHeaders,
+        Scope,
         Send,
         TypeEncodersMap,
     )
@@ -43,12 +50,18 @@ __all__ = (
     "ASGIFileResponse",
     "File",
     "async_file_iterator",
+    "async_file_range_iterator",
     "create_etag_for_file",
 )
 
 # brotli not supported in 'mimetypes.encodings_map' until py 3.9.
 encodings_map[".br"] = "br"
 
+_MAX_BYTE_RANGES = 32
+"""Requests for more byte ranges than this are served the complete file, to limit the overhead of serving many small
+ranges.
+"""
+
 
 async def async_file_iterator(
     file_path: PathType, chunk_size: int, adapter: FileSystemAdapter
@@ -69,6 +82,64 @@ async def async_file_iterator(
             yield chunk
 
 
+async def async_file_range_iterator(
+    file_path: PathType,
+    chunk_size: int,
+    adapter: FileSystemAdapter,
+    byte_ranges: Sequence[tuple[int, int]],
+    part_headers: Sequence[bytes] | None = None,
+    closing_boundary: bytes = b"",
+) -> AsyncGenerator[bytes, None]:
+    """Return an async generator that asynchronously reads byte ranges of a file and yields their chunks.
+
+    Args:
+        file_path: A path to a file.
+        chunk_size: The chunk size to use.
+        adapter: File system adapter class.
+        byte_ranges: A sequence of inclusive ``(start, end)`` byte offsets to read.
+        part_headers: If given, the headers to yield before each range, to create a ``multipart/byteranges`` body.
+        closing_boundary: Bytes to yield after all ranges have been read.
+
+    Returns:
+        An async generator.
+    """
+    async with await adapter.open(file_path) as file:
+        for index, (start, end) in enumerate(byte_ranges):
+            if part_headers is not None:
+                yield part_headers[index]
+
+            await file.seek(start)
+            remaining = end - start + 1
+            while remaining > 0 and (chunk := await file.read(min(chunk_size, remaining))):
+                remaining -= len(chunk)
+                yield chunk
+
+            if part_headers is not None:
+                yield b"\r\n"
+
+    if closing_boundary:
+        yield closing_boundary
+
+
+async def _bytes_range_iterator(
+    content: bytes,
+    byte_ranges: Sequence[tuple[int, int]],
+    part_headers: Sequence[bytes] | None = None,
+    closing_boundary: bytes = b"",
+) -> AsyncGenerator[bytes, None]:
+    """Yield byte ranges of in-memory file content, like :func:`async_file_range_iterator`."""
+    view = memoryview(content)
+    for index, (start, end) in enumerate(byte_ranges):
+        if part_headers is not None:
+            yield part_headers[index]
+        yield bytes(view[start : end + 1])
+        if part_headers is not None:
+            yield b"\r\n"
+
+    if closing_boundary:
+        yield closing_boundary
+
+
 def create_etag_for_file(path: PathType, modified_time: float, file_size: int) -> str:
     """Create an etag.
 
@@ -97,6 +168,7 @@ class ASGIFileResponse(ASGIStreamingResponse):
         encoded_headers: Iterable[tuple[bytes, bytes]] | None = None,
         encoding: str = "utf-8",
         etag: ETag | None = None,
+        file_content: bytes | None = None,
         file_info: FileInfo | Coroutine[None, None, FileInfo] | None = None,
         file_path: str | PathLike | Path,
         file_system: FileSystemProtocol | None = None,
@@ -119,6 +191,8 @@ class ASGIFileResponse(ASGIStreamingResponse):
             encoded_headers: A list of encoded headers.
             encoding: The response encoding.
             etag: An etag.
+            file_content: The content of the file. If given together with ``file_info``, the response is sent without
+                accessing the file system.
             file_info: A file info.
             file_path: A path to a file.
             file_system: A file system adapter.
@@ -165,6 +239,10 @@ class ASGIFileResponse(ASGIStreamingResponse):
         self.chunk_size = chunk_size
         self.etag = etag
         self.file_path = file_path
+        self.file_content = file_content
+        self.byte_ranges: list[tuple[int, int]] | None = None
+        self._request_headers: Headers | None = None
+        self._use_pathsend = False
 
         if file_info:
             self.file_info: FileInfo | Coroutine[Any, Any, FileInfo] = file_info
@@ -173,6 +251,38 @@ class ASGIFileResponse(ASGIStreamingResponse):
         else:
             self.file_info = self.adapter.info(self.file_path)
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI callable of the ``ASGIFileResponse``.
+
+        If the request is a conditional request and the file has not been modified, a ``304 Not Modified`` response is
+        sent without opening the file. If the request has a ``Range`` header, only the requested byte ranges of the file
+        are sent. If the server supports the ``http.response.pathsend`` extension, a file on the local file system is
+        sent by the server, instead of being read by the application.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+
+        Returns:
+            None
+        """
+        if self.status_code == HTTP_200_OK and scope.get("method") in {"GET", "HEAD"}:
+            self._request_headers = Headers.from_scope(scope)
+
+        self._use_pathsend = (
+            self.file_content is None
+            and HTTP_RESPONSE_PATHSEND in (scope.get("extensions") or {})
+            and isinstance(self.adapter.file_system, BaseLocalFileSystem)
+        )
+
+        await super().__call__(scope, receive, send)
+
+    def evaluate_conditional_request(self, scope: Scope) -> None:
+        """Conditional requests are evaluated in :meth:`start_response`, once the ``ETag`` and ``Last-Modified``
+        headers of the file are known.
+        """
+
     async def send_body(self, send: Send, receive: Receive) -> None:
         """Emit a stream of events correlating with the response body.
 
@@ -183,7 +293,20 @@ class ASGIFileResponse(ASGIStreamingResponse):
         Returns:
             None
         """
-        if self.chunk_size < self.content_length:
+        if self.byte_ranges is None:
+            if self.file_content is not None:
+                await send({"type": "http.response.body", "body": self.file_content, "more_body": False})
+                return
+
+            if self._use_pathsend:
+                pathsend_event: HTTPResponsePathsendEvent = {
+                    "type": "http.response.pathsend",
+                    "path": os.path.abspath(os.fspath(self.file_path)),
+                }
+                await send(pathsend_event)
+                return
+
+        if self.byte_ranges is not None or self.chunk_size < self.content_length:
             await super().send_body(send=send, receive=receive)
             return
 
@@ -227,8 +350,99 @@ class ASGIFileResponse(ASGIStreamingResponse):
                 create_etag_for_file(path=self.file_path, modified_time=fs_info["mtime"], file_size=fs_info["size"]),
             )
 
+        if self.status_code == HTTP_200_OK:
+            self.headers.setdefault("accept-ranges", "bytes")
+            if self._request_headers is not None:
+                if self.is_not_modified(self._request_headers):
+                    self.set_not_modified()
+                elif (range_header := self._request_headers.get("range")) is not None and self._is_range_applicable():
+                    self._apply_byte_ranges(parse_range_header(range_header, size=self.content_length))
+
         await super().start_response(send=send)
 
+    def _is_range_applicable(self) -> bool:
+        """Check the ``If-Range`` precondition, which requires the file to be unchanged for byte ranges to be served.
+
+        Returns:
+            A boolean indicating whether the requested byte ranges should be served.
+        """
+        if self._request_headers is None or (if_range := self._request_headers.get("if-range")) is None:
+            return True
+        if if_range.startswith(("W/", '"')):
+            # weak entity tags are never considered a match
+            return if_range == self.headers.get("etag") and not if_range.startswith("W/")
+        return if_range == self.headers.get("last-modified")
+
+    def _apply_byte_ranges(self, byte_ranges: list[tuple[int, int]] | None) -> None:
+        """Set the status code, headers and body iterator of the response to serve the given byte ranges.
+
+        Args:
+            byte_ranges: The requested byte ranges, as returned by :func:`parse_range_header`.
+
+        Returns:
+            None
+        """
+        if byte_ranges is None or len(byte_ranges) > _MAX_BYTE_RANGES:
+            return
+
+        size = self.content_length
+        self.byte_ranges = byte_ranges
+
+        if not byte_ranges:
+            self.status_code = HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+            self.headers["content-range"] = f"bytes */{size}"
+            self.headers["content-length"] = "0"
+            self.content_length = 0
+            self.iterator = self._create_range_iterator(byte_ranges=())
+            return
+
+        self.status_code = HTTP_206_PARTIAL_CONTENT
+
+        if len(byte_ranges) == 1:
+            start, end = byte_ranges[0]
+            self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+            self.content_length = end - start + 1
+            self.headers["content-length"] = str(self.content_length)
+            self.iterator = self._create_range_iterator(byte_ranges=byte_ranges)
+            return
+
+        boundary = token_hex(16)
+        content_type = self.headers.get("content-type", "application/octet-stream")
+        part_header_prefix = f"--{boundary}\r\ncontent-type: {content_type}\r\n"
+        part_headers = [
+            f"{part_header_prefix}content-range: bytes {start}-{end}/{size}\r\n\r\n".encode("latin-1")
+            for start, end in byte_ranges
+        ]
+        closing_boundary = f"--{boundary}--\r\n".encode("latin-1")
+
+        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        self.content_length = sum(
+            len(part_header) + end - start + 1 + 2 for part_header, (start, end) in zip(part_headers, byte_ranges)
+        ) + len(closing_boundary)
+        self.headers["content-length"] = str(self.content_length)
+        self.iterator = self._create_range_iterator(
+            byte_ranges=byte_ranges, part_headers=part_headers, closing_boundary=closing_boundary
+        )
+
+    def _create_range_iterator(
+        self,
+        byte_ranges: Sequence[tuple[int, int]],
+        part_headers: Sequence[bytes] | None = None,
+        closing_boundary: bytes = b"",
+    ) -> AsyncGenerator[bytes, None]:
+        if self.file_content is not None:
+            return _bytes_range_iterator(
+                self.file_content, byte_ranges=byte_ranges, part_headers=part_headers, closing_boundary=closing_boundary
+            )
+        return async_file_range_iterator(
+            file_path=self.file_path,
+            chunk_size=self.chunk_size,
+            adapter=self.adapter,
+            byte_ranges=byte_ranges,
+            part_headers=part_headers,
+            closing_boundary=closing_boundary,
+        )
+
 
 class File(Response):
     """A response, streaming a file as response body."""
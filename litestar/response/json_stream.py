@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+from litestar.concurrency import sync_to_thread
+from litestar.constants import NDJSON_MEDIA_TYPE
+from litestar.enums import MediaType
+from litestar.response.base import Response
+from litestar.response.streaming import ASGIStreamingResponse
+from litestar.serialization import get_json_encoder, get_serializer
+from litestar.types.helper_types import StreamType
+from litestar.utils.deprecation import warn_deprecation
+from litestar.utils.helpers import get_enum_string_value
+
+if TYPE_CHECKING:
+    import msgspec
+
+    from litestar.app import Litestar
+    from litestar.background_tasks import BackgroundTask, BackgroundTasks
+    from litestar.connection import Request
+    from litestar.datastructures.cookie import Cookie
+    from litestar.enums import OpenAPIMediaType
+    from litestar.response.base import ASGIResponse
+    from litestar.types import ResponseCookies, ResponseHeaders, TypeEncodersMap
+
+__all__ = ("JSONStream",)
+
+T = TypeVar("T")
+
+
+class _ChunkEncoder:
+    """Encode items into a JSON array or NDJSON, in chunks of at least ``chunk_size`` bytes."""
+
+    __slots__ = ("buffer", "chunk_size", "encoder", "has_items", "ndjson")
+
+    def __init__(self, encoder: msgspec.json.Encoder, chunk_size: int, ndjson: bool) -> None:
+        self.buffer = bytearray()
+        self.chunk_size = chunk_size
+        self.encoder = encoder
+        self.has_items = False
+        self.ndjson = ndjson
+
+    def add(self, item: Any) -> bool:
+        """Encode ``item`` into the buffer.
+
+        Args:
+            item: The item to encode.
+
+        Returns:
+            Whether the buffer holds a full chunk.
+        """
+        if not self.ndjson:
+            self.buffer += b"," if self.has_items else b"["
+        self.encoder.encode_into(item, self.buffer, -1)
+        if self.ndjson:
+            self.buffer += b"\n"
+        self.has_items = True
+        return len(self.buffer) >= self.chunk_size
+
+    def add_many(self, iterator: Iterator[Any]) -> tuple[bytes, bool]:
+        """Encode items from ``iterator`` until the buffer holds a full chunk or the iterator is exhausted.
+
+        Args:
+            iterator: A sync iterator.
+
+        Returns:
+            A tuple of the encoded chunk and whether the iterator is exhausted.
+        """
+        for item in iterator:
+            if self.add(item):
+                return self.flush(), False
+        return self.finish(), True
+
+    def flush(self) -> bytes:
+        chunk = bytes(self.buffer)
+        self.buffer.clear()
+        return chunk
+
+    def finish(self) -> bytes:
+        if not self.ndjson:
+            self.buffer += b"]" if self.has_items else b"[]"
+        return self.flush()
+
+    async def encode(self, items: Iterable[Any] | AsyncIterable[Any]) -> AsyncGenerator[bytes, None]:
+        """Encode ``items`` into a stream of chunks.
+
+        Items of sync iterables are consumed in a thread, a chunk at a time.
+
+        Args:
+            items: A sync or async iterable.
+
+        Yields:
+            Encoded chunks.
+        """
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                if self.add(item):
+                    yield self.flush()
+            if chunk := self.finish():
+                yield chunk
+            return
+
+        iterator = iter(items)
+        done = False
+        while not done:
+            chunk, done = await sync_to_thread(self.add_many, iterator)
+            if chunk:
+                yield chunk
+
+
+class JSONStream(Response[StreamType[T]]):
+    """An HTTP response that streams items as a JSON array or as newline delimited JSON.
+
+    Items are encoded incrementally with the encoder of the route handler's type encoders, so memory use and time to
+    the first byte do not grow with the number of items. If a return DTO applies to the route handler, it is applied
+    to each item.
+    """
+
+    __slots__ = ("chunk_size", "ndjson")
+
+    def __init__(
+        self,
+        content: StreamType[T] | Callable[[], StreamType[T]],
+        *,
+        background: BackgroundTask | BackgroundTasks | None = None,
+        chunk_size: int = 64 * 1024,
+        cookies: ResponseCookies | None = None,
+        encoding: str = "utf-8",
+        headers: ResponseHeaders | None = None,
+        media_type: MediaType | OpenAPIMediaType | str | None = None,
+        ndjson: bool = False,
+        status_code: int | None = None,
+        type_encoders: TypeEncodersMap | None = None,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            content: A sync or async iterator or iterable of items, or a callable returning one.
+            background: A :class:`BackgroundTask <.background_tasks.BackgroundTask>` instance or
+                :class:`BackgroundTasks <.background_tasks.BackgroundTasks>` to execute after the response is finished.
+                Defaults to None.
+            chunk_size: Minimum size in bytes of the chunks sent, except for the last one.
+            cookies: A list of :class:`Cookie <.datastructures.Cookie>` instances to be set under the response
+                ``Set-Cookie`` header.
+            encoding: The encoding to be used for the response headers.
+            headers: A string keyed dictionary of response headers. Header keys are insensitive.
+            media_type: A value for the response ``Content-Type`` header. Defaults to ``application/json``, or to
+                ``application/x-ndjson`` if ``ndjson`` is ``True``.
+            ndjson: If ``True``, items are sent as newline delimited JSON instead of as a JSON array.
+            status_code: An HTTP status code.
+            type_encoders: A mapping of types to callables that transform them into types supported for serialization.
+        """
+        super().__init__(
+            background=background,
+            content=content,  # type: ignore[arg-type]
+            cookies=cookies,
+            encoding=encoding,
+            headers=headers,
+            media_type=media_type or (NDJSON_MEDIA_TYPE if ndjson else MediaType.JSON),
+            status_code=status_code,
+            type_encoders=type_encoders,
+        )
+        self.chunk_size = chunk_size
+        self.ndjson = ndjson
+
+    def to_asgi_response(
+        self,
+        app: Litestar | None,
+        request: Request,
+        *,
+        background: BackgroundTask | BackgroundTasks | None = None,
+        cookies: Iterable[Cookie] | None = None,
+        encoded_headers: Iterable[tuple[bytes, bytes]] | None = None,
+        headers: dict[str, str] | None = None,
+        is_head_response: bool = False,
+        media_type: MediaType | str | None = None,
+        status_code: int | None = None,
+        type_encoders: TypeEncodersMap | None = None,
+    ) -> ASGIResponse:
+        """Create an ASGIStreamingResponse from a JSONStream instance.
+
+        Args:
+            app: The :class:`Litestar <.app.Litestar>` application instance.
+            background: Background task(s) to be executed after the response is sent.
+            cookies: A list of cookies to be set on the response.
+            encoded_headers: A list of already encoded headers.
+            headers: Additional headers to be merged with the response headers. Response headers take precedence.
+            is_head_response: Whether the response is a HEAD response.
+            media_type: Media type for the response. If ``media_type`` is already set on the response, this is ignored.
+            request: The :class:`Request <.connection.Request>` instance.
+            status_code: Status code for the response. If ``status_code`` is already set on the response, this is
+            type_encoders: A dictionary of type encoders to use for encoding the response content.
+
+        Returns:
+            An ASGIStreamingResponse instance.
+        """
+        if app is not None:
+            warn_deprecation(
+                version="2.1",
+                deprecated_name="app",
+                kind="parameter",
+                removal_in="3.0.0",
+                alternative="request.app",
+            )
+
+        headers = {**headers, **self.headers} if headers is not None else self.headers
+        cookies = self.cookies if cookies is None else itertools.chain(self.cookies, cookies)
+
+        if type_encoders:
+            type_encoders = {**type_encoders, **(self.response_type_encoders or {})}
+        else:
+            type_encoders = self.response_type_encoders
+
+        items = self.content
+        if not isinstance(items, (Iterable, Iterator, AsyncIterable, AsyncIterator)) and callable(items):
+            items = items()
+
+        chunk_encoder = _ChunkEncoder(
+            encoder=get_json_encoder(get_serializer(type_encoders)), chunk_size=self.chunk_size, ndjson=self.ndjson
+        )
+
+        return ASGIStreamingResponse(
+            background=self.background or background,
+            body=b"",
+            content_length=0,
+            cookies=cookies,
+            encoded_headers=encoded_headers,
+            encoding=self.encoding,
+            headers=headers,
+            is_head_response=is_head_response,
+            iterator=chunk_encoder.encode(items),
+            media_type=get_enum_string_value(self.media_type or media_type or MediaType.JSON),
+            status_code=self.status_code or status_code,
+        )
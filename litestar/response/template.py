@@ -155,7 +155,7 @@ class Template(Response[bytes]):
             cookies=cookies,
             encoded_headers=encoded_headers,
             encoding=self.encoding,
-            headers=headers,
+            headers=self._get_headers_with_etag(headers, body),
             is_head_response=is_head_response,
             media_type=media_type,
             status_code=self.status_code or status_code,
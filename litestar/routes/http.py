@@ -3,18 +3,18 @@ from __future__ import annotations
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
-from msgspec.msgpack import decode as _decode_msgpack_plain
-
 from litestar.constants import DEFAULT_ALLOWED_CORS_HEADERS
 from litestar.datastructures.headers import Headers
 from litestar.datastructures.upload_file import UploadFile
 from litestar.enums import HttpMethod, MediaType, ScopeType
 from litestar.exceptions import ClientException, ImproperlyConfiguredException, SerializationException
 from litestar.handlers.http_handlers import HTTPRouteHandler
+from litestar.middleware.response_cache import CachedResponse, get_response_cache_key
 from litestar.response import Response
 from litestar.routes.base import BaseRoute
 from litestar.status_codes import HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST
 from litestar.types.empty import Empty
+from litestar.utils.empty import value_or_default
 from litestar.utils.scope.state import ScopeState
 
 if TYPE_CHECKING:
@@ -126,8 +126,10 @@ class HTTPRoute(BaseRoute):
         Returns:
             An instance of Response or a compatible ASGIApp or a subclass of it
         """
-        if route_handler.cache and (
-            response := await self._get_cached_response(request=request, route_handler=route_handler)
+        if (
+            route_handler.cache
+            and not value_or_default(ScopeState.from_scope(scope).skip_cache, False)
+            and (response := await self._get_cached_response(request=request, route_handler=route_handler))
         ):
             return response
 
@@ -210,7 +212,7 @@ class HTTPRoute(BaseRoute):
 
     @staticmethod
     async def _get_cached_response(request: Request, route_handler: HTTPRouteHandler) -> ASGIApp | None:
-        """Retrieve and un-pickle the cached response, if existing.
+        """Retrieve and decode the cached response, if existing.
 
         Args:
             request: The :class:`Request <litestar.connection.Request>` instance
@@ -219,24 +221,12 @@ class HTTPRoute(BaseRoute):
         Returns:
             A cached response instance, if existing.
         """
+        store = request.app.response_cache_config.get_store_from_app(request.app)
 
-        cache_config = request.app.response_cache_config
-        cache_key = (route_handler.cache_key_builder or cache_config.key_builder)(request)
-        store = cache_config.get_store_from_app(request.app)
-
-        if not (cached_response_data := await store.get(key=cache_key)):
+        if not (cached_response_data := await store.get(key=get_response_cache_key(request, route_handler))):
             return None
 
-        # we use the regular msgspec.msgpack.decode here since we don't need any of
-        # the added decoders
-        messages = _decode_msgpack_plain(cached_response_data)
-
-        async def cached_response(scope: Scope, receive: Receive, send: Send) -> None:
-            ScopeState.from_scope(scope).is_cached = True
-            for message in messages:
-                await send(message)
-
-        return cached_response
+        return CachedResponse.from_bytes(cached_response_data)
 
     def create_options_handler(self, path: str) -> HTTPRouteHandler:
         """Args:
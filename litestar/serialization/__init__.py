@@ -5,6 +5,8 @@ from .msgspec_hooks import (
     default_serializer,
     encode_json,
     encode_msgpack,
+    get_json_encoder,
+    get_msgpack_encoder,
     get_serializer,
 )
 
@@ -15,5 +17,7 @@ __all__ = (
     "default_serializer",
     "encode_json",
     "encode_msgpack",
+    "get_json_encoder",
+    "get_msgpack_encoder",
     "get_serializer",
 )
@@ -32,6 +32,8 @@ __all__ = (
     "default_serializer",
     "encode_json",
     "encode_msgpack",
+    "get_json_encoder",
+    "get_msgpack_encoder",
     "get_serializer",
 )
 
@@ -76,8 +78,10 @@ def default_serializer(value: Any, type_encoders: Mapping[Any, Callable[[Any], A
     Raises:
         TypeError: if value is not supported
     """
-    type_encoders = {**DEFAULT_TYPE_ENCODERS, **(type_encoders or {})}
+    return _serialize(value, {**DEFAULT_TYPE_ENCODERS, **type_encoders} if type_encoders else DEFAULT_TYPE_ENCODERS)
 
+
+def _serialize(value: Any, type_encoders: Mapping[Any, Callable[[Any], Any]]) -> Any:
     for base in value.__class__.__mro__[:-1]:
         try:
             encoder = type_encoders[base]
@@ -124,6 +128,40 @@ _msgspec_msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=default_serializer)
 _msgspec_msgpack_decoder = msgspec.msgpack.Decoder(dec_hook=default_deserializer)
 
 
+def get_json_encoder(serializer: Serializer | None = None) -> msgspec.json.Encoder:
+    """Get a JSON encoder using ``serializer`` as its ``enc_hook``.
+
+    Encoders are not cached. Apart from the default encoder, a new one is created for every call, which should be kept
+    and reused to encode multiple values with the same serializer.
+
+    Args:
+        serializer: Optional callable to support non-natively supported types.
+
+    Returns:
+        A :class:`msgspec.json.Encoder`
+    """
+    if serializer is None or serializer is default_serializer:
+        return _msgspec_json_encoder
+    return msgspec.json.Encoder(enc_hook=serializer)
+
+
+def get_msgpack_encoder(serializer: Serializer | None = None) -> msgspec.msgpack.Encoder:
+    """Get a MessagePack encoder using ``serializer`` as its ``enc_hook``.
+
+    Encoders are not cached. Apart from the default encoder, a new one is created for every call, which should be kept
+    and reused to encode multiple values with the same serializer.
+
+    Args:
+        serializer: Optional callable to support non-natively supported types.
+
+    Returns:
+        A :class:`msgspec.msgpack.Encoder`
+    """
+    if serializer is None or serializer is default_serializer:
+        return _msgspec_msgpack_encoder
+    return msgspec.msgpack.Encoder(enc_hook=serializer)
+
+
 def encode_json(value: Any, serializer: Callable[[Any], Any] | None = None) -> bytes:
     """Encode a value into JSON.
 
@@ -138,7 +176,9 @@ def encode_json(value: Any, serializer: Callable[[Any], Any] | None = None) -> b
         SerializationException: If error encoding ``obj``.
     """
     try:
-        return msgspec.json.encode(value, enc_hook=serializer) if serializer else _msgspec_json_encoder.encode(value)
+        if serializer is None or serializer is default_serializer:
+            return _msgspec_json_encoder.encode(value)
+        return msgspec.json.encode(value, enc_hook=serializer)
     except (TypeError, msgspec.EncodeError) as msgspec_error:
         raise SerializationException(str(msgspec_error)) from msgspec_error
 
@@ -256,6 +296,6 @@ def get_serializer(type_encoders: TypeEncodersMap | None = None) -> Serializer:
     """Get the serializer for the given type encoders."""
 
     if type_encoders:
-        return partial(default_serializer, type_encoders=type_encoders)
+        return partial(_serialize, type_encoders={**DEFAULT_TYPE_ENCODERS, **type_encoders})
 
     return default_serializer
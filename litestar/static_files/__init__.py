@@ -1,4 +1,5 @@
 from litestar.static_files.base import StaticFiles
+from litestar.static_files.cache import StaticFilesCache
 from litestar.static_files.config import StaticFilesConfig, create_static_files_router
 
-__all__ = ("StaticFiles", "StaticFilesConfig", "create_static_files_router")
+__all__ = ("StaticFiles", "StaticFilesCache", "StaticFilesConfig", "create_static_files_router")
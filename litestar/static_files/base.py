@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from os.path import commonpath
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Sequence
+from typing import TYPE_CHECKING, Sequence, cast
 
-from litestar.enums import ScopeType
+from litestar._parsers import parse_accept_encoding_header
+from litestar.datastructures.headers import Headers
+from litestar.enums import CompressionEncoding, ScopeType
 from litestar.exceptions import MethodNotAllowedException, NotFoundException
 from litestar.file_system import FileSystemAdapter
 from litestar.response.file import ASGIFileResponse
@@ -12,8 +14,16 @@ from litestar.status_codes import HTTP_404_NOT_FOUND
 
 __all__ = ("StaticFiles",)
 
+PRECOMPRESSED_FILE_SUFFIXES: dict[str, str] = {
+    CompressionEncoding.BROTLI.value: ".br",
+    CompressionEncoding.ZSTD.value: ".zst",
+    CompressionEncoding.GZIP.value: ".gz",
+}
+"""Suffixes of precompressed sidecar files, by the content encoding they are served with, in order of preference."""
+
 
 if TYPE_CHECKING:
+    from litestar.static_files.cache import StaticFilesCache
     from litestar.types import Receive, Scope, Send
     from litestar.types.composite_types import PathType
     from litestar.types.file_types import FileInfo, FileSystemProtocol
@@ -22,7 +32,7 @@ if TYPE_CHECKING:
 class StaticFiles:
     """ASGI App that handles file sending."""
 
-    __slots__ = ("is_html_mode", "directories", "adapter", "send_as_attachment", "headers")
+    __slots__ = ("is_html_mode", "directories", "adapter", "send_as_attachment", "headers", "precompressed", "cache")
 
     def __init__(
         self,
@@ -32,6 +42,8 @@ class StaticFiles:
         send_as_attachment: bool = False,
         resolve_symlinks: bool = True,
         headers: dict[str, str] | None = None,
+        precompressed: bool = False,
+        cache: StaticFilesCache | None = None,
     ) -> None:
         """Initialize the Application.
 
@@ -43,12 +55,18 @@ class StaticFiles:
              ``attachment`` or ``inline``
             resolve_symlinks: Resolve symlinks to the directories
             headers: Headers that will be sent with every response.
+            precompressed: Serve precompressed sidecar files (``.br``, ``.zst`` or ``.gz``) next to a requested file,
+                if the client accepts their encoding
+            cache: A :class:`StaticFilesCache <litestar.static_files.StaticFilesCache>` to cache resolved paths
+                and the content of small files in
         """
         self.adapter = FileSystemAdapter(file_system)
         self.directories = tuple(Path(p).resolve() if resolve_symlinks else Path(p) for p in directories)
         self.is_html_mode = is_html_mode
         self.send_as_attachment = send_as_attachment
         self.headers = headers
+        self.precompressed = precompressed
+        self.cache = cache
 
     async def get_fs_info(
         self, directories: Sequence[PathType], file_path: PathType
@@ -63,15 +81,23 @@ class StaticFiles:
             A tuple with an optional resolved :class:`Path <anyio.Path>` instance and an optional
             :class:`stat_result <os.stat_result>`.
         """
+        if self.cache is not None and (cached := self.cache.get_fs_info(file_path)) is not None:
+            return cached
+
+        result: tuple[Path, FileInfo] | tuple[None, None] = (None, None)
         for directory in directories:
             try:
                 joined_path = Path(directory, file_path)
                 file_info = await self.adapter.info(joined_path)
                 if file_info and commonpath([str(directory), file_info["name"], joined_path]) == str(directory):
-                    return joined_path, file_info
+                    result = (joined_path, file_info)
+                    break
             except FileNotFoundError:
                 continue
-        return None, None
+
+        if self.cache is not None:
+            self.cache.set_fs_info(file_path, result)
+        return result
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """ASGI callable.
@@ -87,17 +113,108 @@ class StaticFiles:
         if scope["type"] != ScopeType.HTTP or scope["method"] not in {"GET", "HEAD"}:
             raise MethodNotAllowedException()
 
-        res = await self.handle(path=scope["path"], is_head_response=scope["method"] == "HEAD")
+        res = await self.handle(
+            path=scope["path"],
+            is_head_response=scope["method"] == "HEAD",
+            accept_encoding=Headers.from_scope(scope).get("accept-encoding") if self.precompressed else None,
+        )
         await res(scope=scope, receive=receive, send=send)
 
-    async def handle(self, path: str, is_head_response: bool) -> ASGIFileResponse:
+    async def get_precompressed_file(
+        self, file_path: PathType, accept_encoding: str
+    ) -> tuple[Path, FileInfo, str] | tuple[None, None, None]:
+        """Find a precompressed sidecar of a file, in an encoding accepted by the client.
+
+        Args:
+            file_path: The resolved path of the requested file.
+            accept_encoding: The value of the request's ``Accept-Encoding`` header.
+
+        Returns:
+            A tuple of the path and the file info of the sidecar file and its content encoding.
+        """
+        qualities = parse_accept_encoding_header(accept_encoding)
+        default_quality = qualities.get("*", 0.0)
+        encodings = sorted(
+            (encoding for encoding in PRECOMPRESSED_FILE_SUFFIXES if qualities.get(encoding, default_quality) > 0),
+            key=lambda encoding: qualities.get(encoding, default_quality),
+            reverse=True,
+        )
+
+        for encoding in encodings:
+            sidecar_path = Path(f"{file_path}{PRECOMPRESSED_FILE_SUFFIXES[encoding]}")
+            if self.cache is not None and (cached := self.cache.get_fs_info(sidecar_path)) is not None:
+                file_info = cached[1]
+            else:
+                try:
+                    file_info = await self.adapter.info(sidecar_path)
+                except FileNotFoundError:
+                    file_info = None
+                if self.cache is not None:
+                    self.cache.set_fs_info(sidecar_path, (sidecar_path, file_info) if file_info else (None, None))
+            if file_info and file_info["type"] == "file":
+                return sidecar_path, file_info, encoding
+        return None, None, None
+
+    async def create_file_response(
+        self,
+        file_path: Path,
+        file_info: FileInfo,
+        filename: str,
+        is_head_response: bool,
+        accept_encoding: str | None,
+        status_code: int | None = None,
+    ) -> ASGIFileResponse:
+        """Create a response for a resolved file, serving a precompressed sidecar file if possible.
+
+        Args:
+            file_path: The resolved path of the file.
+            file_info: The file info of the file.
+            filename: The name of the file.
+            is_head_response: Whether the response is a response to a ``HEAD`` request.
+            accept_encoding: The value of the request's ``Accept-Encoding`` header.
+            status_code: The status code of the response.
+
+        Returns:
+            An :class:`ASGIFileResponse`.
+        """
+        headers = self.headers
+        if self.precompressed:
+            headers = {**(self.headers or {}), "vary": "Accept-Encoding"}
+            if accept_encoding:
+                sidecar_path, sidecar_info, encoding = await self.get_precompressed_file(file_path, accept_encoding)
+                if sidecar_path is not None and sidecar_info is not None:
+                    file_path, file_info = sidecar_path, sidecar_info
+                    headers["content-encoding"] = cast("str", encoding)
+
+        file_content: bytes | None = None
+        if self.cache is not None and file_info["size"] <= self.cache.max_file_size:
+            cached_file = self.cache.get_file(file_path, file_info)
+            if cached_file is None:
+                async with await self.adapter.open(file_path) as file:
+                    content = await file.read()
+                if len(content) == file_info["size"]:
+                    cached_file = self.cache.set_file(file_path, file_info, content)
+            if cached_file is not None:
+                file_content = cached_file.content
+                headers = {**cached_file.headers, **(headers or {})}
+
+        return ASGIFileResponse(
+            file_path=file_path,
+            file_info=file_info,
+            file_system=self.adapter.file_system,
+            filename=filename,
+            status_code=status_code,
+            content_disposition_type="attachment" if self.send_as_attachment else "inline",
+            is_head_response=is_head_response,
+            headers=headers,
+            file_content=file_content,
+        )
+
+    async def handle(self, path: str, is_head_response: bool, accept_encoding: str | None = None) -> ASGIFileResponse:
         split_path = path.split("/")
         filename = split_path[-1]
         joined_path = Path(*split_path)
         resolved_path, fs_info = await self.get_fs_info(directories=self.directories, file_path=joined_path)
-        content_disposition_type: Literal["inline", "attachment"] = (
-            "attachment" if self.send_as_attachment else "inline"
-        )
 
         if self.is_html_mode and fs_info and fs_info["type"] == "directory":
             filename = "index.html"
@@ -107,14 +224,12 @@ class StaticFiles:
             )
 
         if fs_info and fs_info["type"] == "file":
-            return ASGIFileResponse(
+            return await self.create_file_response(
                 file_path=resolved_path or joined_path,
                 file_info=fs_info,
-                file_system=self.adapter.file_system,
                 filename=filename,
-                content_disposition_type=content_disposition_type,
                 is_head_response=is_head_response,
-                headers=self.headers,
+                accept_encoding=accept_encoding,
             )
 
         if self.is_html_mode:
@@ -125,15 +240,13 @@ class StaticFiles:
             )
 
             if fs_info and fs_info["type"] == "file":
-                return ASGIFileResponse(
+                return await self.create_file_response(
                     file_path=resolved_path or joined_path,
                     file_info=fs_info,
-                    file_system=self.adapter.file_system,
                     filename=filename,
-                    status_code=HTTP_404_NOT_FOUND,
-                    content_disposition_type=content_disposition_type,
                     is_head_response=is_head_response,
-                    headers=self.headers,
+                    accept_encoding=accept_encoding,
+                    status_code=HTTP_404_NOT_FOUND,
                 )
 
         raise NotFoundException(
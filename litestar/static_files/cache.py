@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from email.utils import formatdate
+from time import monotonic
+from typing import TYPE_CHECKING, NamedTuple
+
+from litestar.constants import ONE_MEGABYTE
+from litestar.response.file import create_etag_for_file
+
+__all__ = ("CachedFile", "StaticFilesCache")
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from litestar.types import PathType
+    from litestar.types.file_types import FileInfo
+
+
+class CachedFile(NamedTuple):
+    """The content of a file, together with the file info and headers it was cached with."""
+
+    content: bytes
+    """The content of the file."""
+    file_info: FileInfo
+    """The file info at the time the content was read."""
+    headers: dict[str, str]
+    """The ``etag`` and ``last-modified`` headers of the file."""
+
+
+class StaticFilesCache:
+    """An in-memory cache for :class:`StaticFiles <litestar.static_files.StaticFiles>`.
+
+    It caches the results of resolving a requested path to a file, so that the file system does not have to be queried
+    for every request, and the content of small files, so that they do not have to be read for every request. Files
+    served from the cache cause no file system calls at all.
+
+    Resolved paths are trusted for ``stat_ttl`` seconds. After that, the file system is queried again, and cached
+    content is discarded if the modification time or size of the file has changed. A cache instance should only be
+    used by a single static files router.
+    """
+
+    __slots__ = ("_files", "_stats", "max_entries", "max_file_size", "max_size", "size", "stat_ttl")
+
+    def __init__(
+        self,
+        max_size: int = 32 * ONE_MEGABYTE,
+        max_file_size: int = ONE_MEGABYTE,
+        stat_ttl: float | None = 1.0,
+        max_entries: int = 10_000,
+    ) -> None:
+        """Initialize ``StaticFilesCache``.
+
+        Args:
+            max_size: Maximum total size in bytes of the cached file contents. The least recently used files are
+                evicted once it is exceeded
+            max_file_size: Maximum size in bytes of a file for its content to be cached
+            stat_ttl: Time in seconds for which resolved paths are trusted before the file system is queried again. If
+                ``None``, they are trusted until they are evicted, so changes to the files will not be picked up
+            max_entries: Maximum number of resolved paths to cache, including paths that could not be resolved
+        """
+        self.max_entries = max_entries
+        self.max_file_size = max_file_size
+        self.max_size = max_size
+        self.size = 0
+        self.stat_ttl = stat_ttl
+        self._files: OrderedDict[str, CachedFile] = OrderedDict()
+        self._stats: OrderedDict[str, tuple[float | None, tuple[Path, FileInfo] | tuple[None, None]]] = OrderedDict()
+
+    def get_fs_info(self, file_path: PathType) -> tuple[Path, FileInfo] | tuple[None, None] | None:
+        """Get the cached result of resolving ``file_path``.
+
+        Args:
+            file_path: The requested file path.
+
+        Returns:
+            A tuple of the resolved path and its file info, a tuple of ``None`` values if the path could not be
+            resolved, or ``None`` if there is no valid cached result.
+        """
+        key = str(file_path)
+        if (entry := self._stats.get(key)) is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self._stats[key]
+            return None
+
+        self._stats.move_to_end(key)
+        return result
+
+    def set_fs_info(self, file_path: PathType, result: tuple[Path, FileInfo] | tuple[None, None]) -> None:
+        """Cache the result of resolving ``file_path``.
+
+        Args:
+            file_path: The requested file path.
+            result: A tuple of the resolved path and its file info, or a tuple of ``None`` values.
+
+        Returns:
+            None
+        """
+        key = str(file_path)
+        self._stats[key] = (None if self.stat_ttl is None else monotonic() + self.stat_ttl, result)
+        self._stats.move_to_end(key)
+        while len(self._stats) > self.max_entries:
+            self._stats.popitem(last=False)
+
+    def get_file(self, file_path: PathType, file_info: FileInfo) -> CachedFile | None:
+        """Get the cached content of a file.
+
+        Args:
+            file_path: The resolved path of the file.
+            file_info: The current file info of the file.
+
+        Returns:
+            The cached file, if it exists and the file has not changed since it was cached, else ``None``.
+        """
+        key = str(file_path)
+        if (cached_file := self._files.get(key)) is None:
+            return None
+
+        if cached_file.file_info["mtime"] != file_info["mtime"] or cached_file.file_info["size"] != file_info["size"]:
+            self._evict(key)
+            return None
+
+        self._files.move_to_end(key)
+        return cached_file
+
+    def set_file(self, file_path: PathType, file_info: FileInfo, content: bytes) -> CachedFile:
+        """Cache the content of a file.
+
+        Files larger than :attr:`max_file_size` are not cached.
+
+        Args:
+            file_path: The resolved path of the file.
+            file_info: The file info of the file.
+            content: The content of the file.
+
+        Returns:
+            The cached file.
+        """
+        cached_file = CachedFile(
+            content=content,
+            file_info=file_info,
+            headers={
+                "etag": create_etag_for_file(
+                    path=file_path, modified_time=file_info["mtime"], file_size=file_info["size"]
+                ),
+                "last-modified": formatdate(file_info["mtime"], usegmt=True),
+            },
+        )
+        if len(content) > self.max_file_size:
+            return cached_file
+
+        key = str(file_path)
+        self._evict(key)
+        self._files[key] = cached_file
+        self.size += len(content)
+        while self.size > self.max_size:
+            self._evict(next(iter(self._files)))
+        return cached_file
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._files.clear()
+        self._stats.clear()
+        self.size = 0
+
+    def _evict(self, key: str) -> None:
+        if (cached_file := self._files.pop(key, None)) is not None:
+            self.size -= len(cached_file.content)
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from pathlib import PurePath  # noqa: TCH003
 from typing import TYPE_CHECKING, Any, Sequence
 
+from litestar.connection import Request  # noqa: TCH001
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem
 from litestar.handlers import asgi, get, head
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from litestar.datastructures import CacheControlHeader
     from litestar.handlers.asgi_handlers import ASGIRouteHandler
     from litestar.openapi.spec import SecurityRequirement
+    from litestar.static_files.cache import StaticFilesCache
     from litestar.types import (
         AfterRequestHookHandler,
         AfterResponseHookHandler,
@@ -126,6 +128,8 @@ def create_static_files_router(
     tags: Sequence[str] | None = None,
     router_class: type[Router] = Router,
     resolve_symlinks: bool = True,
+    precompressed: bool = False,
+    cache: StaticFilesCache | None = None,
 ) -> Router:
     """Create a router with handlers to serve static files.
 
@@ -154,6 +158,11 @@ def create_static_files_router(
         tags: ``tags`` passed to the router
         router_class: The class used to construct a router from
         resolve_symlinks: Resolve symlinks of ``directories``
+        precompressed: Serve precompressed sidecar files (``<file>.br``, ``<file>.zst`` or ``<file>.gz``) instead of
+            the requested file, if they exist and the client accepts their encoding. Sidecar files can be created with
+            ``litestar assets compress``
+        cache: A :class:`~litestar.static_files.StaticFilesCache` to cache resolved paths and the content of small
+            files in, so frequently requested files are served without accessing the file system
     """
 
     if file_system is None:
@@ -173,23 +182,37 @@ def create_static_files_router(
         send_as_attachment=send_as_attachment,
         resolve_symlinks=resolve_symlinks,
         headers=headers,
+        precompressed=precompressed,
+        cache=cache,
     )
 
     @get("{file_path:path}", name=name)
-    async def get_handler(file_path: PurePath) -> ASGIFileResponse:
-        return await static_files.handle(path=file_path.as_posix(), is_head_response=False)
+    async def get_handler(file_path: PurePath, request: Request) -> ASGIFileResponse:
+        return await static_files.handle(
+            path=file_path.as_posix(),
+            is_head_response=False,
+            accept_encoding=request.headers.get("accept-encoding") if precompressed else None,
+        )
 
     @head("/{file_path:path}", name=f"{name}/head")
-    async def head_handler(file_path: PurePath) -> ASGIFileResponse:
-        return await static_files.handle(path=file_path.as_posix(), is_head_response=True)
+    async def head_handler(file_path: PurePath, request: Request) -> ASGIFileResponse:
+        return await static_files.handle(
+            path=file_path.as_posix(),
+            is_head_response=True,
+            accept_encoding=request.headers.get("accept-encoding") if precompressed else None,
+        )
 
     handlers = [get_handler, head_handler]
 
     if html_mode:
 
         @get("/", name=f"{name}/index")
-        async def index_handler() -> ASGIFileResponse:
-            return await static_files.handle(path="/", is_head_response=False)
+        async def index_handler(request: Request) -> ASGIFileResponse:
+            return await static_files.handle(
+                path="/",
+                is_head_response=False,
+                accept_encoding=request.headers.get("accept-encoding") if precompressed else None,
+            )
 
         handlers.append(index_handler)
 
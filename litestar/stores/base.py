@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Mapping, Optional, Sequence
 
 from msgspec import Struct
 from msgspec.msgpack import decode as msgpack_decode
@@ -66,6 +66,84 @@ class Store(ABC):
         """Delete all stored values."""
         raise NotImplementedError
 
+    async def get_many(self, keys: Sequence[str], renew_for: int | timedelta | None = None) -> list[bytes | None]:
+        """Get multiple values.
+
+        The default implementation calls :meth:`get` for each key. Stores should override this if they are able to
+        retrieve multiple values more efficiently.
+
+        Args:
+            keys: Keys associated with the values
+            renew_for: If given and a value had an initial expiry time set, renew the
+                expiry time for ``renew_for`` seconds. If the value has not been set
+                with an expiry time this is a no-op
+
+        Returns:
+            A list of the values associated with ``keys``, in the same order. A value is ``None`` if its key does not
+            exist or has expired
+        """
+        return [await self.get(key, renew_for=renew_for) for key in keys]
+
+    async def set_many(self, values: Mapping[str, str | bytes], expires_in: int | timedelta | None = None) -> None:
+        """Set multiple values.
+
+        The default implementation calls :meth:`set` for each key. Stores should override this if they are able to
+        store multiple values more efficiently.
+
+        Args:
+            values: A mapping of keys to the values to associate them with
+            expires_in: Time in seconds before the keys are considered expired
+
+        Returns:
+            ``None``
+        """
+        for key, value in values.items():
+            await self.set(key, value, expires_in=expires_in)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete multiple values.
+
+        Keys that do not exist are ignored. The default implementation calls :meth:`delete` for each key. Stores should
+        override this if they are able to delete multiple values more efficiently.
+
+        Args:
+            keys: Keys of the values to delete
+        """
+        for key in keys:
+            await self.delete(key)
+
+    async def incr(
+        self, key: str, amount: int = 1, expires_in: int | timedelta | None = None, floor: int | None = None
+    ) -> int:
+        """Increment an integer value.
+
+        If ``key`` does not exist, its value is considered to be ``0``. The value is stored as its decimal string
+        representation, so it can be retrieved with :meth:`get`.
+
+        The default implementation uses :meth:`get` and :meth:`set` and is therefore *not* atomic. Stores should
+        override this if they are able to increment a value in a single atomic step.
+
+        Args:
+            key: Key associated with the value
+            amount: Amount to increment the value by. May be negative
+            expires_in: If given, set the time in seconds before the key is considered expired. Otherwise, an
+                existing expiry time is kept
+            floor: If given, raise the current value to at least ``floor`` before incrementing it
+
+        Returns:
+            The value after the increment
+        """
+        current = await self.get(key)
+        value = int(current) if current else 0
+        if floor is not None and value < floor:
+            value = floor
+        value += amount
+        if expires_in is None and current:
+            remaining = await self.expires_in(key)
+            expires_in = remaining if remaining and remaining > 0 else None
+        await self.set(key, str(value), expires_in=expires_in)
+        return value
+
     @abstractmethod
     async def exists(self, key: str) -> bool:
         """Check if a given ``key`` exists."""
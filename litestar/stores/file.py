@@ -3,8 +3,9 @@ from __future__ import annotations
 import os
 import shutil
 import unicodedata
+from pathlib import Path as SyncPath
 from tempfile import mkstemp
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Mapping, Sequence
 
 from anyio import Path
 
@@ -95,6 +96,26 @@ class FileStore(NamespacedStore):
         storage_obj = StorageObject.new(data=value, expires_in=expires_in)
         await self._write(path, storage_obj)
 
+    def _set_many_sync(self, values: Mapping[str, str | bytes], expires_in: int | timedelta | None) -> None:
+        SyncPath(self.path).mkdir(exist_ok=True)
+        for key, value in values.items():
+            if isinstance(value, str):
+                value = value.encode("utf-8")
+            self._write_sync(self._path_from_key(key), StorageObject.new(data=value, expires_in=expires_in))
+
+    async def set_many(self, values: Mapping[str, str | bytes], expires_in: int | timedelta | None = None) -> None:
+        """Set multiple values, writing all files within a single worker thread.
+
+        Args:
+            values: A mapping of keys to the values to associate them with
+            expires_in: Time in seconds before the keys are considered expired
+
+        Returns:
+            ``None``
+        """
+        if values:
+            await sync_to_thread(self._set_many_sync, values, expires_in)
+
     async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
         """Get a value.
 
@@ -123,6 +144,46 @@ class FileStore(NamespacedStore):
 
         return storage_obj.data
 
+    def _get_many_sync(self, keys: Sequence[str], renew_for: int | timedelta | None) -> list[bytes | None]:
+        values: list[bytes | None] = []
+        for key in keys:
+            path = SyncPath(self._path_from_key(key))
+            try:
+                storage_obj = StorageObject.from_bytes(path.read_bytes())
+            except FileNotFoundError:
+                values.append(None)
+                continue
+
+            if storage_obj.expired:
+                path.unlink(missing_ok=True)
+                values.append(None)
+                continue
+
+            if renew_for and storage_obj.expires_at:
+                self._write_sync(
+                    self._path_from_key(key), StorageObject.new(data=storage_obj.data, expires_in=renew_for)
+                )
+
+            values.append(storage_obj.data)
+        return values
+
+    async def get_many(self, keys: Sequence[str], renew_for: int | timedelta | None = None) -> list[bytes | None]:
+        """Get multiple values, reading all files within a single worker thread.
+
+        Args:
+            keys: Keys associated with the values
+            renew_for: If given and a value had an initial expiry time set, renew the
+                expiry time for ``renew_for`` seconds. If the value has not been set
+                with an expiry time this is a no-op
+
+        Returns:
+            A list of the values associated with ``keys``, in the same order. A value is ``None`` if its key does not
+            exist or has expired
+        """
+        if not keys:
+            return []
+        return await sync_to_thread(self._get_many_sync, keys, renew_for)
+
     async def delete(self, key: str) -> None:
         """Delete a value.
 
@@ -134,6 +195,21 @@ class FileStore(NamespacedStore):
         path = self._path_from_key(key)
         await path.unlink(missing_ok=True)
 
+    def _delete_many_sync(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            SyncPath(self._path_from_key(key)).unlink(missing_ok=True)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete multiple values, removing all files within a single worker thread.
+
+        Keys that do not exist are ignored.
+
+        Args:
+            keys: Keys of the values to delete
+        """
+        if keys:
+            await sync_to_thread(self._delete_many_sync, keys)
+
     async def delete_all(self) -> None:
         """Delete all stored values.
 
@@ -1,17 +1,41 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
 
 import anyio
-from anyio import Lock
+from anyio import Lock, create_task_group
 
 from .base import StorageObject, Store
 
-__all__ = ("MemoryStore",)
+__all__ = ("MemoryStore", "MemoryStoreStats", "ShardedMemoryStore")
 
 
 if TYPE_CHECKING:
     from datetime import timedelta
+    from types import TracebackType
+
+    from anyio.abc import TaskGroup
+
+
+def _increment(
+    storage_obj: StorageObject | None, amount: int, expires_in: int | timedelta | None, floor: int | None
+) -> tuple[int, StorageObject]:
+    if storage_obj is None or storage_obj.expired:
+        value, expires_at = 0, None
+    else:
+        value, expires_at = int(storage_obj.data), storage_obj.expires_at
+
+    if floor is not None and value < floor:
+        value = floor
+    value += amount
+
+    new_storage_obj = StorageObject.new(data=str(value).encode("utf-8"), expires_in=expires_in)
+    if expires_in is None:
+        new_storage_obj.expires_at = expires_at
+    return value, new_storage_obj
 
 
 class MemoryStore(Store):
@@ -54,21 +78,77 @@ class MemoryStore(Store):
             ``None``
         """
         async with self._lock:
-            storage_obj = self._store.get(key)
+            return self._get_locked(key, renew_for)
+
+    def _get_locked(self, key: str, renew_for: int | timedelta | None) -> bytes | None:
+        storage_obj = self._store.get(key)
+
+        if not storage_obj:
+            return None
+
+        if storage_obj.expired:
+            self._store.pop(key)
+            return None
+
+        if renew_for and storage_obj.expires_at:
+            # don't use .set() here, so we can hold onto the lock for the whole operation
+            storage_obj = StorageObject.new(data=storage_obj.data, expires_in=renew_for)
+            self._store[key] = storage_obj
+
+        return storage_obj.data
 
-            if not storage_obj:
-                return None
+    async def get_many(self, keys: Sequence[str], renew_for: int | timedelta | None = None) -> list[bytes | None]:
+        """Get multiple values, acquiring the lock only once.
 
-            if storage_obj.expired:
-                self._store.pop(key)
-                return None
+        Args:
+            keys: Keys associated with the values
+            renew_for: If given and a value had an initial expiry time set, renew the
+                expiry time for ``renew_for`` seconds. If the value has not been set
+                with an expiry time this is a no-op
+
+        Returns:
+            A list of the values associated with ``keys``, in the same order. A value is ``None`` if its key does not
+            exist or has expired
+        """
+        async with self._lock:
+            return [self._get_locked(key, renew_for) for key in keys]
 
-            if renew_for and storage_obj.expires_at:
-                # don't use .set() here, so we can hold onto the lock for the whole operation
-                storage_obj = StorageObject.new(data=storage_obj.data, expires_in=renew_for)
-                self._store[key] = storage_obj
+    async def set_many(self, values: Mapping[str, str | bytes], expires_in: int | timedelta | None = None) -> None:
+        """Set multiple values, acquiring the lock only once.
 
-            return storage_obj.data
+        Args:
+            values: A mapping of keys to the values to associate them with
+            expires_in: Time in seconds before the keys are considered expired
+
+        Returns:
+            ``None``
+        """
+        async with self._lock:
+            for key, value in values.items():
+                self._store[key] = StorageObject.new(
+                    data=value.encode("utf-8") if isinstance(value, str) else value, expires_in=expires_in
+                )
+
+    async def incr(
+        self, key: str, amount: int = 1, expires_in: int | timedelta | None = None, floor: int | None = None
+    ) -> int:
+        """Atomically increment an integer value.
+
+        If ``key`` does not exist, its value is considered to be ``0``.
+
+        Args:
+            key: Key associated with the value
+            amount: Amount to increment the value by. May be negative
+            expires_in: If given, set the time in seconds before the key is considered expired. Otherwise, an
+                existing expiry time is kept
+            floor: If given, raise the current value to at least ``floor`` before incrementing it
+
+        Returns:
+            The value after the increment
+        """
+        async with self._lock:
+            value, self._store[key] = _increment(self._store.get(key), amount, expires_in, floor)
+        return value
 
     async def delete(self, key: str) -> None:
         """Delete a value.
@@ -81,6 +161,18 @@ class MemoryStore(Store):
         async with self._lock:
             self._store.pop(key, None)
 
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete multiple values, acquiring the lock only once.
+
+        Keys that do not exist are ignored.
+
+        Args:
+            keys: Keys of the values to delete
+        """
+        async with self._lock:
+            for key in keys:
+                self._store.pop(key, None)
+
     async def delete_all(self) -> None:
         """Delete all stored values."""
         async with self._lock:
@@ -113,3 +205,323 @@ class MemoryStore(Store):
         if storage_obj := self._store.get(key):
             return storage_obj.expires_in
         return None
+
+
+@dataclass(frozen=True)
+class MemoryStoreStats:
+    """Statistics of a :class:`ShardedMemoryStore`."""
+
+    size: int
+    """Number of stored entries, including expired entries that have not been removed yet."""
+    bytes: int
+    """Total size of the stored values in bytes."""
+    hits: int
+    """Number of calls to :meth:`ShardedMemoryStore.get` that returned a value."""
+    misses: int
+    """Number of calls to :meth:`ShardedMemoryStore.get` that did not return a value."""
+    evictions: int
+    """Number of entries that have been evicted to stay within the configured bounds."""
+    expirations: int
+    """Number of expired entries that have been removed."""
+
+
+class _Shard:
+    __slots__ = ("bytes", "data", "evictions", "expirations", "hits", "lock", "misses")
+
+    def __init__(self) -> None:
+        self.data: OrderedDict[str, StorageObject] = OrderedDict()
+        self.lock = Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def pop(self, key: str) -> StorageObject | None:
+        storage_obj = self.data.pop(key, None)
+        if storage_obj is not None:
+            self.bytes -= len(storage_obj.data)
+        return storage_obj
+
+    def get(self, key: str, renew_for: int | timedelta | None) -> bytes | None:
+        storage_obj = self.data.get(key)
+
+        if not storage_obj:
+            self.misses += 1
+            return None
+
+        if storage_obj.expired:
+            self.pop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        if renew_for and storage_obj.expires_at:
+            storage_obj = StorageObject.new(data=storage_obj.data, expires_in=renew_for)
+            self.data[key] = storage_obj
+
+        self.data.move_to_end(key)
+        self.hits += 1
+        return storage_obj.data
+
+    def put(self, key: str, storage_obj: StorageObject) -> None:
+        self.pop(key)
+        self.data[key] = storage_obj
+        self.bytes += len(storage_obj.data)
+
+    def evict(self, max_entries: int | None, max_bytes: int | None) -> None:
+        while self.data and (
+            (max_entries is not None and len(self.data) > max_entries)
+            or (max_bytes is not None and self.bytes > max_bytes)
+        ):
+            _, storage_obj = self.data.popitem(last=False)
+            self.bytes -= len(storage_obj.data)
+            self.evictions += 1
+
+
+class ShardedMemoryStore(Store):
+    """In memory, atomic, asynchronous key/value store, split into independently locked shards.
+
+    In contrast to :class:`MemoryStore`, the number of stored entries and their size can be bounded, in which case the
+    least recently used entries are evicted, and expired entries can be removed periodically in the background while
+    the store is used as an async context manager (e.g. as part of the application's lifespan).
+    """
+
+    __slots__ = ("_max_bytes", "_max_entries", "_shards", "_task_group", "expiry_interval")
+
+    def __init__(
+        self,
+        shards: int = 16,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        expiry_interval: float | None = None,
+    ) -> None:
+        """Initialize :class:`ShardedMemoryStore`
+
+        Args:
+            shards: Number of shards to split the keys into. Each shard is guarded by its own lock
+            max_entries: Maximum number of entries to store. Once reached, the least recently used entries are evicted
+            max_bytes: Maximum total size in bytes of the stored values. Once reached, the least recently used
+                entries are evicted
+            expiry_interval: Interval in seconds in which expired entries are removed in the background, while the
+                store is being used as an async context manager. If ``None``, expired entries are only removed on
+                access or when calling :meth:`delete_expired`
+
+        .. note::
+            The bounds are enforced per shard, i.e. each shard holds at most ``max_entries / shards`` entries and
+            ``max_bytes / shards`` bytes.
+        """
+        if shards < 1:
+            raise ValueError("'shards' must be greater than 0")
+
+        self._shards = tuple(_Shard() for _ in range(shards))
+        self._max_entries = math.ceil(max_entries / shards) if max_entries is not None else None
+        self._max_bytes = math.ceil(max_bytes / shards) if max_bytes is not None else None
+        self._task_group: TaskGroup | None = None
+        self.expiry_interval = expiry_interval
+
+    def _get_shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        """Set a value.
+
+        Args:
+            key: Key to associate the value with
+            value: Value to store
+            expires_in: Time in seconds before the key is considered expired
+
+        Returns:
+            ``None``
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        shard = self._get_shard(key)
+        async with shard.lock:
+            shard.put(key, StorageObject.new(data=value, expires_in=expires_in))
+            shard.evict(max_entries=self._max_entries, max_bytes=self._max_bytes)
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        """Get a value.
+
+        Args:
+            key: Key associated with the value
+            renew_for: If given and the value had an initial expiry time set, renew the
+                expiry time for ``renew_for`` seconds. If the value has not been set
+                with an expiry time this is a no-op
+
+        Returns:
+            The value associated with ``key`` if it exists and is not expired, else
+            ``None``
+        """
+        shard = self._get_shard(key)
+        async with shard.lock:
+            return shard.get(key, renew_for)
+
+    def _group_by_shard(self, keys: Iterable[str]) -> dict[_Shard, list[str]]:
+        grouped: dict[_Shard, list[str]] = defaultdict(list)
+        for key in keys:
+            grouped[self._get_shard(key)].append(key)
+        return grouped
+
+    async def get_many(self, keys: Sequence[str], renew_for: int | timedelta | None = None) -> list[bytes | None]:
+        """Get multiple values, acquiring the lock of each involved shard only once.
+
+        Args:
+            keys: Keys associated with the values
+            renew_for: If given and a value had an initial expiry time set, renew the
+                expiry time for ``renew_for`` seconds. If the value has not been set
+                with an expiry time this is a no-op
+
+        Returns:
+            A list of the values associated with ``keys``, in the same order. A value is ``None`` if its key does not
+            exist or has expired
+        """
+        values: dict[str, bytes | None] = {}
+        for shard, shard_keys in self._group_by_shard(keys).items():
+            async with shard.lock:
+                for key in shard_keys:
+                    values[key] = shard.get(key, renew_for)
+        return [values[key] for key in keys]
+
+    async def set_many(self, values: Mapping[str, str | bytes], expires_in: int | timedelta | None = None) -> None:
+        """Set multiple values, acquiring the lock of each involved shard only once.
+
+        Args:
+            values: A mapping of keys to the values to associate them with
+            expires_in: Time in seconds before the keys are considered expired
+
+        Returns:
+            ``None``
+        """
+        for shard, shard_keys in self._group_by_shard(values).items():
+            async with shard.lock:
+                for key in shard_keys:
+                    value = values[key]
+                    shard.put(
+                        key,
+                        StorageObject.new(
+                            data=value.encode("utf-8") if isinstance(value, str) else value, expires_in=expires_in
+                        ),
+                    )
+                shard.evict(max_entries=self._max_entries, max_bytes=self._max_bytes)
+
+    async def incr(
+        self, key: str, amount: int = 1, expires_in: int | timedelta | None = None, floor: int | None = None
+    ) -> int:
+        """Atomically increment an integer value.
+
+        If ``key`` does not exist, its value is considered to be ``0``.
+
+        Args:
+            key: Key associated with the value
+            amount: Amount to increment the value by. May be negative
+            expires_in: If given, set the time in seconds before the key is considered expired. Otherwise, an
+                existing expiry time is kept
+            floor: If given, raise the current value to at least ``floor`` before incrementing it
+
+        Returns:
+            The value after the increment
+        """
+        shard = self._get_shard(key)
+        async with shard.lock:
+            value, storage_obj = _increment(shard.data.get(key), amount, expires_in, floor)
+            shard.put(key, storage_obj)
+            shard.evict(max_entries=self._max_entries, max_bytes=self._max_bytes)
+        return value
+
+    async def delete(self, key: str) -> None:
+        """Delete a value.
+
+        If no such key exists, this is a no-op.
+
+        Args:
+            key: Key of the value to delete
+        """
+        shard = self._get_shard(key)
+        async with shard.lock:
+            shard.pop(key)
+
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete multiple values, acquiring the lock of each involved shard only once.
+
+        Keys that do not exist are ignored.
+
+        Args:
+            keys: Keys of the values to delete
+        """
+        for shard, shard_keys in self._group_by_shard(keys).items():
+            async with shard.lock:
+                for key in shard_keys:
+                    shard.pop(key)
+
+    async def delete_all(self) -> None:
+        """Delete all stored values."""
+        for shard in self._shards:
+            async with shard.lock:
+                shard.data.clear()
+                shard.bytes = 0
+
+    async def delete_expired(self) -> None:
+        """Delete expired items.
+
+        Shards are processed one after another, so only a single shard is locked at any given time.
+        """
+        for shard in self._shards:
+            async with shard.lock:
+                expired_keys = [key for key, storage_obj in shard.data.items() if storage_obj.expired]
+                for key in expired_keys:
+                    shard.pop(key)
+                shard.expirations += len(expired_keys)
+            await anyio.sleep(0)
+
+    async def exists(self, key: str) -> bool:
+        """Check if a given ``key`` exists."""
+        storage_obj = self._get_shard(key).data.get(key)
+        return storage_obj is not None and not storage_obj.expired
+
+    async def expires_in(self, key: str) -> int | None:
+        """Get the time in seconds ``key`` expires in. If no such ``key`` exists or no
+        expiry time was set, return ``None``.
+        """
+        if storage_obj := self._get_shard(key).data.get(key):
+            return storage_obj.expires_in
+        return None
+
+    @property
+    def stats(self) -> MemoryStoreStats:
+        """Statistics about the stored entries and the usage of the store."""
+        return MemoryStoreStats(
+            size=sum(len(shard.data) for shard in self._shards),
+            bytes=sum(shard.bytes for shard in self._shards),
+            hits=sum(shard.hits for shard in self._shards),
+            misses=sum(shard.misses for shard in self._shards),
+            evictions=sum(shard.evictions for shard in self._shards),
+            expirations=sum(shard.expirations for shard in self._shards),
+        )
+
+    async def _expire_periodically(self, interval: float) -> None:
+        while True:
+            await anyio.sleep(interval)
+            await self.delete_expired()
+
+    async def __aenter__(self) -> None:
+        if self.expiry_interval is None or self._task_group is not None:
+            return
+
+        self._task_group = create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self._expire_periodically, self.expiry_interval)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._task_group is None:
+            return
+
+        self._task_group.cancel_scope.cancel()
+        await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
+        self._task_group = None
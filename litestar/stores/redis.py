@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Mapping, Sequence, cast
 
 from redis.asyncio import Redis
 from redis.asyncio.connection import ConnectionPool
@@ -56,6 +56,39 @@ class RedisStore(NamespacedStore):
         """
         )
 
+        # script to increment a key, optionally raising it to a floor value first, and set its expiry time in one
+        # atomic step
+        self._incr_script = self._redis.register_script(
+            b"""
+        local key = KEYS[1]
+        local amount = tonumber(ARGV[1])
+        local expires_in = tonumber(ARGV[2])
+        local value
+
+        if ARGV[3] ~= '' then
+            local floor = tonumber(ARGV[3])
+            value = tonumber(redis.call('GET', key) or 0)
+            if value < floor then
+                value = floor
+            end
+            value = value + amount
+            local ttl = redis.call('PTTL', key)
+            redis.call('SET', key, string.format('%d', value))
+            if ttl > 0 then
+                redis.call('PEXPIRE', key, ttl)
+            end
+        else
+            value = redis.call('INCRBY', key, amount)
+        end
+
+        if expires_in > 0 then
+            redis.call('PEXPIRE', key, expires_in)
+        end
+
+        return value
+        """
+        )
+
         # script to delete all keys in the namespace
         self._delete_all_script = self._redis.register_script(
             b"""
@@ -171,6 +204,82 @@ class RedisStore(NamespacedStore):
             return cast("bytes | None", data)
         return await self._redis.get(key)
 
+    async def get_many(self, keys: Sequence[str], renew_for: int | timedelta | None = None) -> list[bytes | None]:
+        """Get multiple values in a single round trip.
+
+        Args:
+            keys: Keys associated with the values
+            renew_for: If given and a value had an initial expiry time set, renew the
+                expiry time for ``renew_for`` seconds. If the value has not been set
+                with an expiry time this is a no-op. If ``renew_for`` is not given, the values
+                are fetched with a single ``MGET``, otherwise the fetch and renewal script is
+                executed for each key in a pipeline
+
+        Returns:
+            A list of the values associated with ``keys``, in the same order. A value is ``None`` if its key does not
+            exist or has expired
+        """
+        if not keys:
+            return []
+
+        redis_keys = [self._make_key(key) for key in keys]
+        if not renew_for:
+            return cast("list[bytes | None]", await self._redis.mget(redis_keys))
+
+        if isinstance(renew_for, timedelta):
+            renew_for = renew_for.seconds
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in redis_keys:
+                await self._get_and_renew_script(keys=[key], args=[renew_for], client=pipe)
+            return cast("list[bytes | None]", await pipe.execute())
+
+    async def set_many(self, values: Mapping[str, str | bytes], expires_in: int | timedelta | None = None) -> None:
+        """Set multiple values in a single round trip, using a transactional pipeline.
+
+        Args:
+            values: A mapping of keys to the values to associate them with
+            expires_in: Time in seconds before the keys are considered expired
+
+        Returns:
+            ``None``
+        """
+        if not values:
+            return
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for key, value in values.items():
+                if isinstance(value, str):
+                    value = value.encode("utf-8")
+                pipe.set(self._make_key(key), value, ex=expires_in)
+            await pipe.execute()
+
+    async def incr(
+        self, key: str, amount: int = 1, expires_in: int | timedelta | None = None, floor: int | None = None
+    ) -> int:
+        """Atomically increment an integer value.
+
+        If ``key`` does not exist, its value is considered to be ``0``. Atomicity is guaranteed by using a lua script
+        to execute the increment and the update of the expiry time.
+
+        Args:
+            key: Key associated with the value
+            amount: Amount to increment the value by. May be negative
+            expires_in: If given, set the time in seconds before the key is considered expired. Otherwise, an
+                existing expiry time is kept
+            floor: If given, raise the current value to at least ``floor`` before incrementing it
+
+        Returns:
+            The value after the increment
+        """
+        if isinstance(expires_in, timedelta):
+            expires_in_ms = int(expires_in.total_seconds() * 1000)
+        else:
+            expires_in_ms = (expires_in or 0) * 1000
+        value = await self._incr_script(
+            keys=[self._make_key(key)], args=[amount, expires_in_ms, "" if floor is None else floor]
+        )
+        return int(cast("int", value))
+
     async def delete(self, key: str) -> None:
         """Delete a value.
 
@@ -181,6 +290,17 @@ class RedisStore(NamespacedStore):
         """
         await self._redis.delete(self._make_key(key))
 
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        """Delete multiple values with a single ``DEL`` command.
+
+        Keys that do not exist are ignored.
+
+        Args:
+            keys: Keys of the values to delete
+        """
+        if keys:
+            await self._redis.delete(*(self._make_key(key) for key in keys))
+
     async def delete_all(self) -> None:
         """Delete all stored values in the virtual key namespace.
 
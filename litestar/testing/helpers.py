@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, Sequence
 
 from litestar.app import DEFAULT_OPENAPI_CONFIG, Litestar
+from litestar.constants import ONE_MEGABYTE
 from litestar.controller import Controller
 from litestar.events import SimpleEventEmitter
 from litestar.testing.client import AsyncTestClient, TestClient
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from litestar.config.cors import CORSConfig
     from litestar.config.csrf import CSRFConfig
     from litestar.config.response_cache import ResponseCacheConfig
+    from litestar.config.route_cache import RouteCacheConfig
     from litestar.datastructures import CacheControlHeader, ETag, State
     from litestar.dto import AbstractDTO
     from litestar.events import BaseEventEmitterBackend, EventListener
@@ -72,14 +74,16 @@ def create_test_client(
     dependencies: Dependencies | None = None,
     dto: type[AbstractDTO] | None | EmptyType = Empty,
     etag: ETag | None = None,
-    event_emitter_backend: type[BaseEventEmitterBackend] = SimpleEventEmitter,
+    event_emitter_backend: type[BaseEventEmitterBackend] | Callable[..., BaseEventEmitterBackend] = SimpleEventEmitter,
     exception_handlers: ExceptionHandlersMap | None = None,
     guards: Sequence[Guard] | None = None,
     include_in_schema: bool | EmptyType = Empty,
     listeners: Sequence[EventListener] | None = None,
     logging_config: BaseLoggingConfig | EmptyType | None = Empty,
     middleware: Sequence[Middleware] | None = None,
+    multipart_form_buffer_size: int = ONE_MEGABYTE,
     multipart_form_part_limit: int = 1000,
+    multipart_form_spool_size: int = ONE_MEGABYTE,
     on_app_init: Sequence[OnAppInitHandler] | None = None,
     on_shutdown: Sequence[LifespanHook] | None = None,
     on_startup: Sequence[LifespanHook] | None = None,
@@ -97,6 +101,7 @@ def create_test_client(
     response_headers: ResponseHeaders | None = None,
     return_dto: type[AbstractDTO] | None | EmptyType = Empty,
     root_path: str = "",
+    route_cache_config: RouteCacheConfig | None = None,
     security: Sequence[SecurityRequirement] | None = None,
     session_config: BaseBackendConfig | None = None,
     signature_namespace: Mapping[str, Any] | None = None,
@@ -177,7 +182,8 @@ def create_test_client(
         etag: An ``etag`` header of type :class:`ETag <.datastructures.ETag>` to add to route handlers of this app.
             Can be overridden by route handlers.
         event_emitter_backend: A subclass of
-            :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`.
+            :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`, or a callable
+            returning an instance of one, receiving the listeners as the ``listeners`` keyword argument.
         exception_handlers: A mapping of status codes and/or exception types to handler functions.
         guards: A sequence of :class:`Guard <.types.Guard>` callables.
         include_in_schema: A boolean flag dictating whether  the route handler should be documented in the OpenAPI schema.
@@ -185,8 +191,12 @@ def create_test_client(
         listeners: A sequence of :class:`EventListener <.events.listener.EventListener>`.
         logging_config: A subclass of :class:`BaseLoggingConfig <.logging.config.BaseLoggingConfig>`.
         middleware: A sequence of :class:`Middleware <.types.Middleware>`.
+        multipart_form_buffer_size: The maximal size in bytes of the headers and of non-file field values of a
+            multipart/formdata request part, which are buffered in memory.
         multipart_form_part_limit: The maximal number of allowed parts in a multipart/formdata request. This limit
             is intended to protect from DoS attacks.
+        multipart_form_spool_size: The size in bytes above which files uploaded in a multipart/formdata request are
+            rolled over to disk.
         on_app_init: A sequence of :class:`OnAppInitHandler <.types.OnAppInitHandler>` instances. Handlers receive
             an instance of :class:`AppConfig <.config.app.AppConfig>` that will have been initially populated with
             the parameters passed to :class:`Litestar <litestar.app.Litestar>`, and must return an instance of same.
@@ -211,6 +221,7 @@ def create_test_client(
         response_cache_config: Configures caching behavior of the application.
         return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
             outbound response data.
+        route_cache_config: Configures the cache used to resolve requests to route handlers.
         route_handlers: A sequence of route handlers, which can include instances of
             :class:`Router <.router.Router>`, subclasses of :class:`Controller <.controller.Controller>` or any
             callable decorated by the route handler decorators.
@@ -266,7 +277,9 @@ def create_test_client(
         listeners=listeners,
         logging_config=logging_config,
         middleware=middleware,
+        multipart_form_buffer_size=multipart_form_buffer_size,
         multipart_form_part_limit=multipart_form_part_limit,
+        multipart_form_spool_size=multipart_form_spool_size,
         on_app_init=on_app_init,
         on_shutdown=on_shutdown,
         on_startup=on_startup,
@@ -281,6 +294,7 @@ def create_test_client(
         response_cookies=response_cookies,
         response_headers=response_headers,
         return_dto=return_dto,
+        route_cache_config=route_cache_config,
         route_handlers=route_handlers,
         security=security,
         signature_namespace=signature_namespace,
@@ -327,7 +341,7 @@ def create_async_test_client(
     dependencies: Dependencies | None = None,
     dto: type[AbstractDTO] | None | EmptyType = Empty,
     etag: ETag | None = None,
-    event_emitter_backend: type[BaseEventEmitterBackend] = SimpleEventEmitter,
+    event_emitter_backend: type[BaseEventEmitterBackend] | Callable[..., BaseEventEmitterBackend] = SimpleEventEmitter,
     exception_handlers: ExceptionHandlersMap | None = None,
     guards: Sequence[Guard] | None = None,
     include_in_schema: bool | EmptyType = Empty,
@@ -335,7 +349,9 @@ def create_async_test_client(
     listeners: Sequence[EventListener] | None = None,
     logging_config: BaseLoggingConfig | EmptyType | None = Empty,
     middleware: Sequence[Middleware] | None = None,
+    multipart_form_buffer_size: int = ONE_MEGABYTE,
     multipart_form_part_limit: int = 1000,
+    multipart_form_spool_size: int = ONE_MEGABYTE,
     on_app_init: Sequence[OnAppInitHandler] | None = None,
     on_shutdown: Sequence[LifespanHook] | None = None,
     on_startup: Sequence[LifespanHook] | None = None,
@@ -352,6 +368,7 @@ def create_async_test_client(
     response_headers: ResponseHeaders | None = None,
     return_dto: type[AbstractDTO] | None | EmptyType = Empty,
     root_path: str = "",
+    route_cache_config: RouteCacheConfig | None = None,
     security: Sequence[SecurityRequirement] | None = None,
     session_config: BaseBackendConfig | None = None,
     signature_namespace: Mapping[str, Any] | None = None,
@@ -432,7 +449,8 @@ def create_async_test_client(
         etag: An ``etag`` header of type :class:`ETag <.datastructures.ETag>` to add to route handlers of this app.
             Can be overridden by route handlers.
         event_emitter_backend: A subclass of
-            :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`.
+            :class:`BaseEventEmitterBackend <.events.emitter.BaseEventEmitterBackend>`, or a callable
+            returning an instance of one, receiving the listeners as the ``listeners`` keyword argument.
         exception_handlers: A mapping of status codes and/or exception types to handler functions.
         guards: A sequence of :class:`Guard <.types.Guard>` callables.
         include_in_schema: A boolean flag dictating whether  the route handler should be documented in the OpenAPI schema.
@@ -440,8 +458,12 @@ def create_async_test_client(
         listeners: A sequence of :class:`EventListener <.events.listener.EventListener>`.
         logging_config: A subclass of :class:`BaseLoggingConfig <.logging.config.BaseLoggingConfig>`.
         middleware: A sequence of :class:`Middleware <.types.Middleware>`.
+        multipart_form_buffer_size: The maximal size in bytes of the headers and of non-file field values of a
+            multipart/formdata request part, which are buffered in memory.
         multipart_form_part_limit: The maximal number of allowed parts in a multipart/formdata request. This limit
             is intended to protect from DoS attacks.
+        multipart_form_spool_size: The size in bytes above which files uploaded in a multipart/formdata request are
+            rolled over to disk.
         on_app_init: A sequence of :class:`OnAppInitHandler <.types.OnAppInitHandler>` instances. Handlers receive
             an instance of :class:`AppConfig <.config.app.AppConfig>` that will have been initially populated with
             the parameters passed to :class:`Litestar <litestar.app.Litestar>`, and must return an instance of same.
@@ -466,6 +488,7 @@ def create_async_test_client(
         response_cache_config: Configures caching behavior of the application.
         return_dto: :class:`AbstractDTO <.dto.base_dto.AbstractDTO>` to use for serializing
             outbound response data.
+        route_cache_config: Configures the cache used to resolve requests to route handlers.
         route_handlers: A sequence of route handlers, which can include instances of
             :class:`Router <.router.Router>`, subclasses of :class:`Controller <.controller.Controller>` or any
             callable decorated by the route handler decorators.
@@ -520,7 +543,9 @@ def create_async_test_client(
         listeners=listeners,
         logging_config=logging_config,
         middleware=middleware,
+        multipart_form_buffer_size=multipart_form_buffer_size,
         multipart_form_part_limit=multipart_form_part_limit,
+        multipart_form_spool_size=multipart_form_spool_size,
         on_app_init=on_app_init,
         on_shutdown=on_shutdown,
         on_startup=on_startup,
@@ -535,6 +560,7 @@ def create_async_test_client(
         response_cookies=response_cookies,
         response_headers=response_headers,
         return_dto=return_dto,
+        route_cache_config=route_cache_config,
         route_handlers=route_handlers,
         security=security,
         signature_namespace=signature_namespace,
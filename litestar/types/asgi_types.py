@@ -56,6 +56,7 @@ __all__ = (
     "HTTPReceiveMessage",
     "HTTPRequestEvent",
     "HTTPResponseBodyEvent",
+    "HTTPResponsePathsendEvent",
     "HTTPResponseStartEvent",
     "HTTPScope",
     "HTTPSendMessage",
@@ -188,6 +189,13 @@ class HTTPResponseBodyEvent(TypedDict):
     more_body: bool
 
 
+class HTTPResponsePathsendEvent(TypedDict):
+    """ASGI `http.response.pathsend` event."""
+
+    type: Literal["http.response.pathsend"]
+    path: str
+
+
 class HTTPServerPushEvent(HeaderScope):
     """ASGI `http.response.push` event."""
 
@@ -314,6 +322,7 @@ LifeSpanReceiveMessage: TypeAlias = Union[
 HTTPSendMessage: TypeAlias = Union[
     HTTPResponseStartEvent,
     HTTPResponseBodyEvent,
+    HTTPResponsePathsendEvent,
     HTTPServerPushEvent,
     HTTPDisconnectEvent,
 ]
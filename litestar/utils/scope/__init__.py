@@ -11,7 +11,7 @@ from litestar.utils.scope.state import set_litestar_scope_state as _set_litestar
 if TYPE_CHECKING:
     from litestar.types import Scope, Serializer
 
-__all__ = ("get_serializer_from_scope",)
+__all__ = ("disable_scope_extension", "get_serializer_from_scope")
 
 
 def get_serializer_from_scope(scope: Scope) -> Serializer:
@@ -41,6 +41,23 @@ def get_serializer_from_scope(scope: Scope) -> Serializer:
     return get_serializer(type_encoders)
 
 
+def disable_scope_extension(scope: Scope, extension: str) -> None:
+    """Hide an ASGI extension of the server from the application.
+
+    This is used by middlewares that need to process the messages the application sends, to prevent the application
+    from sending messages of an extension the middleware cannot handle, such as ``http.response.pathsend``.
+
+    Args:
+        scope: The ASGI connection scope.
+        extension: The name of the extension.
+
+    Returns:
+        None
+    """
+    if (extensions := scope.get("extensions")) and extension in extensions:
+        scope["extensions"] = {name: value for name, value in extensions.items() if name != extension}
+
+
 _deprecated_names = {
     "get_litestar_scope_state": _get_litestar_scope_state,
     "set_litestar_scope_state": _set_litestar_scope_state,
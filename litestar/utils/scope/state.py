@@ -36,12 +36,14 @@ class ScopeState:
         "form",
         "headers",
         "is_cached",
+        "is_stale",
         "json",
         "log_context",
         "msgpack",
         "parsed_query",
         "response_compressed",
         "session_id",
+        "skip_cache",
         "url",
         "_compat_ns",
     )
@@ -58,12 +60,14 @@ class ScopeState:
         self.form = Empty
         self.headers = Empty
         self.is_cached = Empty
+        self.is_stale = Empty
         self.json = Empty
         self.log_context: dict[str, Any] = {}
         self.msgpack = Empty
         self.parsed_query = Empty
         self.response_compressed = Empty
         self.session_id = Empty
+        self.skip_cache = Empty
         self.url = Empty
         self._compat_ns: dict[str, Any] = {}
 
@@ -73,17 +77,19 @@ class ScopeState:
     content_type: tuple[str, dict[str, str]] | EmptyType
     cookies: dict[str, str] | EmptyType
     csrf_token: str | EmptyType
-    dependency_cache: dict[str, Any] | EmptyType
+    dependency_cache: dict[int, Any] | EmptyType
     do_cache: bool | EmptyType
     form: dict[str, str | list[str]] | EmptyType
     headers: Headers | EmptyType
     is_cached: bool | EmptyType
+    is_stale: bool | EmptyType
     json: Any | EmptyType
     log_context: dict[str, Any]
     msgpack: Any | EmptyType
     parsed_query: tuple[tuple[str, str], ...] | EmptyType
     response_compressed: bool | EmptyType
     session_id: str | None | EmptyType
+    skip_cache: bool | EmptyType
     url: URL | EmptyType
     _compat_ns: dict[str, Any]
 
@@ -26,7 +26,7 @@ from litestar.middleware.session.client_side import ClientSideSessionBackend, Co
 from litestar.middleware.session.server_side import ServerSideSessionBackend, ServerSideSessionConfig
 from litestar.stores.base import Store
 from litestar.stores.file import FileStore
-from litestar.stores.memory import MemoryStore
+from litestar.stores.memory import MemoryStore, ShardedMemoryStore
 from litestar.stores.redis import RedisStore
 from litestar.testing import RequestFactory
 
@@ -85,13 +85,23 @@ def memory_store() -> MemoryStore:
     return MemoryStore()
 
 
+@pytest.fixture()
+def sharded_memory_store() -> ShardedMemoryStore:
+    return ShardedMemoryStore(shards=4)
+
+
 @pytest.fixture()
 def file_store(tmp_path: Path) -> FileStore:
     return FileStore(path=tmp_path)
 
 
 @pytest.fixture(
-    params=[pytest.param("redis_store", marks=pytest.mark.xdist_group("redis")), "memory_store", "file_store"]
+    params=[
+        pytest.param("redis_store", marks=pytest.mark.xdist_group("redis")),
+        "memory_store",
+        "sharded_memory_store",
+        "file_store",
+    ]
 )
 def store(request: FixtureRequest) -> Store:
     return cast("Store", request.getfixturevalue(request.param))
@@ -1,22 +1,24 @@
 import gzip
 import random
 from datetime import timedelta
-from typing import TYPE_CHECKING, Optional, Type, Union
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Type, Union
 from unittest.mock import MagicMock
 from uuid import uuid4
 
-import msgspec
+import anyio
 import pytest
 
 from litestar import Litestar, Request, Response, get, post
 from litestar.config.compression import CompressionConfig
 from litestar.config.response_cache import CACHE_FOREVER, ResponseCacheConfig
 from litestar.enums import CompressionEncoding
-from litestar.middleware.response_cache import ResponseCacheMiddleware
+from litestar.middleware.response_cache import CachedResponse, ResponseCacheMiddleware
+from litestar.response import Stream
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST, HTTP_500_INTERNAL_SERVER_ERROR
 from litestar.stores.base import Store
 from litestar.stores.memory import MemoryStore
-from litestar.testing import TestClient, create_test_client
+from litestar.testing import AsyncTestClient, TestClient, create_test_client
 from litestar.types import HTTPScope
 
 if TYPE_CHECKING:
@@ -243,10 +245,146 @@ async def test_compression_applies_before_cache() -> None:
     with TestClient(app) as client:
         client.get("/", headers={"Accept-Encoding": str(CompressionEncoding.GZIP.value)})
 
+    stored_value = await app.response_cache_config.get_store_from_app(app).get("GET/::gzip")
+    assert stored_value
+    cached_response = CachedResponse.from_bytes(stored_value)
+    assert (b"content-encoding", b"gzip") in cached_response.headers
+    assert gzip.decompress(cached_response.body).decode() == return_value
+
+
+def test_caches_variant_per_encoding() -> None:
+    return_value = "_litestar_" * 4000
+    mock = MagicMock(return_value=return_value)
+
+    @get(path="/", cache=True, sync_to_thread=False)
+    def handler_fn() -> str:
+        return mock()  # type: ignore[no-any-return]
+
+    with create_test_client([handler_fn], compression_config=CompressionConfig(backend="gzip")) as client:
+        for _ in range(2):
+            response = client.get("/", headers={"Accept-Encoding": "gzip"})
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.text == return_value
+
+            response = client.get("/", headers={"Accept-Encoding": "identity"})
+            assert "content-encoding" not in response.headers
+            assert response.text == return_value
+
+        assert mock.call_count == 2
+
+
+async def test_caches_streamed_response_as_single_body() -> None:
+    @get(path="/", cache=True)
+    async def handler_fn() -> Stream:
+        async def generator() -> AsyncIterator[str]:
+            for i in range(3):
+                yield str(i)
+
+        return Stream(generator())
+
+    app = Litestar([handler_fn])
+
+    with TestClient(app) as client:
+        assert client.get("/").text == "012"
+        assert client.get("/").text == "012"
+
     stored_value = await app.response_cache_config.get_store_from_app(app).get("GET/")
     assert stored_value
-    stored_messages = msgspec.msgpack.decode(stored_value)
-    assert gzip.decompress(stored_messages[1]["body"]).decode() == return_value
+    assert CachedResponse.from_bytes(stored_value).body == b"012"
+
+
+@pytest.mark.parametrize("lock_expiration", [None, 5])
+async def test_coalesce_requests(lock_expiration: Optional[int]) -> None:
+    call_count = 0
+
+    @get("/", cache=True)
+    async def handler() -> str:
+        nonlocal call_count
+        call_count += 1
+        await anyio.sleep(0.1)
+        return str(call_count)
+
+    app = Litestar(
+        [handler],
+        response_cache_config=ResponseCacheConfig(coalesce_requests=True, lock_expiration=lock_expiration),
+    )
+    responses: List[str] = []
+
+    async with AsyncTestClient(app) as client:
+
+        async def make_request() -> None:
+            responses.append((await client.get("/")).text)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(make_request)
+
+    assert call_count == 1
+    assert responses == ["1"] * 5
+    assert not await app.response_cache_config.get_store_from_app(app).exists("GET/::lock")
+
+
+def test_stale_while_revalidate(mock: MagicMock, frozen_datetime: "Coordinates") -> None:
+    mock.side_effect = ["1", "2", "3"]
+
+    @get("/", cache=10)
+    async def handler() -> str:
+        return mock()  # type: ignore[no-any-return]
+
+    with create_test_client([handler], response_cache_config=ResponseCacheConfig(stale_while_revalidate=5)) as client:
+        assert client.get("/").text == "1"
+
+        frozen_datetime.shift(delta=timedelta(seconds=12))
+        # the stale response is served, and refreshed in the background
+        assert client.get("/").text == "1"
+        for _ in range(100):
+            if mock.call_count == 2:
+                break
+            sleep(0.01)
+        assert mock.call_count == 2
+        assert client.get("/").text == "2"
+        assert mock.call_count == 2
+
+        frozen_datetime.shift(delta=timedelta(seconds=16))
+        client.get("/")
+        assert mock.call_count == 3
+
+
+@pytest.mark.parametrize("coalesce_requests", [False, True])
+async def test_stale_while_revalidate_does_not_block_requests(coalesce_requests: bool) -> None:
+    call_count = 0
+
+    @get("/", cache=1)
+    async def handler() -> str:
+        nonlocal call_count
+        call_count += 1
+        if call_count > 1:
+            await anyio.sleep(0.5)
+        return str(call_count)
+
+    app = Litestar(
+        [handler],
+        response_cache_config=ResponseCacheConfig(coalesce_requests=coalesce_requests, stale_while_revalidate=5),
+    )
+
+    async with AsyncTestClient(app) as client:
+        assert (await client.get("/")).text == "1"
+        await anyio.sleep(1.1)
+
+        async def make_request() -> str:
+            start = monotonic()
+            text = (await client.get("/")).text
+            # neither the request triggering the refresh nor requests arriving during it wait for the refresh
+            assert monotonic() - start < 0.3
+            return text
+
+        assert await make_request() == "1"
+        await anyio.sleep(0.1)
+        assert await make_request() == "1"
+
+        await anyio.sleep(0.6)
+        assert (await client.get("/")).text == "2"
+        assert call_count == 2
 
 
 @pytest.mark.parametrize(
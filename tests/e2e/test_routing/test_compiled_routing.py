@@ -0,0 +1,153 @@
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pytest
+
+from litestar import Litestar, MediaType, Router, asgi, get, post, websocket
+from litestar._asgi.routing_trie.compiled import compile_route_map
+from litestar.config.app import ExperimentalFeatures
+from litestar.connection import WebSocket
+from litestar.static_files import create_static_files_router
+from litestar.status_codes import HTTP_200_OK, HTTP_404_NOT_FOUND, HTTP_405_METHOD_NOT_ALLOWED
+from litestar.testing import TestClient, create_test_client
+from litestar.types import Receive, Scope, Send
+
+
+@get("/users/{user_id:int}", media_type=MediaType.TEXT, sync_to_thread=False)
+def get_user(user_id: int) -> str:
+    return f"user {user_id}"
+
+
+@post("/users/{user_id:int}", media_type=MediaType.TEXT, sync_to_thread=False)
+def update_user(user_id: int) -> str:
+    return f"updated {user_id}"
+
+
+@get("/users/{user_id:int}/posts/latest/comments", media_type=MediaType.TEXT, sync_to_thread=False)
+def get_latest_comments(user_id: int) -> str:
+    return f"comments {user_id}"
+
+
+@get("/users/{user_id:int}/posts/{post_id:str}", media_type=MediaType.TEXT, sync_to_thread=False)
+def get_post(user_id: int, post_id: str) -> str:
+    return f"post {user_id} {post_id}"
+
+
+@get("/users/me", media_type=MediaType.TEXT, sync_to_thread=False)
+def get_me() -> str:
+    return "me"
+
+
+@get("/a/b/c/{value:int}", media_type=MediaType.TEXT, sync_to_thread=False)
+def deep(value: int) -> str:
+    return f"deep {value}"
+
+
+@get("/files/{name:str}/{file_path:path}", media_type=MediaType.TEXT, sync_to_thread=False)
+def get_file(name: str, file_path: Path) -> str:
+    return f"{name}:{file_path}"
+
+
+@get(["/", "/optional/{value:int}"], media_type=MediaType.TEXT, sync_to_thread=False)
+def optional(value: Optional[int]) -> str:
+    return str(value)
+
+
+ROUTE_HANDLERS: List[Any] = [
+    get_user,
+    update_user,
+    get_latest_comments,
+    get_post,
+    get_me,
+    deep,
+    get_file,
+    optional,
+]
+
+
+@pytest.mark.parametrize(
+    "method, path, expected_status_code, expected_text",
+    [
+        ("GET", "/users/1", HTTP_200_OK, "user 1"),
+        ("POST", "/users/1", 201, "updated 1"),
+        ("DELETE", "/users/1", HTTP_405_METHOD_NOT_ALLOWED, None),
+        ("GET", "/users/abc", HTTP_404_NOT_FOUND, None),
+        ("GET", "/users/me", HTTP_200_OK, "me"),
+        ("GET", "/users/1/posts/latest/comments", HTTP_200_OK, "comments 1"),
+        ("GET", "/users/1/posts/latest", HTTP_404_NOT_FOUND, None),
+        ("GET", "/users/1/posts/other", HTTP_200_OK, "post 1 other"),
+        ("GET", "/users/1/posts/latest/other", HTTP_404_NOT_FOUND, None),
+        ("GET", "/a/b/c/1", HTTP_200_OK, "deep 1"),
+        ("GET", "/a/b/c", HTTP_404_NOT_FOUND, None),
+        ("GET", "/a/b/x/1", HTTP_404_NOT_FOUND, None),
+        ("GET", "/a/b", HTTP_404_NOT_FOUND, None),
+        ("GET", "/files/docs/a/b/c.txt", HTTP_200_OK, "docs:/a/b/c.txt"),
+        ("GET", "/", HTTP_200_OK, "None"),
+        ("GET", "/optional/2/", HTTP_200_OK, "2"),
+        ("GET", "/unknown", HTTP_404_NOT_FOUND, None),
+    ],
+)
+@pytest.mark.parametrize("compiled", [True, False])
+def test_compiled_routing_matches_trie_routing(
+    compiled: bool, method: str, path: str, expected_status_code: int, expected_text: Optional[str]
+) -> None:
+    experimental_features = [ExperimentalFeatures.COMPILED_ROUTING] if compiled else None
+    with create_test_client(ROUTE_HANDLERS, experimental_features=experimental_features) as client:
+        response = client.request(method, path)
+        assert response.status_code == expected_status_code
+        if expected_text is not None:
+            assert response.text == expected_text
+
+
+def test_compiled_routing_with_mounts_and_websockets(tmp_path: Path) -> None:
+    tmp_path.joinpath("test.txt").write_text("content")
+
+    @asgi("/mount", is_mount=True)
+    async def mount(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": scope["path"].encode()})
+
+    @websocket("/ws/{room:str}")
+    async def ws_handler(socket: WebSocket, room: str) -> None:
+        await socket.accept()
+        await socket.send_text(room)
+        await socket.close()
+
+    with create_test_client(
+        [mount, ws_handler, get_user, create_static_files_router(path="/static", directories=[tmp_path])],
+        experimental_features=[ExperimentalFeatures.COMPILED_ROUTING],
+    ) as client:
+        assert client.get("/mount/sub/path").text == "/sub/path/"
+        assert client.get("/static/test.txt").text == "content"
+        assert client.get("/users/2").text == "user 2"
+
+        with client.websocket_connect("/ws/lobby") as ws:
+            assert ws.receive_text() == "lobby"
+
+
+def test_compiled_routing_recompiles_after_registration() -> None:
+    @get("/late/{value:int}", media_type=MediaType.TEXT, sync_to_thread=False)
+    def late(value: int) -> str:
+        return f"late {value}"
+
+    app = Litestar([get_user], experimental_features=[ExperimentalFeatures.COMPILED_ROUTING])
+    with TestClient(app=app) as client:
+        assert client.get("/users/1").status_code == HTTP_200_OK
+        assert client.get("/late/1").status_code == HTTP_404_NOT_FOUND
+
+        app.register(late)
+        assert client.get("/late/1").text == "late 1"
+
+
+def test_compile_route_map_collapses_static_components() -> None:
+    router = Router("/api/v1/internal", route_handlers=[get_user, deep])
+    app = Litestar([router])
+
+    compiled_root = compile_route_map(app.asgi_router.root_route_map_node)
+
+    api_node = compiled_root.children["api"]
+    assert api_node.prefix == ("v1", "internal")
+    assert set(api_node.children) == {"users", "a"}
+    assert api_node.children["a"].prefix == ("b", "c")
+    assert api_node.children["users"].param_child is not None
+    assert api_node.children["users"].param_child.path_parameters["GET"][0][0] == "user_id"
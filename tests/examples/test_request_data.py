@@ -10,8 +10,9 @@ from docs.examples.request_data.request_data_7 import app as app_7
 from docs.examples.request_data.request_data_8 import app as app_8
 from docs.examples.request_data.request_data_9 import app as app_9
 from docs.examples.request_data.request_data_10 import app as app_10
+from docs.examples.request_data.stream_request import app as stream_app
 
-from litestar.serialization import encode_msgpack
+from litestar.serialization import encode_json, encode_msgpack
 from litestar.testing import TestClient
 
 
@@ -102,6 +103,26 @@ def test_msgpack_app() -> None:
         assert response.json() == test_data
 
 
+def test_stream_app() -> None:
+    measurements = [{"sensor": "a", "value": 1.5}, {"sensor": "b", "value": 2}]
+
+    with TestClient(app=stream_app) as client:
+        response = client.post("/measurements", json=measurements)
+        assert response.json() == {"count": 2}
+
+        response = client.post(
+            "/measurements",
+            content=b"\n".join(encode_json(measurement) for measurement in measurements),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.json() == {"count": 2}
+
+        response = client.post(
+            "/measurements", content=encode_msgpack(measurements), headers={"Content-Type": "application/x-msgpack"}
+        )
+        assert response.json() == {"count": 2}
+
+
 def test_custom_request_app() -> None:
     with TestClient(app=custom_request_class_app) as client:
         response = client.get("/kitten-name")
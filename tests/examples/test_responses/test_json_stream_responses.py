@@ -0,0 +1,20 @@
+import json
+
+from docs.examples.responses.json_stream_responses import app
+
+from litestar.testing import TestClient
+
+
+def test_json_stream_responses_example() -> None:
+    with TestClient(app) as client:
+        response = client.get("/rows")
+        assert response.headers["content-type"] == "application/json"
+        rows = response.json()
+        assert len(rows) == 200_000
+        assert rows[-1] == {"id": 199_999, "name": "row 199999"}
+
+        response = client.get("/rows.ndjson")
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert len(lines) == 200_000
+        assert json.loads(lines[0]) == {"id": 0, "name": "row 0"}
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, AsyncGenerator, Callable
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Literal
 from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
 
 import pytest
 from pytest_mock import MockerFixture
 
-from litestar import Litestar, asgi
+from litestar import Litestar, asgi, get
 from litestar._asgi.asgi_router import ASGIRouter
+from litestar._asgi.routing_trie.cache import RouteCache
+from litestar.config.app import ExperimentalFeatures
+from litestar.config.route_cache import RouteCacheConfig
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.testing import TestClient, create_test_client
 from litestar.utils.helpers import get_exception_group
@@ -194,3 +198,72 @@ async def test_lifespan_shutdown_failure(mock_format_exc: MagicMock) -> None:
 
     assert send.call_count == 2
     assert send.call_args_list[1][0][0] == {"type": "lifespan.shutdown.failed", "message": mock_format_exc.return_value}
+
+
+@pytest.mark.parametrize("compiled_routing", [False, True])
+def test_route_cache_keyed_by_path_template(compiled_routing: bool) -> None:
+    @get("/items/{item_id:uuid}", sync_to_thread=False)
+    def handler(item_id: UUID) -> str:
+        return str(item_id)
+
+    experimental_features = [ExperimentalFeatures.COMPILED_ROUTING] if compiled_routing else None
+    with create_test_client([handler], experimental_features=experimental_features) as client:
+        route_cache = client.app.asgi_router.route_cache
+        item_ids = [uuid4() for _ in range(10)]
+        for item_id in item_ids:
+            response = client.get(f"/items/{item_id}")
+            assert response.text == str(item_id)
+
+        assert len(route_cache) == 1
+        assert route_cache.misses == 1
+        assert route_cache.hits == 9
+        assert route_cache.evictions == 0
+
+
+def test_route_cache_config() -> None:
+    @get("/a/{value:int}", sync_to_thread=False)
+    def handler_a(value: int) -> int:
+        return value
+
+    @get("/b/{value:int}", sync_to_thread=False)
+    def handler_b(value: int) -> int:
+        return value
+
+    with create_test_client(
+        [handler_a, handler_b], route_cache_config=RouteCacheConfig(max_size=1, eviction_policy="fifo")
+    ) as client:
+        route_cache = client.app.asgi_router.route_cache
+        assert route_cache.max_size == 1
+        assert route_cache.eviction_policy == "fifo"
+
+        assert client.get("/a/1").json() == 1
+        assert client.get("/b/2").json() == 2
+        assert client.get("/a/3").json() == 3
+
+        assert len(route_cache) == 1
+        assert route_cache.evictions == 2
+        assert route_cache.misses == 3
+
+
+@pytest.mark.parametrize(
+    "eviction_policy, expected_keys",
+    [("lru", {"a", "c"}), ("fifo", {"b", "c"})],
+)
+def test_route_cache_eviction_policy(eviction_policy: Literal["lru", "fifo"], expected_keys: set[str]) -> None:
+    cache: RouteCache[int] = RouteCache(max_size=2, eviction_policy=eviction_policy)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert {key for key in ("a", "b", "c") if key in cache._data} == expected_keys
+    assert cache.hits == 1
+    assert cache.evictions == 1
+
+
+def test_route_cache_disabled() -> None:
+    cache: RouteCache[int] = RouteCache(max_size=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.misses == 1
@@ -71,6 +71,16 @@ async def test_pub_sub(channels_backend: ChannelsBackend, channels: set[str]) ->
     assert received == {(c, b"something") for c in channels}
 
 
+async def test_publish_many(channels_backend: ChannelsBackend) -> None:
+    await channels_backend.subscribe(["foo", "bar"])
+    await channels_backend.publish_many([(b"one", ["foo"]), (b"two", ["foo", "bar"])])
+
+    event_generator = channels_backend.stream_events()
+    received = [await async_next(event_generator) for _ in range(3)]
+    assert sorted(received) == [("bar", b"two"), ("foo", b"one"), ("foo", b"two")]
+    assert [data for channel, data in received if channel == "foo"] == [b"one", b"two"]
+
+
 async def test_pub_sub_unsubscribe(channels_backend: ChannelsBackend) -> None:
     await channels_backend.subscribe(["foo", "bar"])
     await channels_backend.publish(b"something", ["foo"])
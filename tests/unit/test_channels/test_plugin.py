@@ -11,10 +11,11 @@ from _pytest.fixtures import FixtureRequest
 from pytest_mock import MockerFixture
 
 from litestar import Litestar, get
-from litestar.channels import ChannelsBackend, ChannelsPlugin
+from litestar.channels import ChannelsBackend, ChannelsMetrics, ChannelsPlugin
 from litestar.channels.backends.memory import MemoryChannelsBackend
 from litestar.channels.subscriber import BacklogStrategy
-from litestar.exceptions import ImproperlyConfiguredException, LitestarException
+from litestar.exceptions import ImproperlyConfiguredException, LitestarException, WebSocketDisconnect
+from litestar.status_codes import WS_1013_TRY_AGAIN_LATER
 from litestar.testing import TestClient, create_test_client
 from litestar.types.asgi_types import WebSocketMode
 
@@ -134,6 +135,118 @@ def test_create_ws_route_handlers(
         assert ws.receive_json(mode=socket_send_mode, timeout=2) == ["foo"]
 
 
+async def test_publish_batched(memory_backend: MemoryChannelsBackend, mocker: MockerFixture) -> None:
+    publish_many = mocker.spy(memory_backend, "publish_many")
+
+    async with ChannelsPlugin(backend=memory_backend, channels=["something"], publish_batch_size=2) as plugin:
+        subscriber = await plugin.subscribe("something")
+        for message in (b"foo", b"bar", b"baz"):
+            plugin.publish(message, "something")
+
+        res = await get_from_stream(subscriber, 3)
+
+    assert res == [b"foo", b"bar", b"baz"]
+    assert [len(call.args[0]) for call in publish_many.call_args_list] == [2, 1]
+
+
+@pytest.mark.parametrize("socket_send_mode", ["text", "binary"])
+def test_ws_route_handlers_share_send_event(
+    memory_backend: MemoryChannelsBackend, socket_send_mode: WebSocketMode
+) -> None:
+    channels_plugin = ChannelsPlugin(
+        backend=memory_backend,
+        create_ws_route_handlers=True,
+        channels=["something"],
+        ws_send_mode=socket_send_mode,
+        ws_send_event_cache_size=1,
+    )
+    app = Litestar(plugins=[channels_plugin])
+
+    with TestClient(app) as client, client.websocket_connect("/something") as ws, client.websocket_connect(
+        "/something"
+    ) as other_ws:
+        channels_plugin.publish(["foo"], "something")
+        assert ws.receive_json(mode=socket_send_mode, timeout=2) == ["foo"]
+        assert other_ws.receive_json(mode=socket_send_mode, timeout=2) == ["foo"]
+        assert list(channels_plugin._ws_send_events) == [b'["foo"]']
+
+        channels_plugin.publish(["bar"], "something")
+        assert ws.receive_json(mode=socket_send_mode, timeout=2) == ["bar"]
+        assert other_ws.receive_json(mode=socket_send_mode, timeout=2) == ["bar"]
+        assert list(channels_plugin._ws_send_events) == [b'["bar"]']
+
+
+def test_ws_route_handlers_disconnect_slow_consumer(memory_backend: MemoryChannelsBackend) -> None:
+    channels_plugin = ChannelsPlugin(
+        backend=memory_backend,
+        create_ws_route_handlers=True,
+        channels=["something"],
+        subscriber_max_backlog=1,
+        subscriber_backlog_strategy="disconnect",
+    )
+    app = Litestar(plugins=[channels_plugin])
+
+    with TestClient(app) as client, client.websocket_connect("/something") as ws:
+        for message in ("foo", "bar", "baz"):
+            channels_plugin.publish(message, "something")
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            ws.receive_text(timeout=2)
+
+    assert exc_info.value.code == WS_1013_TRY_AGAIN_LATER
+    assert channels_plugin.metrics().disconnected == 1
+
+
+async def test_coalesce_channels(memory_backend: MemoryChannelsBackend) -> None:
+    async with ChannelsPlugin(
+        backend=memory_backend, channels=["price", "news"], coalesce_channels=["price"]
+    ) as plugin:
+        subscriber = await plugin.subscribe(["price", "news"])
+        for data, channel in [(b"1", "price"), (b"a", "news"), (b"2", "price"), (b"b", "news")]:
+            plugin.publish(data, channel)
+
+        await asyncio.sleep(0.01)
+        assert await get_from_stream(subscriber, 3) == [b"2", b"a", b"b"]
+
+
+async def test_metrics(memory_backend: MemoryChannelsBackend) -> None:
+    on_metrics = MagicMock()
+    async with ChannelsPlugin(
+        backend=memory_backend,
+        channels=["foo", "bar"],
+        subscriber_max_backlog=1,
+        on_metrics=on_metrics,
+        metrics_interval=0.01,
+    ) as plugin:
+        subscriber = await plugin.subscribe(["foo", "bar"])
+        other_subscriber = await plugin.subscribe("foo")
+        plugin.publish(b"something", "foo")
+        plugin.publish(b"something else", "foo")
+        await asyncio.sleep(0.01)
+
+        metrics = plugin.metrics()
+        assert metrics.subscribers == 2
+        assert metrics.queued == 2
+        assert metrics.dropped == 2
+        assert metrics.max_lag > 0
+
+        await get_from_stream(subscriber, 1)
+        await plugin.unsubscribe(subscriber)
+
+        metrics = plugin.metrics()
+        assert metrics.subscribers == 1
+        assert metrics.queued == 1
+        assert metrics.delivered == 1
+        assert metrics.dropped == 2
+
+        await get_from_stream(other_subscriber, 1)
+        await asyncio.sleep(0.05)
+
+    assert on_metrics.call_args.args[0] == ChannelsMetrics(
+        subscribers=1, queued=0, max_lag=0, delivered=2, dropped=2, coalesced=0, disconnected=0
+    )
+
+
 @pytest.mark.flaky(reruns=5)
 async def test_ws_route_handlers_receive_arbitrary_message(channels_backend: ChannelsBackend) -> None:
     """The websocket handlers await `WebSocket.receive()` to detect disconnection and stop the subscription.
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from litestar.channels import Subscriber
+from litestar.channels import Subscriber, SubscriberMetrics
 from litestar.channels.subscriber import BacklogStrategy
 from litestar.utils.compat import async_next
 
@@ -97,7 +97,7 @@ async def test_qsize() -> None:
     assert not subscriber.qsize
 
 
-@pytest.mark.parametrize("backlog_strategy", ["backoff", "dropleft"])
+@pytest.mark.parametrize("backlog_strategy", ["backoff", "dropleft", "disconnect"])
 async def test_backlog(backlog_strategy: BacklogStrategy) -> None:
     messages = [b"foo", b"bar", b"baz"]
     subscriber = Subscriber(AsyncMock(), backlog_strategy=backlog_strategy, max_backlog=2)
@@ -105,10 +105,91 @@ async def test_backlog(backlog_strategy: BacklogStrategy) -> None:
     for message in messages:
         subscriber.put_nowait(message)
 
+    if backlog_strategy == "disconnect":
+        assert subscriber.is_disconnected
+        assert await get_from_stream(subscriber, 2) == []
+        assert subscriber.dropped == 3
+        return
+
     assert subscriber.qsize == 2
     enqueued_items = await get_from_stream(subscriber, 2)
 
     assert expected_messages == enqueued_items
+    assert subscriber.metrics == SubscriberMetrics(queued=0, delivered=2, dropped=1, coalesced=0, lag=0)
+
+
+async def test_backlog_dropleft_join() -> None:
+    subscriber = Subscriber(AsyncMock(), backlog_strategy="dropleft", max_backlog=1)
+    subscriber.put_nowait(b"foo")
+    subscriber.put_nowait(b"bar")
+
+    async with subscriber.run_in_background(AsyncMock()):
+        await asyncio.wait_for(subscriber.stop(join=True), timeout=1)
+
+    assert subscriber.delivered == 1
+    assert subscriber.dropped == 1
+
+
+async def test_disconnect_rejects_events() -> None:
+    on_event = AsyncMock()
+    on_disconnect = AsyncMock()
+    subscriber = Subscriber(AsyncMock(), backlog_strategy="disconnect", max_backlog=1)
+    subscriber.put_nowait(b"foo")
+    assert not subscriber.put_nowait(b"bar")
+    assert not subscriber.put_nowait(b"baz")
+    await subscriber.put(b"baz")
+
+    async with subscriber.run_in_background(on_event, on_disconnect=on_disconnect):
+        await asyncio.wait_for(subscriber.stop(join=True), timeout=1)
+
+    on_event.assert_not_called()
+    on_disconnect.assert_awaited_once()
+    assert subscriber.dropped == 2
+
+
+@pytest.mark.parametrize("backlog_strategy", ["backoff", "dropleft"])
+async def test_coalesce(backlog_strategy: BacklogStrategy) -> None:
+    subscriber = Subscriber(AsyncMock(), backlog_strategy=backlog_strategy, max_backlog=2)
+
+    assert subscriber.put_nowait(b"foo", coalesce_key="price")
+    assert subscriber.put_nowait(b"bar")
+    assert subscriber.put_nowait(b"baz", coalesce_key="price")
+
+    assert subscriber.qsize == 2
+    assert subscriber.coalesced == 1
+    assert await get_from_stream(subscriber, 2) == [b"baz", b"bar"]
+
+    assert subscriber.put_nowait(b"qux", coalesce_key="price")
+    assert await get_from_stream(subscriber, 1) == [b"qux"]
+
+
+async def test_coalesce_dropleft_evicted() -> None:
+    subscriber = Subscriber(AsyncMock(), backlog_strategy="dropleft", max_backlog=1)
+
+    subscriber.put_nowait(b"foo", coalesce_key="price")
+    subscriber.put_nowait(b"bar")
+    subscriber.put_nowait(b"baz", coalesce_key="price")
+
+    assert subscriber.coalesced == 0
+    assert await get_from_stream(subscriber, 1) == [b"baz"]
+
+
+async def test_lag(monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar.channels import subscriber as subscriber_module
+
+    now = 1.0
+    monkeypatch.setattr(subscriber_module, "monotonic", lambda: now)
+    subscriber = Subscriber(AsyncMock())
+
+    assert subscriber.lag == 0
+    subscriber.put_nowait(b"foo")
+    now = 2.0
+    subscriber.put_nowait(b"bar")
+    now = 4.0
+    assert subscriber.lag == 3
+
+    await async_next(subscriber.iter_events())
+    assert subscriber.lag == 2
 
 
 async def tests_run_in_background_run_in_background_called_while_running_raises() -> None:
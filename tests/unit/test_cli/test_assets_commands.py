@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import brotli
+
+from litestar.cli.main import litestar_group as cli_command
+
+if TYPE_CHECKING:
+    from click.testing import CliRunner
+
+
+def test_compress_assets(runner: CliRunner, tmp_path: Path) -> None:
+    content = b"body { color: red; }\n" * 100
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "style.css").write_bytes(content)
+    (tmp_path / "small.css").write_bytes(b"body {}")
+    (tmp_path / "image.png").write_bytes(content)
+
+    result = runner.invoke(cli_command, ["assets", "compress", str(tmp_path), "-e", "br", "-e", "gzip", "-e", "zstd"])
+
+    assert result.exit_code == 0, result.output
+    assert brotli.decompress((tmp_path / "nested" / "style.css.br").read_bytes()) == content
+    assert gzip.decompress((tmp_path / "nested" / "style.css.gz").read_bytes()) == content
+    assert (tmp_path / "nested" / "style.css.zst").exists()
+    assert os.stat(tmp_path / "nested" / "style.css.gz").st_mtime == os.stat(tmp_path / "nested" / "style.css").st_mtime
+    assert not (tmp_path / "small.css.gz").exists()
+    assert not (tmp_path / "image.png.gz").exists()
+    assert not (tmp_path / "nested" / "style.css.gz.gz").exists()
+
+
+def test_compress_assets_skips_up_to_date(runner: CliRunner, tmp_path: Path) -> None:
+    (tmp_path / "app.js").write_bytes(b"console.log('hello');\n" * 100)
+    sidecar = tmp_path / "app.js.gz"
+
+    runner.invoke(cli_command, ["assets", "compress", str(tmp_path), "-e", "gzip"])
+    sidecar.write_bytes(b"stale")
+    os.utime(sidecar, (os.stat(tmp_path / "app.js").st_mtime + 10,) * 2)
+
+    result = runner.invoke(cli_command, ["assets", "compress", str(tmp_path), "-e", "gzip"])
+    assert result.exit_code == 0, result.output
+    assert sidecar.read_bytes() == b"stale"
+
+    result = runner.invoke(cli_command, ["assets", "compress", str(tmp_path), "-e", "gzip", "--force"])
+    assert result.exit_code == 0, result.output
+    assert gzip.decompress(sidecar.read_bytes()) == b"console.log('hello');\n" * 100
+
+
+def test_compress_assets_skips_incompressible(runner: CliRunner, tmp_path: Path) -> None:
+    (tmp_path / "random.txt").write_bytes(os.urandom(2048))
+
+    result = runner.invoke(cli_command, ["assets", "compress", str(tmp_path), "-e", "gzip"])
+
+    assert result.exit_code == 0, result.output
+    assert not (tmp_path / "random.txt.gz").exists()
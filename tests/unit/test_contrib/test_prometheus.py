@@ -3,6 +3,7 @@ import time
 from http.client import HTTPException
 from pathlib import Path
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -215,3 +216,18 @@ def test_procdir(monkeypatch: MonkeyPatch, tmp_path: Path, mocker: MockerFixture
         client.get("/metrics")
 
     mock_collector.assert_called_once_with(mock_registry.return_value)
+
+
+@pytest.mark.parametrize("message_type", ["http.response.body", "http.response.pathsend"])
+async def test_prometheus_middleware_response_duration(message_type: str) -> None:
+    middleware = PrometheusMiddleware(app=AsyncMock(), config=create_config())
+    send = AsyncMock()
+    request_span = {"start_time": time.perf_counter() - 1, "end_time": 0, "duration": 0, "status_code": 200}
+
+    wrapped_send = middleware._get_wrapped_send(send, request_span)
+    await wrapped_send({"type": "http.response.start", "status": 200, "headers": []})
+    await wrapped_send({"type": message_type})
+
+    assert request_span["duration"] >= 1
+    assert request_span["end_time"] > request_span["start_time"]
+    assert send.call_count == 2
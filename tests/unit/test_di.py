@@ -1,10 +1,13 @@
 from functools import partial
-from typing import Any, AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 
+import anyio
 import pytest
 
+from litestar import get
 from litestar.di import Provide
 from litestar.exceptions import ImproperlyConfiguredException, LitestarWarning
+from litestar.testing import create_test_client
 from litestar.types import Empty
 
 
@@ -165,3 +168,176 @@ def test_raises_when_dependency_is_not_callable() -> None:
 def test_raises_when_generator_dependency_is_cached(dep: Any) -> None:
     with pytest.raises(ImproperlyConfiguredException):
         Provide(dep, use_cache=True)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"cache_ttl": 0},
+        {"cache_ttl": 1, "cache_scope": "request"},
+        {"use_cache": True, "cache_scope": "request"},
+    ],
+)
+def test_raises_for_invalid_cache_options(kwargs: Dict[str, Any]) -> None:
+    with pytest.raises(ImproperlyConfiguredException):
+        Provide(async_callable, **kwargs)
+
+
+def test_cache_scope_app() -> None:
+    provider = Provide(async_callable, cache_scope="app")
+    assert provider.use_cache
+    assert provider == Provide(async_callable, use_cache=True)
+    assert Provide(async_callable, cache_ttl=5).cache_scope == "app"
+
+
+async def test_provide_cache_ttl(anyio_backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar import di
+
+    now = 0.0
+    monkeypatch.setattr(di, "monotonic", lambda: now)
+    counter = 0
+
+    async def dependency() -> int:
+        nonlocal counter
+        counter += 1
+        return counter
+
+    provider = Provide(dependency, cache_ttl=10)
+    assert await provider() == 1
+    now = 9
+    assert await provider() == 1
+    now = 10
+    assert await provider() == 2
+    assert await provider() == 2
+
+
+async def test_provide_cache_single_flight(anyio_backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar import di
+
+    now = 0.0
+    monkeypatch.setattr(di, "monotonic", lambda: now)
+    calls = 0
+    release = anyio.Event()
+
+    async def dependency() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    provider = Provide(dependency, cache_ttl=10)
+    results: Dict[int, Optional[int]] = {}
+
+    async def call(index: int) -> None:
+        results[index] = await provider()
+
+    async with anyio.create_task_group() as tg:
+        for i in range(3):
+            tg.start_soon(call, i)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert calls == 1
+    assert results == {0: 1, 1: 1, 2: 1}
+
+    # an expired value is served to other callers while it is being recomputed
+    now = 10
+    release = anyio.Event()
+    results.clear()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(call, 0)
+        await anyio.wait_all_tasks_blocked()
+        tg.start_soon(call, 1)
+        await anyio.wait_all_tasks_blocked()
+        assert results == {1: 1}
+        release.set()
+
+    assert calls == 2
+    assert results == {0: 2, 1: 1}
+
+
+async def test_provide_cache_failed_computation_is_retried(anyio_backend: str) -> None:
+    fail = True
+
+    async def dependency() -> str:
+        if fail:
+            raise ValueError()
+        return "value"
+
+    provider = Provide(dependency, use_cache=True)
+    with pytest.raises(ValueError):
+        await provider()
+
+    fail = False
+    assert await provider() == "value"
+
+
+def test_cache_scope_request() -> None:
+    calls = 0
+
+    def dependency() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    def nested(first: int) -> int:
+        return first
+
+    @get(
+        "/",
+        dependencies={
+            "first": Provide(dependency, cache_scope="request", sync_to_thread=False),
+            "second": Provide(dependency, cache_scope="request", sync_to_thread=False),
+            "nested": Provide(nested, sync_to_thread=False),
+        },
+    )
+    def handler(first: int, second: int, nested: int) -> Dict[str, int]:
+        return {"first": first, "second": second, "nested": nested}
+
+    with create_test_client(handler) as client:
+        assert client.get("/").json() == {"first": 1, "second": 1, "nested": 1}
+        assert client.get("/").json() == {"first": 2, "second": 2, "nested": 2}
+
+
+def test_cache_scope_request_async() -> None:
+    calls = 0
+
+    async def dependency() -> object:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.01)
+        return object()
+
+    @get(
+        "/",
+        dependencies={
+            "first": Provide(dependency, cache_scope="request"),
+            "second": Provide(dependency, cache_scope="request"),
+        },
+    )
+    async def handler(first: object, second: object) -> bool:
+        return first is second
+
+    with create_test_client(handler) as client:
+        assert client.get("/").json() is True
+        assert client.get("/").json() is True
+        assert calls == 2
+
+
+def test_cache_scope_request_async_failure() -> None:
+    async def dependency() -> int:
+        await anyio.sleep(0.01)
+        raise ValueError()
+
+    @get(
+        "/",
+        dependencies={
+            "first": Provide(dependency, cache_scope="request"),
+            "second": Provide(dependency, cache_scope="request"),
+        },
+    )
+    async def handler(first: int, second: int) -> None:
+        return None
+
+    with create_test_client(handler, raise_server_exceptions=False) as client:
+        assert client.get("/").status_code == 500
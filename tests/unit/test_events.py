@@ -1,11 +1,15 @@
+from functools import partial
 from typing import Any
 from unittest.mock import MagicMock
 
+import anyio
 import pytest
 from pytest_lazyfixture import lazy_fixture
 
 from litestar import Litestar, Request, get
-from litestar.events.emitter import SimpleEventEmitter
+from litestar.channels.backends.memory import MemoryChannelsBackend
+from litestar.events import ChannelsEventEmitter, EventQueueFullException
+from litestar.events.emitter import OverflowPolicy, SimpleEventEmitter
 from litestar.events.listener import EventListener, listener
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.status_codes import HTTP_200_OK
@@ -142,3 +146,146 @@ async def test_event_listener_raises_exception(async_listener: EventListener, mo
 
     error_mock.assert_called()
     mock.assert_called()
+
+
+async def test_max_concurrency_and_priority() -> None:
+    calls: list[str] = []
+    running = 0
+    max_running = 0
+
+    async def record(name: str) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        calls.append(name)
+        await anyio.sleep(0.01)
+        running -= 1
+
+    @listener("test_event", priority=0)
+    async def low_priority_listener() -> None:
+        await record("low")
+
+    @listener("test_event", priority=10)
+    async def high_priority_listener() -> None:
+        await record("high")
+
+    async with SimpleEventEmitter([low_priority_listener, high_priority_listener], max_concurrency=1) as emitter:
+        emitter.emit("test_event")
+        emitter.emit("test_event")
+
+    assert max_running == 1
+    assert calls == ["high", "high", "low", "low"]
+
+
+async def test_listener_max_concurrency() -> None:
+    running = 0
+    max_running = 0
+
+    @listener("test_event", max_concurrency=2)
+    async def limited_listener() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await anyio.sleep(0.01)
+        running -= 1
+
+    async with SimpleEventEmitter([limited_listener]) as emitter:
+        for _ in range(10):
+            emitter.emit("test_event")
+
+    assert max_running == 2
+
+
+async def test_listener_max_concurrency_does_not_block_other_listeners() -> None:
+    calls: list[str] = []
+
+    @listener("a", max_concurrency=1)
+    async def slow_listener() -> None:
+        await anyio.sleep(0.05)
+        calls.append("a")
+
+    @listener("b")
+    async def fast_listener() -> None:
+        calls.append("b")
+
+    async with SimpleEventEmitter([slow_listener, fast_listener], max_concurrency=2) as emitter:
+        for _ in range(4):
+            emitter.emit("a")
+        emitter.emit("b")
+
+    assert calls[0] == "b"
+    assert calls.count("a") == 4
+
+
+@pytest.mark.parametrize(
+    "overflow_policy,expected_calls",
+    [("drop_new", ["first", "second"]), ("drop_oldest", ["second", "third"])],
+)
+async def test_overflow_policy(overflow_policy: OverflowPolicy, expected_calls: list[str]) -> None:
+    calls: list[str] = []
+
+    @listener("test_event")
+    async def event_listener(value: str) -> None:
+        calls.append(value)
+
+    async with SimpleEventEmitter(
+        [event_listener], max_queue_size=2, overflow_policy=overflow_policy, max_concurrency=1
+    ) as emitter:
+        for value in ("first", "second", "third"):
+            emitter.emit("test_event", value)
+
+    assert calls == expected_calls
+
+
+async def test_overflow_policy_raise(async_listener: EventListener, mock: MagicMock) -> None:
+    async with SimpleEventEmitter([async_listener], max_queue_size=1) as emitter:
+        emitter.emit("test_event")
+        with pytest.raises(EventQueueFullException):
+            emitter.emit("test_event")
+
+    assert mock.call_count == 1
+
+
+async def test_shutdown_timeout(mock: MagicMock) -> None:
+    @listener("test_event")
+    async def slow_listener() -> None:
+        await anyio.sleep(10)
+        mock()
+
+    with anyio.fail_after(1):
+        async with SimpleEventEmitter([slow_listener], shutdown_timeout=0.01) as emitter:
+            emitter.emit("test_event")
+
+    mock.assert_not_called()
+
+
+def test_event_emitter_backend_factory(mock: MagicMock, async_listener: EventListener) -> None:
+    @get("/")
+    def route_handler(request: Request[Any, Any, Any]) -> None:
+        request.app.emit("test_event")
+
+    with create_test_client(
+        route_handlers=[route_handler],
+        listeners=[async_listener],
+        event_emitter_backend=partial(SimpleEventEmitter, max_concurrency=1),
+    ) as client:
+        assert isinstance(client.app.event_emitter, SimpleEventEmitter)
+        assert client.app.event_emitter.max_concurrency == 1
+        client.get("/")
+
+    mock.assert_called_once()
+
+
+async def test_channels_event_emitter(mock: MagicMock) -> None:
+    backend = MemoryChannelsBackend()
+
+    @listener("test_event")
+    async def event_listener(*args: Any, **kwargs: Any) -> None:
+        mock(*args, **kwargs)
+
+    async with ChannelsEventEmitter([event_listener], backend=backend) as emitter:
+        emitter.emit("test_event", "positional", keyword={"nested": 1})
+        with pytest.raises(ImproperlyConfiguredException):
+            emitter.emit("unknown_event")
+
+    mock.assert_called_once_with("positional", keyword={"nested": 1})
@@ -0,0 +1,143 @@
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator, List
+
+import msgspec
+import pytest
+from typing_extensions import Annotated
+
+from litestar import Litestar, post
+from litestar.di import Provide
+from litestar.dto import DataclassDTO, DTOConfig
+from litestar.enums import RequestEncodingType
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.params import Body
+from litestar.status_codes import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from litestar.testing import create_test_client
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+ITEMS = [{"id": i, "name": f"item-{i}"} for i in range(10)]
+
+
+@pytest.mark.parametrize("annotation", [AsyncIterator[Item], AsyncIterable[Item], AsyncGenerator[Item, None]])
+@pytest.mark.parametrize(
+    "content_type, body",
+    [
+        (RequestEncodingType.JSON, json.dumps(ITEMS).encode()),
+        ("application/x-ndjson", b"\n".join(json.dumps(item).encode() for item in ITEMS)),
+        (RequestEncodingType.MESSAGEPACK, msgspec.msgpack.encode(ITEMS)),
+    ],
+)
+def test_request_body_stream(annotation: Any, content_type: str, body: bytes) -> None:
+    received: List[Any] = []
+
+    @post("/", signature_namespace={"annotation": annotation})
+    async def handler(data: annotation) -> None:  # type: ignore[valid-type]
+        async for item in data:
+            received.append(item)
+
+    with create_test_client([handler]) as client:
+        response = client.post("/", content=body, headers={"Content-Type": content_type})
+        assert response.status_code == HTTP_201_CREATED
+        assert received == [Item(**item) for item in ITEMS]  # type: ignore[arg-type]
+
+
+def test_request_body_stream_body_media_type() -> None:
+    @post("/")
+    async def handler(data: Annotated[AsyncIterator[Item], Body(media_type=RequestEncodingType.MESSAGEPACK)]) -> int:
+        return len([item async for item in data])
+
+    with create_test_client([handler]) as client:
+        assert client.post("/", content=msgspec.msgpack.encode(ITEMS)).json() == len(ITEMS)
+
+
+def test_request_body_stream_empty() -> None:
+    @post("/")
+    async def handler(data: AsyncIterator[Item]) -> int:
+        return len([item async for item in data])
+
+    with create_test_client([handler]) as client:
+        assert client.post("/").json() == 0
+        assert client.post("/", content=b"[]").json() == 0
+
+
+def test_request_body_stream_lax_conversion() -> None:
+    @post("/")
+    async def handler(data: AsyncIterator[Item]) -> List[int]:
+        return [item.id async for item in data]
+
+    with create_test_client([handler]) as client:
+        assert client.post("/", content=b'[{"id": "1", "name": "a"}]').json() == [1]
+
+
+def test_request_body_stream_validation_error() -> None:
+    received: List[Item] = []
+
+    @post("/")
+    async def handler(data: AsyncIterator[Item]) -> None:
+        async for item in data:
+            received.append(item)
+
+    with create_test_client([handler]) as client:
+        response = client.post("/", content=b'[{"id": 1, "name": "a"}, {"id": "x", "name": "b"}]')
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["extra"] == [{"key": "1.id", "message": "Expected `int`, got `str`", "source": "body"}]
+        assert received == [Item(id=1, name="a")]
+
+        response = client.post("/", content=b'{"id": 1, "name": "a"}')
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize("experimental_codegen_backend", [False, True])
+def test_request_body_stream_dto(experimental_codegen_backend: bool) -> None:
+    class ItemDTO(DataclassDTO[Item]):
+        config = DTOConfig(rename_fields={"name": "title"}, experimental_codegen_backend=experimental_codegen_backend)
+
+    @post("/", dto=ItemDTO, return_dto=None)
+    async def handler(data: AsyncIterator[Item]) -> List[str]:
+        return [f"{item.id}:{item.name}" async for item in data]
+
+    with create_test_client([handler]) as client:
+        response = client.post("/", content=b'[{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]')
+        assert response.json() == ["1:a", "2:b"]
+
+        response = client.post("/", content=b'[{"id": 1, "name": "a"}]')
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["extra"][0]["key"] == "0"
+
+        response = client.post("/", content=b'[{"id": 1, "title": "a"}, {"id": "x", "title": "b"}]')
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["extra"] == [{"key": "1.id", "message": "Expected `int`, got `str`", "source": "body"}]
+
+        schema = client.app.openapi_schema.paths["/"].post.request_body.content["application/json"].schema  # type: ignore[union-attr]
+        assert schema.type == "array"
+
+
+def test_request_body_stream_openapi() -> None:
+    @post("/")
+    async def handler(data: AsyncIterator[Item]) -> None:
+        pass
+
+    schema = Litestar([handler]).openapi_schema.to_schema()["paths"]["/"]["post"]["requestBody"]
+    assert schema["content"]["application/json"]["schema"] == {
+        "type": "array",
+        "items": {"$ref": "#/components/schemas/Item"},
+    }
+
+
+def test_request_body_stream_incompatible_dependency() -> None:
+    async def dependency(data: Item) -> Item:
+        return data
+
+    @post("/", dependencies={"dep": Provide(dependency)})
+    async def handler(data: AsyncIterator[Item], dep: Item) -> None:
+        pass
+
+    with pytest.raises(ImproperlyConfiguredException):
+        Litestar([handler])
@@ -1,8 +1,10 @@
-from typing import List, Set
+from typing import Any, Dict, List, Set
+from unittest.mock import MagicMock
 
 import pytest
 
-from litestar._kwargs.dependencies import Dependency, create_dependency_batches
+from litestar._kwargs import kwargs_model
+from litestar._kwargs.dependencies import Dependency, create_dependency_batches, create_dependency_plan
 from litestar.di import Provide
 from litestar.exceptions import HTTPException, ValidationException
 from litestar.handlers import get
@@ -65,7 +67,7 @@ def test_dependency_batches(dependency_tree: Set[Dependency], expected_batches:
 @pytest.mark.parametrize(
     "exception,status_code,text",
     [
-        (ValueError("value_error"), HTTP_500_INTERNAL_SERVER_ERROR, "Exception Group Traceback"),
+        (ValueError("value_error"), HTTP_500_INTERNAL_SERVER_ERROR, "ValueError: value_error"),
         (
             HTTPException(status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail="http_exception"),
             HTTP_422_UNPROCESSABLE_ENTITY,
@@ -100,3 +102,97 @@ def test_dependency_batch_with_exception(exception: Exception, status_code: int,
         response = client.get("/")
         assert response.status_code == status_code
         assert text in response.text
+
+
+@pytest.mark.parametrize(
+    "exception,status_code,text",
+    [
+        (ValueError("value_error"), HTTP_500_INTERNAL_SERVER_ERROR, "Exception Group Traceback"),
+        (
+            HTTPException(status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail="http_exception"),
+            HTTP_422_UNPROCESSABLE_ENTITY,
+            '{"status_code":422,"detail":"http_exception"}',
+        ),
+        (
+            ValidationException("validation_exception"),
+            HTTP_400_BAD_REQUEST,
+            '{"status_code":400,"detail":"validation_exception"}',
+        ),
+    ],
+)
+def test_async_dependency_batch_with_exception(exception: Exception, status_code: int, text: str) -> None:
+    async def a() -> None:
+        raise exception
+
+    def c(a: None, b: None) -> None:
+        pass
+
+    @get(path="/")
+    def handler(c: None) -> None:
+        pass
+
+    with create_test_client(
+        route_handlers=handler,
+        dependencies={
+            "a": Provide(a),
+            "b": Provide(dummy),
+            "c": Provide(c),
+        },
+    ) as client:
+        response = client.get("/")
+        assert response.status_code == status_code
+        assert text in response.text
+
+
+def sync_dummy() -> None:
+    pass
+
+
+SYNC_DEPENDENCY_A = Dependency("SA", Provide(sync_dummy, sync_to_thread=False), [])
+SYNC_DEPENDENCY_B = Dependency("SB", Provide(sync_dummy, sync_to_thread=False), [DEPENDENCY_A, DEPENDENCY_B])
+
+
+@pytest.mark.parametrize(
+    "batches,expected_plan",
+    [
+        ([], []),
+        ([{DEPENDENCY_A}], [DEPENDENCY_A]),
+        ([{DEPENDENCY_A, DEPENDENCY_B}], [(DEPENDENCY_A, DEPENDENCY_B)]),
+        ([{DEPENDENCY_A, SYNC_DEPENDENCY_A}], [SYNC_DEPENDENCY_A, DEPENDENCY_A]),
+        (
+            [{DEPENDENCY_A, DEPENDENCY_B, SYNC_DEPENDENCY_A}, {SYNC_DEPENDENCY_B}],
+            [SYNC_DEPENDENCY_A, (DEPENDENCY_A, DEPENDENCY_B), SYNC_DEPENDENCY_B],
+        ),
+    ],
+)
+def test_dependency_plan(batches: List[Set[Dependency]], expected_plan: List[Any]) -> None:
+    assert create_dependency_plan(batches) == expected_plan
+
+
+@pytest.mark.parametrize("async_dependencies,expected_task_groups", [(0, 0), (1, 0), (2, 1), (5, 1)])
+def test_task_group_only_for_async_dependencies(
+    async_dependencies: int, expected_task_groups: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    create_task_group_mock = MagicMock(wraps=kwargs_model.create_task_group)
+    monkeypatch.setattr(kwargs_model, "create_task_group", create_task_group_mock)
+
+    def make_provider(value: int) -> Provide:
+        def sync_dependency() -> int:
+            return value
+
+        async def async_dependency() -> int:
+            return value
+
+        if value < async_dependencies:
+            return Provide(async_dependency)
+        return Provide(sync_dependency, sync_to_thread=False)
+
+    @get("/", dependencies={key: make_provider(i) for i, key in enumerate("abcde")})
+    def handler(a: int, b: int, c: int, d: int, e: int) -> Dict[str, int]:
+        return {"a": a, "b": b, "c": c, "d": d, "e": e}
+
+    with create_test_client(handler) as client:
+        response = client.get("/")
+        assert response.json() == {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4}
+
+    assert create_task_group_mock.call_count == expected_task_groups
@@ -6,15 +6,17 @@ from dataclasses import asdict, dataclass
 from os import path
 from os.path import dirname, join, realpath
 from pathlib import Path
-from typing import Any, DefaultDict, Dict, List, Optional
+from typing import Any, AsyncIterator, DefaultDict, Dict, List, Optional
 
 import msgspec
 import pytest
 from typing_extensions import Annotated
 
 from litestar import Request, post
+from litestar._multipart import parse_multipart_form_stream
 from litestar.datastructures.upload_file import UploadFile
 from litestar.enums import RequestEncodingType
+from litestar.exceptions import InternalServerException, ValidationException
 from litestar.params import Body
 from litestar.status_codes import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 from litestar.testing import create_test_client
@@ -566,3 +568,114 @@ def test_multipart_and_url_encoded_behave_the_same(form_type) -> None:  # type:
                 headers={"Content-Type": "multipart/form-data; boundary=1f35df74046888ceaa62d8a534a076dd"},
             )
         assert response.status_code == HTTP_201_CREATED
+
+
+async def test_parse_multipart_form_stream_byte_by_byte() -> None:
+    body = (
+        b"preamble\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="name"\r\n\r\n'
+        b"moishe zuchmir\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="empty"\r\n\r\n'
+        b"\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="test.txt"\r\n'
+        b"Content-Type: text/plain\r\n\r\n"
+        b"line 1\r\n--not the boundary\r\nline 2\r\n"
+        b"--boundary--\r\n"
+        b"epilogue"
+    )
+
+    async def stream() -> AsyncIterator[bytes]:
+        for i in range(len(body)):
+            yield body[i : i + 1]
+
+    form = await parse_multipart_form_stream(stream(), boundary=b"boundary")
+
+    assert form["name"] == "moishe zuchmir"
+    assert form["empty"] is None
+    assert isinstance(form["file"], UploadFile)
+    assert form["file"].filename == "test.txt"
+    assert form["file"].content_type == "text/plain"
+    assert await form["file"].read() == b"line 1\r\n--not the boundary\r\nline 2"
+
+
+def test_multipart_form_spool_size() -> None:
+    @post("/", signature_types=[UploadFile])
+    async def handler(data: UploadFile = Body(media_type=RequestEncodingType.MULTI_PART)) -> None:
+        assert data.rolled_to_disk
+        assert await data.read() == b"a" * 1000
+
+    with create_test_client(route_handlers=[handler], multipart_form_spool_size=100) as client:
+        response = client.post("/", files={"file": ("test.txt", b"a" * 1000)})
+        assert response.status_code == HTTP_201_CREATED
+
+
+def test_multipart_form_buffer_size() -> None:
+    @post("/")
+    async def handler(data: Dict[str, Any] = Body(media_type=RequestEncodingType.MULTI_PART)) -> None:
+        return None
+
+    with create_test_client(route_handlers=[handler], multipart_form_buffer_size=100) as client:
+        assert client.post("/", files={"value": (None, b"a" * 100)}).status_code == HTTP_201_CREATED
+        assert client.post("/", files={"value": (None, b"a" * 101)}).status_code == HTTP_400_BAD_REQUEST
+        # file parts are not bounded by the buffer size
+        assert client.post("/", files={"file": ("test.txt", b"a" * 1000)}).status_code == HTTP_201_CREATED
+
+
+@pytest.mark.parametrize("file_size", [10, 1000])
+def test_request_body_before_form(file_size: int) -> None:
+    @post("/")
+    async def handler(request: Request) -> bytes:
+        body = await request.body()
+        form = await request.form()
+        assert await form["file"].read() == b"a" * file_size
+        return body
+
+    with create_test_client(route_handlers=[handler], multipart_form_spool_size=100) as client:
+        request = client.build_request("POST", "/", files={"file": ("test.txt", b"a" * file_size)})
+        response = client.send(request)
+        assert response.status_code == HTTP_201_CREATED
+        assert response.content == request.read()
+
+
+def test_request_body_after_form_consumes_stream() -> None:
+    @post("/")
+    async def handler(request: Request) -> None:
+        await request.form()
+        with pytest.raises(InternalServerException, match="stream consumed"):
+            await request.body()
+
+    with create_test_client(route_handlers=[handler]) as client:
+        assert client.post("/", files={"value": (None, b"abc")}).status_code == HTTP_201_CREATED
+
+
+async def test_parse_multipart_form_stream_truncated() -> None:
+    async def stream() -> AsyncIterator[bytes]:
+        yield b'--boundary\r\nContent-Disposition: form-data; name="name"\r\n\r\nmoishe'
+
+    with pytest.raises(ValidationException, match="unexpected end"):
+        await parse_multipart_form_stream(stream(), boundary=b"boundary")
+
+
+async def test_parse_multipart_form_stream_closes_files_on_error() -> None:
+    upload_files: List[UploadFile] = []
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield b'--boundary\r\nContent-Disposition: form-data; name="file"; filename="a.txt"\r\n\r\na\r\n'
+        yield b'--boundary\r\nContent-Disposition: form-data; name="other"; filename="b.txt"\r\n\r\nb'
+
+    original_init = UploadFile.__init__
+
+    def init(self: UploadFile, *args: Any, **kwargs: Any) -> None:
+        original_init(self, *args, **kwargs)
+        upload_files.append(self)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(UploadFile, "__init__", init)
+        with pytest.raises(ValidationException):
+            await parse_multipart_form_stream(stream(), boundary=b"boundary")
+
+    assert len(upload_files) == 2
+    assert all(upload_file.file.closed for upload_file in upload_files)
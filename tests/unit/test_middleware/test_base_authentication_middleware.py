@@ -259,3 +259,23 @@ def test_authentication_exclude_http_methods_default() -> None:
         # OPTIONS should be excluded by default
         response = client.options("/")
         assert response.is_success
+
+
+def test_authentication_middleware_left_out_of_excluded_method_stack() -> None:
+    @get("/")
+    def handler() -> None:
+        return None
+
+    app = Litestar(route_handlers=[handler], middleware=[DefineMiddleware(AuthMiddleware)])
+    asgi_handlers = app.asgi_router.root_route_map_node.children["/"].asgi_handlers
+
+    def has_auth_middleware(method: str) -> bool:
+        asgi_app = asgi_handlers[method][0]
+        while asgi_app is not None:
+            if isinstance(asgi_app, AuthMiddleware):
+                return True
+            asgi_app = getattr(asgi_app, "app", None)
+        return False
+
+    assert has_auth_middleware("GET")
+    assert not has_auth_middleware("OPTIONS")
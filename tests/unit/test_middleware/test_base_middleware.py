@@ -1,7 +1,8 @@
 from typing import TYPE_CHECKING
 
-from litestar import MediaType, asgi, get
+from litestar import Litestar, MediaType, WebSocket, asgi, get, websocket
 from litestar.datastructures.headers import MutableScopeHeaders
+from litestar.enums import ScopeType
 from litestar.exceptions import ValidationException
 from litestar.middleware import AbstractMiddleware, DefineMiddleware
 from litestar.response.base import ASGIResponse
@@ -141,3 +142,67 @@ def test_exclude_by_opt_key() -> None:
     with create_test_client(handler, middleware=[DefineMiddleware(SubclassMiddleware)]) as client:
         response = client.get("/")
         assert "test" not in response.headers
+
+
+def _get_middleware_stack(app: Litestar, path: str, method: str) -> "list[type]":
+    asgi_app = app.asgi_router.root_route_map_node.children[path].asgi_handlers[method][0]
+    stack = []
+    while asgi_app is not None:
+        stack.append(type(asgi_app))
+        asgi_app = getattr(asgi_app, "app", None)
+    return stack
+
+
+class _PassThroughMiddleware(AbstractMiddleware):
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        await self.app(scope, receive, send)
+
+
+def test_middleware_excluded_by_opt_key_left_out_of_stack() -> None:
+    class SubclassMiddleware(_PassThroughMiddleware):
+        exclude_opt_key = "exclude_route"
+
+    @get("/excluded", exclude_route=True)
+    def excluded_handler() -> None:
+        return None
+
+    @get("/included")
+    def included_handler() -> None:
+        return None
+
+    app = Litestar([excluded_handler, included_handler], middleware=[DefineMiddleware(SubclassMiddleware)])
+
+    assert SubclassMiddleware not in _get_middleware_stack(app, "/excluded", "GET")
+    assert SubclassMiddleware in _get_middleware_stack(app, "/included", "GET")
+
+
+def test_middleware_excluded_by_scope_type_left_out_of_stack() -> None:
+    class SubclassMiddleware(_PassThroughMiddleware):
+        scopes = {ScopeType.HTTP}
+
+    @get("/http")
+    def http_handler() -> None:
+        return None
+
+    @websocket("/ws")
+    async def websocket_handler(socket: WebSocket) -> None:
+        await socket.accept()
+        await socket.close()
+
+    app = Litestar([http_handler, websocket_handler], middleware=[DefineMiddleware(SubclassMiddleware)])
+
+    assert SubclassMiddleware in _get_middleware_stack(app, "/http", "GET")
+    assert SubclassMiddleware not in _get_middleware_stack(app, "/ws", "websocket")
+
+
+def test_middleware_excluded_by_path_pattern_kept_in_stack() -> None:
+    class SubclassMiddleware(_PassThroughMiddleware):
+        exclude = r"^/excluded"
+
+    @get("/excluded")
+    def handler() -> None:
+        return None
+
+    app = Litestar([handler], middleware=[DefineMiddleware(SubclassMiddleware)])
+
+    assert SubclassMiddleware in _get_middleware_stack(app, "/excluded", "GET")
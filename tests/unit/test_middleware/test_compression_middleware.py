@@ -248,3 +248,110 @@ def test_compression_with_custom_backend(handler: HTTPRouteHandler) -> None:
         assert response.text == "_litestar_" * 4000
         assert response.headers["Content-Encoding"] == "deflate"
         assert int(response.headers["Content-Length"]) < 40000
+
+
+@pytest.mark.parametrize("streaming", (False, True))
+def test_zstd_compression(handler: HTTPRouteHandler, streaming: bool) -> None:
+    pytest.importorskip("zstandard")
+
+    @get("/streaming-response")
+    def streaming_handler() -> Stream:
+        return Stream(streaming_iter(content=b"_litestar_" * 400, count=10))
+
+    with create_test_client(
+        route_handlers=[handler, streaming_handler], compression_config=CompressionConfig(backend="zstd")
+    ) as client:
+        response = client.get("/streaming-response" if streaming else "/", headers={"Accept-Encoding": "zstd"})
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "_litestar_" * 4000
+        assert response.headers["Content-Encoding"] == CompressionEncoding.ZSTD
+
+
+@pytest.mark.parametrize("zstd_level, should_raise", ((0, True), (1, False), (22, False), (23, True)))
+def test_config_zstd_level_validation(zstd_level: int, should_raise: bool) -> None:
+    pytest.importorskip("zstandard")
+
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="zstd", zstd_level=zstd_level)
+    else:
+        CompressionConfig(backend="zstd", zstd_level=zstd_level)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected_encoding",
+    (
+        ("gzip, br", CompressionEncoding.BROTLI),
+        ("gzip;q=1.0, br;q=0.5", CompressionEncoding.GZIP),
+        ("GZIP;q=0.5, BR;q=0.5", CompressionEncoding.BROTLI),
+        ("br;q=0, gzip", CompressionEncoding.GZIP),
+        ("br;q=0, gzip;q=0", None),
+        ("*", CompressionEncoding.BROTLI),
+        ("br;q=0, *;q=0.5", CompressionEncoding.GZIP),
+        ("identity", None),
+        ("xbr", None),
+        ("", None),
+    ),
+)
+def test_resolve_encoding_quality_values(accept_encoding: str, expected_encoding: Union[str, None]) -> None:
+    assert CompressionConfig(backend="brotli").resolve_encoding(accept_encoding) == expected_encoding
+
+
+@pytest.mark.parametrize(
+    "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
+)
+async def test_compression_streaming_response_without_flushing_chunks(
+    backend: Literal["gzip", "brotli"],
+    compression_encoding: Literal[CompressionEncoding.BROTLI, CompressionEncoding.GZIP],
+    create_scope: Callable[..., Scope],
+    mock_asgi_app: ASGIApp,
+) -> None:
+    mock = MagicMock()
+
+    async def fake_send(message: Message) -> None:
+        mock(message)
+
+    wrapped_send = CompressionMiddleware(
+        mock_asgi_app, CompressionConfig(backend=backend, flush_chunks=False)
+    ).create_compression_send_wrapper(fake_send, compression_encoding, create_scope())
+
+    await wrapped_send(HTTPResponseStartEvent(type="http.response.start", status=200, headers={}))
+    await wrapped_send(HTTPResponseBodyEvent(type="http.response.body", body=b"abc", more_body=True))
+    await wrapped_send(HTTPResponseBodyEvent(type="http.response.body", body=b"abc", more_body=True))
+    # without flushing, the compressor holds back the small chunk
+    assert not mock.mock_calls[-1].args[0]["body"]
+
+    await wrapped_send(HTTPResponseBodyEvent(type="http.response.body", body=b"", more_body=False))
+    assert mock.mock_calls[-1].args[0]["body"]
+
+
+def test_compression_in_worker_thread(handler: HTTPRouteHandler, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar.middleware.compression import middleware
+
+    sync_to_thread_mock = MagicMock(wraps=middleware.sync_to_thread)
+    monkeypatch.setattr(middleware, "sync_to_thread", sync_to_thread_mock)
+
+    with create_test_client(
+        route_handlers=[handler], compression_config=CompressionConfig(backend="gzip", thread_offload_threshold=40000)
+    ) as client:
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "_litestar_" * 4000
+        assert response.headers["Content-Encoding"] == CompressionEncoding.GZIP
+        assert sync_to_thread_mock.call_count == 1
+
+
+def test_compression_skips_encoded_response() -> None:
+    body = zlib.compress(b"_litestar_" * 4000)
+
+    @get(path="/", media_type=MediaType.TEXT, response_headers={"content-encoding": "deflate"})
+    def handler_fn() -> bytes:
+        return body
+
+    with create_test_client(
+        route_handlers=[handler_fn], compression_config=CompressionConfig(backend="gzip")
+    ) as client:
+        response = client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["Content-Encoding"] == "deflate"
+        assert response.text == "_litestar_" * 4000
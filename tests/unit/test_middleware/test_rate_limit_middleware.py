@@ -10,6 +10,7 @@ from litestar.middleware.rate_limit import (
     DURATION_VALUES,
     CacheObject,
     DurationUnit,
+    RateLimitAlgorithm,
     RateLimitConfig,
 )
 from litestar.serialization import decode_json, encode_json
@@ -225,3 +226,114 @@ async def test_rate_limiting_works_with_mounted_apps(tmpdir: "Path") -> None:
         response = client.get("/src/static/test.css")
         assert response.status_code == HTTP_200_OK
         assert response.text == "styles content"
+
+
+@pytest.mark.parametrize("algorithm", ["fixed_window", "sliding_window", "token_bucket"])
+def test_counter_algorithms(algorithm: RateLimitAlgorithm) -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> None:
+        return None
+
+    config = RateLimitConfig(rate_limit=("minute", 2), algorithm=algorithm)
+
+    with travel(datetime(2024, 1, 1, 0, 0, 10), tick=False) as frozen_time, create_test_client(
+        [handler], middleware=[config.middleware]
+    ) as client:
+        response = client.get("/")
+        assert response.status_code == HTTP_200_OK
+        assert response.headers[config.rate_limit_limit_header_key] == "2"
+        assert response.headers[config.rate_limit_remaining_header_key] == "1"
+
+        response = client.get("/")
+        assert response.status_code == HTTP_200_OK
+        assert response.headers[config.rate_limit_remaining_header_key] == "0"
+
+        response = client.get("/")
+        assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers[config.rate_limit_remaining_header_key] == "0"
+
+        frozen_time.shift(120)
+
+        response = client.get("/")
+        assert response.status_code == HTTP_200_OK
+
+
+def test_fixed_window_reset_header() -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> None:
+        return None
+
+    config = RateLimitConfig(rate_limit=("minute", 1), algorithm="fixed_window")
+
+    with travel(datetime(2024, 1, 1, 0, 0, 10), tick=False), create_test_client(
+        [handler], middleware=[config.middleware]
+    ) as client:
+        assert client.get("/").headers[config.rate_limit_reset_header_key] == "50"
+
+
+def test_sliding_window_weighs_previous_window() -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> None:
+        return None
+
+    config = RateLimitConfig(rate_limit=("minute", 2), algorithm="sliding_window")
+
+    with travel(datetime(2024, 1, 1, 0, 0, 50), tick=False) as frozen_time, create_test_client(
+        [handler], middleware=[config.middleware]
+    ) as client:
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_200_OK
+
+        # a fixed window would allow 2 requests here, but half of the previous window is still covered
+        frozen_time.shift(40)
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_429_TOO_MANY_REQUESTS
+
+
+def test_token_bucket_regenerates_tokens() -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> None:
+        return None
+
+    config = RateLimitConfig(rate_limit=("minute", 2), algorithm="token_bucket")
+
+    with travel(datetime(2024, 1, 1), tick=False) as frozen_time, create_test_client(
+        [handler], middleware=[config.middleware]
+    ) as client:
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_200_OK
+        response = client.get("/")
+        assert response.status_code == HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers[config.rate_limit_reset_header_key] == "30"
+
+        # one token is regenerated every 30 seconds, rejected requests do not consume tokens
+        frozen_time.shift(30)
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_429_TOO_MANY_REQUESTS
+
+        frozen_time.shift(60)
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_429_TOO_MANY_REQUESTS
+
+
+@pytest.mark.parametrize("algorithm", ["fixed_window", "sliding_window"])
+def test_window_algorithms_do_not_count_rejected_requests(algorithm: RateLimitAlgorithm) -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> None:
+        return None
+
+    config = RateLimitConfig(rate_limit=("minute", 2), algorithm=algorithm)
+
+    with travel(datetime(2024, 1, 1, 0, 0, 50), tick=False) as frozen_time, create_test_client(
+        [handler], middleware=[config.middleware]
+    ) as client:
+        assert client.get("/").status_code == HTTP_200_OK
+        assert client.get("/").status_code == HTTP_200_OK
+        for _ in range(5):
+            assert client.get("/").status_code == HTTP_429_TOO_MANY_REQUESTS
+
+        # half of the previous window is still covered by the sliding window. Had the retries been counted, they
+        # would keep the client limited
+        frozen_time.shift(40)
+        assert client.get("/").status_code == HTTP_200_OK
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import pytest
@@ -7,6 +7,7 @@ from litestar import HttpMethod
 from litestar._parsers import (
     parse_cookie_string,
     parse_query_string,
+    parse_range_header,
     parse_url_encoded_form_data,
 )
 from litestar.datastructures import Cookie, MultiDict
@@ -70,6 +71,31 @@ def test_parse_cookie_string(cookie_string: str, expected: Dict[str, str]) -> No
     assert parse_cookie_string(cookie_string) == expected
 
 
+@pytest.mark.parametrize(
+    "range_header, expected",
+    (
+        ("bytes=0-4", [(0, 4)]),
+        ("bytes=5-", [(5, 9)]),
+        ("bytes=-3", [(7, 9)]),
+        ("bytes=-20", [(0, 9)]),
+        ("bytes=8-20", [(8, 9)]),
+        ("bytes=0-1, 6-7", [(0, 1), (6, 7)]),
+        ("bytes=6-7,0-1", [(0, 1), (6, 7)]),
+        ("bytes=0-3,2-5,6-7", [(0, 7)]),
+        ("bytes=10-20", []),
+        ("bytes=-0", []),
+        ("bytes=10-20,0-1", [(0, 1)]),
+        ("items=0-1", None),
+        ("bytes=", None),
+        ("bytes=4-1", None),
+        ("bytes=a-b", None),
+        ("bytes=0-1,-", None),
+    ),
+)
+def test_parse_range_header(range_header: str, expected: Optional[List[Tuple[int, int]]]) -> None:
+    assert parse_range_header(range_header, size=10) == expected
+
+
 def test_parse_query_string() -> None:
     query: Dict[str, Any] = {
         "value": "10",
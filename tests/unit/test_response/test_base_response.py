@@ -1,14 +1,16 @@
 from pathlib import PurePosixPath
-from typing import Any, Optional
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
 
+import msgspec
 import pytest
 
 from litestar import MediaType, get
-from litestar.datastructures import Cookie
+from litestar.datastructures import Cookie, ETag
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.response import Response
 from litestar.response.base import ASGIResponse
-from litestar.serialization import default_serializer, get_serializer
+from litestar.serialization import default_serializer, get_json_encoder, get_msgpack_encoder, get_serializer
 from litestar.status_codes import (
     HTTP_100_CONTINUE,
     HTTP_101_SWITCHING_PROTOCOLS,
@@ -204,6 +206,41 @@ def test_get_serializer() -> None:
     )
 
 
+def test_get_encoders() -> None:
+    class Foo:
+        pass
+
+    serializer = get_serializer({Foo: lambda f: "foo"})
+
+    assert get_json_encoder() is get_json_encoder(default_serializer)
+    assert get_msgpack_encoder() is get_msgpack_encoder(default_serializer)
+    assert get_json_encoder(serializer).encode([Foo()]) == b'["foo"]'
+    assert get_msgpack_encoder(serializer).encode([Foo()]) == get_msgpack_encoder().encode(["foo"])
+
+
+@pytest.mark.parametrize("media_type", [MediaType.JSON, MediaType.MESSAGEPACK])
+def test_data_handler_reuses_encoders(media_type: MediaType, monkeypatch: pytest.MonkeyPatch) -> None:
+    class Foo:
+        pass
+
+    @get("/", type_encoders={Foo: lambda f: "foo"}, media_type=media_type, sync_to_thread=False)
+    def handler() -> List[Foo]:
+        return [Foo()]
+
+    render_mock = MagicMock(wraps=Response.render)
+    monkeypatch.setattr(Response, "render", lambda self, *args, **kwargs: render_mock(self, *args, **kwargs))
+
+    with create_test_client([handler]) as client:
+        for _ in range(3):
+            response = client.get("/")
+            assert response.status_code == HTTP_200_OK
+            assert response.content in (b'["foo"]', msgspec.msgpack.encode(["foo"]))
+
+    encoders = {(id(c.kwargs["json_encoder"]), id(c.kwargs["msgpack_encoder"])) for c in render_mock.call_args_list}
+    assert len(render_mock.call_args_list) == 3
+    assert len(encoders) == 1
+
+
 def test_head_response_doesnt_support_content() -> None:
     with pytest.raises(ImproperlyConfiguredException):
         ASGIResponse(body=b"hello world", media_type=MediaType.TEXT, is_head_response=True)
@@ -216,3 +253,46 @@ def test_asgi_response_encoded_headers() -> None:
         (b"content-type", b"application/json"),
         (b"content-length", b"0"),
     ]
+
+
+def test_set_etag_generates_weak_etag() -> None:
+    @get("/")
+    def handler() -> Response[str]:
+        response = Response("hello world", media_type=MediaType.TEXT)
+        response.set_etag()
+        return response
+
+    with create_test_client(handler) as client:
+        response = client.get("/")
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert client.get("/").headers["etag"] == etag
+
+        response = client.get("/", headers={"if-none-match": etag})
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert "content-length" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected_status_code",
+    (
+        ('"abc"', HTTP_304_NOT_MODIFIED),
+        ('W/"abc"', HTTP_304_NOT_MODIFIED),
+        ('"foo", "abc"', HTTP_304_NOT_MODIFIED),
+        ("*", HTTP_304_NOT_MODIFIED),
+        ('"foo"', HTTP_200_OK),
+    ),
+)
+def test_conditional_request_if_none_match(if_none_match: str, expected_status_code: int) -> None:
+    @get("/", etag=ETag(value="abc"))
+    def handler() -> str:
+        return "hello world"
+
+    with create_test_client(handler) as client:
+        response = client.get("/", headers={"if-none-match": if_none_match})
+        assert response.status_code == expected_status_code
+
+        response = client.post("/", headers={"if-none-match": if_none_match})
+        assert response.status_code != HTTP_304_NOT_MODIFIED
@@ -2,20 +2,27 @@ import os
 from email.utils import formatdate
 from os import stat, urandom
 from pathlib import Path
-from typing import Any, Coroutine
+from typing import Any, Callable, Coroutine, List, Tuple
+from unittest.mock import AsyncMock
 
 import pytest
 from fsspec.implementations.local import LocalFileSystem
 
 from litestar import get
+from litestar.config.compression import CompressionConfig
 from litestar.connection.base import empty_send
 from litestar.datastructures import ETag
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem, FileSystemAdapter
 from litestar.response.file import ASGIFileResponse, File, async_file_iterator
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
 from litestar.testing import create_test_client
-from litestar.types import FileSystemProtocol
+from litestar.types import ASGIApp, FileSystemProtocol, Message, Receive, Scope, Send
 
 
 @pytest.mark.parametrize("content_disposition_type", ("inline", "attachment"))
@@ -117,6 +124,145 @@ async def test_file_iterator(tmpdir: Path, chunk_size: int) -> None:
     assert result == content
 
 
+@pytest.mark.parametrize(
+    "range_header, expected_range, chunk_size",
+    (("bytes=10-19", (10, 19), 1024), ("bytes=-5", (1019, 1023), 1024), ("bytes=100-", (100, 1023), 16)),
+)
+def test_file_response_single_range(
+    tmpdir: Path, range_header: str, expected_range: Tuple[int, int], chunk_size: int
+) -> None:
+    content = urandom(1024)
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(content)
+    start, end = expected_range
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path, chunk_size=chunk_size)
+
+    with create_test_client(handler) as client:
+        response = client.get("/", headers={"range": range_header})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert response.content == content[start : end + 1]
+        assert response.headers["content-range"] == f"bytes {start}-{end}/1024"
+        assert response.headers["content-length"] == str(end - start + 1)
+        assert response.headers["accept-ranges"] == "bytes"
+
+
+def test_file_response_multiple_ranges(tmpdir: Path) -> None:
+    content = urandom(1024)
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(content)
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path, media_type="text/plain")
+
+    with create_test_client(handler) as client:
+        response = client.get("/", headers={"range": "bytes=0-9, 500-509"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert response.headers["content-length"] == str(len(response.content))
+
+        content_type, _, boundary = response.headers["content-type"].partition("; boundary=")
+        assert content_type == "multipart/byteranges"
+        assert response.content == (
+            f"--{boundary}\r\ncontent-type: text/plain; charset=utf-8\r\ncontent-range: bytes 0-9/1024\r\n\r\n".encode()
+            + content[0:10]
+            + f"\r\n--{boundary}\r\ncontent-type: text/plain; charset=utf-8\r\n"
+            f"content-range: bytes 500-509/1024\r\n\r\n".encode()
+            + content[500:510]
+            + f"\r\n--{boundary}--\r\n".encode()
+        )
+
+
+def test_file_response_unsatisfiable_range(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path)
+
+    with create_test_client(handler) as client:
+        response = client.get("/", headers={"range": "bytes=100-200"})
+        assert response.status_code == HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response.headers["content-range"] == "bytes */7"
+        assert response.content == b""
+
+
+@pytest.mark.parametrize("range_header", ("items=0-1", "bytes=2-1"))
+def test_file_response_ignores_invalid_range(tmpdir: Path, range_header: str) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path)
+
+    with create_test_client(handler) as client:
+        response = client.get("/", headers={"range": range_header})
+        assert response.status_code == HTTP_200_OK
+        assert response.content == b"content"
+
+
+def test_file_response_if_range(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path)
+
+    with create_test_client(handler) as client:
+        etag = client.get("/").headers["etag"]
+        last_modified = client.get("/").headers["last-modified"]
+
+        for if_range in (etag, last_modified):
+            response = client.get("/", headers={"range": "bytes=0-2", "if-range": if_range})
+            assert response.status_code == HTTP_206_PARTIAL_CONTENT
+            assert response.content == b"con"
+
+        for if_range in ('"other"', f"W/{etag}", "Thu, 01 Jan 1970 00:00:00 GMT"):
+            response = client.get("/", headers={"range": "bytes=0-2", "if-range": if_range})
+            assert response.status_code == HTTP_200_OK
+            assert response.content == b"content"
+
+
+def test_file_response_conditional_request(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+    file_system = BaseLocalFileSystem()
+    file_system.open = AsyncMock(wraps=file_system.open)  # type: ignore[method-assign]
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path, file_system=file_system)
+
+    with create_test_client(handler) as client:
+        response = client.get("/")
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+        file_system.open.reset_mock()
+
+        for headers in ({"if-none-match": etag}, {"if-modified-since": last_modified}):
+            response = client.get("/", headers=headers)
+            assert response.status_code == HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+            assert "content-length" not in response.headers
+
+        assert not file_system.open.called
+
+        for headers in (
+            {"if-none-match": '"other"', "if-modified-since": last_modified},
+            {"if-modified-since": "Thu, 01 Jan 1970 00:00:00 GMT"},
+            {"if-modified-since": "invalid"},
+        ):
+            response = client.get("/", headers=headers)
+            assert response.status_code == HTTP_200_OK
+            assert response.content == b"content"
+
+
 @pytest.mark.parametrize("size", (1024, 2048, 4096, 1024 * 10, 2048 * 10, 4096 * 10))
 def test_large_files(tmpdir: Path, size: int) -> None:
     content = urandom(1024 * size)
@@ -322,3 +468,81 @@ def test_asgi_response_encoded_headers(file: Path) -> None:
         (b"content-type", b"application/octet-stream"),
         (b"content-disposition", b'attachment; filename=""'),
     ]
+
+
+def make_pathsend_middleware(sent_paths: List[str]) -> Callable[[ASGIApp], ASGIApp]:
+    """Create a middleware advertising the pathsend extension and handling it like a server would."""
+
+    def middleware(app: ASGIApp) -> ASGIApp:
+        async def wrapped_app(scope: Scope, receive: Receive, send: Send) -> None:
+            scope["extensions"] = {**(scope.get("extensions") or {}), "http.response.pathsend": {}}
+
+            async def wrapped_send(message: Message) -> None:
+                if message["type"] == "http.response.pathsend":
+                    sent_paths.append(message["path"])
+                    message = {"type": "http.response.body", "body": Path(message["path"]).read_bytes()}
+                await send(message)
+
+            await app(scope, receive, wrapped_send)
+
+        return wrapped_app
+
+    return middleware
+
+
+def test_file_response_pathsend(file: Path) -> None:
+    file = Path(file)
+    sent_paths: List[str] = []
+
+    @get("/")
+    def handler() -> File:
+        return File(path=file)
+
+    with create_test_client(handler, middleware=[make_pathsend_middleware(sent_paths)]) as client:
+        response = client.get("/")
+        assert response.status_code == HTTP_200_OK
+        assert response.content == file.read_bytes()
+        assert response.headers["content-length"] == str(file.stat().st_size)
+        assert sent_paths == [str(file.absolute())]
+
+        sent_paths.clear()
+        response = client.get("/", headers={"range": "bytes=0-1"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert response.content == file.read_bytes()[:2]
+        assert not sent_paths
+
+
+def test_file_response_pathsend_not_used_for_other_file_systems(file: Path) -> None:
+    file = Path(file)
+    sent_paths: List[str] = []
+
+    @get("/")
+    def handler() -> File:
+        return File(path=file, file_system=LocalFileSystem())
+
+    with create_test_client(handler, middleware=[make_pathsend_middleware(sent_paths)]) as client:
+        response = client.get("/")
+        assert response.status_code == HTTP_200_OK
+        assert response.content == file.read_bytes()
+        assert not sent_paths
+
+
+def test_file_response_pathsend_disabled_by_compression(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_text("content" * 1000)
+    sent_paths: List[str] = []
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path)
+
+    with create_test_client(
+        handler,
+        middleware=[make_pathsend_middleware(sent_paths)],
+        compression_config=CompressionConfig(backend="gzip"),
+    ) as client:
+        response = client.get("/", headers={"accept-encoding": "gzip"})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "content" * 1000
+        assert not sent_paths
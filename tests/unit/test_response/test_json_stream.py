@@ -0,0 +1,136 @@
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+import anyio
+import pytest
+
+from litestar import get
+from litestar.dto import DataclassDTO, DTOConfig
+from litestar.response import JSONStream
+from litestar.testing import RequestFactory, create_test_client
+
+
+@dataclass
+class Item:
+    id: int
+    secret: str
+
+
+class Money:
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+
+def sync_items(count: int) -> Iterator[Item]:
+    for i in range(count):
+        yield Item(id=i, secret="secret")
+
+
+async def async_items(count: int) -> AsyncIterator[Item]:
+    for i in range(count):
+        yield Item(id=i, secret="secret")
+
+
+@pytest.mark.parametrize("count", [0, 1, 10])
+@pytest.mark.parametrize("make_items", [sync_items, async_items, lambda count: list(sync_items(count))])
+def test_json_stream(make_items: Any, count: int) -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> JSONStream[Item]:
+        return JSONStream(make_items(count))
+
+    with create_test_client([handler]) as client:
+        response = client.get("/")
+        assert response.headers["content-type"] == "application/json"
+        assert "content-length" not in response.headers
+        assert response.json() == [{"id": i, "secret": "secret"} for i in range(count)]
+
+
+@pytest.mark.parametrize("make_items", [sync_items, async_items])
+def test_json_stream_ndjson(make_items: Any) -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> JSONStream[Item]:
+        return JSONStream(make_items(3), ndjson=True)
+
+    with create_test_client([handler]) as client:
+        response = client.get("/")
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text.endswith("\n")
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"id": i, "secret": "secret"} for i in range(3)
+        ]
+
+
+def test_json_stream_callable_content() -> None:
+    @get("/", sync_to_thread=False)
+    def handler() -> JSONStream[Item]:
+        return JSONStream(lambda: sync_items(2))
+
+    with create_test_client([handler]) as client:
+        assert client.get("/").json() == [{"id": 0, "secret": "secret"}, {"id": 1, "secret": "secret"}]
+
+
+def test_json_stream_type_encoders() -> None:
+    @get("/", type_encoders={Money: lambda m: m.amount}, sync_to_thread=False)
+    def handler() -> JSONStream[Dict[str, Money]]:
+        return JSONStream([{"price": Money(1)}, {"price": Money(2)}])
+
+    with create_test_client([handler]) as client:
+        assert client.get("/").json() == [{"price": 1}, {"price": 2}]
+
+
+@pytest.mark.parametrize("make_items", [sync_items, async_items, lambda count: list(sync_items(count))])
+def test_json_stream_return_dto(make_items: Any) -> None:
+    class ItemDTO(DataclassDTO[Item]):
+        config = DTOConfig(exclude={"secret"})
+
+    @get("/", return_dto=ItemDTO, sync_to_thread=False)
+    def handler() -> JSONStream[Item]:
+        return JSONStream(make_items(3))
+
+    with create_test_client([handler]) as client:
+        assert client.get("/").json() == [{"id": 0}, {"id": 1}, {"id": 2}]
+        schema = client.app.openapi_schema.paths["/"].get.responses["200"].content["application/json"].schema  # type: ignore[index, union-attr]
+        assert schema.type == "array"
+
+
+@pytest.mark.parametrize("make_items", [sync_items, async_items])
+def test_json_stream_return_dto_callable_content(make_items: Any) -> None:
+    class ItemDTO(DataclassDTO[Item]):
+        config = DTOConfig(exclude={"secret"})
+
+    @get("/", return_dto=ItemDTO, sync_to_thread=False)
+    def handler() -> JSONStream[Item]:
+        return JSONStream(lambda: make_items(3))
+
+    with create_test_client([handler]) as client:
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.json() == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+async def test_json_stream_chunk_size(ndjson: bool) -> None:
+    messages: List[Any] = []
+    done = anyio.Event()
+
+    async def receive() -> Any:
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Any) -> None:
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message["more_body"]:
+            done.set()
+
+    response = JSONStream(async_items(100), chunk_size=256, ndjson=ndjson)
+    asgi_response = response.to_asgi_response(app=None, request=RequestFactory().get())
+    await asgi_response({"type": "http", "method": "GET"}, receive, send)  # type: ignore[arg-type]
+
+    chunks = [message["body"] for message in messages if message["type"] == "http.response.body"]
+    assert chunks[-1] == b""
+    assert len(chunks) > 3
+    assert all(len(chunk) >= 256 for chunk in chunks[:-2])
+    body = b"".join(chunks)
+    items = [json.loads(line) for line in body.splitlines()] if ndjson else json.loads(body)
+    assert items == [{"id": i, "secret": "secret"} for i in range(100)]
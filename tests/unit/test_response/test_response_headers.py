@@ -1,10 +1,11 @@
-from typing import Dict
+from typing import Any, Dict, Union
 
 import pytest
 
-from litestar import Controller, HttpMethod, Litestar, Router, get, post
-from litestar.datastructures import CacheControlHeader, ETag, ResponseHeader
+from litestar import Controller, HttpMethod, Litestar, Response, Router, get, post
+from litestar.datastructures import CacheControlHeader, Cookie, ETag, ResponseHeader
 from litestar.datastructures.headers import Header
+from litestar.response.base import ASGIResponse
 from litestar.status_codes import HTTP_201_CREATED
 from litestar.testing import TestClient, create_test_client
 
@@ -187,3 +188,43 @@ def test_explicit_headers_override_response_headers(
     route_handler, _ = app.routes[0].route_handler_map[HttpMethod.GET]  # type: ignore[union-attr]
     resolved_headers = {header.name: header for header in route_handler.resolve_response_headers()}
     assert resolved_headers[header.HEADER_NAME].value == header.to_header()
+
+
+@pytest.mark.parametrize("return_response", [False, True])
+def test_static_response_headers_and_cookies(return_response: bool) -> None:
+    @get(
+        "/",
+        response_headers=[ResponseHeader(name="X-Static", value="static"), ResponseHeader(name="X-Other", value="1")],
+        response_cookies=[Cookie(key="static", value="cookie")],
+    )
+    def handler() -> Union[Response[str], str]:
+        if return_response:
+            return Response("hello", headers={"x-other": "2"}, cookies=[Cookie(key="dynamic", value="cookie")])
+        return "hello"
+
+    with create_test_client([handler]) as client:
+        first_response = client.get("/")
+        second_response = client.get("/")
+
+    for response in (first_response, second_response):
+        assert response.headers["x-static"] == "static"
+        assert response.headers.get_list("x-other") == (["2"] if return_response else ["1"])
+        assert response.cookies["static"] == "cookie"
+        assert response.cookies.get("dynamic") == ("cookie" if return_response else None)
+
+
+def test_static_response_headers_with_custom_to_asgi_response() -> None:
+    class CustomResponse(Response):
+        def to_asgi_response(self, *args: Any, **kwargs: Any) -> ASGIResponse:
+            asgi_response = super().to_asgi_response(*args, **kwargs)
+            asgi_response.headers.add("x-custom", "custom")
+            return asgi_response
+
+    @get("/", response_headers=[ResponseHeader(name="X-Static", value="static")], response_class=CustomResponse)
+    def handler() -> str:
+        return "hello"
+
+    with create_test_client([handler]) as client:
+        response = client.get("/")
+        assert response.headers["x-static"] == "static"
+        assert response.headers["x-custom"] == "custom"
@@ -211,3 +211,84 @@ def test_dto_data_typed_as_any() -> None:
     (field,) = msgspec.structs.fields(model)
     assert field.name == "data"
     assert field.type is Any
+
+
+def test_signature_model_passthrough_types() -> None:
+    @get()
+    def my_fn(
+        a: int,
+        b: str,
+        c: Optional[bytes],
+        d: Any,
+        e: List[int],
+        f: Annotated[int, Parameter(gt=1)],
+        g: Union[int, str],
+    ) -> None:
+        pass
+
+    model = SignatureModel.create(
+        dependency_name_set=set(),
+        fn=my_fn.fn,
+        data_dto=None,
+        parsed_signature=ParsedSignature.from_fn(my_fn.fn, {}),
+        type_decoders=[],
+    )
+
+    assert model._passthrough_types == {
+        "a": (int,),
+        "b": (str,),
+        "c": (bytes, type(None)),
+        "d": None,
+        "e": False,
+        "f": False,
+        "g": (int, str),
+    }
+
+
+def test_parse_values_skips_model_for_typed_values() -> None:
+    @get()
+    def my_fn(a: int, b: str, c: Optional[float], d: List[int]) -> None:
+        pass
+
+    model = SignatureModel.create(
+        dependency_name_set=set(),
+        fn=my_fn.fn,
+        data_dto=None,
+        parsed_signature=ParsedSignature.from_fn(my_fn.fn, {}),
+        type_decoders=[],
+    )
+    connection = MagicMock()
+    convert_with_model = MagicMock(wraps=model._convert_with_model)
+    model._convert_with_model = convert_with_model  # type: ignore[method-assign]
+
+    assert model.parse_values_from_connection_kwargs(connection=connection, a=1, b="x", c=None, d=["1"], e=1) == {
+        "a": 1,
+        "b": "x",
+        "c": None,
+        "d": [1],
+    }
+    assert model.parse_values_from_connection_kwargs(connection=connection, a="2", b="x", c=1, d=[]) == {
+        "a": 2,
+        "b": "x",
+        "c": 1.0,
+        "d": [],
+    }
+    assert not convert_with_model.called
+
+    # missing values are left to the model
+    with pytest.raises(Exception):
+        model.parse_values_from_connection_kwargs(connection=connection, a=1, b="x", c=None)
+    assert convert_with_model.call_count == 1
+
+
+@pytest.mark.parametrize("query,status_code", [("?a=1&b=2", HTTP_200_OK), ("?a=1&b=x", 400), ("?b=2", 400)])
+def test_partially_typed_values_validation(query: str, status_code: int) -> None:
+    @get("/{c:int}")
+    def handler(c: int, a: int, b: int) -> int:
+        return a + b + c
+
+    with create_test_client(handler) as client:
+        response = client.get(f"/3{query}")
+        assert response.status_code == status_code
+        if status_code == HTTP_200_OK:
+            assert response.json() == 6
@@ -11,7 +11,7 @@ from typing_extensions import TypeAlias
 
 from litestar import MediaType, Router, get
 from litestar.static_files import StaticFilesConfig, create_static_files_router
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT, HTTP_304_NOT_MODIFIED
 from litestar.testing import create_test_client
 from tests.unit.test_static_files.conftest import MakeConfig
 
@@ -30,6 +30,30 @@ def test_default_static_files_config(tmpdir: Path, make_config: MakeConfig) -> N
         assert response.text == "content"
 
 
+def test_static_files_range_request(tmpdir: Path, make_config: MakeConfig) -> None:
+    path = tmpdir / "test.txt"
+    path.write_text("content", "utf-8")
+    static_files_config, router = make_config(StaticFilesConfig(path="/static", directories=[tmpdir]))
+
+    with create_test_client(router, static_files_config=static_files_config) as client:
+        response = client.get("/static/test.txt", headers={"range": "bytes=3-"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT, response.text
+        assert response.text == "tent"
+        assert response.headers["content-range"] == "bytes 3-6/7"
+
+
+def test_static_files_conditional_request(tmpdir: Path, make_config: MakeConfig) -> None:
+    path = tmpdir / "test.txt"
+    path.write_text("content", "utf-8")
+    static_files_config, router = make_config(StaticFilesConfig(path="/static", directories=[tmpdir]))
+
+    with create_test_client(router, static_files_config=static_files_config) as client:
+        etag = client.get("/static/test.txt").headers["etag"]
+        response = client.get("/static/test.txt", headers={"if-none-match": etag})
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+
 @pytest.fixture()
 def setup_dirs(tmpdir: Path) -> tuple[Path, Path]:
     paths = []
@@ -295,3 +319,44 @@ def test_resolve_symlinks(tmp_path: Path, resolve: bool) -> None:
             assert client.get("/test.txt").status_code == 404
         else:
             assert client.get("/test.txt").status_code == 200
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected_encoding,expected_file",
+    [
+        ("gzip, br", "br", "test.js.br"),
+        ("gzip", "gzip", "test.js.gz"),
+        ("br;q=0.5, gzip", "gzip", "test.js.gz"),
+        ("identity", None, "test.js"),
+    ],
+)
+def test_static_files_precompressed(
+    tmp_path: Path, accept_encoding: str, expected_encoding: str | None, expected_file: str
+) -> None:
+    (tmp_path / "test.js").write_bytes(b"content")
+    (tmp_path / "test.js.br").write_bytes(brotli.compress(b"content"))
+    (tmp_path / "test.js.gz").write_bytes(gzip.compress(b"content", mtime=0))
+
+    router = create_static_files_router(path="/static", directories=[tmp_path], precompressed=True)
+
+    with create_test_client(router) as client:
+        response = client.get("/static/test.js", headers={"accept-encoding": accept_encoding})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers.get("content-encoding") == expected_encoding
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["content-length"] == str((tmp_path / expected_file).stat().st_size)
+        assert response.text == "content"
+
+
+def test_static_files_precompressed_disabled(tmp_path: Path) -> None:
+    (tmp_path / "test.js").write_bytes(b"content")
+    (tmp_path / "test.js.gz").write_bytes(gzip.compress(b"content", mtime=0))
+
+    router = create_static_files_router(path="/static", directories=[tmp_path])
+
+    with create_test_client(router) as client:
+        response = client.get("/static/test.js", headers={"accept-encoding": "gzip"})
+        assert response.status_code == HTTP_200_OK
+        assert "content-encoding" not in response.headers
+        assert response.text == "content"
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from litestar.file_system import BaseLocalFileSystem
+from litestar.static_files import StaticFilesCache, create_static_files_router
+from litestar.status_codes import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT, HTTP_304_NOT_MODIFIED, HTTP_404_NOT_FOUND
+from litestar.testing import create_test_client
+
+
+class MockFileSystem(BaseLocalFileSystem):
+    def __init__(self) -> None:
+        self.info = AsyncMock(wraps=super().info)  # type: ignore[method-assign]
+        self.open = AsyncMock(wraps=super().open)  # type: ignore[method-assign]
+
+    def reset_mock(self) -> None:
+        self.info.reset_mock()
+        self.open.reset_mock()
+
+    @property
+    def call_count(self) -> int:
+        return self.info.call_count + self.open.call_count
+
+
+@pytest.fixture()
+def file_system() -> MockFileSystem:
+    return MockFileSystem()
+
+
+def test_serve_from_cache_without_file_system_calls(tmp_path: Path, file_system: MockFileSystem) -> None:
+    (tmp_path / "test.txt").write_text("content")
+    cache = StaticFilesCache()
+    router = create_static_files_router(path="/static", directories=[tmp_path], file_system=file_system, cache=cache)
+
+    with create_test_client(router) as client:
+        first_response = client.get("/static/test.txt")
+        assert first_response.status_code == HTTP_200_OK
+        assert file_system.open.call_count == 1
+
+        file_system.reset_mock()
+        response = client.get("/static/test.txt")
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "content"
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["etag"] == first_response.headers["etag"]
+        assert response.headers["last-modified"] == first_response.headers["last-modified"]
+        assert response.headers["content-length"] == "7"
+        assert not file_system.call_count
+
+        response = client.get("/static/test.txt", headers={"range": "bytes=1-3"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert response.text == "ont"
+
+        response = client.get("/static/test.txt", headers={"range": "bytes=0-0,2-3"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert b"\r\n\r\nc\r\n" in response.content
+        assert b"\r\n\r\nnt\r\n" in response.content
+
+        response = client.get("/static/test.txt", headers={"if-none-match": first_response.headers["etag"]})
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert not file_system.call_count
+
+    assert cache.size == 7
+
+
+def test_cache_missing_files(tmp_path: Path, file_system: MockFileSystem) -> None:
+    router = create_static_files_router(
+        path="/static", directories=[tmp_path], file_system=file_system, cache=StaticFilesCache()
+    )
+
+    with create_test_client(router) as client:
+        assert client.get("/static/test.txt").status_code == HTTP_404_NOT_FOUND
+        file_system.reset_mock()
+        assert client.get("/static/test.txt").status_code == HTTP_404_NOT_FOUND
+        assert not file_system.call_count
+
+
+def test_revalidate_after_stat_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar.static_files import cache as cache_module
+
+    path = tmp_path / "test.txt"
+    path.write_text("content")
+    now = 0.0
+    monkeypatch.setattr(cache_module, "monotonic", lambda: now)
+    router = create_static_files_router(path="/static", directories=[tmp_path], cache=StaticFilesCache(stat_ttl=1))
+
+    with create_test_client(router) as client:
+        assert client.get("/static/test.txt").text == "content"
+
+        path.write_text("changed content")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime + 10, stat.st_mtime + 10))
+        assert client.get("/static/test.txt").text == "content"
+
+        now = 2.0
+        assert client.get("/static/test.txt").text == "changed content"
+
+
+def test_large_files_not_cached(tmp_path: Path, file_system: MockFileSystem) -> None:
+    (tmp_path / "test.txt").write_text("content")
+    cache = StaticFilesCache(max_file_size=5)
+    router = create_static_files_router(path="/static", directories=[tmp_path], file_system=file_system, cache=cache)
+
+    with create_test_client(router) as client:
+        assert client.get("/static/test.txt").text == "content"
+        assert client.get("/static/test.txt").text == "content"
+        assert file_system.open.call_count == 2
+
+    assert cache.size == 0
+
+
+def test_evict_least_recently_used(tmp_path: Path) -> None:
+    cache = StaticFilesCache(max_size=10)
+    file_info = {"name": "", "size": 4, "type": "file", "mtime": 1.0, "islink": False}
+    cache.set_file(tmp_path / "a", file_info, b"aaaa")  # type: ignore[arg-type]
+    cache.set_file(tmp_path / "b", file_info, b"bbbb")  # type: ignore[arg-type]
+    assert cache.get_file(tmp_path / "a", file_info)  # type: ignore[arg-type]
+
+    cache.set_file(tmp_path / "c", file_info, b"cccc")  # type: ignore[arg-type]
+
+    assert cache.size == 8
+    assert cache.get_file(tmp_path / "a", file_info)  # type: ignore[arg-type]
+    assert cache.get_file(tmp_path / "b", file_info) is None  # type: ignore[arg-type]
+    assert cache.get_file(tmp_path / "c", file_info)  # type: ignore[arg-type]
+    assert cache.get_file(tmp_path / "c", {**file_info, "mtime": 2.0}) is None  # type: ignore[arg-type]
+    assert cache.size == 4
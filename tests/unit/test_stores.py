@@ -15,15 +15,16 @@ from pytest_mock import MockerFixture
 from time_machine import Coordinates
 
 from litestar.exceptions import ImproperlyConfiguredException
+from litestar.stores.base import Store
 from litestar.stores.file import FileStore
-from litestar.stores.memory import MemoryStore
+from litestar.stores.memory import MemoryStore, ShardedMemoryStore
 from litestar.stores.redis import RedisStore
 from litestar.stores.registry import StoreRegistry
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
-    from litestar.stores.base import NamespacedStore, Store
+    from litestar.stores.base import NamespacedStore
 
 
 @pytest.fixture()
@@ -108,6 +109,103 @@ async def test_get_and_renew_redis(redis_store: RedisStore, renew_for: int | tim
     assert stored_value is not None
 
 
+async def test_get_many_set_many(store: Store) -> None:
+    await store.set_many({"foo": b"bar", "baz": "qux"})
+
+    assert await store.get_many(["foo", "missing", "baz"]) == [b"bar", None, b"qux"]
+    assert await store.get_many([]) == []
+
+
+async def test_set_many_expires(store: Store, frozen_datetime: Coordinates) -> None:
+    await store.set_many({"foo": b"bar", "baz": b"qux"}, expires_in=1)
+
+    frozen_datetime.shift(2)
+    # shifting time does not affect the Redis instance
+    # this is done to emulate auto-expiration
+    if isinstance(store, RedisStore):
+        await store._redis.expire(f"{store.namespace}:foo", 0)
+        await store._redis.expire(f"{store.namespace}:baz", 0)
+
+    assert await store.get_many(["foo", "baz"]) == [None, None]
+
+
+@pytest.mark.parametrize("renew_for", [10, timedelta(seconds=10)])
+async def test_get_many_and_renew(store: Store, renew_for: int | timedelta, frozen_datetime: Coordinates) -> None:
+    if isinstance(store, RedisStore):
+        pytest.skip()
+
+    await store.set_many({"foo": b"bar", "baz": b"qux"}, expires_in=1)
+    assert await store.get_many(["foo", "baz"], renew_for=renew_for) == [b"bar", b"qux"]
+    frozen_datetime.shift(2)
+
+    assert await store.get_many(["foo", "baz"]) == [b"bar", b"qux"]
+
+
+async def test_delete_many(store: Store) -> None:
+    await store.set_many({"foo": b"bar", "baz": b"qux", "other": b"value"})
+
+    await store.delete_many(["foo", "baz", "missing"])
+
+    assert await store.get_many(["foo", "baz", "other"]) == [None, None, b"value"]
+
+
+async def test_incr(store: Store) -> None:
+    assert await store.incr("foo") == 1
+    assert await store.incr("foo", 5) == 6
+    assert await store.incr("foo", -2) == 4
+    assert await store.get("foo") == b"4"
+
+
+async def test_incr_floor(store: Store) -> None:
+    assert await store.incr("foo", 1, floor=10) == 11
+    assert await store.incr("foo", 1, floor=5) == 12
+    assert await store.incr("foo", 1, floor=20) == 21
+
+
+async def test_incr_expires(store: Store) -> None:
+    await store.incr("foo", expires_in=10)
+    assert 0 < (await store.expires_in("foo") or 0) <= 10
+
+    await store.incr("foo", expires_in=timedelta(seconds=100))
+    assert 10 < (await store.expires_in("foo") or 0) <= 100
+
+    # keeps the existing expiry time
+    await store.incr("foo", floor=10)
+    assert 10 < (await store.expires_in("foo") or 0) <= 100
+
+
+async def test_incr_default_implementation() -> None:
+    class NonAtomicStore(MemoryStore):
+        incr = Store.incr
+
+    store = NonAtomicStore()
+    assert await store.incr("foo", 2, expires_in=10) == 2
+    assert await store.incr("foo", 1, floor=5) == 6
+    assert await store.get("foo") == b"6"
+    assert 0 < (await store.expires_in("foo") or 0) <= 10
+
+
+async def test_batch_operations_default_implementation(mocker: MockerFixture) -> None:
+    class SingleKeyStore(MemoryStore):
+        get_many = Store.get_many
+        set_many = Store.set_many
+        delete_many = Store.delete_many
+
+    store = SingleKeyStore()
+    get_spy = mocker.spy(store, "get")
+    set_spy = mocker.spy(store, "set")
+    delete_spy = mocker.spy(store, "delete")
+
+    await store.set_many({"foo": b"bar", "baz": b"qux"}, expires_in=10)
+    assert await store.get_many(["foo", "baz"]) == [b"bar", b"qux"]
+    await store.delete_many(["foo", "baz"])
+
+    assert set_spy.call_count == 2
+    assert get_spy.call_count == 2
+    assert delete_spy.call_count == 2
+    assert await store.exists("foo") is False
+
+
 async def test_delete(store: Store) -> None:
     key = "key"
     await store.set(key, b"value", 60)
@@ -303,7 +401,7 @@ async def test_namespaced_store_delete_all_propagates_down(namespaced_store: Nam
     assert await namespaced_store.get("bar") is None
 
 
-@pytest.mark.parametrize("store_fixture", ["memory_store", "file_store"])
+@pytest.mark.parametrize("store_fixture", ["memory_store", "sharded_memory_store", "file_store"])
 async def test_memory_delete_expired(store_fixture: str, request: FixtureRequest, frozen_datetime: Coordinates) -> None:
     store = request.getfixturevalue(store_fixture)
 
@@ -325,6 +423,76 @@ async def test_memory_delete_expired(store_fixture: str, request: FixtureRequest
         assert await store.get(key) is not None
 
 
+async def test_sharded_memory_store_evicts_least_recently_used() -> None:
+    store = ShardedMemoryStore(shards=1, max_entries=2)
+
+    await store.set("one", b"1")
+    await store.set("two", b"2")
+    assert await store.get("one") == b"1"
+    await store.set("three", b"3")
+
+    assert await store.get("two") is None
+    assert await store.get("one") == b"1"
+    assert await store.get("three") == b"3"
+    assert store.stats.evictions == 1
+    assert store.stats.size == 2
+
+
+async def test_sharded_memory_store_max_bytes() -> None:
+    store = ShardedMemoryStore(shards=1, max_bytes=10)
+
+    await store.set("one", b"x" * 6)
+    await store.set("two", b"x" * 4)
+    assert store.stats.bytes == 10
+
+    await store.set("one", b"x" * 2)
+    assert store.stats.bytes == 6
+    assert store.stats.evictions == 0
+
+    await store.set("three", b"x" * 5)
+    assert await store.exists("two") is False
+    assert await store.exists("one") is True
+    assert store.stats.bytes == 7
+    assert store.stats.evictions == 1
+
+
+async def test_sharded_memory_store_stats(frozen_datetime: Coordinates) -> None:
+    store = ShardedMemoryStore(shards=2)
+
+    await store.set("foo", b"bar")
+    await store.set("baz", b"qux", expires_in=1)
+    assert await store.get("foo") == b"bar"
+    assert await store.get("missing") is None
+
+    frozen_datetime.shift(2)
+    assert await store.get("baz") is None
+
+    stats = store.stats
+    assert stats.size == 1
+    assert stats.bytes == 3
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.expirations == 1
+
+
+async def test_sharded_memory_store_expires_in_background() -> None:
+    store = ShardedMemoryStore(shards=2, expiry_interval=0.01)
+
+    async with store:
+        await store.set("foo", b"bar", expires_in=timedelta(milliseconds=1))
+        await store.set("baz", b"qux")
+        await asyncio.sleep(0.1)
+        assert store.stats.size == 1
+        assert store.stats.expirations == 1
+
+    assert store._task_group is None
+
+
+def test_sharded_memory_store_invalid_shards() -> None:
+    with pytest.raises(ValueError):
+        ShardedMemoryStore(shards=0)
+
+
 def test_registry_get(memory_store: MemoryStore) -> None:
     default_factory = MagicMock()
     default_factory.return_value = memory_store
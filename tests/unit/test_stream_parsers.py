@@ -0,0 +1,99 @@
+import json
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator, Callable, List
+
+import msgspec
+import pytest
+
+from litestar._stream_parsers import parse_json_array_stream, parse_msgpack_array_stream, parse_ndjson_stream
+from litestar.exceptions import ValidationException
+
+ITEMS: List[Any] = [
+    {"a": [1, {"b": 'x,]}\\"['}], "c": None},
+    "s\\",
+    3,
+    -1.5,
+    [],
+    {},
+    [[1, 2], [3]],
+    "ü",
+    True,
+    {"bin": "x" * 300, "list": list(range(300))},
+]
+
+
+async def _chunks(body: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), chunk_size):
+        yield body[i : i + chunk_size]
+
+
+async def _collect(
+    parser: Callable[[AsyncIterable[bytes]], AsyncGenerator[bytes, None]], body: bytes, chunk_size: int = 1
+) -> List[bytes]:
+    return [item async for item in parser(_chunks(body, chunk_size))]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+@pytest.mark.parametrize("indent", [None, 2])
+async def test_parse_json_array_stream(chunk_size: int, indent: Any) -> None:
+    body = json.dumps(ITEMS, indent=indent, ensure_ascii=False).encode()
+    items = await _collect(parse_json_array_stream, body, chunk_size)
+    assert [json.loads(item) for item in items] == ITEMS
+
+
+@pytest.mark.parametrize("body", [b"", b"[]", b" [ ] \n"])
+async def test_parse_json_array_stream_empty(body: bytes) -> None:
+    assert await _collect(parse_json_array_stream, body) == []
+
+
+@pytest.mark.parametrize("body", [b"{}", b"1", b"[1,]", b"[,1]", b"[1,,2]", b"[1", b"[1]x", b"[1] ]", b"[{]"])
+async def test_parse_json_array_stream_invalid(body: bytes) -> None:
+    with pytest.raises(ValidationException):
+        await _collect(parse_json_array_stream, body)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+async def test_parse_ndjson_stream(chunk_size: int) -> None:
+    body = b"\n".join(json.dumps(item).encode() for item in ITEMS) + b"\n\n"
+    items = await _collect(parse_ndjson_stream, body, chunk_size)
+    assert [json.loads(item) for item in items] == ITEMS
+
+
+async def test_parse_ndjson_stream_without_trailing_newline() -> None:
+    assert await _collect(parse_ndjson_stream, b'{"a": 1}\r\n\n{"a": 2}') == [b'{"a": 1}', b'{"a": 2}']
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+@pytest.mark.parametrize(
+    "items",
+    [
+        ITEMS,
+        [b"x", b"x" * 300, b"x" * 70000, {"ext": msgspec.msgpack.Ext(1, b"data")}],
+        [2**8, 2**16, 2**32, -(2**7), -(2**15), -(2**31), -(2**63), 1.5, None, False],
+        [{str(i): i for i in range(20)}, list(range(20))],
+        list(range(20)),
+    ],
+)
+async def test_parse_msgpack_array_stream(chunk_size: int, items: List[Any]) -> None:
+    body = msgspec.msgpack.encode(items)
+    result = await _collect(parse_msgpack_array_stream, body, chunk_size)
+    assert [msgspec.msgpack.decode(item) for item in result] == items
+
+
+async def test_parse_msgpack_array_stream_large_array() -> None:
+    items = list(range(70000))
+    result = await _collect(parse_msgpack_array_stream, msgspec.msgpack.encode(items), 1000)
+    assert result == [msgspec.msgpack.encode(item) for item in items]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        msgspec.msgpack.encode({"a": 1}),
+        msgspec.msgpack.encode([1, 2])[:-1],
+        msgspec.msgpack.encode([1, 2]) + b"\x01",
+        b"\x91\xc1",
+    ],
+)
+async def test_parse_msgpack_array_stream_invalid(body: bytes) -> None:
+    with pytest.raises(ValidationException):
+        await _collect(parse_msgpack_array_stream, body)